@@ -2,6 +2,7 @@
 from .charts import (
     BarChart,
     DonutChart,
+    TurnoutChart,
     StatCard,
     CompatibilityMeter,
     InsightCard,
@@ -11,10 +12,14 @@ from .charts import (
 )
 from .loading_overlay import LoadingOverlay, InlineSpinner, ButtonLoadingState
 from .empty_state import EmptyState
+from .paged_list import PagedList
+from .view_slot import ViewSlot
+from .render_debug_panel import RenderDebugPanel
 
 __all__ = [
     'BarChart',
     'DonutChart', 
+    'TurnoutChart',
     'StatCard',
     'CompatibilityMeter',
     'InsightCard',
@@ -25,4 +30,7 @@ __all__ = [
     'InlineSpinner',
     'ButtonLoadingState',
     'EmptyState',
+    'PagedList',
+    'ViewSlot',
+    'RenderDebugPanel',
 ]
@@ -382,6 +382,85 @@ def create_progress_bar(
     return progress_bar
 
 
+def create_turnout_chart(
+    series: List[Dict],  # [{"label": str, "value": float}] oldest bucket first
+    title: str = "",
+    votes_per_second: float = None,
+    color: str = "#5C6BC0",
+    chart_height: int = 120,
+) -> ft.Container:
+    """Create a vertical column chart of turnout per time bucket"""
+    peak = max((d.get("value", 0) for d in series), default=0)
+    
+    columns = []
+    for item in series:
+        value = item.get("value", 0)
+        height = (value / peak * chart_height) if peak > 0 else 0
+        columns.append(
+            ft.Container(
+                content=ft.Container(
+                    bgcolor=color,
+                    height=max(2, height),
+                    border_radius=ft.border_radius.only(top_left=3, top_right=3),
+                ),
+                expand=True,
+                height=chart_height,
+                alignment=ft.alignment.bottom_center,
+                tooltip=f"{item.get('label', '')}: {value:.0f} votes",
+            )
+        )
+    
+    header = []
+    if title:
+        header.append(ft.Text(title, size=16, weight=ft.FontWeight.BOLD, color="#333333", expand=True))
+    if votes_per_second is not None:
+        header.append(
+            ft.Container(
+                content=ft.Row(
+                    [
+                        ft.Icon(ft.Icons.SPEED, size=14, color=color),
+                        ft.Text(f"{votes_per_second:.2f} votes/sec", size=12, color=color, weight=ft.FontWeight.BOLD),
+                    ],
+                    spacing=4,
+                ),
+                bgcolor=ft.Colors.with_opacity(0.1, color),
+                padding=ft.padding.symmetric(horizontal=10, vertical=4),
+                border_radius=12,
+            )
+        )
+    
+    content_controls = []
+    if header:
+        content_controls.append(ft.Row(header, alignment=ft.MainAxisAlignment.SPACE_BETWEEN))
+        content_controls.append(ft.Container(height=12))
+    if columns:
+        content_controls.append(ft.Row(columns, spacing=2, vertical_alignment=ft.CrossAxisAlignment.END))
+        content_controls.append(
+            ft.Row(
+                [
+                    ft.Text(series[0].get("label", ""), size=10, color="#999999"),
+                    ft.Text(series[-1].get("label", ""), size=10, color="#999999"),
+                ],
+                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+            )
+        )
+    else:
+        content_controls.append(
+            ft.Container(
+                content=ft.Text("No votes recorded yet", size=12, color="#999999"),
+                height=chart_height,
+                alignment=ft.alignment.center,
+            )
+        )
+    
+    return ft.Container(
+        content=ft.Column(content_controls, spacing=4),
+        bgcolor=ft.Colors.WHITE,
+        border_radius=12,
+        padding=16,
+    )
+
+
 # Legacy class-based exports for backward compatibility
 class BarChart(ft.Container):
     """Horizontal bar chart - wrapper around create_bar_chart"""
@@ -399,6 +478,14 @@ class DonutChart(ft.Container):
                          border_radius=chart.border_radius, padding=chart.padding, **kwargs)
 
 
+class TurnoutChart(ft.Container):
+    """Turnout curve - wrapper around create_turnout_chart"""
+    def __init__(self, series, title="", votes_per_second=None, color="#5C6BC0", **kwargs):
+        chart = create_turnout_chart(series, title, votes_per_second, color)
+        super().__init__(content=chart.content, bgcolor=chart.bgcolor,
+                         border_radius=chart.border_radius, padding=chart.padding, **kwargs)
+
+
 class StatCard(ft.Container):
     """Stat card - wrapper around create_stat_card"""
     def __init__(self, title, value, icon=None, color="#5C6BC0", trend=None, subtitle="", width=None, **kwargs):
@@ -406,6 +493,12 @@ class StatCard(ft.Container):
         super().__init__(content=card.content, bgcolor=card.bgcolor,
                          border_radius=card.border_radius, padding=card.padding,
                          width=card.width, shadow=card.shadow, **kwargs)
+        # Row -> Column -> value Row -> value Text; kept so live updates can patch it
+        self.value_text = card.content.controls[-1].controls[1].controls[0]
+    
+    def set_value(self, value):
+        """Update the displayed value in place"""
+        self.value_text.value = str(value)
 
 
 class InsightCard(ft.Container):
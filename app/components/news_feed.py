@@ -1,6 +1,8 @@
 import flet as ft
 from datetime import datetime
 from app.theme import AppTheme
+from app.components.paged_list import PagedList
+from app.components.view_slot import ViewSlot
 
 
 class NewsFeedCard(ft.Container):
@@ -192,22 +194,21 @@ class NewsFeedCard(ft.Container):
 class NewsFeed(ft.Column):
     """News feed component for displaying updates from officials"""
     
+    PAGE_SIZE = 20
+    
     def __init__(self, db, filter_role=None):
         super().__init__()
         self.db = db
         self.filter_role = filter_role
         self.filter_category = None
-        self.posts = []
+        self.posts_list = None
         
         self.expand = True
         self.spacing = 0
         self._build_ui()
     
-    def _build_ui(self):
-        self.posts = self._load_posts()
-        
-        # Filter buttons
-        filter_row = ft.Row(
+    def _build_filter_row(self):
+        return ft.Row(
             [
                 ft.Text("Filter by:", size=12, color=ft.Colors.GREY_600),
                 self._create_filter_chip("All", None),
@@ -218,8 +219,9 @@ class NewsFeed(ft.Column):
             spacing=8,
             wrap=True,
         )
-        
-        category_row = ft.Row(
+    
+    def _build_category_row(self):
+        return ft.Row(
             [
                 ft.Text("Category:", size=12, color=ft.Colors.GREY_600),
                 self._create_category_chip("All", None),
@@ -231,16 +233,20 @@ class NewsFeed(ft.Column):
             spacing=8,
             wrap=True,
         )
+    
+    def _build_ui(self):
+        # Filter buttons - kept in slots so a filter click only redraws its chips
+        self.filter_slot = ViewSlot(self._build_filter_row)
+        self.category_slot = ViewSlot(self._build_category_row)
         
-        # Posts grid - uses ResponsiveRow for flexible layout
-        if self.posts:
-            posts_content = ft.ResponsiveRow(
-                [NewsFeedCard(post) for post in self.posts],
-                spacing=16,
-                run_spacing=16,
-            )
-        else:
-            posts_content = ft.Container(
+        # Posts list - cards are built as they scroll into view, pages load on demand
+        posts_content = PagedList(
+            fetch_page=self._load_posts,
+            build_item=lambda post: NewsFeedCard(post, col={"xs": 12}),
+            page_size=self.PAGE_SIZE,
+            height=640,
+            spacing=16,
+            empty_content=ft.Container(
                 content=ft.Column(
                     [
                         ft.Icon(ft.Icons.ARTICLE_OUTLINED, size=48, color=ft.Colors.GREY_400),
@@ -260,7 +266,9 @@ class NewsFeed(ft.Column):
                 ),
                 padding=40,
                 alignment=ft.alignment.center,
-            )
+            ),
+        )
+        self.posts_list = posts_content
         
         self.controls = [
             ft.Container(
@@ -284,8 +292,8 @@ class NewsFeed(ft.Column):
                             color=ft.Colors.GREY_600,
                         ),
                         ft.Divider(height=1, color=ft.Colors.GREY_300),
-                        filter_row,
-                        category_row,
+                        self.filter_slot,
+                        self.category_slot,
                         ft.Divider(height=1, color=ft.Colors.GREY_300),
                         posts_content,
                     ],
@@ -337,20 +345,19 @@ class NewsFeed(ft.Column):
     
     def _on_role_filter(self, role):
         self.filter_role = role
-        self._build_ui()
-        if self.page:
-            self.page.update()
+        self.filter_slot.refresh()
+        self.posts_list.reset()
     
     def _on_category_filter(self, category):
         self.filter_category = category
-        self._build_ui()
-        if self.page:
-            self.page.update()
+        self.category_slot.refresh()
+        self.posts_list.reset()
     
-    def _load_posts(self):
+    def _load_posts(self, offset=0, limit=PAGE_SIZE):
         if self.db:
             return self.db.get_news_posts(
-                limit=50,
+                limit=limit,
+                offset=offset,
                 category=self.filter_category,
                 author_role=self.filter_role
             )
@@ -358,6 +365,4 @@ class NewsFeed(ft.Column):
     
     def refresh(self):
         """Refresh the news feed"""
-        self._build_ui()
-        if self.page:
-            self.page.update()
+        self.posts_list.reset()
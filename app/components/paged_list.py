@@ -0,0 +1,149 @@
+"""
+Paged List Component for HonestBallot
+A virtualized list that fetches rows from the database one page at a time
+"""
+
+import threading
+
+import flet as ft
+from app.theme import AppTheme
+
+
+class PagedList(ft.Container):
+    """
+    A scrollable list that only builds the rows currently on screen and asks
+    the database for the next page as the user nears the end.
+
+    Rows are held in an ft.ListView with build_controls_on_demand, so Flutter
+    lays out just the visible window; a "Load more" footer covers lists too
+    short to scroll.
+
+    Parameters
+    ----------
+    fetch_page     : callable(offset, limit) -> list  – returns one page of rows
+    build_item     : callable(row) -> ft.Control       – renders a single row
+    page_size      : int                               – rows requested per page
+    height         : int | None                        – viewport height (the list scrolls inside it)
+    item_extent    : int | None                        – fixed row height, lets Flutter skip measuring
+    spacing        : int                               – gap between rows
+    empty_content  : ft.Control | None                 – shown when the first page is empty
+    header         : ft.Control | None                 – pinned above the rows (e.g. column titles)
+    on_page_loaded : callable(PagedList) | None        – called after every page is appended
+    """
+
+    def __init__(
+        self,
+        fetch_page,
+        build_item,
+        page_size: int = 50,
+        height: int | None = 520,
+        item_extent: int | None = None,
+        spacing: int = 8,
+        empty_content=None,
+        header=None,
+        on_page_loaded=None,
+        load_threshold: int = 300,
+    ):
+        self._fetch_page = fetch_page
+        self._build_item = build_item
+        self.page_size = page_size
+        self._empty_content = empty_content
+        self._header = header
+        self._on_page_loaded = on_page_loaded
+        self._load_threshold = load_threshold
+        self._lock = threading.Lock()
+
+        self.loaded_count = 0
+        self.has_more = True
+
+        self._load_more_button = ft.Container(
+            content=ft.TextButton(
+                "Load more",
+                icon=ft.Icons.EXPAND_MORE,
+                style=ft.ButtonStyle(color=AppTheme.PRIMARY),
+                on_click=lambda e: self.load_next_page(),
+            ),
+            alignment=ft.alignment.center,
+        )
+        self.list_view = ft.ListView(
+            spacing=spacing,
+            item_extent=item_extent,
+            build_controls_on_demand=True,
+            on_scroll=self._on_scroll,
+            on_scroll_interval=50,
+            expand=True,
+        )
+
+        self._viewport_height = height
+        super().__init__(height=height)
+        self._load_first_page()
+
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @property
+    def is_empty(self) -> bool:
+        return self.loaded_count == 0 and not self.has_more
+
+    def load_next_page(self) -> int:
+        """Fetch and append the next page; returns the number of rows added"""
+        added = self._append_page()
+        if self.page:
+            self.update()
+        return added
+
+    def reset(self, fetch_page=None, first_page=None):
+        """Drop loaded rows and start again from the first page
+
+        first_page lets a caller that already fetched offset 0 (e.g. a search)
+        hand those rows over instead of querying again.
+        """
+        if fetch_page is not None:
+            self._fetch_page = fetch_page
+        self._load_first_page(first_page)
+        if self.page:
+            self.update()
+
+    def _append_page(self, rows=None) -> int:
+        with self._lock:
+            if not self.has_more:
+                return 0
+            if rows is None:
+                rows = self._fetch_page(self.loaded_count, self.page_size) or []
+            self.has_more = len(rows) == self.page_size
+
+            items = self.list_view.controls
+            if items and items[-1] is self._load_more_button:
+                items.pop()
+            items.extend(self._build_item(row) for row in rows)
+            if self.has_more:
+                items.append(self._load_more_button)
+            self.loaded_count += len(rows)
+
+        if self._on_page_loaded:
+            self._on_page_loaded(self)
+        return len(rows)
+
+    def _load_first_page(self, rows=None):
+        with self._lock:
+            self.list_view.controls = []
+            self.loaded_count = 0
+            self.has_more = True
+
+        self._append_page(rows)
+
+        if self.is_empty and self._empty_content is not None:
+            self.content = self._empty_content
+            self.height = None
+            return
+
+        self.height = self._viewport_height
+        if self._header is not None:
+            self.content = ft.Column([self._header, self.list_view], spacing=0)
+        else:
+            self.content = self.list_view
+
+    def _on_scroll(self, e: ft.OnScrollEvent):
+        if not self.has_more or e.max_scroll_extent is None:
+            return
+        if e.max_scroll_extent - e.pixels <= self._load_threshold:
+            self.load_next_page()
@@ -0,0 +1,104 @@
+"""
+Render Debug Panel for HonestBallot
+Shows per-view render costs collected by the render profiler
+"""
+
+import flet as ft
+from app.theme import AppTheme
+
+
+class RenderDebugPanel(ft.Container):
+    """
+    A compact table of the slowest views (averaged) and the latest renders.
+
+    Follows the profiler while mounted, so new samples appear as the user
+    navigates; rows are redrawn in place without touching the rest of the page.
+
+    Parameters
+    ----------
+    profiler : RenderProfiler  – source of samples (see app.services.render_profiler)
+    recent   : int             – how many of the latest renders to list
+    """
+
+    def __init__(self, profiler, recent: int = 10):
+        self._profiler = profiler
+        self._recent = recent
+
+        self._summary_column = ft.Column(spacing=4)
+        self._recent_column = ft.Column(spacing=2)
+
+        super().__init__(
+            content=ft.Column(
+                [
+                    ft.Row(
+                        [
+                            ft.Text("Render costs", size=16, weight=ft.FontWeight.BOLD),
+                            ft.TextButton("Clear", on_click=lambda e: self._clear()),
+                        ],
+                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+                    ),
+                    self._header_row(["View", "Renders", "Avg ms", "Max ms", "Controls", "Payload", "Queries"]),
+                    self._summary_column,
+                    ft.Divider(height=1, color=AppTheme.BORDER_LIGHT),
+                    ft.Text("Latest renders", size=12, weight=ft.FontWeight.W_600, color=AppTheme.TEXT_MUTED),
+                    self._recent_column,
+                ],
+                spacing=8,
+                scroll=ft.ScrollMode.AUTO,
+            ),
+            width=760,
+            height=420,
+            padding=12,
+        )
+        self._fill()
+
+    def did_mount(self):
+        self._profiler.add_listener(self._on_sample)
+
+    def will_unmount(self):
+        self._profiler.remove_listener(self._on_sample)
+
+    # ─────────────────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _cell(value, width, bold=False):
+        return ft.Container(
+            content=ft.Text(str(value), size=11, weight=ft.FontWeight.W_600 if bold else None,
+                            overflow=ft.TextOverflow.ELLIPSIS),
+            width=width,
+        )
+
+    def _header_row(self, labels):
+        widths = [220, 60, 70, 70, 70, 80, 90]
+        return ft.Row([self._cell(label, w, bold=True) for label, w in zip(labels, widths)], spacing=8)
+
+    def _fill(self):
+        self._summary_column.controls = [
+            ft.Row(
+                [
+                    self._cell(row["name"], 220),
+                    self._cell(row["renders"], 60),
+                    self._cell(f"{row['avg_ms']:.1f}", 70),
+                    self._cell(f"{row['max_ms']:.1f}", 70),
+                    self._cell(f"{row['avg_controls']:.0f}", 70),
+                    self._cell(f"{row['avg_payload_bytes'] / 1024:.1f} KB", 80),
+                    self._cell(f"{row['avg_queries']:.1f} / {row['avg_query_ms']:.1f}ms", 90),
+                ],
+                spacing=8,
+            )
+            for row in self._profiler.summary()
+        ] or [ft.Text("No renders recorded yet", size=11, color=AppTheme.TEXT_MUTED)]
+
+        self._recent_column.controls = [
+            ft.Text(sample.summary(), size=11, color=AppTheme.TEXT_SECONDARY)
+            for sample in self._profiler.recent(self._recent)
+        ]
+
+    def _on_sample(self, sample):
+        self._fill()
+        if self.page:
+            self.update()
+
+    def _clear(self):
+        self._profiler.clear()
+        self._on_sample(None)
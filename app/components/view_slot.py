@@ -0,0 +1,36 @@
+"""
+View Slot Component for HonestBallot
+A stable placeholder for one section of a view that can be rebuilt on its own
+"""
+
+import flet as ft
+
+
+class ViewSlot(ft.Container):
+    """
+    Holds the output of a builder function and rebuilds just that section.
+
+    Views keep a reference to each slot and call refresh() when the state
+    behind it changes; only the slot's subtree is rebuilt and sent to the
+    client, instead of reconstructing the whole view and calling page.update().
+
+    Usage:
+        self._progress = ViewSlot(self._build_voting_progress)
+        ...
+        self._progress.refresh()
+
+    Parameters
+    ----------
+    build   : callable() -> ft.Control | None  – builds the slot's content
+    **kwargs: passed to ft.Container (margin, padding, expand, ...)
+    """
+
+    def __init__(self, build, **kwargs):
+        self._build = build
+        super().__init__(content=build(), **kwargs)
+
+    def refresh(self, update: bool = True):
+        """Rebuild the content; pushes it to the client when mounted and update is set"""
+        self.content = self._build()
+        if update and self.page:
+            self.update()
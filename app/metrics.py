@@ -0,0 +1,281 @@
+"""
+Metrics Module for HonestBallot
+Process-wide counters, gauges and histograms for operational monitoring,
+exposed in Prometheus text format on a side HTTP endpoint
+"""
+
+import threading
+from bisect import bisect_left
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+try:
+    from app.config import Config
+except ImportError:
+    Config = None
+
+
+# Seconds; suits both sub-millisecond queries and bcrypt-bound logins
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def _format_value(value) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(pairs: Iterable[Tuple[str, object]]) -> str:
+    pairs = list(pairs)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class _Metric:
+    """Base for a named metric with an optional fixed set of label names"""
+    
+    type_name = "untyped"
+    
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple, object] = {}
+    
+    def _key(self, labels: Dict) -> Tuple:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+    
+    def samples(self):
+        """Yield (suffix, label_pairs, value) for the exposition output"""
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            yield "", list(zip(self.label_names, key)), value
+    
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type_name}"]
+        for suffix, pairs, value in self.samples():
+            lines.append(f"{self.name}{suffix}{_format_labels(pairs)} {_format_value(value)}")
+        return "\n".join(lines)
+
+
+class Counter(_Metric):
+    """Monotonically increasing count"""
+    
+    type_name = "counter"
+    
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    """Value that goes up and down, or is read from a callback at scrape time"""
+    
+    type_name = "gauge"
+    
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = ()):
+        super().__init__(name, help_text, labels)
+        self._function: Optional[Callable[[], float]] = None
+    
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+    
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+    
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+    
+    def set_function(self, function: Callable[[], float]):
+        """Read the (unlabelled) value from function on every scrape, e.g. a queue size"""
+        self._function = function
+    
+    def value(self, **labels) -> float:
+        if self._function is not None:
+            return self._function()
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+    
+    def samples(self):
+        if self._function is not None:
+            try:
+                yield "", [], self._function()
+            except Exception as e:
+                print(f"Error reading gauge {self.name}: {e}")
+            return
+        yield from super().samples()
+
+
+class Histogram(_Metric):
+    """Distribution of observed values in cumulative buckets"""
+    
+    type_name = "histogram"
+    
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...] = (), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+    
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = {"counts": [0] * (len(self.buckets) + 1), "sum": 0.0, "count": 0}
+            state["counts"][bisect_left(self.buckets, value)] += 1
+            state["sum"] += value
+            state["count"] += 1
+    
+    def count(self, **labels) -> int:
+        with self._lock:
+            state = self._values.get(self._key(labels))
+            return state["count"] if state else 0
+    
+    def samples(self):
+        with self._lock:
+            items = [(key, list(state["counts"]), state["sum"], state["count"]) for key, state in self._values.items()]
+        for key, counts, total, count in items:
+            pairs = list(zip(self.label_names, key))
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                yield "_bucket", pairs + [("le", _format_value(float(bound)))], cumulative
+            yield "_sum", pairs, total
+            yield "_count", pairs, count
+
+
+class MetricsRegistry:
+    """Named metrics for the process; asking twice for a name returns the same metric"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, _Metric] = {}
+    
+    def _register(self, cls, name, help_text, labels, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, help_text, labels, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"Metric {name} is already registered as a {metric.type_name}")
+            return metric
+    
+    def counter(self, name: str, help_text: str, labels: Tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter, name, help_text, labels)
+    
+    def gauge(self, name: str, help_text: str, labels: Tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge, name, help_text, labels)
+    
+    def histogram(self, name: str, help_text: str, labels: Tuple[str, ...] = (), buckets=DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram, name, help_text, labels, buckets=buckets)
+    
+    def render(self) -> str:
+        """All metrics in Prometheus text exposition format"""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(metric.render() for metric in metrics) + "\n"
+
+
+registry = MetricsRegistry()
+
+# Voting
+VOTES_CAST = registry.counter("honestballot_votes_cast_total", "Ballots recorded, by position", ("position",))
+VOTE_CHANGES = registry.counter("honestballot_vote_changes_total", "Ballots changed after casting, by position", ("position",))
+LEDGER_BATCHES_SEALED = registry.counter("honestballot_ledger_batches_sealed_total", "Vote ledger batches sealed with a Merkle root")
+RESULTS_PENDING_VOTES = registry.gauge("honestballot_results_pending_votes", "Votes waiting in the live results broadcaster")
+
+# Authentication and sessions
+LOGIN_ATTEMPTS = registry.counter("honestballot_login_attempts_total", "Login attempts by outcome (success, failure, locked)", ("outcome",))
+LOGIN_SECONDS = registry.histogram("honestballot_login_duration_seconds", "Time to check a login's credentials")
+ACCOUNT_LOCKOUTS = registry.counter("honestballot_account_lockouts_total", "Accounts locked after too many failed logins")
+ACTIVE_SESSIONS = registry.gauge("honestballot_active_sessions", "Sessions created and not yet ended")
+SESSIONS_STARTED = registry.counter("honestballot_sessions_started_total", "Sessions created")
+
+# Audit log and background work
+AUDIT_EVENTS = registry.counter("honestballot_audit_events_total", "Audit log entries written, by action type", ("action_type",))
+NEWS_QUEUE_DEPTH = registry.gauge("honestballot_news_analysis_queue_depth", "News posts waiting for analysis")
+
+# Cross-worker event bus
+BUS_EVENTS = registry.counter("honestballot_bus_events_total", "Event bus messages by direction (published, received)", ("direction",))
+
+# Backups
+BACKUPS = registry.counter("honestballot_backups_total", "Scheduled snapshot attempts by outcome (created, skipped, failed)", ("outcome",))
+BACKUP_SECONDS = registry.histogram("honestballot_backup_duration_seconds", "Time to copy, check and record one snapshot",
+                                    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0))
+
+# Read replica
+REPLICA_REFRESHES = registry.counter("honestballot_replica_refreshes_total", "Read replica refreshes by outcome (copied, unchanged, failed)", ("outcome",))
+REPLICA_REFRESH_SECONDS = registry.histogram("honestballot_replica_refresh_duration_seconds", "Time to copy the database into the read replica",
+                                             buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0))
+REPLICA_LAG_SECONDS = registry.gauge("honestballot_replica_lag_seconds", "Age of the read replica when a report last used it")
+
+# Startup
+STARTUP_PHASE_SECONDS = registry.gauge("honestballot_startup_phase_seconds", "Time spent in each cold-start phase and first view import", ("phase",))
+
+# Database
+DB_QUERY_SECONDS = registry.histogram("honestballot_db_query_duration_seconds", "SQL statement latency including fetch, by statement kind", ("statement",))
+DB_QUERY_ERRORS = registry.counter("honestballot_db_query_errors_total", "SQL statements that raised, by statement kind", ("statement",))
+DB_LOCK_WAIT_SECONDS = registry.histogram("honestballot_db_lock_wait_seconds", "Time spent waiting for the shared database lock")
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass  # Scrapes every few seconds would flood the console
+
+
+_server: Optional[ThreadingHTTPServer] = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(host: str = None, port: int = None) -> ThreadingHTTPServer:
+    """Serve /metrics on a side port in a daemon thread; returns the running server"""
+    global _server
+    if host is None:
+        host = Config.METRICS_HOST if Config else "127.0.0.1"
+    if port is None:
+        port = Config.METRICS_PORT if Config else 9108
+    with _server_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name="metrics-server", daemon=True).start()
+        return _server
+
+
+def stop_metrics_server():
+    global _server
+    with _server_lock:
+        if _server is not None:
+            _server.shutdown()
+            _server.server_close()
+            _server = None
@@ -1,4 +1,16 @@
 # Services - Data access, APIs, business logic
 from .ai_service import AIService, RecommendationEngine
+from .analytics_service import AnalyticsSnapshot, AnalyticsSnapshotBuilder, AnalyticsScheduler, get_analytics_scheduler
+from .news_analysis_service import NewsAnalysisPipeline, get_news_pipeline
+from .search_controller import SearchController
+from .render_profiler import RenderProfiler, RenderSample, get_render_profiler, profile_render, profiled
+from .event_bus import EventBus, SqliteEventBus, get_event_bus
+from .backup_service import BackupScheduler, get_backup_scheduler
+from .replica_service import ReplicaRefresher, get_read_replica, get_reporting_database
 
-__all__ = ['AIService', 'RecommendationEngine']
+__all__ = ['AIService', 'RecommendationEngine', 'AnalyticsSnapshot', 'AnalyticsSnapshotBuilder',
+           'AnalyticsScheduler', 'get_analytics_scheduler',
+           'NewsAnalysisPipeline', 'get_news_pipeline', 'SearchController',
+           'RenderProfiler', 'RenderSample', 'get_render_profiler', 'profile_render', 'profiled',
+           'EventBus', 'SqliteEventBus', 'get_event_bus', 'BackupScheduler', 'get_backup_scheduler',
+           'ReplicaRefresher', 'get_read_replica', 'get_reporting_database']
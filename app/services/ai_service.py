@@ -4,7 +4,7 @@ Uses lightweight rule-based inference without external API dependencies
 """
 
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 from collections import Counter
 
 
@@ -65,9 +65,9 @@ class AIService:
         Calculate compatibility score between voter preferences and politician
         Returns score (0-100) and list of matching areas
         """
-        biography = politician.get("biography", "").lower()
-        position = politician.get("position", "").lower()
-        party = politician.get("party", "").lower()
+        biography = (politician.get("biography") or "").lower()
+        position = (politician.get("position") or "").lower()
+        party = (politician.get("party") or "").lower()
         
         combined_text = f"{biography} {position} {party}"
         
@@ -94,10 +94,13 @@ class AIService:
         
         return min(100, max(0, score)), matches
     
-    def get_candidate_insights(self, politician: Dict) -> Dict:
-        """Generate comprehensive insights about a candidate"""
-        biography = politician.get("biography", "")
-        
+    def get_candidate_insights(self, politician: Dict, counts: Optional[Dict] = None) -> Dict:
+        """
+        Generate comprehensive insights about a candidate
+        Pass precomputed verification/legal record counts to skip the per-candidate queries
+        """
+        biography = politician.get("biography") or ""
+
         insights = {
             "themes": self._extract_themes(biography),
             "sentiment_score": self._analyze_sentiment(biography),
@@ -105,9 +108,14 @@ class AIService:
             "key_strengths": self._identify_strengths(biography),
             "focus_areas": self._get_focus_areas(biography),
         }
-        
-        # Add verification status if db available
-        if self.db:
+
+        if counts is not None:
+            insights["verified_achievements"] = counts.get("verified_achievements", 0)
+            insights["pending_verifications"] = counts.get("pending_verifications", 0)
+            insights["legal_records"] = counts.get("legal_records", 0)
+            insights["verified_records"] = counts.get("verified_records", 0)
+        elif self.db:
+            # Add verification status if db available
             verifications = self.db.get_verifications_by_politician(politician.get("id", 0))
             insights["verified_achievements"] = len([v for v in verifications if v[4] == 'verified'])
             insights["pending_verifications"] = len([v for v in verifications if v[4] == 'pending'])
@@ -128,20 +136,32 @@ class AIService:
             "candidate1": {
                 "name": candidate1.get("full_name") or candidate1.get("username"),
                 "insights": insights1,
-                "overall_score": self._calculate_overall_score(insights1),
+                "overall_score": self.calculate_overall_score(insights1),
             },
             "candidate2": {
                 "name": candidate2.get("full_name") or candidate2.get("username"),
                 "insights": insights2,
-                "overall_score": self._calculate_overall_score(insights2),
+                "overall_score": self.calculate_overall_score(insights2),
             },
             "comparison_summary": self._generate_comparison_summary(candidate1, candidate2, insights1, insights2),
         }
         
         return comparison
     
+    def analyze_news_post(self, title: str, content: str) -> Dict:
+        """Derive sentiment and weighted themes for a news post"""
+        text = f"{title or ''} {content or ''}"
+        return {
+            "sentiment": self._analyze_sentiment(text),
+            "themes": dict(self._theme_matches(text)),
+        }
+    
     def _extract_themes(self, text: str) -> List[str]:
         """Extract key themes from text"""
+        return [t[0] for t in self._theme_matches(text)]
+    
+    def _theme_matches(self, text: str) -> List[Tuple[str, int]]:
+        """(theme name, keyword matches) pairs, most frequent first"""
         text_lower = text.lower()
         themes = []
         
@@ -150,9 +170,9 @@ class AIService:
             if matches > 0:
                 themes.append((theme.replace("_", " ").title(), matches))
         
-        # Sort by frequency and return theme names
+        # Sort by frequency
         themes.sort(key=lambda x: x[1], reverse=True)
-        return [t[0] for t in themes]
+        return themes
     
     def _analyze_sentiment(self, text: str) -> float:
         """Simple sentiment analysis (-1 to 1)"""
@@ -218,8 +238,8 @@ class AIService:
         areas.sort(key=lambda x: x["relevance"], reverse=True)
         return areas[:5]
     
-    def _calculate_overall_score(self, insights: Dict) -> int:
-        """Calculate overall candidate score"""
+    def calculate_overall_score(self, insights: Dict) -> int:
+        """Calculate an overall 0-100 candidate score from get_candidate_insights() output"""
         score = 50  # Base
         
         # Sentiment bonus
@@ -248,8 +268,8 @@ class AIService:
         name1 = c1.get("full_name") or c1.get("username", "Candidate 1")
         name2 = c2.get("full_name") or c2.get("username", "Candidate 2")
         
-        score1 = self._calculate_overall_score(i1)
-        score2 = self._calculate_overall_score(i2)
+        score1 = self.calculate_overall_score(i1)
+        score2 = self.calculate_overall_score(i2)
         
         summary_parts = []
         
@@ -287,46 +307,116 @@ class RecommendationEngine:
         self.db = db
         self.ai = ai_service or AIService(db)
     
-    def get_recommendations(self, voter_preferences: List[str], position: str = None, limit: int = 5) -> List[Dict]:
-        """Get recommended candidates based on voter preferences"""
+    def get_recommendations(self, voter_preferences: List[str], position: str = None, limit: int = 5,
+                            on_compute: Callable[[], None] = None) -> List[Dict]:
+        """Get recommended candidates based on voter preferences
+        
+        The ranking (ids and scores only) is cached per preference set, so a hit
+        loads just the top limit candidates. on_compute is called before a cache
+        miss is ranked, e.g. to show a loading indicator.
+        """
+        cache_key = self.cache_key(voter_preferences, position)
+        if self.db:
+            cached = self.db.get_cached_recommendations(cache_key)
+            # Entries cached before rankings were stored as ids are lists; those are ranked again
+            if isinstance(cached, dict):
+                ranked = cached["ranked"][:limit]
+                return self._load_recommendations(voter_preferences, ranked)
+        
+        if on_compute:
+            on_compute()
+        recommendations = self._rank_candidates(voter_preferences, position)
+        
+        # Full ranking is cached so every limit is served from one entry
+        if self.db:
+            ranked = [[rec["politician"]["id"], rec["compatibility_score"]] for rec in recommendations]
+            self.db.save_cached_recommendations(cache_key, {"ranked": ranked})
+        
+        return recommendations[:limit]
+    
+    def is_cached(self, voter_preferences: List[str], position: str = None) -> bool:
+        """Whether recommendations for these preferences can be served from the cache"""
+        return bool(self.db) and isinstance(
+            self.db.get_cached_recommendations(self.cache_key(voter_preferences, position)), dict
+        )
+    
+    @staticmethod
+    def cache_key(voter_preferences: List[str], position: str = None) -> str:
+        """Canonical key: the same preference set in any order maps to one entry"""
+        return f"{position or '*'}|{','.join(sorted(set(voter_preferences)))}"
+    
+    def _rank_candidates(self, voter_preferences: List[str], position: str = None) -> List[Dict]:
+        """Score every candidate against the preferences, best match first"""
         politicians = self.db.get_users_by_role("politician") if self.db else []
+        verification_counts = self.db.get_verification_counts_by_politician() if self.db else {}
+        legal_counts = self.db.get_legal_record_counts_by_politician() if self.db else {}
         
         recommendations = []
-        
         for pol in politicians:
+            # Filter by position if specified
+            if position and pol[7] != position:
+                continue
             politician_dict = {
                 "id": pol[0],
                 "username": pol[1],
-                "email": pol[2],
                 "full_name": pol[5],
                 "position": pol[7],
                 "party": pol[8],
                 "biography": pol[9],
-                "profile_image": pol[10],
             }
-            
-            # Filter by position if specified
-            if position and politician_dict["position"] != position:
-                continue
-            
-            # Calculate compatibility
-            score, matches = self.ai.calculate_compatibility_score(voter_preferences, politician_dict)
-            
-            # Get insights
-            insights = self.ai.get_candidate_insights(politician_dict)
-            
-            recommendations.append({
-                "politician": politician_dict,
-                "compatibility_score": score,
-                "matching_areas": matches,
-                "insights": insights,
-                "reason": self._generate_recommendation_reason(politician_dict, matches, insights),
-            })
+            recommendations.append(
+                self._recommendation(politician_dict, voter_preferences, verification_counts, legal_counts)
+            )
         
         # Sort by compatibility score
         recommendations.sort(key=lambda x: x["compatibility_score"], reverse=True)
         
-        return recommendations[:limit]
+        return recommendations
+    
+    def _load_recommendations(self, voter_preferences: List[str], ranked: List[List]) -> List[Dict]:
+        """Build recommendations for cached (id, score) pairs, reading only those candidates"""
+        ids = [politician_id for politician_id, _ in ranked]
+        rows = {row[0]: row for row in self.db.get_politicians_by_ids(ids)}
+        verification_counts = self.db.get_verification_counts_by_politician(ids)
+        legal_counts = self.db.get_legal_record_counts_by_politician(ids)
+        
+        recommendations = []
+        for politician_id, score in ranked:
+            row = rows.get(politician_id)
+            if row is None:
+                continue
+            politician_dict = {
+                "id": row[0],
+                "username": row[1],
+                "full_name": row[2],
+                "position": row[3],
+                "party": row[4],
+                "biography": row[5],
+            }
+            recommendations.append(self._recommendation(
+                politician_dict, voter_preferences, verification_counts, legal_counts, score=score
+            ))
+        return recommendations
+    
+    def _recommendation(self, politician: Dict, voter_preferences: List[str], verification_counts: Dict,
+                        legal_counts: Dict, score: int = None) -> Dict:
+        """One recommendation entry, with insights from batched counts instead of per-candidate queries"""
+        compatibility, matches = self.ai.calculate_compatibility_score(voter_preferences, politician)
+        v_counts = verification_counts.get(politician["id"], {})
+        l_counts = legal_counts.get(politician["id"], {})
+        insights = self.ai.get_candidate_insights(politician, counts={
+            "verified_achievements": v_counts.get("verified", 0),
+            "pending_verifications": v_counts.get("pending", 0),
+            "legal_records": l_counts.get("total", 0),
+            "verified_records": l_counts.get("verified", 0),
+        })
+        return {
+            "politician": politician,
+            "compatibility_score": compatibility if score is None else score,
+            "matching_areas": matches,
+            "insights": insights,
+            "reason": self._generate_recommendation_reason(politician, matches, insights),
+        }
     
     def get_similar_candidates(self, politician_id: int, limit: int = 3) -> List[Dict]:
         """Find candidates similar to a given politician"""
@@ -0,0 +1,425 @@
+"""
+Analytics Service - Single-pass aggregation of election analytics
+Gathers every input the analytics page needs in a handful of set-based queries
+and derives stats, chart series and insight inputs from that one read
+"""
+
+import threading
+import weakref
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+from app.services.ai_service import AIService
+from app.storage.database import Database
+
+try:
+    from app.config import Config
+except ImportError:
+    Config = None
+
+
+# Palette mirrors ChartColors.MIXED; kept here so the service stays free of UI imports
+SERIES_COLORS = ["#5C6BC0", "#4CAF50", "#FF9800", "#F44336", "#9C27B0", "#00BCD4", "#795548", "#607D8B"]
+
+
+@dataclass(frozen=True)
+class AnalyticsSnapshot:
+    """Immutable, point-in-time view of election analytics shared by all page sections"""
+
+    stats: Mapping[str, int]
+    chart_data: Mapping[str, Tuple[Dict, ...]]
+    top_candidates: Tuple[Dict, ...]
+    theme_counts: Tuple[Tuple[str, int], ...]
+    experience_levels: Mapping[str, int]
+    verification_totals: Mapping[str, int]
+    candidates_with_verifications: int
+    position_leaders: Tuple[Tuple[str, str, int], ...]
+    candidates_with_votes: int
+    politicians: Tuple[Dict, ...] = ()
+    news_themes: Tuple[Dict, ...] = ()
+    news_sentiment: Tuple[Dict, ...] = ()
+    # Turnout as (bucket_start, vote_count) rows: per minute overall, per hour by position
+    turnout_series: Tuple[Tuple[str, int], ...] = ()
+    turnout_by_position: Mapping[str, Tuple[Tuple[str, int], ...]] = field(default_factory=lambda: MappingProxyType({}))
+    votes_per_second: float = 0.0
+    built_at: datetime = field(default_factory=datetime.now)
+    # Statements run to build the snapshot, as measured while building it
+    query_count: int = 0
+
+    @property
+    def candidate_count(self) -> int:
+        return self.stats.get("candidates", 0)
+
+    def age_seconds(self, now: Optional[datetime] = None) -> float:
+        """Seconds elapsed since the snapshot was built"""
+        return ((now or datetime.now()) - self.built_at).total_seconds()
+
+
+def freeze(value):
+    """Read-only copy of nested rows: dicts become MappingProxyType, lists and tuples tuples"""
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class QueryCounter:
+    """Counts the statements the current thread runs while the block is open"""
+
+    def __init__(self):
+        self.count = 0
+        self._thread = None
+
+    def __enter__(self):
+        self._thread = threading.get_ident()
+        Database.add_query_listener(self._on_query)
+        return self
+
+    def __exit__(self, *exc):
+        Database.remove_query_listener(self._on_query)
+
+    def _on_query(self, sql, elapsed):
+        # Listeners are shared, so statements from other threads are skipped
+        if threading.get_ident() == self._thread:
+            self.count += 1
+
+
+def empty_snapshot() -> AnalyticsSnapshot:
+    """Snapshot used when no database is available"""
+    return AnalyticsSnapshot(
+        stats=MappingProxyType({"candidates": 0, "verified": 0, "votes": 0, "positions": 0}),
+        chart_data=MappingProxyType({
+            "votes_by_position": (),
+            "party_distribution": (),
+            "verification_status": (),
+            "legal_records": (),
+        }),
+        top_candidates=(),
+        theme_counts=(),
+        experience_levels=MappingProxyType({"high": 0, "medium": 0, "emerging": 0, "unknown": 0}),
+        verification_totals=MappingProxyType({"verified": 0, "pending": 0, "rejected": 0}),
+        candidates_with_verifications=0,
+        position_leaders=(),
+        candidates_with_votes=0,
+    )
+
+
+class AnalyticsSnapshotBuilder:
+    """Builds an AnalyticsSnapshot from one batch of aggregate queries"""
+
+    TOP_CANDIDATES_LIMIT = 5
+    # Minute buckets in the overall turnout curve, hour buckets per position
+    TURNOUT_MINUTES = 30
+    TURNOUT_HOURS = 12
+
+    def __init__(self, db, ai_service: AIService = None):
+        self.db = db
+        # Text analysis only; counts are supplied from the batch queries
+        self.ai = ai_service or AIService(None)
+
+    def build(self) -> AnalyticsSnapshot:
+        """Read all inputs once and derive every analytics section from them"""
+        if not self.db:
+            return empty_snapshot()
+
+        with QueryCounter() as queries:
+            # Light rows: the snapshot keeps every politician for as long as it is current
+            politician_rows = self.db.get_politician_summaries()
+            results = self.db.get_election_results()
+            verification_counts = self.db.get_verification_counts_by_politician()
+            legal_counts = self.db.get_legal_record_counts_by_politician()
+            # News features are precomputed by the news analysis pipeline
+            news_themes = self.db.get_news_theme_trends()
+            news_sentiment = self.db.get_news_sentiment_by_politician()
+            # Turnout is read from the pre-bucketed counters, once for every open page
+            turnout_series = self.db.get_turnout_series("minute", limit=self.TURNOUT_MINUTES)
+            turnout_by_position = self.db.get_turnout_by_position("hour", limit=self.TURNOUT_HOURS)
+            votes_per_second = self.db.get_current_vote_rate(window_seconds=60)
+
+        politicians = [self._politician_dict(row) for row in politician_rows]
+
+        verification_totals = {"verified": 0, "pending": 0, "rejected": 0}
+        candidates_with_verifications = 0
+        for pol in politicians:
+            counts = verification_counts.get(pol["id"])
+            if not counts:
+                continue
+            for status in verification_totals:
+                verification_totals[status] += counts[status]
+            if counts["verified"] > 0:
+                candidates_with_verifications += 1
+
+        legal_totals = {"total": 0, "verified": 0, "pending": 0}
+        for counts in legal_counts.values():
+            for key in legal_totals:
+                legal_totals[key] += counts[key]
+
+        total_votes = sum(r[6] for r in results)
+        positions = {p["position"] for p in politicians if p["position"]}
+
+        stats = {
+            "candidates": len(politicians),
+            "verified": verification_totals["verified"],
+            "votes": total_votes,
+            "positions": len(positions),
+        }
+
+        # One pass over biographies feeds both the top-candidate ranking and insights
+        theme_counter = Counter()
+        experience_levels = {"high": 0, "medium": 0, "emerging": 0, "unknown": 0}
+        scored_candidates = []
+        for pol in politicians:
+            v_counts = verification_counts.get(pol["id"], {})
+            l_counts = legal_counts.get(pol["id"], {})
+            insights = self.ai.get_candidate_insights(pol, counts={
+                "verified_achievements": v_counts.get("verified", 0),
+                "pending_verifications": v_counts.get("pending", 0),
+                "legal_records": l_counts.get("total", 0),
+                "verified_records": l_counts.get("verified", 0),
+            })
+            theme_counter.update(insights["themes"])
+            experience_levels[insights["experience_level"]] = experience_levels.get(insights["experience_level"], 0) + 1
+            scored_candidates.append({
+                "politician": pol,
+                "insights": insights,
+                "score": self.ai.calculate_overall_score(insights),
+                "summary": self.ai.generate_candidate_summary(pol),
+            })
+
+        scored_candidates.sort(key=lambda x: x["score"], reverse=True)
+
+        return AnalyticsSnapshot(
+            stats=MappingProxyType(stats),
+            chart_data=freeze(self._chart_data(results, politicians, verification_totals, legal_totals)),
+            top_candidates=freeze(scored_candidates[:self.TOP_CANDIDATES_LIMIT]),
+            theme_counts=tuple(theme_counter.most_common(5)),
+            experience_levels=MappingProxyType(experience_levels),
+            verification_totals=MappingProxyType(verification_totals),
+            candidates_with_verifications=candidates_with_verifications,
+            position_leaders=self._position_leaders(results),
+            candidates_with_votes=len([r for r in results if r[6] > 0]),
+            politicians=freeze(politicians),
+            news_themes=freeze(news_themes),
+            news_sentiment=freeze(news_sentiment),
+            turnout_series=freeze(turnout_series),
+            turnout_by_position=freeze(turnout_by_position),
+            votes_per_second=votes_per_second,
+            query_count=queries.count,
+        )
+
+    def _politician_dict(self, row) -> Dict:
+        """Convert a get_politician_summaries row into the dict shape used by AIService"""
+        return {
+            "id": row[0],
+            "username": row[1],
+            "full_name": row[2],
+            "position": row[3],
+            "party": row[4],
+            "biography": row[5] or "",
+        }
+
+    def _chart_data(self, results, politicians: List[Dict], verification_totals: Dict, legal_totals: Dict) -> Dict:
+        """Derive chart series from the already-fetched rows"""
+        position_votes = {}
+        for r in results:
+            pos = r[3] or "Unknown"
+            position_votes[pos] = position_votes.get(pos, 0) + r[6]
+
+        party_counts = {}
+        for pol in politicians:
+            party = pol["party"] or "Independent"
+            party_counts[party] = party_counts.get(party, 0) + 1
+
+        return {
+            "votes_by_position": self._series(position_votes),
+            "party_distribution": self._series(party_counts),
+            "verification_status": (
+                {"label": "Verified", "value": verification_totals["verified"], "color": "#4CAF50"},
+                {"label": "Pending", "value": verification_totals["pending"], "color": "#FF9800"},
+                {"label": "Rejected", "value": verification_totals["rejected"], "color": "#F44336"},
+            ),
+            "legal_records": (
+                {"label": "Total Records", "value": legal_totals["total"], "color": "#5C6BC0"},
+                {"label": "Verified", "value": legal_totals["verified"], "color": "#4CAF50"},
+                {"label": "Pending", "value": legal_totals["pending"], "color": "#FF9800"},
+            ),
+        }
+
+    def _series(self, counts: Dict[str, int]) -> Tuple[Dict, ...]:
+        return tuple(
+            {"label": label, "value": value, "color": SERIES_COLORS[i % len(SERIES_COLORS)]}
+            for i, (label, value) in enumerate(counts.items())
+        )
+
+    def _position_leaders(self, results) -> Tuple[Tuple[str, str, int], ...]:
+        """(position, leader name, votes) per position, in result order"""
+        leaders = {}
+        for r in results:
+            pos = r[3] or "Unknown"
+            if pos not in leaders or r[6] > leaders[pos][1]:
+                leaders[pos] = (r[1] or r[2], r[6])
+        return tuple((pos, name, votes) for pos, (name, votes) in leaders.items())
+
+
+def turnout_chart_series(rows, label_format: str = "%H:%M") -> Tuple[Dict, ...]:
+    """Convert (bucket_start, vote_count) rows into chart data with local-time labels"""
+    series = []
+    for bucket_start, vote_count in rows:
+        try:
+            started = datetime.strptime(bucket_start, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+            label = started.astimezone().strftime(label_format)
+        except (TypeError, ValueError):
+            label = str(bucket_start)
+        series.append({"label": label, "value": vote_count})
+    return tuple(series)
+
+
+class AnalyticsScheduler:
+    """
+    Rebuilds analytics snapshots on a background worker (stale-while-revalidate)
+    Views read latest() immediately; a rebuild runs every interval_seconds and
+    shortly after writes to tables the analytics depend on (votes excepted).
+    """
+
+    # Writes to these tables make the current snapshot stale
+    # "replica" is announced after the read replica is refreshed, for snapshots built from it;
+    # starting/stopping voting or switching election session changes which votes are counted
+    RELEVANT_TABLES = ("users", "votes", "achievement_verifications", "legal_records", "news_post_features",
+                       "election_sessions", "voting_status", "replica")
+    # Votes stream in continuously while voting is open, and the page already patches its vote
+    # count from live results deltas; they wait for the regular interval instead of waking the worker
+    INTERVAL_ONLY_TABLES = ("votes",)
+
+    def __init__(self, db, interval_seconds: int = None, debounce_seconds: float = 1.0,
+                 builder: AnalyticsSnapshotBuilder = None):
+        if interval_seconds is None:
+            interval_seconds = Config.ANALYTICS_REFRESH_SECONDS if Config else 30
+        self.db = db
+        self.interval_seconds = interval_seconds
+        self.debounce_seconds = debounce_seconds
+        self.builder = builder or AnalyticsSnapshotBuilder(db)
+
+        self._snapshot: Optional[AnalyticsSnapshot] = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._subscribers: List[Callable[[], Optional[Callable[[AnalyticsSnapshot], None]]]] = []
+
+    def latest(self) -> AnalyticsSnapshot:
+        """Return the newest snapshot, building one synchronously only if none exists yet"""
+        snapshot = self._snapshot
+        if snapshot is None:
+            snapshot = self.refresh()
+        return snapshot
+
+    def refresh(self) -> AnalyticsSnapshot:
+        """Rebuild the snapshot now and notify subscribers"""
+        with self._lock:
+            snapshot = self.builder.build()
+            self._snapshot = snapshot
+        # Drop subscribers whose view was garbage-collected without unsubscribing
+        self._subscribers = [ref for ref in self._subscribers if ref() is not None]
+        for ref in list(self._subscribers):
+            callback = ref()
+            if callback is None:
+                continue
+            try:
+                callback(snapshot)
+            except Exception as e:
+                print(f"Error notifying analytics subscriber: {e}")
+        return snapshot
+
+    def request_refresh(self):
+        """Ask the worker to rebuild soon; repeated requests are coalesced"""
+        self._wake.set()
+
+    def subscribe(self, callback: Callable[[AnalyticsSnapshot], None]):
+        """
+        Register a callback receiving each new snapshot (called on the worker thread)
+        Bound methods are held weakly, so a page whose session ends without
+        unmounting is not kept alive (or notified) by the process-wide scheduler.
+        """
+        if not any(ref() == callback for ref in self._subscribers):
+            self._subscribers = self._subscribers + [_subscriber_ref(callback)]
+
+    def unsubscribe(self, callback: Callable[[AnalyticsSnapshot], None]):
+        self._subscribers = [ref for ref in self._subscribers if ref() not in (None, callback)]
+
+    def rebind(self, db):
+        """Build future snapshots from db; the current one is kept until the rebuild lands"""
+        with self._lock:
+            self.db = db
+            self.builder.db = db
+        self.request_refresh()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Start the background worker and listen for relevant writes"""
+        if self.running:
+            return
+        self._stopped.clear()
+        Database.add_change_listener(self._on_db_change)
+        self._thread = threading.Thread(target=self._run, name="analytics-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the background worker"""
+        Database.remove_change_listener(self._on_db_change)
+        self._stopped.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _on_db_change(self, table, details):
+        if table in self.RELEVANT_TABLES and table not in self.INTERVAL_ONLY_TABLES:
+            self.request_refresh()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            triggered = self._wake.wait(self.interval_seconds)
+            if self._stopped.is_set():
+                break
+            if triggered:
+                # Let a burst of writes settle so it costs one rebuild
+                self._stopped.wait(self.debounce_seconds)
+                self._wake.clear()
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Error rebuilding analytics snapshot: {e}")
+
+
+def _subscriber_ref(callback):
+    """Weak reference for bound methods; plain functions are held as-is"""
+    if hasattr(callback, "__self__"):
+        return weakref.WeakMethod(callback)
+    return lambda: callback
+
+
+_scheduler: Optional[AnalyticsScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_analytics_scheduler(db) -> AnalyticsScheduler:
+    """
+    Return the process-wide analytics scheduler, starting it on first use
+    A different db (e.g. reporting fell back from the read replica to the
+    primary, or back again) rebinds the scheduler instead of being ignored.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = AnalyticsScheduler(db)
+            _scheduler.start()
+        elif _scheduler.db is not db:
+            _scheduler.rebind(db)
+        return _scheduler
@@ -0,0 +1,122 @@
+"""
+Backup Service - Scheduled point-in-time snapshots of the database
+Takes a snapshot every BACKUP_INTERVAL_MINUTES while the database has
+changed since the last one, on a background thread in the main process
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from app.metrics import BACKUP_SECONDS, BACKUPS
+from app.security_logger import logger as app_logger
+from app.storage.backup import BackupManager, BackupResult
+from app.storage.vote_ledger import connect_read_only
+
+try:
+    from app.config import Config
+except ImportError:
+    Config = None
+
+
+backup_logger = app_logger.getChild("backup")
+
+
+class BackupScheduler:
+    """
+    Snapshots the database on an interval, skipping intervals with no writes
+    Changes are detected with PRAGMA data_version on the scheduler's own
+    connection, so writes from any worker process count.
+    """
+    
+    def __init__(self, manager: BackupManager = None, interval_seconds: float = None):
+        if interval_seconds is None:
+            interval_seconds = (Config.BACKUP_INTERVAL_MINUTES if Config else 60) * 60
+        self.manager = manager or BackupManager()
+        self.interval_seconds = interval_seconds
+        self.last_result: Optional[BackupResult] = None
+        
+        self._watch: Optional[sqlite3.Connection] = None
+        self._seen_version = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self):
+        """Start the background worker; the first snapshot is taken one interval from now"""
+        if self.running:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="backup-scheduler", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 5.0):
+        self._stopped.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        with self._lock:
+            if self._watch is not None:
+                self._watch.close()
+                self._watch = None
+    
+    def has_changes(self) -> bool:
+        """Whether anything was committed since the last snapshot (always true before the first)"""
+        with self._lock:
+            if self._watch is None:
+                self._watch = connect_read_only(str(self.manager.db_path))
+                self._watch.rollback()  # Only used for data_version, never holds a read transaction
+            version = self._watch.execute('PRAGMA data_version').fetchone()[0]
+            return self._seen_version is None or version != self._seen_version
+    
+    def snapshot(self, force: bool = False) -> Optional[BackupResult]:
+        """Take a snapshot now if the database changed (or force); returns it, or None if skipped"""
+        if not self.has_changes() and not force:
+            BACKUPS.inc(outcome="skipped")
+            return None
+        # Writes committed while the copy runs make the next interval's snapshot due
+        with self._lock:
+            self._seen_version = self._watch.execute('PRAGMA data_version').fetchone()[0]
+        started = time.perf_counter()
+        try:
+            result = self.manager.create_snapshot()
+        except Exception as e:
+            BACKUPS.inc(outcome="failed")
+            backup_logger.error(f"Backup failed | {type(e).__name__}: {e}")
+            # Retry next interval even if nothing else is written
+            self._seen_version = None
+            return None
+        BACKUPS.inc(outcome="created")
+        BACKUP_SECONDS.observe(time.perf_counter() - started)
+        backup_logger.info(
+            f"Backup created | {result.path} | {result.size_bytes}B | {result.seconds * 1000:.0f}ms "
+            f"| steps={result.steps} restarts={result.restarts}"
+        )
+        self.last_result = result
+        return result
+    
+    def _run(self):
+        while not self._stopped.wait(self.interval_seconds):
+            try:
+                self.snapshot()
+            except Exception as e:
+                print(f"Error in backup scheduler: {e}")
+
+
+_scheduler: Optional[BackupScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def get_backup_scheduler() -> BackupScheduler:
+    """Return the process-wide backup scheduler, starting it on first use"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = BackupScheduler()
+            _scheduler.start()
+        return _scheduler
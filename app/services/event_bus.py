@@ -0,0 +1,273 @@
+"""
+Event Bus - Broadcasts session events to every worker process
+Flet pubsub only reaches sessions in the process that sent a message; with
+several server workers, events are also appended to a shared SQLite file
+that each worker polls and re-broadcasts to its own sessions
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Dict, List, Optional
+
+from app.metrics import BUS_EVENTS
+from app.storage.database import Database
+from app.storage.voting_state import invalidate_voting_states
+
+try:
+    from app.config import Config
+except ImportError:
+    Config = None
+
+
+VOTING_STATUS_CHANGED = "voting_status_changed"
+# Another election session became the active one (ballots and results follow it)
+ELECTION_SESSION_CHANGED = "election_session_changed"
+
+
+def encode_message(message) -> str:
+    """JSON-encode a pubsub message, keeping non-string dict keys (e.g. candidate ids)"""
+    def tag(value):
+        if isinstance(value, dict):
+            if all(isinstance(key, str) for key in value):
+                return {key: tag(item) for key, item in value.items()}
+            return {"__items__": [[key, tag(item)] for key, item in value.items()]}
+        if isinstance(value, (list, tuple)):
+            return [tag(item) for item in value]
+        return value
+    return json.dumps(tag(message))
+
+
+def decode_message(payload: str):
+    """Inverse of encode_message"""
+    def untag(value):
+        if isinstance(value, dict):
+            if set(value) == {"__items__"}:
+                return {key: untag(item) for key, item in value["__items__"]}
+            return {key: untag(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [untag(item) for item in value]
+        return value
+    return untag(json.loads(payload))
+
+
+class EventBus:
+    """Single-process bus: publishing is a pubsub send_all to this process's sessions"""
+    
+    def __init__(self):
+        self._pubsub = None
+        self._listeners = []
+    
+    def attach(self, pubsub):
+        """Deliver through this pubsub client (any session's client reaches every session)"""
+        self._pubsub = pubsub
+    
+    @property
+    def running(self) -> bool:
+        return True
+    
+    def start(self):
+        pass
+    
+    def stop(self, timeout: float = 5.0):
+        pass
+    
+    def publish(self, message: Dict, pubsub=None):
+        """Send message to every session; pubsub overrides the attached client"""
+        BUS_EVENTS.inc(direction="published")
+        self._deliver(message, pubsub)
+    
+    def add_listener(self, listener):
+        """Register a callback for events published by other workers, run once per process"""
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+    
+    def remove_listener(self, listener):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+    
+    # Lets the bus stand in for a pubsub client (see ResultsBroadcaster.attach)
+    def send_all(self, message: Dict):
+        self.publish(message)
+    
+    def _deliver(self, message: Dict, pubsub=None):
+        pubsub = pubsub or self._pubsub
+        if pubsub:
+            try:
+                pubsub.send_all(message)
+            except Exception as e:
+                print(f"Error delivering bus event: {e}")
+
+
+class SqliteEventBus(EventBus):
+    """Fanout between worker processes through an append-only SQLite table
+    
+    Each published message is delivered locally at once and stored with the
+    publishing worker's id; a poller thread in every worker delivers rows from
+    the other workers. Rows older than the retention window are pruned.
+    """
+    
+    def __init__(self, path: str = None, poll_interval: float = None, retention_seconds: float = None):
+        super().__init__()
+        if path is None:
+            path = Config.EVENT_BUS_PATH if Config else "voting_app_events.db"
+        if poll_interval is None:
+            poll_interval = (Config.EVENT_BUS_POLL_MS if Config else 200) / 1000
+        if retention_seconds is None:
+            retention_seconds = Config.EVENT_BUS_RETENTION_SECONDS if Config else 300
+        self.path = path
+        self.poll_interval = poll_interval
+        self.retention_seconds = retention_seconds
+        self.worker_id = uuid.uuid4().hex
+        
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._last_id = 0
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def open(self):
+        """Create the events table if needed; only events published after this are received"""
+        with self._lock:
+            if self._connection is not None:
+                return
+            self._connection = sqlite3.connect(self.path, check_same_thread=False, timeout=5)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('''
+                CREATE TABLE IF NOT EXISTS bus_events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    origin TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            ''')
+            self._connection.commit()
+            self._last_id = self._connection.execute('SELECT COALESCE(MAX(id), 0) FROM bus_events').fetchone()[0]
+    
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+    
+    def start(self):
+        """Open the events file and start polling it"""
+        if self.running:
+            return
+        self.open()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="event-bus", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 5.0):
+        self._stopped.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+        self.close()
+    
+    def publish(self, message: Dict, pubsub=None):
+        """Deliver to this worker's sessions now and to the other workers on their next poll"""
+        super().publish(message, pubsub)
+        self.open()
+        try:
+            with self._lock:
+                self._connection.execute(
+                    'INSERT INTO bus_events (origin, payload, created_at) VALUES (?, ?, ?)',
+                    (self.worker_id, encode_message(message), time.time())
+                )
+                self._connection.commit()
+        except Exception as e:
+            print(f"Error publishing bus event: {e}")
+    
+    def poll(self) -> List[Dict]:
+        """Deliver events other workers published since the last poll; returns them"""
+        self.open()
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT id, origin, payload FROM bus_events WHERE id > ? ORDER BY id',
+                (self._last_id,)
+            ).fetchall()
+            if rows:
+                self._last_id = rows[-1][0]
+        
+        received = []
+        for _, origin, payload in rows:
+            if origin == self.worker_id:
+                continue
+            try:
+                message = decode_message(payload)
+            except ValueError as e:
+                print(f"Error decoding bus event: {e}")
+                continue
+            BUS_EVENTS.inc(direction="received")
+            for listener in list(self._listeners):
+                try:
+                    listener(message)
+                except Exception as e:
+                    print(f"Error in bus listener: {e}")
+            self._deliver(message)
+            received.append(message)
+        return received
+    
+    def prune(self) -> int:
+        """Delete events older than the retention window; returns how many"""
+        self.open()
+        with self._lock:
+            deleted = self._connection.execute(
+                'DELETE FROM bus_events WHERE created_at < ?',
+                (time.time() - self.retention_seconds,)
+            ).rowcount
+            self._connection.commit()
+        return deleted
+    
+    def _run(self):
+        next_prune = time.monotonic()
+        while not self._stopped.is_set():
+            try:
+                self.poll()
+                if time.monotonic() >= next_prune:
+                    self.prune()
+                    next_prune = time.monotonic() + max(self.retention_seconds / 10, 1)
+            except Exception as e:
+                print(f"Error polling event bus: {e}")
+            self._stopped.wait(self.poll_interval)
+
+
+def _on_remote_event(message):
+    # Another worker started or stopped voting, or switched election session; the next
+    # read reloads the status and active session before sessions react or ballots are stamped
+    if isinstance(message, dict) and message.get("type") in (VOTING_STATUS_CHANGED, ELECTION_SESSION_CHANGED):
+        invalidate_voting_states()
+
+
+def _on_db_change(table, details):
+    # Whoever activates a session (a view, a script), the other workers must drop their cached one
+    if table == "election_sessions" and details.get("action") == "activate":
+        get_event_bus().publish({
+            "type": ELECTION_SESSION_CHANGED,
+            "election_session_id": details.get("election_session_id"),
+        })
+
+
+_bus: Optional[EventBus] = None
+_bus_lock = threading.Lock()
+
+
+def get_event_bus() -> EventBus:
+    """Return the process-wide event bus: SQLite fanout when WORKERS > 1, pubsub only otherwise"""
+    global _bus
+    with _bus_lock:
+        if _bus is None:
+            workers = Config.WORKERS if Config else 1
+            _bus = SqliteEventBus() if workers > 1 else EventBus()
+            _bus.add_listener(_on_remote_event)
+            Database.add_change_listener(_on_db_change)
+            _bus.start()
+        return _bus
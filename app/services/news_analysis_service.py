@@ -0,0 +1,98 @@
+"""
+News Analysis Service - Background sentiment and theme extraction for news posts
+Posts are analyzed once when created or edited; aggregates read the stored features
+"""
+
+import queue
+import threading
+from typing import Dict, Optional
+
+from app.metrics import NEWS_QUEUE_DEPTH
+from app.services.ai_service import AIService
+from app.storage.database import Database
+
+
+class NewsAnalysisPipeline:
+    """Queue-backed worker that stores sentiment and themes for each news post"""
+    
+    def __init__(self, db, ai_service: AIService = None):
+        self.db = db
+        self.ai = ai_service or AIService(None)
+        self._queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self):
+        """Start the worker, queue any posts not analyzed yet and follow new writes"""
+        if self.running:
+            return
+        Database.add_change_listener(self._on_db_change)
+        self._thread = threading.Thread(target=self._run, name="news-analysis", daemon=True)
+        self._thread.start()
+        for post_id in self.db.get_unanalyzed_news_post_ids():
+            self.enqueue(post_id)
+    
+    def stop(self, timeout: float = 5.0):
+        """Stop the worker once queued posts are processed"""
+        Database.remove_change_listener(self._on_db_change)
+        if self._thread:
+            self._queue.put(None)
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def enqueue(self, post_id: int):
+        """Queue a post for analysis"""
+        self._queue.put(post_id)
+    
+    def queue_depth(self) -> int:
+        """Posts waiting to be analyzed"""
+        return self._queue.qsize()
+    
+    def wait_until_idle(self):
+        """Block until every queued post has been analyzed"""
+        self._queue.join()
+    
+    def analyze_post(self, post_id: int) -> Optional[Dict]:
+        """Analyze one post synchronously and store its features"""
+        post = self.db.get_news_post_by_id(post_id)
+        if not post:
+            return None
+        _, author_id, _, title, content = post
+        features = self.ai.analyze_news_post(title, content)
+        self.db.save_news_post_features(post_id, author_id, features["sentiment"], features["themes"])
+        return features
+    
+    def _on_db_change(self, table, details):
+        # Deletes remove their features in the same transaction; re-analysis finds nothing
+        if table == "news_posts" and details.get("post_id"):
+            self.enqueue(details["post_id"])
+    
+    def _run(self):
+        while True:
+            post_id = self._queue.get()
+            try:
+                if post_id is None:
+                    break
+                self.analyze_post(post_id)
+            except Exception as e:
+                print(f"Error analyzing news post {post_id}: {e}")
+            finally:
+                self._queue.task_done()
+
+
+_pipeline: Optional[NewsAnalysisPipeline] = None
+_pipeline_lock = threading.Lock()
+
+
+def get_news_pipeline(db) -> NewsAnalysisPipeline:
+    """Return the process-wide news analysis pipeline, starting it on first use"""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = NewsAnalysisPipeline(db)
+            _pipeline.start()
+            NEWS_QUEUE_DEPTH.set_function(_pipeline.queue_depth)
+        return _pipeline
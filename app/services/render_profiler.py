@@ -0,0 +1,277 @@
+"""
+Render Profiler - Per-render cost sampling for Flet views
+Times view builds and page updates, counts the controls and estimated update
+payload they produce, and attributes the database statements run meanwhile
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import wraps
+from typing import Dict, List, Optional
+
+from app.storage.database import Database
+
+try:
+    from app.config import Config
+except ImportError:
+    Config = None
+
+
+# Child of the security logger's "honestballot" logger, so samples share its handlers
+render_logger = logging.getLogger("honestballot.render")
+
+
+@dataclass(frozen=True)
+class RenderSample:
+    """Cost of one render: a navigation (show_*) or a view builder"""
+    
+    name: str
+    build_ms: float
+    update_ms: float
+    control_count: int
+    payload_bytes: int
+    query_count: int
+    query_ms: float
+    recorded_at: datetime = field(default_factory=datetime.now)
+    
+    @property
+    def total_ms(self) -> float:
+        return self.build_ms + self.update_ms
+    
+    def summary(self) -> str:
+        return (
+            f"{self.name} total={self.total_ms:.1f}ms build={self.build_ms:.1f}ms "
+            f"update={self.update_ms:.1f}ms controls={self.control_count} "
+            f"payload={self.payload_bytes}B queries={self.query_count} ({self.query_ms:.1f}ms)"
+        )
+
+
+class RenderRecorder:
+    """Collects the measurements for one render while its block runs"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.root = None
+        self.query_count = 0
+        self.query_seconds = 0.0
+        self._started = time.perf_counter()
+        self._built_at = None
+    
+    def built(self, root=None):
+        """Mark the end of the build phase; root is the control whose tree is measured"""
+        if root is not None:
+            self.root = root
+        self._built_at = time.perf_counter()
+        return root
+    
+    def _on_query(self, elapsed: float):
+        self.query_count += 1
+        self.query_seconds += elapsed
+    
+    def _finish(self) -> RenderSample:
+        ended = time.perf_counter()
+        built_at = self._built_at or ended
+        control_count, payload_bytes = measure_controls(self.root) if self.root is not None else (0, 0)
+        return RenderSample(
+            name=self.name,
+            build_ms=(built_at - self._started) * 1000,
+            update_ms=(ended - built_at) * 1000,
+            control_count=control_count,
+            payload_bytes=payload_bytes,
+            query_count=self.query_count,
+            query_ms=self.query_seconds * 1000,
+        )
+
+
+class _NullRecorder:
+    """Stand-in handed out while profiling is disabled"""
+    
+    name = None
+    
+    def built(self, root=None):
+        return root
+
+
+def measure_controls(root):
+    """Count the controls under root and estimate the bytes an add/update of it sends"""
+    count = 0
+    payload = 0
+    stack = [root]
+    while stack:
+        control = stack.pop()
+        count += 1
+        try:
+            command = control._build_command(False)
+            payload += len(json.dumps(command.attrs, default=str)) + len(control._get_control_name())
+            stack.extend(control._get_children())
+        except Exception:
+            continue
+    return count, payload
+
+
+class RenderProfiler:
+    """Process-wide store of recent render samples with per-view aggregates"""
+    
+    def __init__(self, enabled: bool = None, history: int = None, slow_ms: float = None):
+        if enabled is None:
+            enabled = Config.RENDER_PROFILING if Config else False
+        if history is None:
+            history = Config.RENDER_PROFILE_HISTORY if Config else 200
+        if slow_ms is None:
+            slow_ms = Config.SLOW_RENDER_MS if Config else 250
+        self.slow_ms = slow_ms
+        self.enabled = False
+        
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=history)
+        self._totals: Dict[str, Dict[str, float]] = {}
+        self._active = threading.local()  # per-thread stack of open recorders
+        self._listeners = []
+        
+        if enabled:
+            self.enable()
+    
+    def enable(self):
+        if not self.enabled:
+            self.enabled = True
+            Database.add_query_listener(self._on_query)
+    
+    def disable(self):
+        if self.enabled:
+            self.enabled = False
+            Database.remove_query_listener(self._on_query)
+    
+    @contextmanager
+    def profile(self, name: str, root=None):
+        """Measure the enclosed block as one render of name"""
+        if not self.enabled:
+            yield _NullRecorder()
+            return
+        
+        recorder = RenderRecorder(name)
+        recorder.root = root
+        stack = self._stack()
+        stack.append(recorder)
+        try:
+            yield recorder
+        finally:
+            stack.remove(recorder)
+            self.record(recorder._finish())
+    
+    def record(self, sample: RenderSample):
+        """Store a sample, log it and notify listeners (e.g. an open debug panel)"""
+        with self._lock:
+            self._samples.append(sample)
+            totals = self._totals.setdefault(sample.name, {
+                "renders": 0, "total_ms": 0.0, "max_ms": 0.0, "controls": 0,
+                "payload_bytes": 0, "queries": 0, "query_ms": 0.0,
+            })
+            totals["renders"] += 1
+            totals["total_ms"] += sample.total_ms
+            totals["max_ms"] = max(totals["max_ms"], sample.total_ms)
+            totals["controls"] += sample.control_count
+            totals["payload_bytes"] += sample.payload_bytes
+            totals["queries"] += sample.query_count
+            totals["query_ms"] += sample.query_ms
+            listeners = list(self._listeners)
+        
+        if sample.total_ms >= self.slow_ms:
+            render_logger.warning(f"Slow render | {sample.summary()}")
+        else:
+            render_logger.debug(sample.summary())
+        
+        for listener in listeners:
+            try:
+                listener(sample)
+            except Exception as e:
+                print(f"Error in render listener: {e}")
+    
+    def recent(self, limit: int = 50) -> List[RenderSample]:
+        """Most recent samples, newest first"""
+        with self._lock:
+            return list(self._samples)[-limit:][::-1]
+    
+    def summary(self) -> List[Dict]:
+        """Per-view averages, slowest first"""
+        with self._lock:
+            rows = [
+                {
+                    "name": name,
+                    "renders": t["renders"],
+                    "avg_ms": t["total_ms"] / t["renders"],
+                    "max_ms": t["max_ms"],
+                    "avg_controls": t["controls"] / t["renders"],
+                    "avg_payload_bytes": t["payload_bytes"] / t["renders"],
+                    "avg_queries": t["queries"] / t["renders"],
+                    "avg_query_ms": t["query_ms"] / t["renders"],
+                }
+                for name, t in self._totals.items()
+            ]
+        return sorted(rows, key=lambda r: r["avg_ms"], reverse=True)
+    
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+    
+    def add_listener(self, listener):
+        with self._lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+    
+    def remove_listener(self, listener):
+        with self._lock:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+    
+    def _stack(self) -> list:
+        stack = getattr(self._active, "stack", None)
+        if stack is None:
+            stack = self._active.stack = []
+        return stack
+    
+    def _on_query(self, sql, elapsed):
+        # Statements count toward every open render on this thread, so a
+        # navigation includes the queries of the view builders it runs
+        for recorder in self._stack():
+            recorder._on_query(elapsed)
+
+
+_profiler: Optional[RenderProfiler] = None
+_profiler_lock = threading.Lock()
+
+
+def get_render_profiler() -> RenderProfiler:
+    """Return the process-wide render profiler"""
+    global _profiler
+    with _profiler_lock:
+        if _profiler is None:
+            _profiler = RenderProfiler()
+        return _profiler
+
+
+def profile_render(name: str, root=None):
+    """Context manager measuring one render; call .built(control) when the build ends"""
+    return get_render_profiler().profile(name, root)
+
+
+def profiled(name: str = None):
+    """Decorator for view builder methods; the view itself is measured as the root"""
+    def decorator(build):
+        @wraps(build)
+        def wrapper(self, *args, **kwargs):
+            profiler = get_render_profiler()
+            if not profiler.enabled:
+                return build(self, *args, **kwargs)
+            with profiler.profile(name or f"{type(self).__name__}.{build.__name__}", root=self) as recorder:
+                result = build(self, *args, **kwargs)
+                recorder.built()
+                return result
+        return wrapper
+    return decorator
@@ -0,0 +1,97 @@
+"""
+Replica Service - Keeps the read replica fresh and routes reports to it
+Refreshes the replica every REPLICA_REFRESH_SECONDS on a background thread
+in the main process; reporting screens get their database from
+get_reporting_database(), which is the replica when REPLICA_ENABLED is set
+"""
+
+import threading
+from typing import Optional
+
+from app.security_logger import logger as app_logger
+from app.storage.database import get_database
+from app.storage.replica import ReadReplica
+
+try:
+    from app.config import Config
+except ImportError:
+    Config = None
+
+
+replica_logger = app_logger.getChild("replica")
+
+
+class ReplicaRefresher:
+    """Refreshes a read replica on an interval (a no-op while nothing is written)"""
+    
+    def __init__(self, replica: ReadReplica, interval_seconds: float = None):
+        if interval_seconds is None:
+            interval_seconds = Config.REPLICA_REFRESH_SECONDS if Config else 15
+        self.replica = replica
+        self.interval_seconds = interval_seconds
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self):
+        if self.running:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="replica-refresher", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 5.0):
+        self._stopped.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def _run(self):
+        while not self._stopped.wait(self.interval_seconds):
+            try:
+                result = self.replica.refresh()
+            except Exception as e:
+                replica_logger.error(f"Replica refresh failed | {type(e).__name__}: {e}")
+                continue
+            if result is not None:
+                replica_logger.debug(
+                    f"Replica refreshed | {result.size_bytes}B | {result.seconds * 1000:.0f}ms "
+                    f"| steps={result.steps} restarts={result.restarts}"
+                )
+
+
+_replica: Optional[ReadReplica] = None
+_refresher: Optional[ReplicaRefresher] = None
+_replica_lock = threading.Lock()
+
+
+def get_read_replica() -> ReadReplica:
+    """Return the process-wide read replica, starting its refresher on first use"""
+    global _replica, _refresher
+    with _replica_lock:
+        if _replica is None:
+            _replica = ReadReplica()
+            _refresher = ReplicaRefresher(_replica)
+            _refresher.start()
+        return _replica
+
+
+def get_reporting_database(primary=None):
+    """The database reporting screens should read
+    
+    The read replica when REPLICA_ENABLED is set, refreshed first if it is
+    older than REPLICA_MAX_STALENESS_SECONDS; otherwise, or if the replica
+    cannot be refreshed, the primary database.
+    """
+    if primary is None:
+        primary = get_database()
+    if not (Config and Config.REPLICA_ENABLED):
+        return primary
+    try:
+        return get_read_replica().database()
+    except Exception as e:
+        replica_logger.warning(f"Read replica unavailable, reporting from the database | {type(e).__name__}: {e}")
+        return primary
@@ -0,0 +1,137 @@
+"""
+Results Broadcaster - Pushes coalesced vote tally deltas to connected sessions
+Committed votes are accumulated and published over Flet pubsub at a bounded rate,
+so live result views patch counts without polling the database
+"""
+
+import threading
+from typing import Dict, Optional
+
+from app.metrics import RESULTS_PENDING_VOTES
+from app.storage.database import Database
+
+try:
+    from app.config import Config
+except ImportError:
+    Config = None
+
+
+RESULTS_DELTA = "results_delta"
+
+
+class ResultsBroadcaster:
+    """Coalesces vote commits into at most max_per_second pubsub messages"""
+    
+    def __init__(self, max_per_second: float = None):
+        if max_per_second is None:
+            max_per_second = Config.RESULTS_PUSH_MAX_PER_SECOND if Config else 2
+        self.min_interval = 1.0 / max(max_per_second, 0.1)
+        
+        self._pubsub = None
+        self._lock = threading.Lock()
+        self._pending = self._empty_delta()
+        self._wake = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    @staticmethod
+    def _empty_delta() -> Dict:
+        return {"candidates": {}, "positions": {}, "total": 0}
+    
+    def attach(self, pubsub):
+        """Publish through this pubsub client (any session's client reaches every session)"""
+        self._pubsub = pubsub
+    
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+    
+    def start(self):
+        """Start following vote commits"""
+        if self.running:
+            return
+        self._stopped.clear()
+        Database.add_change_listener(self._on_db_change)
+        self._thread = threading.Thread(target=self._run, name="results-broadcaster", daemon=True)
+        self._thread.start()
+    
+    def stop(self, timeout: float = 5.0):
+        """Stop publishing; pending deltas are flushed first"""
+        Database.remove_change_listener(self._on_db_change)
+        self._stopped.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+    
+    def record_vote(self, candidate_id, position, count: int = 1):
+        """Add a committed vote to the pending delta"""
+        with self._lock:
+            candidates = self._pending["candidates"]
+            positions = self._pending["positions"]
+            candidates[candidate_id] = candidates.get(candidate_id, 0) + count
+            positions[position] = positions.get(position, 0) + count
+            self._pending["total"] += count
+        self._wake.set()
+    
+    def record_vote_change(self, previous_candidate_id, candidate_id, position):
+        """Move a committed vote between candidates; position and overall totals are unchanged"""
+        if previous_candidate_id == candidate_id:
+            return
+        with self._lock:
+            candidates = self._pending["candidates"]
+            candidates[previous_candidate_id] = candidates.get(previous_candidate_id, 0) - 1
+            candidates[candidate_id] = candidates.get(candidate_id, 0) + 1
+        self._wake.set()
+    
+    def pending_votes(self) -> int:
+        """Votes recorded but not yet published"""
+        return self._pending["total"]
+    
+    def flush(self) -> Optional[Dict]:
+        """Publish the pending delta now; returns the message sent, if any"""
+        with self._lock:
+            # A changed vote moves counts between candidates without adding to the total
+            if not self._pending["candidates"]:
+                return None
+            delta, self._pending = self._pending, self._empty_delta()
+        message = {"type": RESULTS_DELTA, **delta}
+        if self._pubsub:
+            try:
+                self._pubsub.send_all(message)
+            except Exception as e:
+                print(f"Error publishing results delta: {e}")
+        return message
+    
+    def _on_db_change(self, table, details):
+        # cast_vote reports the candidate and position; update_vote also the previous candidate
+        if table != "votes":
+            return
+        if details.get("action") == "cast":
+            self.record_vote(details["candidate_id"], details.get("position"))
+        elif details.get("action") == "update":
+            self.record_vote_change(details["previous_candidate_id"], details["candidate_id"], details.get("position"))
+    
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wake.wait()
+            self._wake.clear()
+            self.flush()
+            # Votes arriving during the pause are coalesced into the next message
+            self._stopped.wait(self.min_interval)
+        self.flush()
+
+
+_broadcaster: Optional[ResultsBroadcaster] = None
+_broadcaster_lock = threading.Lock()
+
+
+def get_results_broadcaster() -> ResultsBroadcaster:
+    """Return the process-wide results broadcaster, starting it on first use"""
+    global _broadcaster
+    with _broadcaster_lock:
+        if _broadcaster is None:
+            _broadcaster = ResultsBroadcaster()
+            _broadcaster.start()
+            RESULTS_PENDING_VOTES.set_function(_broadcaster.pending_votes)
+        return _broadcaster
@@ -0,0 +1,169 @@
+"""
+Search Controller - Debounced, cancellable search for dashboard search boxes
+Keystrokes restart a short timer; only the last query runs, on a worker thread,
+and results from superseded queries are dropped by sequence number
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Iterable, Optional
+
+from app.storage.database import Database
+
+try:
+    from app.config import Config
+except ImportError:
+    Config = None
+
+
+class SearchController:
+    """Runs search_fn(query) for the latest submitted query and hands results to on_results"""
+    
+    def __init__(self, search_fn: Callable, on_results: Callable,
+                 debounce_seconds: float = None, cache_size: int = None,
+                 cache_ttl: float = 60.0, invalidate_on: Iterable[str] = ()):
+        if debounce_seconds is None:
+            debounce_seconds = (Config.SEARCH_DEBOUNCE_MS if Config else 300) / 1000.0
+        if cache_size is None:
+            cache_size = Config.SEARCH_CACHE_SIZE if Config else 32
+        self.search_fn = search_fn
+        self.on_results = on_results
+        self.debounce_seconds = debounce_seconds
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self.invalidate_on = frozenset(invalidate_on)
+        
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._timer: Optional[threading.Timer] = None
+        self._future: Optional[Future] = None
+        self._cache = OrderedDict()  # query -> (stored_at, results)
+    
+    @staticmethod
+    def normalize(query) -> str:
+        return " ".join((query or "").split()).lower()
+    
+    def submit(self, query):
+        """Schedule a search for query, superseding any pending one"""
+        key = self.normalize(query)
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+            self._cancel_pending()
+            cached = self._cache_get(key)
+            if cached is None:
+                self._timer = threading.Timer(self.debounce_seconds, self._dispatch, (seq, query, key))
+                self._timer.daemon = True
+                self._timer.start()
+        
+        if cached is not None:
+            self._deliver(seq, query, cached)
+        return seq
+    
+    def search_now(self, query):
+        """Run a search synchronously (cache first) and return its results"""
+        key = self.normalize(query)
+        with self._lock:
+            cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        results = self.search_fn(query)
+        self._cache_put(key, results)
+        return results
+    
+    def cancel(self):
+        """Drop the pending search and ignore any result still in flight"""
+        with self._lock:
+            self._seq += 1
+            self._cancel_pending()
+    
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+    
+    def attach(self):
+        """
+        Start dropping cached results on writes to invalidate_on tables
+        Call from the owning view's did_mount; the registration is weak, so a
+        session that ends without unmounting does not keep the view alive.
+        """
+        if self.invalidate_on:
+            Database.add_change_listener(self._on_db_change, weak=True)
+    
+    def close(self):
+        """Cancel pending work and stop following database writes"""
+        self.cancel()
+        if self.invalidate_on:
+            Database.remove_change_listener(self._on_db_change)
+    
+    def _cancel_pending(self):
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        if self._future:
+            self._future.cancel()
+            self._future = None
+    
+    def _cache_get(self, key):
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        stored_at, results = entry
+        if time.monotonic() - stored_at > self.cache_ttl:
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return results
+    
+    def _cache_put(self, key, results):
+        with self._lock:
+            self._cache[key] = (time.monotonic(), results)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+    
+    def _dispatch(self, seq, query, key):
+        with self._lock:
+            if seq != self._seq:
+                return
+            self._timer = None
+            self._future = _get_search_executor().submit(self._run, seq, query, key)
+    
+    def _run(self, seq, query, key):
+        # A newer keystroke may have arrived while the timer fired; skip the query
+        if seq != self._seq:
+            return
+        try:
+            results = self.search_fn(query)
+        except Exception as e:
+            print(f"Error running search for '{query}': {e}")
+            return
+        self._cache_put(key, results)
+        self._deliver(seq, query, results)
+    
+    def _deliver(self, seq, query, results):
+        if seq != self._seq:
+            return
+        try:
+            self.on_results(query, results)
+        except Exception as e:
+            print(f"Error showing search results for '{query}': {e}")
+    
+    def _on_db_change(self, table, details):
+        if table in self.invalidate_on:
+            self.clear_cache()
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_search_executor() -> ThreadPoolExecutor:
+    """Return the process-wide pool that runs debounced searches"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="search")
+        return _executor
@@ -0,0 +1,70 @@
+"""
+Startup Timing for HonestBallot
+Records how long each cold-start phase takes (imports, database, services,
+first page) and logs a single report once the first page is on screen
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Optional, Tuple
+
+from app.metrics import STARTUP_PHASE_SECONDS
+from app.security_logger import logger as app_logger
+
+
+startup_logger = app_logger.getChild("startup")
+
+
+class StartupTimer:
+    """Named phase durations measured from process start"""
+    
+    def __init__(self, started: float = None):
+        self.started = started if started is not None else time.perf_counter()
+        self.reported = False
+        self._lock = threading.Lock()
+        self._phases: List[Tuple[str, float]] = []
+    
+    def begin(self, started: float):
+        """Measure from started, a perf_counter() value taken at the top of the entry script"""
+        self.started = started
+    
+    def record(self, name: str, seconds: float):
+        """Add a phase; after the report, later sessions and view imports are only logged at debug"""
+        with self._lock:
+            if not self.reported:
+                self._phases.append((name, seconds))
+                STARTUP_PHASE_SECONDS.set(seconds, phase=name)
+                return
+        startup_logger.debug(f"{name} took {seconds * 1000:.1f}ms")
+    
+    @contextmanager
+    def phase(self, name: str):
+        """Time the enclosed block as one phase"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+    
+    def phases(self) -> List[Tuple[str, float]]:
+        with self._lock:
+            return list(self._phases)
+    
+    def report(self) -> Optional[str]:
+        """Log the phases so far and the total since start; only the first call reports"""
+        with self._lock:
+            if self.reported:
+                return None
+            self.reported = True
+            phases = list(self._phases)
+        total = time.perf_counter() - self.started
+        STARTUP_PHASE_SECONDS.set(total, phase="total")
+        line = f"Startup | total={total * 1000:.1f}ms | " + " ".join(
+            f"{name}={seconds * 1000:.1f}ms" for name, seconds in phases
+        )
+        startup_logger.info(line)
+        return line
+
+
+startup_timer = StartupTimer()
@@ -1,13 +1,15 @@
 import uuid
 from datetime import datetime, timedelta
 from app.storage.database import Database
+from app.metrics import ACTIVE_SESSIONS, SESSIONS_STARTED
 
 
 class SessionManager:
     """Manages user sessions with unique tokens"""
     
-    def __init__(self):
-        self.db = Database()
+    def __init__(self, db=None):
+        # The app hands in the process-wide database; standalone use opens its own
+        self.db = db if db is not None else Database()
         self.sessions = {}  # In-memory session cache
         self.session_timeout = timedelta(hours=8)  # Session timeout
     
@@ -27,6 +29,8 @@ class SessionManager:
             "created_at": datetime.now(),
             "last_activity": datetime.now()
         }
+        ACTIVE_SESSIONS.inc()
+        SESSIONS_STARTED.inc()
         
         return session_token
     
@@ -52,6 +56,7 @@ class SessionManager:
         """End a user session"""
         if session_token in self.sessions:
             del self.sessions[session_token]
+            ACTIVE_SESSIONS.dec()
         self.db.end_session(session_token)
     
     def get_session_user(self, session_token):
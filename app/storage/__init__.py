@@ -1,4 +1,8 @@
 # Storage / Persistence Layer
-from .database import Database, init_demo_data
+from .backends import PostgresBackend, SQLiteBackend, StorageBackend, create_backend
+from .database import Database, VotingClosedError, get_database, init_demo_data
+from .async_database import AsyncDatabase, get_async_database
 
-__all__ = ['Database', 'init_demo_data']
+__all__ = ['Database', 'VotingClosedError', 'get_database', 'init_demo_data',
+           'StorageBackend', 'SQLiteBackend', 'PostgresBackend', 'create_backend',
+           'AsyncDatabase', 'get_async_database']
@@ -0,0 +1,85 @@
+"""
+Async Database - An asyncio facade over Database for async Flet handlers
+Each call runs the ordinary Database method on a small thread pool owned by
+that Database (its connection), so an event loop serving many sessions never
+waits on disk I/O, the database lock or bcrypt.
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from app.storage.database import Database, get_database
+
+try:
+    from app.config import Config
+except ImportError:
+    Config = None
+
+
+class AsyncDatabase:
+    """Awaitable versions of the Database methods used on hot paths
+    
+    Statements are still serialized by the Database's lock, so the pool only
+    needs to be large enough that a few slow calls (a login's bcrypt check)
+    don't queue everything else behind them.
+    """
+    
+    def __init__(self, db: Database, max_workers: int = None):
+        if max_workers is None:
+            max_workers = Config.ASYNC_DB_WORKERS if Config else 4
+        self.db = db
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-async")
+    
+    async def run(self, fn: Callable, *args, **kwargs):
+        """Await fn(*args, **kwargs) run on this database's pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+    
+    async def verify_user_by_username(self, username, password):
+        return await self.run(self.db.verify_user_by_username, username, password)
+    
+    async def verify_user(self, email, password):
+        return await self.run(self.db.verify_user, email, password)
+    
+    async def cast_vote(self, voter_id, candidate_id, position, election_session_id=None):
+        return await self.run(self.db.cast_vote, voter_id, candidate_id, position, election_session_id)
+    
+    async def update_vote(self, voter_id, candidate_id, position, election_session_id=None):
+        return await self.run(self.db.update_vote, voter_id, candidate_id, position, election_session_id)
+    
+    async def get_election_results(self, election_session_id=None):
+        return await self.run(self.db.get_election_results, election_session_id)
+    
+    async def get_news_posts(self, limit=50, offset=0, category=None, author_role=None):
+        return await self.run(self.db.get_news_posts, limit, offset, category, author_role)
+    
+    async def log_action(self, action, action_type, description=None, user_id=None, user_role=None,
+                         target_type=None, target_id=None, details=None, ip_address=None):
+        return await self.run(
+            self.db.log_action, action, action_type, description=description, user_id=user_id,
+            user_role=user_role, target_type=target_type, target_id=target_id, details=details,
+            ip_address=ip_address,
+        )
+    
+    def close(self):
+        """Stop accepting calls; calls already queued still finish"""
+        self._executor.shutdown(wait=False)
+
+
+_async_databases_lock = threading.Lock()
+
+
+def get_async_database(db: Optional[Database] = None) -> AsyncDatabase:
+    """Return the AsyncDatabase for db (the process-wide Database by default), creating it on first use"""
+    if db is None:
+        db = get_database()
+    with _async_databases_lock:
+        # Kept on the Database itself, so the pool lives exactly as long as its connection's owner
+        async_db = getattr(db, "_async_database", None)
+        if async_db is None:
+            async_db = db._async_database = AsyncDatabase(db)
+        return async_db
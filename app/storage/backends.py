@@ -0,0 +1,531 @@
+"""
+Storage Backends - The database engines Database can run on
+SQLiteBackend is the default single-file engine, and the supported one.
+PostgresBackend is experimental: it runs the same Database code against a
+PostgreSQL server, for deployments whose worker processes need to write
+concurrently. Connections come from a pool, and the SQLite dialect Database
+is written in is translated as statements run (placeholders, INSERT OR
+REPLACE/IGNORE, LIKE, column types), with small SQL functions standing in
+for SQLite's date(), datetime() and strftime().
+"""
+
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+try:
+    from app.config import Config
+except ImportError:
+    Config = None
+
+
+POSTGRES_SCHEMES = ("postgres://", "postgresql://")
+SQLITE_SCHEME = "sqlite:///"
+
+
+class StorageBackend:
+    """One database engine: how Database connects to it and where dialects differ
+    
+    connect() returns an object with the sqlite3.Connection methods Database
+    uses (cursor, execute, commit, rollback, close, in_transaction).
+    """
+    
+    name = "base"
+    # File path or URL, for messages and as Database.db_path
+    location = ""
+    # Exception classes raised by the engine's driver, caught by Database
+    Error = Exception
+    IntegrityError = Exception
+    OperationalError = Exception
+    supports_full_text_search = False
+    # Whether every Database on this engine shares Database's process-wide lock
+    # (SQLite); otherwise each Database serializes only its own connection
+    shares_process_lock = False
+    
+    def connect(self):
+        raise NotImplementedError
+    
+    def prepare_schema(self, connection):
+        """Create whatever the engine needs before Database's DDL runs"""
+    
+    def get_schema_version(self, connection) -> int:
+        raise NotImplementedError
+    
+    def set_schema_version(self, connection, version: int):
+        raise NotImplementedError
+    
+    def close(self):
+        """Release engine-wide resources such as a connection pool"""
+
+
+class SQLiteBackend(StorageBackend):
+    """A database file opened with the standard library's sqlite3"""
+    
+    name = "sqlite"
+    Error = sqlite3.Error
+    IntegrityError = sqlite3.IntegrityError
+    OperationalError = sqlite3.OperationalError
+    supports_full_text_search = True
+    shares_process_lock = True
+    
+    def __init__(self, path):
+        self.location = str(path)
+    
+    def connect(self):
+        # Enable check_same_thread=False to allow cross-thread access (safe for this app)
+        return sqlite3.connect(self.location, check_same_thread=False)
+    
+    def get_schema_version(self, connection) -> int:
+        return connection.execute('PRAGMA user_version').fetchone()[0]
+    
+    def set_schema_version(self, connection, version: int):
+        connection.execute(f'PRAGMA user_version = {int(version)}')
+
+
+class Statement(NamedTuple):
+    """A statement translated for PostgreSQL"""
+    
+    sql: str
+    # Column whose generated value becomes cursor.lastrowid (INSERT ... RETURNING)
+    returning: Optional[str] = None
+
+
+# SQLite date/time functions, as PostgreSQL functions over the same text timestamps
+# ('YYYY-MM-DD HH:MM:SS', UTC) with an optional '+/-N unit' modifier
+POSTGRES_SHIM_FUNCTIONS = (
+    '''
+    CREATE OR REPLACE FUNCTION sqlite_time(value text, modifier text DEFAULT NULL) RETURNS timestamp AS $$
+        SELECT (CASE WHEN lower(value) = 'now' THEN now() AT TIME ZONE 'UTC' ELSE value::timestamp END)
+               + COALESCE(modifier::interval, interval '0')
+    $$ LANGUAGE sql STABLE
+    ''',
+    '''
+    CREATE OR REPLACE FUNCTION sqlite_datetime(value text, modifier text DEFAULT NULL) RETURNS text AS $$
+        SELECT to_char(sqlite_time(value, modifier), 'YYYY-MM-DD HH24:MI:SS')
+    $$ LANGUAGE sql STABLE
+    ''',
+    '''
+    CREATE OR REPLACE FUNCTION sqlite_date(value text, modifier text DEFAULT NULL) RETURNS text AS $$
+        SELECT to_char(sqlite_time(value, modifier), 'YYYY-MM-DD')
+    $$ LANGUAGE sql STABLE
+    ''',
+    '''
+    CREATE OR REPLACE FUNCTION sqlite_strftime(fmt text, value text, modifier text DEFAULT NULL) RETURNS text AS $$
+        SELECT to_char(sqlite_time(value, modifier),
+                       replace(replace(replace(replace(replace(replace(replace(fmt,
+                           '%Y', 'YYYY'), '%m', 'MM'), '%d', 'DD'), '%H', 'HH24'), '%M', 'MI'), '%S', 'SS'), '%f', 'SS.MS'))
+    $$ LANGUAGE sql STABLE
+    ''',
+)
+
+# BEGIN IMMEDIATE takes SQLite's write lock up front; the closest PostgreSQL
+# equivalent serializes those transactions on one advisory lock
+IMMEDIATE_LOCK_SQL = "SELECT pg_advisory_xact_lock(hashtext('honestballot.begin_immediate'))"
+
+_DDL_REPLACEMENTS = (
+    (re.compile(r"\bINTEGER\s+PRIMARY\s+KEY\s+AUTOINCREMENT\b", re.I), "INTEGER GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY"),
+    # Types follow a column name, so a column named after a type (votes.timestamp) keeps its name.
+    # Timestamps stay text, as in SQLite, so reads return the same strings
+    (re.compile(r"(\w\s+)TIMESTAMP\b", re.I), r"\1TEXT"),
+    (re.compile(r"(\w\s+)BOOLEAN\b", re.I), r"\1INTEGER"),
+    (re.compile(r"(\w\s+)BLOB\b", re.I), r"\1BYTEA"),
+    # SQLite here never enforces foreign keys (PRAGMA foreign_keys is off), so
+    # neither does the PostgreSQL schema: deleting a user keeps their history
+    (re.compile(r",\s*FOREIGN\s+KEY\s*\([^)]*\)\s*REFERENCES\s+\w+\s*\([^)]*\)", re.I), ""),
+)
+_FUNCTION_CALL = re.compile(r"\b(strftime|datetime|date)\s*\(", re.I)
+_CURRENT_TIMESTAMP = re.compile(r"\bCURRENT_TIMESTAMP\b", re.I)
+_LIKE = re.compile(r"\bLIKE\b", re.I)
+_INSERT_OR = re.compile(r"^\s*INSERT\s+OR\s+(REPLACE|IGNORE)\s+INTO\s+(\w+)\s*\(([^)]*)\)", re.I)
+_INSERT_VALUES = re.compile(r"^\s*INSERT\s+INTO\s+(\w+)\b[^;]*\bVALUES\b", re.I | re.S)
+
+
+def _split_literals(sql: str) -> List[Tuple[str, bool]]:
+    """Split SQL into (text, is_string_literal) parts on single quotes"""
+    parts = sql.split("'")
+    return [(part, i % 2 == 1) for i, part in enumerate(parts)]
+
+
+def _join_literals(parts: List[Tuple[str, bool]]) -> str:
+    return "'".join(part for part, _ in parts)
+
+
+def translate_to_postgres(sql: str, has_parameters: bool = True,
+                          primary_keys: Dict[str, Tuple[str, ...]] = None,
+                          identity_columns: Dict[str, str] = None) -> Statement:
+    """Rewrite one SQLite statement for PostgreSQL and psycopg2
+    
+    primary_keys and identity_columns describe existing tables: the first
+    gives INSERT OR REPLACE its conflict target, the second the generated
+    column an INSERT ... VALUES returns as lastrowid.
+    """
+    primary_keys = primary_keys or {}
+    identity_columns = identity_columns or {}
+    head = sql.lstrip()[:32].upper()
+    if head.startswith("BEGIN IMMEDIATE"):
+        return Statement(f"BEGIN; {IMMEDIATE_LOCK_SQL}")
+    if head.startswith("EXPLAIN QUERY PLAN"):
+        # The query tracer's plan for a slow statement
+        sql = "EXPLAIN" + sql.lstrip()[len("EXPLAIN QUERY PLAN"):]
+    
+    parts = []
+    for part, literal in _split_literals(sql):
+        # psycopg2 formats the whole string when given parameters, literals included
+        if has_parameters:
+            part = part.replace("%", "%%")
+        if not literal:
+            part = _FUNCTION_CALL.sub(lambda m: f"sqlite_{m.group(1).lower()}(", part)
+            part = _CURRENT_TIMESTAMP.sub("sqlite_datetime('now')", part)
+            part = _LIKE.sub("ILIKE", part)
+            if head.startswith("CREATE TABLE"):
+                for pattern, replacement in _DDL_REPLACEMENTS:
+                    part = pattern.sub(replacement, part)
+            if has_parameters:
+                part = part.replace("?", "%s")
+        parts.append((part, literal))
+    translated = _join_literals(parts).strip().rstrip(";")
+    
+    match = _INSERT_OR.match(translated)
+    if match:
+        mode, table, columns = match.group(1).upper(), match.group(2), match.group(3)
+        translated = f"INSERT INTO {table} ({columns})" + translated[match.end():]
+        if mode == "IGNORE":
+            translated += " ON CONFLICT DO NOTHING"
+        else:
+            keys = primary_keys.get(table.lower(), ())
+            if not keys:
+                raise ValueError(f"INSERT OR REPLACE into {table} needs a primary key")
+            updates = [c.strip() for c in columns.split(",") if c.strip() and c.strip() not in keys]
+            action = ", ".join(f"{c} = EXCLUDED.{c}" for c in updates)
+            translated += f" ON CONFLICT ({', '.join(keys)}) " + (f"DO UPDATE SET {action}" if action else "DO NOTHING")
+    
+    returning = None
+    match = _INSERT_VALUES.match(translated)
+    if match and " RETURNING " not in translated.upper():
+        returning = identity_columns.get(match.group(1).lower())
+        if returning:
+            translated += f" RETURNING {returning}"
+    return Statement(translated, returning)
+
+
+_DML = re.compile(r"^\s*(INSERT|UPDATE|DELETE|REPLACE)\b", re.I)
+_DDL = re.compile(r"^\s*(CREATE|DROP|ALTER)\b", re.I)
+
+
+def _adapt_parameters(parameters):
+    # SQLite stores booleans as 0/1 and the translated schema keeps INTEGER columns
+    return tuple(int(value) if isinstance(value, bool) else value for value in parameters)
+
+
+class PostgresCursor:
+    """The sqlite3.Cursor subset Database uses, translating each statement
+    
+    Each statement runs on a psycopg2 cursor of the pooled connection it
+    borrowed; its rows are already client-side, so they can be fetched after
+    that connection goes back to the pool.
+    """
+    
+    arraysize = 1
+    
+    def __init__(self, connection: "PostgresConnection"):
+        self.connection = connection
+        self._cursor = None
+        self.lastrowid = None
+    
+    @property
+    def description(self):
+        return self._cursor.description if self._cursor else None
+    
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount if self._cursor else -1
+    
+    def execute(self, sql, parameters=()):
+        with self.connection.borrow(sql) as raw:
+            statement = self.connection.backend.translate(raw, sql, bool(parameters))
+            self._cursor = raw.cursor()
+            try:
+                self._cursor.execute(statement.sql, _adapt_parameters(parameters) if parameters else None)
+            except self.connection.backend.Error:
+                self.connection._recover()
+                raise
+            self.lastrowid = None
+            if statement.returning:
+                row = self._cursor.fetchone()
+                self.lastrowid = row[0] if row else None
+        if _DDL.match(sql):
+            self.connection.backend.forget_catalog()
+        return self
+    
+    def executemany(self, sql, seq_of_parameters):
+        with self.connection.borrow(sql) as raw:
+            statement = self.connection.backend.translate(raw, sql, True, returning=False)
+            self._cursor = raw.cursor()
+            try:
+                self._cursor.executemany(statement.sql, [_adapt_parameters(p) for p in seq_of_parameters])
+            except self.connection.backend.Error:
+                self.connection._recover()
+                raise
+        self.lastrowid = None
+        return self
+    
+    def fetchone(self):
+        return self._cursor.fetchone()
+    
+    def fetchall(self):
+        return self._cursor.fetchall()
+    
+    def fetchmany(self, size=None):
+        return self._cursor.fetchmany(size or self.arraysize)
+    
+    def __iter__(self):
+        return iter(self._cursor)
+    
+    def close(self):
+        if self._cursor is not None:
+            self._cursor.close()
+
+
+class PostgresConnection:
+    """The sqlite3.Connection subset Database uses, over psycopg2 connections borrowed from the pool
+    
+    A pooled connection is checked out for each statement and handed back when
+    it finishes, unless the statement opened a transaction: that connection
+    then stays checked out until commit() or rollback().
+    
+    Transactions follow sqlite3's default: statements run on their own until
+    an INSERT/UPDATE/DELETE opens a transaction, which lasts until commit()
+    or rollback(). A failed statement rolls back its whole transaction (SQLite
+    only undoes the statement), since PostgreSQL refuses anything else in it.
+    """
+    
+    def __init__(self, backend: "PostgresBackend"):
+        self.backend = backend
+        # The pooled connection checked out right now, if any
+        self.raw = None
+        self.closed = False
+        self._lock = threading.RLock()
+    
+    @property
+    def in_transaction(self) -> bool:
+        return self.raw is not None and \
+            self.raw.info.transaction_status != self.backend.extensions.TRANSACTION_STATUS_IDLE
+    
+    @contextmanager
+    def borrow(self, sql=None):
+        """The pooled connection to run sql on, returned to the pool afterwards unless a transaction is open
+        
+        An INSERT/UPDATE/DELETE sql opens that transaction first.
+        """
+        with self._lock:
+            if self.raw is None:
+                if self.closed:
+                    raise self.backend.Error("Cannot operate on a closed database.")
+                self.raw = self.backend.checkout()
+            try:
+                if sql is not None and _DML.match(sql) and not self.in_transaction:
+                    self.raw.cursor().execute("BEGIN")
+                yield self.raw
+            finally:
+                if self.raw is not None and not self.in_transaction:
+                    raw, self.raw = self.raw, None
+                    self.backend.release(raw)
+    
+    def cursor(self, factory=None):
+        # As with sqlite3, factory is a cursor class (a PostgresCursor subclass) built on this connection
+        return (factory or PostgresCursor)(self)
+    
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+    
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+    
+    def commit(self):
+        # A transaction opened with BEGIN on an autocommit connection is ended the same way
+        with self._lock:
+            if self.in_transaction:
+                with self.borrow() as raw:
+                    raw.cursor().execute("COMMIT")
+    
+    def rollback(self):
+        with self._lock:
+            if self.in_transaction:
+                with self.borrow() as raw:
+                    raw.cursor().execute("ROLLBACK")
+    
+    def close(self):
+        with self._lock:
+            self.rollback()
+            self.closed = True
+    
+    def _recover(self):
+        if self.raw.info.transaction_status == self.backend.extensions.TRANSACTION_STATUS_INERROR:
+            self.raw.cursor().execute("ROLLBACK")
+
+
+class PostgresBackend(StorageBackend):
+    """A PostgreSQL database reached through a psycopg2 connection pool
+    
+    Database instances borrow a connection per statement or transaction (see
+    PostgresConnection) and serialize only their own statements, so threads
+    with their own Database, and worker processes, write concurrently. A
+    caller finding every connection in use waits for one to come back.
+    """
+    
+    name = "postgresql"
+    shares_process_lock = False
+    # Translations kept before the cache is cleared (statements built with f-strings vary)
+    STATEMENT_CACHE_SIZE = 1024
+    
+    def __init__(self, dsn: str, min_connections: int = None, max_connections: int = None):
+        try:
+            import psycopg2
+            import psycopg2.extensions
+            import psycopg2.pool
+        except ImportError as e:
+            raise ImportError("The PostgreSQL backend needs psycopg2 (pip install psycopg2-binary)") from e
+        if min_connections is None:
+            min_connections = Config.DATABASE_POOL_MIN if Config else 1
+        if max_connections is None:
+            max_connections = Config.DATABASE_POOL_MAX if Config else 10
+        self.location = dsn
+        self.extensions = psycopg2.extensions
+        self.Error = psycopg2.Error
+        self.IntegrityError = psycopg2.IntegrityError
+        self.OperationalError = psycopg2.OperationalError
+        self.pool = psycopg2.pool.ThreadedConnectionPool(min_connections, max_connections, dsn)
+        # The pool raises when exhausted; checkouts wait on this instead
+        self._available = threading.BoundedSemaphore(max_connections)
+        # SUM() and AVG() return NUMERIC; callers expect int/float as from SQLite
+        self._numeric = psycopg2.extensions.new_type(
+            psycopg2.extensions.DECIMAL.values, "HONESTBALLOT_NUMERIC", self._cast_numeric
+        )
+        
+        self._lock = threading.Lock()
+        self._statements: Dict[Tuple[str, bool, bool], Statement] = {}
+        self._primary_keys: Optional[Dict[str, Tuple[str, ...]]] = None
+        self._identity_columns: Optional[Dict[str, str]] = None
+    
+    @staticmethod
+    def _cast_numeric(value, cursor):
+        if value is None:
+            return None
+        number = float(value)
+        return int(number) if number.is_integer() and "." not in value else number
+    
+    def connect(self) -> PostgresConnection:
+        return PostgresConnection(self)
+    
+    def checkout(self):
+        """Take a connection from the pool, waiting while all of them are in use"""
+        self._available.acquire()
+        try:
+            raw = self.pool.getconn()
+        except BaseException:
+            self._available.release()
+            raise
+        if not raw.autocommit:
+            # First checkout of a new pooled connection
+            raw.autocommit = True
+            self.extensions.register_type(self._numeric, raw)
+        return raw
+    
+    def release(self, raw):
+        self.pool.putconn(raw)
+        self._available.release()
+    
+    def close(self):
+        self.pool.closeall()
+    
+    def prepare_schema(self, connection: PostgresConnection):
+        with connection.borrow() as raw:
+            cursor = raw.cursor()
+            for statement in POSTGRES_SHIM_FUNCTIONS:
+                cursor.execute(statement)
+            cursor.execute('CREATE TABLE IF NOT EXISTS schema_meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL)')
+    
+    def get_schema_version(self, connection: PostgresConnection) -> int:
+        with connection.borrow() as raw:
+            cursor = raw.cursor()
+            cursor.execute("SELECT to_regclass('schema_meta') IS NOT NULL")
+            if not cursor.fetchone()[0]:
+                return 0
+            cursor.execute("SELECT value FROM schema_meta WHERE name = 'schema_version'")
+            row = cursor.fetchone()
+            return row[0] if row else 0
+    
+    def set_schema_version(self, connection: PostgresConnection, version: int):
+        with connection.borrow() as raw:
+            raw.cursor().execute(
+                "INSERT INTO schema_meta (name, value) VALUES ('schema_version', %s) "
+                "ON CONFLICT (name) DO UPDATE SET value = EXCLUDED.value",
+                (int(version),)
+            )
+    
+    def translate(self, raw, sql: str, has_parameters: bool, returning: bool = True) -> Statement:
+        """translate_to_postgres() with this database's tables, cached per statement"""
+        key = (sql, has_parameters, returning)
+        with self._lock:
+            statement = self._statements.get(key)
+            if statement is not None:
+                return statement
+            if self._primary_keys is None:
+                self._load_catalog(raw)
+            statement = translate_to_postgres(
+                sql, has_parameters, self._primary_keys, self._identity_columns if returning else None
+            )
+            if len(self._statements) >= self.STATEMENT_CACHE_SIZE:
+                self._statements.clear()
+            self._statements[key] = statement
+            return statement
+    
+    def forget_catalog(self):
+        """Drop cached table metadata and translations after DDL"""
+        with self._lock:
+            self._statements.clear()
+            self._primary_keys = None
+            self._identity_columns = None
+    
+    def _load_catalog(self, raw):
+        cursor = raw.cursor()
+        cursor.execute('''
+            SELECT c.relname, a.attname FROM pg_attribute a
+            JOIN pg_class c ON c.oid = a.attrelid
+            WHERE c.relnamespace = current_schema()::regnamespace AND a.attidentity <> '' AND a.attnum > 0
+        ''')
+        self._identity_columns = {table: column for table, column in cursor.fetchall()}
+        cursor.execute('''
+            SELECT c.relname, a.attname FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indrelid
+            JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+            WHERE i.indisprimary AND c.relnamespace = current_schema()::regnamespace
+            ORDER BY c.relname, array_position(i.indkey::int2[], a.attnum)
+        ''')
+        primary_keys: Dict[str, Tuple[str, ...]] = {}
+        for table, column in cursor.fetchall():
+            primary_keys[table] = primary_keys.get(table, ()) + (column,)
+        self._primary_keys = primary_keys
+
+
+_postgres_backends: Dict[str, PostgresBackend] = {}
+_postgres_backends_lock = threading.Lock()
+
+
+def create_backend(name) -> StorageBackend:
+    """Backend for a database name: a postgresql:// URL or a SQLite file (optionally sqlite:///path)
+    
+    PostgreSQL backends, and so their pools, are shared per URL within a process.
+    """
+    name = str(name)
+    if name.startswith(POSTGRES_SCHEMES):
+        with _postgres_backends_lock:
+            backend = _postgres_backends.get(name)
+            if backend is None:
+                backend = _postgres_backends[name] = PostgresBackend(name)
+            return backend
+    if name.startswith(SQLITE_SCHEME):
+        name = name[len(SQLITE_SCHEME):]
+    return SQLiteBackend(name)
@@ -0,0 +1,264 @@
+"""
+Backup - Online, consistent copies of the database file
+Copies go through SQLite's backup API from a separate read-only connection,
+a few pages per step with a pause in between, so a copy never holds the
+database lock for long and voters' writes proceed while it runs. Snapshots
+are written under a temporary name, checked, and described by a JSON
+manifest (checksum, schema version, size) used to verify them later.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+from urllib.parse import quote
+
+from app.storage.vote_ledger import connect_read_only
+from app.storage.voting_state import invalidate_voting_states
+
+try:
+    from app.config import Config
+except ImportError:
+    Config = None
+
+
+SNAPSHOT_PREFIX = "voting_app-"
+SNAPSHOT_TIME_FORMAT = "%Y%m%d-%H%M%S"
+
+
+class _Restarted(Exception):
+    """A write from another connection restarted the copy too many times"""
+
+
+@dataclass
+class BackupResult:
+    """What one copy took and produced"""
+    
+    path: str
+    pages: int
+    steps: int
+    restarts: int
+    seconds: float
+    size_bytes: int = 0
+    sha256: Optional[str] = None
+    schema_version: Optional[int] = None
+    created_at: Optional[str] = None
+    source: Optional[str] = None
+
+
+def file_sha256(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def backup_database(source_path, target_path, pages_per_step: int = None, step_sleep: float = None,
+                    max_restarts: int = 3, on_step: Callable[[int, int], None] = None) -> BackupResult:
+    """Copy a live database file to target_path without holding its lock for the whole copy
+    
+    Each step copies pages_per_step pages and then sleeps, letting writers in.
+    A commit from another connection restarts the copy; after max_restarts
+    the rest is copied in one step so a busy database still gets a backup.
+    The target only appears, complete, once the copy has finished.
+    on_step(remaining, total) is called after each step, e.g. to show progress.
+    """
+    if pages_per_step is None:
+        pages_per_step = Config.BACKUP_PAGES_PER_STEP if Config else 256
+    if step_sleep is None:
+        step_sleep = (Config.BACKUP_STEP_SLEEP_MS if Config else 5) / 1000
+    target_path = Path(target_path)
+    partial_path = target_path.with_name(target_path.name + ".partial")
+    if partial_path.exists():
+        partial_path.unlink()
+    
+    started = time.perf_counter()
+    progress = {"steps": 0, "restarts": 0, "remaining": None, "pages": 0}
+    
+    def on_progress(status, remaining, total):
+        if on_step is not None:
+            on_step(remaining, total)
+        progress["steps"] += 1
+        progress["pages"] = total
+        if progress["remaining"] is not None and remaining >= progress["remaining"]:
+            progress["restarts"] += 1
+            if progress["restarts"] > max_restarts:
+                raise _Restarted()
+        progress["remaining"] = remaining
+    
+    # Not connect_read_only(): a transaction held across steps would block writers throughout
+    source = sqlite3.connect(f"file:{quote(Path(source_path).resolve().as_posix())}?mode=ro", uri=True)
+    target = sqlite3.connect(str(partial_path))
+    try:
+        try:
+            source.backup(target, pages=pages_per_step, progress=on_progress, sleep=step_sleep)
+        except _Restarted:
+            source.backup(target)
+            progress["steps"] += 1
+        target.commit()
+    finally:
+        target.close()
+        source.close()
+    os.replace(partial_path, target_path)
+    
+    return BackupResult(
+        path=str(target_path),
+        pages=progress["pages"],
+        steps=progress["steps"],
+        restarts=progress["restarts"],
+        seconds=time.perf_counter() - started,
+        size_bytes=target_path.stat().st_size,
+    )
+
+
+def check_database_file(path) -> List[str]:
+    """Problems SQLite's integrity check finds in a database file (empty when it is sound)"""
+    try:
+        connection = connect_read_only(str(path))
+        try:
+            rows = connection.execute('PRAGMA integrity_check').fetchall()
+        finally:
+            connection.close()
+    except sqlite3.Error as e:
+        return [str(e)]
+    problems = [row[0] for row in rows]
+    return [] if problems == ["ok"] else problems
+
+
+class BackupManager:
+    """Point-in-time snapshots of one database file in a backup directory
+    
+    Snapshots are named voting_app-YYYYmmdd-HHMMSS.db with a .json manifest
+    beside them; only the newest `retention` are kept.
+    """
+    
+    def __init__(self, db_path: str = None, backup_dir: str = None, retention: int = None):
+        if db_path is None:
+            db_path = Config.DATABASE_NAME if Config else "voting_app.db"
+        if backup_dir is None:
+            backup_dir = Config.BACKUP_DIR if Config else "backups"
+        if retention is None:
+            retention = Config.BACKUP_RETENTION if Config else 48
+        self.db_path = Path(db_path)
+        self.backup_dir = Path(backup_dir)
+        self.retention = retention
+    
+    def create_snapshot(self, label: str = "") -> BackupResult:
+        """Back up the database now, verify the copy, write its manifest and apply retention"""
+        self.backup_dir.mkdir(parents=True, exist_ok=True)
+        now = datetime.now()
+        name = SNAPSHOT_PREFIX + now.strftime(SNAPSHOT_TIME_FORMAT) + (f"-{label}" if label else "")
+        path = self.backup_dir / f"{name}.db"
+        suffix = 1
+        while path.exists():
+            suffix += 1
+            path = self.backup_dir / f"{name}-{suffix}.db"
+        
+        result = backup_database(self.db_path, path)
+        problems = check_database_file(path)
+        if problems:
+            path.unlink()
+            raise sqlite3.DatabaseError(f"Backup of {self.db_path} failed its integrity check: {problems[0]}")
+        result.sha256 = file_sha256(path)
+        result.schema_version = self._schema_version(path)
+        result.created_at = now.isoformat(timespec="seconds")
+        result.source = str(self.db_path)
+        self._manifest_path(path).write_text(json.dumps(asdict(result), indent=2))
+        self.prune()
+        return result
+    
+    def list_snapshots(self) -> List[Dict]:
+        """Snapshots with their manifests, newest first"""
+        if not self.backup_dir.exists():
+            return []
+        snapshots = []
+        paths = sorted(self.backup_dir.glob(f"{SNAPSHOT_PREFIX}*.db"), key=lambda p: (p.stat().st_mtime_ns, p.name), reverse=True)
+        for path in paths:
+            manifest = self._read_manifest(path) or {}
+            snapshots.append(dict(manifest, path=str(path), size_bytes=path.stat().st_size))
+        return snapshots
+    
+    def prune(self) -> List[str]:
+        """Delete snapshots beyond the newest `retention`; returns the deleted paths"""
+        deleted = []
+        if self.retention <= 0:
+            return deleted
+        for snapshot in self.list_snapshots()[self.retention:]:
+            path = Path(snapshot["path"])
+            path.unlink(missing_ok=True)
+            self._manifest_path(path).unlink(missing_ok=True)
+            deleted.append(str(path))
+        return deleted
+    
+    def verify_snapshot(self, path) -> List[str]:
+        """Problems with a snapshot: integrity check, checksum or schema version vs its manifest"""
+        path = Path(path)
+        if not path.exists():
+            return [f"{path} does not exist"]
+        problems = check_database_file(path)
+        manifest = self._read_manifest(path)
+        if manifest is None:
+            problems.append("manifest missing")
+        else:
+            if manifest.get("sha256") != file_sha256(path):
+                problems.append("checksum does not match the manifest")
+            if manifest.get("schema_version") != self._schema_version(path):
+                problems.append("schema version does not match the manifest")
+        return problems
+    
+    def restore_snapshot(self, path, target_path=None) -> BackupResult:
+        """Replace the database with a verified snapshot
+        
+        The current database is first saved as a "pre-restore" snapshot. The
+        copy goes through the backup API, so connections already open on the
+        target see the restored data on their next read.
+        """
+        problems = self.verify_snapshot(path)
+        if problems:
+            raise ValueError(f"Snapshot {path} failed verification: {'; '.join(problems)}")
+        target_path = Path(target_path) if target_path else self.db_path
+        if target_path.exists():
+            BackupManager(target_path, self.backup_dir, retention=0).create_snapshot(label="pre-restore")
+        
+        started = time.perf_counter()
+        source = connect_read_only(str(path))
+        target = sqlite3.connect(str(target_path), timeout=30)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
+        # Cached voting status in this process may describe the replaced data
+        invalidate_voting_states()
+        return BackupResult(
+            path=str(target_path), pages=0, steps=1, restarts=0,
+            seconds=time.perf_counter() - started, size_bytes=target_path.stat().st_size,
+            sha256=file_sha256(target_path), source=str(path),
+        )
+    
+    @staticmethod
+    def _manifest_path(path: Path) -> Path:
+        return path.with_suffix(".json")
+    
+    def _read_manifest(self, path: Path) -> Optional[Dict]:
+        try:
+            return json.loads(self._manifest_path(path).read_text())
+        except (OSError, ValueError):
+            return None
+    
+    @staticmethod
+    def _schema_version(path: Path) -> Optional[int]:
+        try:
+            connection = connect_read_only(str(path))
+            try:
+                return connection.execute('PRAGMA user_version').fetchone()[0]
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            return None
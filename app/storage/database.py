@@ -3,9 +3,17 @@ import os
 import bcrypt
 import json
 import threading
-from datetime import datetime
+import time
+import weakref
+from datetime import datetime, timezone
 from pathlib import Path
 
+from app.metrics import AUDIT_EVENTS, LEDGER_BATCHES_SEALED, VOTE_CHANGES, VOTES_CAST
+from app.storage.backends import PostgresCursor, StorageBackend, create_backend
+from app.storage.query_tracer import QueryTracer, TimedLock
+from app.storage.vote_ledger import GENESIS_HASH, LEAF_FIELDS, audit_path, chain_hash, leaf_hash, merkle_root
+from app.storage.voting_state import voting_state_for
+
 # Import configuration
 try:
     from app.config import Config
@@ -14,33 +22,274 @@ except ImportError:
     Config = None
 
 
+class VotingClosedError(Exception):
+    """A ballot was cast or changed while voting is not open"""
+
+
+class _WeakChangeListener:
+    """Change listener wrapping a bound method; unregisters itself once the owner is collected"""
+    
+    def __init__(self, method):
+        self._method = weakref.WeakMethod(method)
+    
+    def __call__(self, table, details):
+        method = self._method()
+        if method is None:
+            Database.remove_change_listener(self)
+            return
+        method(table, details)
+    
+    def __eq__(self, other):
+        if isinstance(other, _WeakChangeListener):
+            return self._method == other._method
+        method = self._method()
+        return method is not None and method == other
+    
+    __hash__ = None
+
+
+class QueryTimingMixin:
+    """Times each statement a cursor runs (including fetching its rows) and reports it
+    to the query tracer and Database query listeners; mixed into a driver's cursor class"""
+    
+    _pending = None  # [sql, parameters, elapsed, lock_wait] for a SELECT awaiting fetch
+    lock = None  # TimedLock of the owning Database, set by Database._traced_cursor()
+    
+    def execute(self, sql, parameters=()):
+        if self._pending:
+            self._finish(*self._pending, rows=-1)
+        if not (Database._query_tracer.enabled or Database._query_listeners):
+            return super().execute(sql, parameters)
+        
+        lock_wait = self.lock.take_wait() if self.lock is not None else 0.0
+        started = time.perf_counter()
+        try:
+            super().execute(sql, parameters)
+        except Exception as e:
+            Database._query_tracer.record_error(sql, e)
+            raise
+        elapsed = time.perf_counter() - started
+        if self.description is None:
+            self._finish(sql, parameters, elapsed, lock_wait, rows=self.rowcount)
+        else:
+            self._pending = [sql, parameters, elapsed, lock_wait]
+        return self
+    
+    def executemany(self, sql, seq_of_parameters):
+        if self._pending:
+            self._finish(*self._pending, rows=-1)
+        if not (Database._query_tracer.enabled or Database._query_listeners):
+            return super().executemany(sql, seq_of_parameters)
+        
+        lock_wait = self.lock.take_wait() if self.lock is not None else 0.0
+        started = time.perf_counter()
+        try:
+            super().executemany(sql, seq_of_parameters)
+        except Exception as e:
+            Database._query_tracer.record_error(sql, e)
+            raise
+        self._finish(sql, None, time.perf_counter() - started, lock_wait, rows=self.rowcount)
+        return self
+    
+    def fetchone(self):
+        if not self._pending:
+            return super().fetchone()
+        started = time.perf_counter()
+        row = super().fetchone()
+        self._fetched(time.perf_counter() - started, 0 if row is None else 1)
+        return row
+    
+    def fetchall(self):
+        if not self._pending:
+            return super().fetchall()
+        started = time.perf_counter()
+        rows = super().fetchall()
+        self._fetched(time.perf_counter() - started, len(rows))
+        return rows
+    
+    def fetchmany(self, size=None):
+        if size is None:
+            size = self.arraysize
+        if not self._pending:
+            return super().fetchmany(size)
+        started = time.perf_counter()
+        rows = super().fetchmany(size)
+        self._fetched(time.perf_counter() - started, len(rows))
+        return rows
+    
+    def _fetched(self, fetch_elapsed, rows):
+        # The first fetch closes out the statement; later fetches are not timed
+        sql, parameters, elapsed, lock_wait = self._pending
+        self._finish(sql, parameters, elapsed + fetch_elapsed, lock_wait, rows=rows)
+    
+    def _finish(self, sql, parameters, elapsed, lock_wait, rows):
+        self._pending = None
+        if Database._query_tracer.enabled:
+            Database._query_tracer.record(sql, parameters, elapsed, rows, lock_wait, self.connection)
+        if Database._query_listeners:
+            Database._notify_query(sql, elapsed)
+
+
+class TracedCursor(QueryTimingMixin, sqlite3.Cursor):
+    """sqlite3 cursor whose statements are traced"""
+
+
+class TracedPostgresCursor(QueryTimingMixin, PostgresCursor):
+    """PostgreSQL cursor whose statements are traced"""
+
+
 class Database:
     """Local SQLite database manager for the voting application"""
     
-    # Class-level lock shared across all instances for thread safety
-    _db_lock = threading.RLock()
+    # Class-level lock shared across all instances for thread safety (re-entrant, times waits);
+    # a read replica sets its own on the instance so reports never queue behind ballots
+    _db_lock = TimedLock()
+    
+    # Per-statement latency, rows and lock wait; slow statements are logged with their plan
+    _query_tracer = QueryTracer()
+    
+    # Callbacks notified after committed writes as listener(table, details)
+    _change_listeners = []
+    
+    # Callbacks notified after every statement as listener(sql, elapsed_seconds)
+    _query_listeners = []
+    
+    # Writes to these tables change candidate rankings and drop cached recommendations
+    RECOMMENDATION_INPUT_TABLES = ("users", "achievement_verifications", "legal_records")
     
-    def __init__(self, db_name=None):
-        """Initialize database connection"""
+    # Stored in PRAGMA user_version by create_schema(); bump it whenever the DDL changes
+    SCHEMA_VERSION = 3
+    
+    # Election session created when a vote or start_voting finds none active
+    DEFAULT_ELECTION_NAME = "General Election"
+    
+    def __init__(self, db_name=None, backend: StorageBackend = None):
+        """Initialize database connection
+        
+        db_name is a SQLite file or a postgresql:// URL (see app.storage.backends);
+        a backend given directly is used as is.
+        """
         # Use config if available, otherwise use default
-        if db_name is None:
-            db_name = Config.DATABASE_NAME if Config else "voting_app.db"
-        self.db_path = Path(db_name)
+        if backend is None:
+            if db_name is None:
+                db_name = (Config.DATABASE_URL or Config.DATABASE_NAME) if Config else "voting_app.db"
+            backend = create_backend(db_name)
+        self.backend = backend
+        if not backend.shares_process_lock and "_db_lock" not in self.__dict__:
+            # A server database handles concurrent connections; only this one needs serializing
+            self._db_lock = TimedLock()
+        self.db_path = Path(backend.location)
         self.connection = None
         self.cursor = None
+        # Cached voting status, shared with other instances on the same file
+        self.voting_state = voting_state_for(self.db_path)
         self.initialize_db()
     
+    @classmethod
+    def add_change_listener(cls, listener, weak=False):
+        """
+        Register a callback invoked after writes to a table are committed
+        With weak=True a bound method is held by weak reference, so a per-session
+        listener goes away with its object even if it is never removed.
+        """
+        if weak:
+            listener = _WeakChangeListener(listener)
+        if listener not in cls._change_listeners:
+            cls._change_listeners.append(listener)
+    
+    @classmethod
+    def remove_change_listener(cls, listener):
+        """Unregister a change listener"""
+        if listener in cls._change_listeners:
+            cls._change_listeners.remove(listener)
+    
+    @classmethod
+    def add_query_listener(cls, listener):
+        """Register a callback invoked after each SQL statement runs"""
+        if listener not in cls._query_listeners:
+            cls._query_listeners.append(listener)
+    
+    @classmethod
+    def remove_query_listener(cls, listener):
+        """Unregister a query listener"""
+        if listener in cls._query_listeners:
+            cls._query_listeners.remove(listener)
+    
+    @classmethod
+    def get_query_stats(cls, order_by="total_ms", limit=None):
+        """Per-statement latency/rows/lock-wait stats, most expensive first"""
+        return cls._query_tracer.snapshot(order_by=order_by, limit=limit)
+    
+    @classmethod
+    def get_lock_stats(cls):
+        """Acquisition count and wait totals for the shared database lock"""
+        return cls._db_lock.stats()
+    
+    @classmethod
+    def _notify_query(cls, sql, elapsed):
+        for listener in list(cls._query_listeners):
+            try:
+                listener(sql, elapsed)
+            except Exception as e:
+                print(f"Error in query listener: {e}")
+    
+    def _notify_change(self, table, **details):
+        """Notify change listeners that a table was written"""
+        # Voter account changes never affect candidate rankings
+        if table in self.RECOMMENDATION_INPUT_TABLES and details.get("role") != "voter":
+            self.clear_recommendation_cache()
+        for listener in list(Database._change_listeners):
+            try:
+                listener(table, details)
+            except Exception as e:
+                print(f"Error in change listener: {e}")
+    
     def _get_cursor(self):
         """Get the cursor, creating a new one if needed. Use within _db_lock context."""
         if self.cursor is None:
-            self.cursor = self.connection.cursor()
+            self.cursor = self._traced_cursor()
         return self.cursor
     
+    def _traced_cursor(self):
+        """A new cursor on the connection whose statements are traced"""
+        factory = TracedPostgresCursor if self.backend.name == "postgresql" else TracedCursor
+        cursor = self.connection.cursor(factory=factory)
+        # Waits are read from this instance's lock: a replica or server database has its own
+        cursor.lock = self._db_lock
+        return cursor
+    
     def initialize_db(self):
-        """Initialize database and create tables if they don't exist"""
-        # Enable check_same_thread=False to allow cross-thread access (safe for this app)
-        self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
-        self.cursor = self.connection.cursor()
+        """Open the database, creating tables only if its schema is out of date"""
+        self.connection = self.backend.connect()
+        self.cursor = self._traced_cursor()
+        
+        # A database stamped by setup_db.py (or an earlier open) skips the DDL checks
+        if self.get_schema_version() >= self.SCHEMA_VERSION:
+            self._detect_search_indexes()
+        else:
+            self.create_schema()
+    
+    def get_schema_version(self):
+        """Schema version recorded in the database file (0 for a new or unstamped file)"""
+        with self._db_lock:
+            return self.backend.get_schema_version(self.connection)
+    
+    def _detect_search_indexes(self):
+        """Set the FTS flags from the tables create_schema() managed to build"""
+        if not self.backend.supports_full_text_search:
+            self.candidate_index_enabled = self.legal_record_index_enabled = False
+            return
+        rows = self.connection.execute(
+            "SELECT name FROM sqlite_master WHERE name IN ('candidate_search', 'legal_record_search')"
+        ).fetchall()
+        names = {row[0] for row in rows}
+        self.candidate_index_enabled = 'candidate_search' in names
+        self.legal_record_index_enabled = 'legal_record_search' in names
+    
+    def create_schema(self):
+        """Create tables and indexes if they don't exist, backfill derived tables
+        and stamp the schema version; run by setup_db.py"""
+        self.backend.prepare_schema(self.connection)
         
         # Create users table
         self.cursor.execute('''
@@ -207,7 +456,184 @@ class Database:
             )
         ''')
         
+        # Create vote_rate_buckets table: turnout counters bumped at cast time
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS vote_rate_buckets (
+                granularity TEXT NOT NULL,
+                bucket_start TIMESTAMP NOT NULL,
+                position TEXT NOT NULL,
+                vote_count INTEGER DEFAULT 0,
+                PRIMARY KEY (granularity, bucket_start, position)
+            )
+        ''')
+        self._backfill_vote_rate_buckets()
+        
+        # Partition votes by election session: every vote belongs to one, per-session
+        # indexes keep current-election reads independent of past elections, and
+        # vote_tallies holds the running count per (session, candidate)
+        self._assign_unscoped_votes()
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS vote_tallies (
+                election_session_id INTEGER NOT NULL,
+                candidate_id INTEGER NOT NULL,
+                position TEXT NOT NULL,
+                vote_count INTEGER DEFAULT 0,
+                PRIMARY KEY (election_session_id, candidate_id)
+            )
+        ''')
+        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_votes_session_position ON votes(election_session_id, position, candidate_id)')
+        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_votes_session_voter ON votes(election_session_id, voter_id)')
+        self._backfill_vote_tallies()
+        
+        # Create the vote ledger: one append-only entry per cast or changed vote, sealed
+        # in batches whose Merkle roots are hash-chained (see app.storage.vote_ledger).
+        # Triggers refuse deletes and any update except stamping an entry's batch once
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS ledger_batches (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                first_seq INTEGER NOT NULL,
+                last_seq INTEGER NOT NULL,
+                leaf_count INTEGER NOT NULL,
+                merkle_root TEXT NOT NULL,
+                prev_hash TEXT NOT NULL,
+                chain_hash TEXT NOT NULL,
+                sealed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS vote_ledger (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                election_session_id INTEGER NOT NULL,
+                vote_id INTEGER NOT NULL,
+                voter_id INTEGER NOT NULL,
+                candidate_id INTEGER NOT NULL,
+                position TEXT NOT NULL,
+                action TEXT NOT NULL,
+                recorded_at TEXT NOT NULL,
+                leaf_hash TEXT NOT NULL,
+                batch_id INTEGER,
+                FOREIGN KEY (batch_id) REFERENCES ledger_batches(id)
+            )
+        ''')
+        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_vote_ledger_vote ON vote_ledger(vote_id, seq)')
+        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_vote_ledger_unsealed ON vote_ledger(seq) WHERE batch_id IS NULL')
+        if self.backend.name == "postgresql":
+            self._create_ledger_guards_postgres()
+        else:
+            self.cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS vote_ledger_no_delete BEFORE DELETE ON vote_ledger
+                BEGIN SELECT RAISE(ABORT, 'vote_ledger is append-only'); END
+            ''')
+            self.cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS vote_ledger_seal_only BEFORE UPDATE ON vote_ledger
+                WHEN OLD.batch_id IS NOT NULL OR NEW.seq IS NOT OLD.seq
+                    OR NEW.election_session_id IS NOT OLD.election_session_id OR NEW.vote_id IS NOT OLD.vote_id
+                    OR NEW.voter_id IS NOT OLD.voter_id OR NEW.candidate_id IS NOT OLD.candidate_id
+                    OR NEW.position IS NOT OLD.position OR NEW.action IS NOT OLD.action
+                    OR NEW.recorded_at IS NOT OLD.recorded_at OR NEW.leaf_hash IS NOT OLD.leaf_hash
+                BEGIN SELECT RAISE(ABORT, 'vote_ledger is append-only'); END
+            ''')
+            self.cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS ledger_batches_no_update BEFORE UPDATE ON ledger_batches
+                BEGIN SELECT RAISE(ABORT, 'ledger_batches is append-only'); END
+            ''')
+            self.cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS ledger_batches_no_delete BEFORE DELETE ON ledger_batches
+                BEGIN SELECT RAISE(ABORT, 'ledger_batches is append-only'); END
+            ''')
+        self._backfill_vote_ledger()
+        
+        # Create news analysis side tables (filled by the news analysis pipeline)
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS news_post_features (
+                post_id INTEGER PRIMARY KEY,
+                author_id INTEGER NOT NULL,
+                sentiment REAL DEFAULT 0,
+                analyzed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (post_id) REFERENCES news_posts(id),
+                FOREIGN KEY (author_id) REFERENCES users(id)
+            )
+        ''')
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS news_post_themes (
+                post_id INTEGER NOT NULL,
+                theme TEXT NOT NULL,
+                weight INTEGER DEFAULT 1,
+                PRIMARY KEY (post_id, theme),
+                FOREIGN KEY (post_id) REFERENCES news_posts(id)
+            )
+        ''')
+        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_post_features_author ON news_post_features(author_id)')
+        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_news_post_themes_theme ON news_post_themes(theme)')
+        
+        # Create recommendation cache (canonical preference key -> ranked politician ids and scores)
+        self.cursor.execute('''
+            CREATE TABLE IF NOT EXISTS recommendation_cache (
+                cache_key TEXT PRIMARY KEY,
+                payload TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Create candidate search index (trigram FTS5 over politician name/position/party,
+        # rowid = users.id); builds without FTS5, and PostgreSQL, fall back to LIKE scans
+        self.candidate_index_enabled = False
+        if self.backend.supports_full_text_search:
+            try:
+                self.cursor.execute('''
+                    CREATE VIRTUAL TABLE IF NOT EXISTS candidate_search USING fts5(
+                        full_name, username, position, party, tokenize='trigram'
+                    )
+                ''')
+                self.candidate_index_enabled = True
+                self._backfill_candidate_search()
+            except self.backend.OperationalError as e:
+                print(f"Candidate search index unavailable, using LIKE search: {e}")
+        
+        # Create legal record search index (rowid = legal_records.id) and the
+        # per-politician index used to group records
+        self.cursor.execute('CREATE INDEX IF NOT EXISTS idx_legal_records_politician ON legal_records(politician_id, created_at)')
+        self.legal_record_index_enabled = False
+        if self.backend.supports_full_text_search:
+            try:
+                self.cursor.execute('''
+                    CREATE VIRTUAL TABLE IF NOT EXISTS legal_record_search USING fts5(
+                        title, description, record_type, politician_name, tokenize='trigram'
+                    )
+                ''')
+                self.legal_record_index_enabled = True
+                self._backfill_legal_record_search()
+            except self.backend.OperationalError as e:
+                print(f"Legal record search index unavailable, using LIKE search: {e}")
+        
+        self.backend.set_schema_version(self.connection, self.SCHEMA_VERSION)
         self.connection.commit()
+        # A new file may reuse the path of a deleted one
+        self.voting_state.invalidate()
+    
+    def _create_ledger_guards_postgres(self):
+        """The vote ledger's append-only triggers, for PostgreSQL"""
+        self.cursor.execute('''
+            CREATE OR REPLACE FUNCTION ledger_append_only() RETURNS trigger AS $$
+            BEGIN
+                -- The one update allowed: stamping an unsealed entry's batch
+                IF TG_OP = 'UPDATE' AND TG_TABLE_NAME = 'vote_ledger' AND OLD.batch_id IS NULL
+                   AND (NEW.seq, NEW.election_session_id, NEW.vote_id, NEW.voter_id, NEW.candidate_id,
+                        NEW.position, NEW.action, NEW.recorded_at, NEW.leaf_hash)
+                       IS NOT DISTINCT FROM
+                       (OLD.seq, OLD.election_session_id, OLD.vote_id, OLD.voter_id, OLD.candidate_id,
+                        OLD.position, OLD.action, OLD.recorded_at, OLD.leaf_hash) THEN
+                    RETURN NEW;
+                END IF;
+                RAISE EXCEPTION '% is append-only', TG_TABLE_NAME;
+            END
+            $$ LANGUAGE plpgsql
+        ''')
+        for table in ("vote_ledger", "ledger_batches"):
+            self.cursor.execute(f'''
+                CREATE OR REPLACE TRIGGER {table}_append_only BEFORE UPDATE OR DELETE ON {table}
+                FOR EACH ROW EXECUTE FUNCTION ledger_append_only()
+            ''')
     
     def hash_password(self, password):
         """Hash password using bcrypt (secure, salted hashing)"""
@@ -228,21 +654,25 @@ class Database:
     
     def create_user(self, username, email, password, role="voter"):
         """Create a new user"""
-        with Database._db_lock:
+        with self._db_lock:
             try:
                 password_hash = self.hash_password(password)
                 self.cursor.execute('''
                     INSERT INTO users (username, email, password_hash, role)
                     VALUES (?, ?, ?, ?)
                 ''', (username, email, password_hash, role))
+                user_id = self.cursor.lastrowid
+                if role == "politician":
+                    self._sync_candidate_search(user_id)
                 self.connection.commit()
+                self._notify_change("users", user_id=user_id, role=role)
                 return True
-            except sqlite3.IntegrityError:
+            except self.backend.IntegrityError:
                 return False
     
     def verify_user(self, email, password):
         """Verify user credentials using bcrypt"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 SELECT id, username, email, role, password_hash FROM users
                 WHERE email = ?
@@ -266,7 +696,7 @@ class Database:
     
     def get_user_by_email(self, email):
         """Get user by email"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 SELECT id, username, email, role FROM users WHERE email = ?
             ''', (email,))
@@ -282,7 +712,7 @@ class Database:
     
     def create_user_session(self, user_id, session_token):
         """Create a new user session"""
-        with Database._db_lock:
+        with self._db_lock:
             try:
                 self.cursor.execute('''
                     INSERT INTO user_sessions (user_id, session_token)
@@ -290,12 +720,12 @@ class Database:
                 ''', (user_id, session_token))
                 self.connection.commit()
                 return session_token
-            except sqlite3.IntegrityError:
+            except self.backend.IntegrityError:
                 return None
     
     def verify_session(self, session_token):
         """Verify if session is active"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 SELECT user_id FROM user_sessions
                 WHERE session_token = ? AND is_active = 1
@@ -313,7 +743,7 @@ class Database:
     
     def end_session(self, session_token):
         """End a user session"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 UPDATE user_sessions SET is_active = 0
                 WHERE session_token = ?
@@ -326,7 +756,7 @@ class Database:
     
     def get_user_activity(self, user_id):
         """Get comprehensive user activity data"""
-        with Database._db_lock:
+        with self._db_lock:
             # Get user basic info with last login
             self.cursor.execute('''
                 SELECT id, username, email, role, status, created_at, last_login
@@ -377,7 +807,7 @@ class Database:
     
     def get_all_user_activities(self, role_filter=None, limit=50):
         """Get activity summary for all users (admin view)"""
-        with Database._db_lock:
+        with self._db_lock:
             query = '''
                 SELECT u.id, u.username, u.email, u.role, u.status, u.last_login,
                        (SELECT COUNT(*) FROM audit_logs WHERE user_id = u.id) as action_count,
@@ -409,77 +839,400 @@ class Database:
             } for r in results]
     
     def cast_vote(self, voter_id, candidate_id, position, election_session_id=None):
-        """Record a vote"""
-        with Database._db_lock:
+        """Record a vote in an election session (the active one by default)
+        
+        Returns False if the voter already voted for the position; raises
+        VotingClosedError if voting is not open.
+        """
+        with self._db_lock:
+            # Checked under the lock, so a ballot cannot slip in after stop_voting commits
+            if not self.is_voting_active():
+                raise VotingClosedError("Voting is not open")
+            if election_session_id is None:
+                election_session_id = self._ensure_election_session()
             try:
                 self.cursor.execute('''
                     INSERT INTO votes (voter_id, candidate_id, position, election_session_id)
                     VALUES (?, ?, ?, ?)
                 ''', (voter_id, candidate_id, position, election_session_id))
+                vote_id = self.cursor.lastrowid
+                self._bump_vote_tally(election_session_id, candidate_id, position, 1)
+                self._bump_vote_rate_buckets(position)
+                self._append_ledger_entry(election_session_id, vote_id, voter_id, candidate_id, position, "cast")
                 self.connection.commit()
-                return True
-            except sqlite3.IntegrityError:
-                # User already voted for this position
+            except self.backend.IntegrityError:
+                # User already voted for this position in this session
+                self.connection.rollback()
                 return False
+            self._notify_change("votes", action="cast", voter_id=voter_id, candidate_id=candidate_id,
+                                position=position, election_session_id=election_session_id)
+            VOTES_CAST.inc(position=position)
+            self._seal_ledger_if_full()
+            return True
     
-    def update_vote(self, voter_id, candidate_id, position):
-        """Update an existing vote for a position"""
-        with Database._db_lock:
+    def update_vote(self, voter_id, candidate_id, position, election_session_id=None):
+        """Change a voter's choice for a position within one election session
+        
+        Raises VotingClosedError if voting is not open.
+        """
+        with self._db_lock:
+            if not self.is_voting_active():
+                raise VotingClosedError("Voting is not open")
+            if election_session_id is None:
+                election_session_id = self.get_active_election_session_id()
             try:
+                self.cursor.execute('''
+                    SELECT id, candidate_id FROM votes
+                    WHERE voter_id = ? AND position = ? AND election_session_id = ?
+                ''', (voter_id, position, election_session_id))
+                row = self.cursor.fetchone()
+                if not row:
+                    return False
+                vote_id, previous_candidate_id = row
+                
                 self.cursor.execute('''
                     UPDATE votes 
-                    SET candidate_id = ?, voted_at = CURRENT_TIMESTAMP
-                    WHERE voter_id = ? AND position = ?
-                ''', (candidate_id, voter_id, position))
+                    SET candidate_id = ?, timestamp = CURRENT_TIMESTAMP
+                    WHERE voter_id = ? AND position = ? AND election_session_id = ?
+                ''', (candidate_id, voter_id, position, election_session_id))
+                if previous_candidate_id != candidate_id:
+                    self._bump_vote_tally(election_session_id, previous_candidate_id, position, -1)
+                    self._bump_vote_tally(election_session_id, candidate_id, position, 1)
+                self._append_ledger_entry(election_session_id, vote_id, voter_id, candidate_id, position, "update")
                 self.connection.commit()
-                return self.cursor.rowcount > 0
             except Exception as e:
+                self.connection.rollback()
                 print(f"Error updating vote: {e}")
                 return False
+            self._notify_change("votes", action="update", voter_id=voter_id, candidate_id=candidate_id,
+                                position=position, election_session_id=election_session_id,
+                                previous_candidate_id=previous_candidate_id)
+            VOTE_CHANGES.inc(position=position)
+            self._seal_ledger_if_full()
+            return True
     
-    def get_votes_by_position(self, position, election_session_id=None):
-        """Get vote counts by position"""
-        with Database._db_lock:
-            if election_session_id:
-                self.cursor.execute('''
-                    SELECT candidate_id, COUNT(*) as count
-                    FROM votes
-                    WHERE position = ? AND election_session_id = ?
-                    GROUP BY candidate_id
-                    ORDER BY count DESC
-                ''', (position, election_session_id))
-            else:
+    # Vote Ledger Methods
+    @property
+    def LEDGER_BATCH_SIZE(self):
+        return Config.LEDGER_BATCH_SIZE if Config else 256
+    
+    def _append_ledger_entry(self, election_session_id, vote_id, voter_id, candidate_id, position, action):
+        """Append one ballot write to the vote ledger (caller commits)"""
+        recorded_at = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S.%f')
+        entry_hash = leaf_hash(election_session_id, vote_id, voter_id, candidate_id, position, action, recorded_at)
+        self.cursor.execute('''
+            INSERT INTO vote_ledger
+                (election_session_id, vote_id, voter_id, candidate_id, position, action, recorded_at, leaf_hash)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (election_session_id, vote_id, voter_id, candidate_id, position, action, recorded_at, entry_hash))
+    
+    def _backfill_vote_ledger(self):
+        """Record existing votes once, for databases created before the ledger, and seal them"""
+        self.cursor.execute('SELECT 1 FROM vote_ledger LIMIT 1')
+        if self.cursor.fetchone():
+            return
+        rows = self.connection.execute('''
+            SELECT election_session_id, id, voter_id, candidate_id, position, timestamp
+            FROM votes WHERE election_session_id IS NOT NULL ORDER BY id
+        ''')
+        for election_session_id, vote_id, voter_id, candidate_id, position, timestamp in rows:
+            self.cursor.execute('''
+                INSERT INTO vote_ledger
+                    (election_session_id, vote_id, voter_id, candidate_id, position, action, recorded_at, leaf_hash)
+                VALUES (?, ?, ?, ?, ?, 'cast', ?, ?)
+            ''', (election_session_id, vote_id, voter_id, candidate_id, position, timestamp,
+                  leaf_hash(election_session_id, vote_id, voter_id, candidate_id, position, "cast", timestamp)))
+        self._seal_ledger_batches(partial=True)
+    
+    def seal_ledger(self, partial=True):
+        """Seal pending ledger entries into batches; partial=False leaves a short tail pending.
+        Returns the ids of the new batches."""
+        with self._db_lock:
+            try:
+                # Take the write lock before reading the tail, so another worker can't seal it too
+                if not self.connection.in_transaction:
+                    self.cursor.execute('BEGIN IMMEDIATE')
+                sealed = self._seal_ledger_batches(partial)
+                self.connection.commit()
+            except self.backend.Error as e:
+                self.connection.rollback()
+                print(f"Error sealing vote ledger: {e}")
+                return []
+        if sealed:
+            self._notify_change("ledger_batches", batch_ids=sealed)
+        return sealed
+    
+    def _seal_ledger_batches(self, partial):
+        """Seal pending entries in LEDGER_BATCH_SIZE batches, oldest first (caller commits)"""
+        size = self.LEDGER_BATCH_SIZE
+        sealed = []
+        while True:
+            self.cursor.execute(
+                'SELECT seq, leaf_hash FROM vote_ledger WHERE batch_id IS NULL ORDER BY seq LIMIT ?', (size,)
+            )
+            rows = self.cursor.fetchall()
+            if not rows or (len(rows) < size and not partial):
+                break
+            root = merkle_root(bytes.fromhex(row[1]) for row in rows).hex()
+            self.cursor.execute('SELECT chain_hash FROM ledger_batches ORDER BY id DESC LIMIT 1')
+            head = self.cursor.fetchone()
+            prev_hash = head[0] if head else GENESIS_HASH
+            first_seq, last_seq = rows[0][0], rows[-1][0]
+            self.cursor.execute('''
+                INSERT INTO ledger_batches (first_seq, last_seq, leaf_count, merkle_root, prev_hash, chain_hash)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (first_seq, last_seq, len(rows), root, prev_hash,
+                  chain_hash(prev_hash, root, first_seq, last_seq, len(rows))))
+            batch_id = self.cursor.lastrowid
+            self.cursor.execute(
+                'UPDATE vote_ledger SET batch_id = ? WHERE seq BETWEEN ? AND ? AND batch_id IS NULL',
+                (batch_id, first_seq, last_seq)
+            )
+            sealed.append(batch_id)
+            LEDGER_BATCHES_SEALED.inc()
+            if len(rows) < size:
+                break
+        return sealed
+    
+    def _seal_ledger_if_full(self):
+        """Seal once a full batch is pending; one indexed count on the vote path"""
+        with self._db_lock:
+            self.cursor.execute(
+                'SELECT COUNT(*) FROM (SELECT 1 FROM vote_ledger WHERE batch_id IS NULL LIMIT ?) AS unsealed',
+                (self.LEDGER_BATCH_SIZE,)
+            )
+            full = self.cursor.fetchone()[0] >= self.LEDGER_BATCH_SIZE
+        if full:
+            self.seal_ledger(partial=False)
+    
+    def get_ledger_head(self):
+        """Latest sealed batch as a dict (its chain_hash commits to the whole sealed ledger), or None"""
+        with self._db_lock:
+            self.cursor.execute('''
+                SELECT id, first_seq, last_seq, leaf_count, merkle_root, prev_hash, chain_hash, sealed_at
+                FROM ledger_batches ORDER BY id DESC LIMIT 1
+            ''')
+            row = self.cursor.fetchone()
+        if not row:
+            return None
+        return dict(zip(("id", "first_seq", "last_seq", "leaf_count", "merkle_root", "prev_hash", "chain_hash", "sealed_at"), row))
+    
+    def get_vote_inclusion_proof(self, vote_id):
+        """Proof that a vote's latest ledger entry is in its sealed batch, or None if it
+        is not sealed yet; check it with app.storage.vote_ledger.verify_inclusion_proof"""
+        with self._db_lock:
+            self.cursor.execute(f'''
+                SELECT seq, batch_id, leaf_hash, {", ".join(LEAF_FIELDS)}
+                FROM vote_ledger WHERE vote_id = ? ORDER BY seq DESC LIMIT 1
+            ''', (vote_id,))
+            entry = self.cursor.fetchone()
+            if not entry or entry[1] is None:
+                return None
+            seq, batch_id, entry_hash = entry[:3]
+            self.cursor.execute(
+                'SELECT first_seq, last_seq, leaf_count, merkle_root, prev_hash, chain_hash FROM ledger_batches WHERE id = ?',
+                (batch_id,)
+            )
+            first_seq, last_seq, leaf_count, root, prev_hash, batch_chain = self.cursor.fetchone()
+            self.cursor.execute('SELECT seq, leaf_hash FROM vote_ledger WHERE batch_id = ? ORDER BY seq', (batch_id,))
+            rows = self.cursor.fetchall()
+        leaves = [bytes.fromhex(row[1]) for row in rows]
+        # Position in the batch, not seq - first_seq: PostgreSQL identity values can skip numbers
+        index = [row[0] for row in rows].index(seq)
+        return {
+            "seq": seq,
+            "entry": dict(zip(LEAF_FIELDS, entry[3:])),
+            "leaf_hash": entry_hash,
+            "leaf_index": index,
+            "leaf_count": leaf_count,
+            "path": [sibling.hex() for sibling in audit_path(leaves, index)],
+            "merkle_root": root,
+            "batch": {
+                "id": batch_id,
+                "first_seq": first_seq,
+                "last_seq": last_seq,
+                "prev_hash": prev_hash,
+                "chain_hash": batch_chain,
+            },
+        }
+    
+    # Turnout Time-Series Methods
+    # Buckets are keyed by UTC start time, matching votes.timestamp (CURRENT_TIMESTAMP)
+    VOTE_RATE_FORMATS = {
+        "minute": "%Y-%m-%d %H:%M:00",
+        "hour": "%Y-%m-%d %H:00:00",
+    }
+    ALL_POSITIONS = "*"
+    
+    def _bump_vote_rate_buckets(self, position):
+        """Increment the per-minute and per-hour counters for one new vote (caller commits)"""
+        for granularity, fmt in self.VOTE_RATE_FORMATS.items():
+            for bucket_position in (position, self.ALL_POSITIONS):
                 self.cursor.execute('''
-                    SELECT candidate_id, COUNT(*) as count
-                    FROM votes
-                    WHERE position = ?
-                    GROUP BY candidate_id
-                    ORDER BY count DESC
-                ''', (position,))
+                    INSERT INTO vote_rate_buckets (granularity, bucket_start, position, vote_count)
+                    VALUES (?, strftime(?, 'now'), ?, 1)
+                    ON CONFLICT (granularity, bucket_start, position)
+                    DO UPDATE SET vote_count = vote_rate_buckets.vote_count + 1
+                ''', (granularity, fmt, bucket_position))
+    
+    def _assign_unscoped_votes(self):
+        """Move votes cast before session scoping into the latest election session
+        
+        A missing session id also defeated UNIQUE(voter_id, position, election_session_id),
+        since NULLs never collide; duplicates of an already scoped vote stay unscoped.
+        """
+        self.cursor.execute('SELECT 1 FROM votes WHERE election_session_id IS NULL LIMIT 1')
+        if not self.cursor.fetchone():
+            return
+        self.cursor.execute('SELECT id FROM election_sessions ORDER BY is_active DESC, id DESC LIMIT 1')
+        row = self.cursor.fetchone()
+        if row:
+            session_id = row[0]
+        else:
+            self.cursor.execute("INSERT INTO election_sessions (name, is_active) VALUES (?, 1)", (self.DEFAULT_ELECTION_NAME,))
+            session_id = self.cursor.lastrowid
+        # The earliest of each voter's unscoped votes for a position moves, unless one is already scoped
+        self.cursor.execute('''
+            UPDATE votes SET election_session_id = ?
+            WHERE election_session_id IS NULL
+            AND NOT EXISTS (
+                SELECT 1 FROM votes v WHERE v.voter_id = votes.voter_id AND v.position = votes.position
+                AND (v.election_session_id = ? OR (v.election_session_id IS NULL AND v.id < votes.id))
+            )
+        ''', (session_id, session_id))
+    
+    def _backfill_vote_tallies(self):
+        """Seed per-session tallies from existing votes once, for databases created before tallies"""
+        self.cursor.execute('SELECT 1 FROM vote_tallies LIMIT 1')
+        if self.cursor.fetchone():
+            return
+        self.cursor.execute('''
+            INSERT INTO vote_tallies (election_session_id, candidate_id, position, vote_count)
+            SELECT election_session_id, candidate_id, MAX(position), COUNT(*)
+            FROM votes WHERE election_session_id IS NOT NULL
+            GROUP BY election_session_id, candidate_id
+        ''')
+    
+    def _bump_vote_tally(self, election_session_id, candidate_id, position, delta):
+        """Add delta to one candidate's tally in a session (caller commits)"""
+        self.cursor.execute('''
+            INSERT INTO vote_tallies (election_session_id, candidate_id, position, vote_count)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (election_session_id, candidate_id)
+            DO UPDATE SET vote_count = vote_tallies.vote_count + excluded.vote_count
+        ''', (election_session_id, candidate_id, position, delta))
+    
+    def _backfill_vote_rate_buckets(self):
+        """Seed buckets from existing votes once, for databases created before bucketing"""
+        self.cursor.execute('SELECT 1 FROM vote_rate_buckets LIMIT 1')
+        if self.cursor.fetchone():
+            return
+        for granularity, fmt in self.VOTE_RATE_FORMATS.items():
+            self.cursor.execute('''
+                INSERT INTO vote_rate_buckets (granularity, bucket_start, position, vote_count)
+                SELECT ?, strftime(?, timestamp), position, COUNT(*)
+                FROM votes GROUP BY 2, 3
+            ''', (granularity, fmt))
+            self.cursor.execute('''
+                INSERT INTO vote_rate_buckets (granularity, bucket_start, position, vote_count)
+                SELECT ?, strftime(?, timestamp), ?, COUNT(*)
+                FROM votes GROUP BY 2
+            ''', (granularity, fmt, self.ALL_POSITIONS))
+    
+    def get_turnout_series(self, granularity="minute", position=None, limit=60):
+        """Get the latest (bucket_start, vote_count) turnout buckets, oldest first
+        
+        Reads one position's buckets, or overall turnout when position is None.
+        """
+        if granularity not in self.VOTE_RATE_FORMATS:
+            raise ValueError(f"Unknown granularity: {granularity}")
+        with self._db_lock:
+            self.cursor.execute('''
+                SELECT bucket_start, vote_count FROM (
+                    SELECT bucket_start, vote_count FROM vote_rate_buckets
+                    WHERE granularity = ? AND position = ?
+                    ORDER BY bucket_start DESC
+                    LIMIT ?
+                ) AS latest ORDER BY bucket_start
+            ''', (granularity, position or self.ALL_POSITIONS, limit))
             return self.cursor.fetchall()
     
-    def get_votes_by_voter(self, voter_id):
-        """Get all votes cast by a specific voter"""
-        with Database._db_lock:
+    def get_turnout_by_position(self, granularity="hour", limit=24):
+        """Get {position: [(bucket_start, vote_count), ...]} over the latest buckets"""
+        if granularity not in self.VOTE_RATE_FORMATS:
+            raise ValueError(f"Unknown granularity: {granularity}")
+        with self._db_lock:
+            self.cursor.execute('''
+                SELECT position, bucket_start, vote_count FROM vote_rate_buckets
+                WHERE granularity = ? AND position != ?
+                  AND bucket_start >= (
+                      SELECT COALESCE(MIN(bucket_start), '') FROM (
+                          SELECT bucket_start FROM vote_rate_buckets
+                          WHERE granularity = ? AND position = ?
+                          ORDER BY bucket_start DESC LIMIT ?
+                      ) AS latest
+                  )
+                ORDER BY position, bucket_start
+            ''', (granularity, self.ALL_POSITIONS, granularity, self.ALL_POSITIONS, limit))
+            series = {}
+            for position, bucket_start, vote_count in self.cursor.fetchall():
+                series.setdefault(position, []).append((bucket_start, vote_count))
+            return series
+    
+    def get_current_vote_rate(self, window_seconds=60, position=None):
+        """Get votes per second over the trailing window, read from minute buckets"""
+        window_minutes = max(1, int(window_seconds) // 60)
+        with self._db_lock:
+            self.cursor.execute('''
+                SELECT COALESCE(SUM(vote_count), 0), CAST(strftime('%S', 'now') AS INTEGER)
+                FROM vote_rate_buckets
+                WHERE granularity = 'minute' AND position = ?
+                  AND bucket_start >= strftime('%Y-%m-%d %H:%M:00', 'now', ?)
+            ''', (position or self.ALL_POSITIONS, f"-{window_minutes - 1} minutes"))
+            votes, seconds_into_minute = self.cursor.fetchone()
+            # The current minute bucket is partial; only count its elapsed seconds
+            elapsed = (window_minutes - 1) * 60 + seconds_into_minute + 1
+            return votes / elapsed
+    
+    def get_votes_by_position(self, position, election_session_id=None):
+        """Get (candidate_id, count) for a position in a session (the active one by default)"""
+        if election_session_id is None:
+            election_session_id = self.get_active_election_session_id()
+        with self._db_lock:
+            self.cursor.execute('''
+                SELECT candidate_id, vote_count
+                FROM vote_tallies
+                WHERE election_session_id = ? AND position = ? AND vote_count > 0
+                ORDER BY vote_count DESC
+            ''', (election_session_id, position))
+            return self.cursor.fetchall()
+    
+    def get_votes_by_voter(self, voter_id, election_session_id=None):
+        """Get all votes cast by a specific voter in a session (the active one by default)"""
+        if election_session_id is None:
+            election_session_id = self.get_active_election_session_id()
+        with self._db_lock:
             self.cursor.execute('''
                 SELECT position, candidate_id FROM votes
-                WHERE voter_id = ?
-            ''', (voter_id,))
+                WHERE voter_id = ? AND election_session_id = ?
+            ''', (voter_id, election_session_id))
             return self.cursor.fetchall()
     
-    def has_voted_for_position(self, voter_id, position):
-        """Check if voter has already voted for a position"""
-        with Database._db_lock:
+    def has_voted_for_position(self, voter_id, position, election_session_id=None):
+        """Check if voter has already voted for a position in a session (the active one by default)"""
+        if election_session_id is None:
+            election_session_id = self.get_active_election_session_id()
+        with self._db_lock:
             self.cursor.execute('''
                 SELECT COUNT(*) FROM votes
-                WHERE voter_id = ? AND position = ?
-            ''', (voter_id, position))
+                WHERE voter_id = ? AND position = ? AND election_session_id = ?
+            ''', (voter_id, position, election_session_id))
             result = self.cursor.fetchone()
             return result[0] > 0 if result else False
     
     def get_candidates_by_position(self, position):
         """Get all candidates for a position"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 SELECT id, name, position, party, bio FROM candidates
                 WHERE position = ?
@@ -488,7 +1241,7 @@ class Database:
     
     def add_candidate(self, name, position, party, bio=""):
         """Add a new candidate"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 INSERT INTO candidates (name, position, party, bio)
                 VALUES (?, ?, ?, ?)
@@ -496,97 +1249,186 @@ class Database:
             self.connection.commit()
             return self.cursor.lastrowid
     
-    def create_election_session(self, name):
-        """Create an election session"""
-        with Database._db_lock:
+    def create_election_session(self, name, activate=True):
+        """Create an election session; by default it becomes the active one"""
+        with self._db_lock:
+            if activate:
+                self.cursor.execute('UPDATE election_sessions SET is_active = 0 WHERE is_active = 1')
             self.cursor.execute('''
                 INSERT INTO election_sessions (name, is_active)
-                VALUES (?, 1)
-            ''', (name,))
+                VALUES (?, ?)
+            ''', (name, 1 if activate else 0))
+            session_id = self.cursor.lastrowid
             self.connection.commit()
-            return self.cursor.lastrowid
+            if activate:
+                self._load_voting_state()
+                self._notify_change("election_sessions", action="activate", election_session_id=session_id)
+            return session_id
+    
+    def set_active_election_session(self, election_session_id):
+        """Point current votes, tallies and results at another election session"""
+        with self._db_lock:
+            self.cursor.execute('SELECT 1 FROM election_sessions WHERE id = ?', (election_session_id,))
+            if not self.cursor.fetchone():
+                return False
+            self.cursor.execute(
+                'UPDATE election_sessions SET is_active = CASE WHEN id = ? THEN 1 ELSE 0 END WHERE is_active = 1 OR id = ?',
+                (election_session_id, election_session_id)
+            )
+            self.connection.commit()
+            self._load_voting_state()
+            self._notify_change("election_sessions", action="activate", election_session_id=election_session_id)
+            return True
+    
+    def get_active_election_session_id(self):
+        """Id of the active election session, or None; a memory read once loaded"""
+        return self.get_voting_state().election_session_id
+    
+    def get_election_sessions(self):
+        """All election sessions, newest first"""
+        with self._db_lock:
+            self.cursor.execute('''
+                SELECT id, name, start_time, end_time, is_active, created_at
+                FROM election_sessions ORDER BY id DESC
+            ''')
+            return self.cursor.fetchall()
+    
+    def _ensure_election_session(self):
+        """Active session id, creating the default session if there is none. Use within _db_lock context."""
+        election_session_id = self.get_active_election_session_id()
+        if election_session_id is None:
+            self.cursor.execute(
+                'INSERT INTO election_sessions (name, is_active) VALUES (?, 1)',
+                (self.DEFAULT_ELECTION_NAME,)
+            )
+            election_session_id = self.cursor.lastrowid
+            self.connection.commit()
+            self._load_voting_state()
+        return election_session_id
+    
+    def has_users(self):
+        """Whether any account exists, without loading user rows"""
+        with self._db_lock:
+            self.cursor.execute('SELECT 1 FROM users LIMIT 1')
+            return self.cursor.fetchone() is not None
     
     def get_all_users(self):
         """Get all users (for admin purposes)"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 SELECT id, username, email, role, created_at, full_name, status, position, party, biography, profile_image FROM users
             ''')
             return self.cursor.fetchall()
     
-    def get_users_by_role(self, role):
-        """Get all users by role"""
-        with Database._db_lock:
-            self.cursor.execute('''
+    def get_politicians_by_ids(self, politician_ids):
+        """Get (id, username, full_name, position, party, biography) rows for just the given politicians"""
+        if not politician_ids:
+            return []
+        with self._db_lock:
+            placeholders = ','.join(['?' for _ in politician_ids])
+            self.cursor.execute(f'''
+                SELECT id, username, full_name, position, party, biography
+                FROM users WHERE id IN ({placeholders}) AND role = 'politician'
+            ''', list(politician_ids))
+            return self.cursor.fetchall()
+    
+    def get_users_by_role(self, role, limit=None, offset=0):
+        """Get users by role, optionally one page at a time"""
+        with self._db_lock:
+            query = '''
                 SELECT id, username, email, role, created_at, full_name, status, position, party, biography, profile_image 
                 FROM users WHERE role = ?
-            ''', (role,))
+            '''
+            params = [role]
+            if limit is not None:
+                query += " ORDER BY id LIMIT ? OFFSET ?"
+                params.extend([limit, offset])
+            self.cursor.execute(query, params)
+            return self.cursor.fetchall()
+    
+    def get_politician_summaries(self):
+        """Politicians as (id, username, full_name, position, party, biography), without
+        credentials or the profile image, for reports that hold on to every row"""
+        with self._db_lock:
+            self.cursor.execute('''
+                SELECT id, username, full_name, position, party, biography
+                FROM users WHERE role = 'politician'
+            ''')
             return self.cursor.fetchall()
     
     def create_voter(self, username, email, password, full_name):
         """Create a new voter account"""
-        with Database._db_lock:
+        with self._db_lock:
             try:
                 password_hash = self.hash_password(password)
                 self.cursor.execute('''
                     INSERT INTO users (username, email, password_hash, full_name, role, status)
                     VALUES (?, ?, ?, ?, 'voter', 'active')
                 ''', (username, email, password_hash, full_name))
+                user_id = self.cursor.lastrowid
                 self.connection.commit()
+                self._notify_change("users", user_id=user_id, role="voter")
                 return True
-            except sqlite3.IntegrityError:
+            except self.backend.IntegrityError:
                 return False
     
     def create_politician(self, username, email, password, full_name, position, party, biography, profile_image=None):
         """Create a new politician account"""
-        with Database._db_lock:
+        with self._db_lock:
             try:
                 password_hash = self.hash_password(password)
                 self.cursor.execute('''
                     INSERT INTO users (username, email, password_hash, full_name, role, status, position, party, biography, profile_image)
                     VALUES (?, ?, ?, ?, 'politician', 'active', ?, ?, ?, ?)
                 ''', (username, email, password_hash, full_name, position, party, biography, profile_image))
+                # Read before the index sync, whose own statements move lastrowid
+                user_id = self.cursor.lastrowid
+                self._sync_candidate_search(user_id)
                 self.connection.commit()
+                self._notify_change("users", user_id=user_id, role="politician")
                 return True
-            except sqlite3.IntegrityError:
+            except self.backend.IntegrityError:
                 return False
     
     def update_user_status(self, user_id, status):
         """Update user status (active/inactive)"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 UPDATE users SET status = ? WHERE id = ?
             ''', (status, user_id))
             self.connection.commit()
+            self._notify_change("users", user_id=user_id)
     
     def update_voter(self, user_id, full_name, email, username):
         """Update voter account without changing password"""
-        with Database._db_lock:
+        with self._db_lock:
             try:
                 self.cursor.execute('''
                     UPDATE users SET full_name = ?, email = ?, username = ? WHERE id = ?
                 ''', (full_name, email, username, user_id))
                 self.connection.commit()
+                self._notify_change("users", user_id=user_id, role="voter")
                 return True
-            except sqlite3.IntegrityError:
+            except self.backend.IntegrityError:
                 return False
     
     def update_voter_with_password(self, user_id, full_name, email, username, password):
         """Update voter account with new password"""
-        with Database._db_lock:
+        with self._db_lock:
             try:
                 password_hash = self.hash_password(password)
                 self.cursor.execute('''
                     UPDATE users SET full_name = ?, email = ?, username = ?, password_hash = ? WHERE id = ?
                 ''', (full_name, email, username, password_hash, user_id))
                 self.connection.commit()
+                self._notify_change("users", user_id=user_id, role="voter")
                 return True
-            except sqlite3.IntegrityError:
+            except self.backend.IntegrityError:
                 return False
     
     def update_politician(self, user_id, full_name, email, username, position, party, biography, profile_image=None):
         """Update politician account without changing password"""
-        with Database._db_lock:
+        with self._db_lock:
             try:
                 if profile_image:
                     self.cursor.execute('''
@@ -596,14 +1438,17 @@ class Database:
                     self.cursor.execute('''
                         UPDATE users SET full_name = ?, email = ?, username = ?, position = ?, party = ?, biography = ? WHERE id = ?
                     ''', (full_name, email, username, position, party, biography, user_id))
+                self._sync_candidate_search(user_id)
+                self._sync_legal_record_search(politician_id=user_id)
                 self.connection.commit()
+                self._notify_change("users", user_id=user_id, role="politician")
                 return True
-            except sqlite3.IntegrityError:
+            except self.backend.IntegrityError:
                 return False
     
     def update_politician_with_password(self, user_id, full_name, email, username, position, party, biography, password, profile_image=None):
         """Update politician account with new password"""
-        with Database._db_lock:
+        with self._db_lock:
             try:
                 password_hash = self.hash_password(password)
                 if profile_image:
@@ -614,35 +1459,209 @@ class Database:
                     self.cursor.execute('''
                         UPDATE users SET full_name = ?, email = ?, username = ?, position = ?, party = ?, biography = ?, password_hash = ? WHERE id = ?
                     ''', (full_name, email, username, position, party, biography, password_hash, user_id))
+                self._sync_candidate_search(user_id)
+                self._sync_legal_record_search(politician_id=user_id)
                 self.connection.commit()
+                self._notify_change("users", user_id=user_id, role="politician")
                 return True
-            except sqlite3.IntegrityError:
+            except self.backend.IntegrityError:
                 return False
     
     def delete_user(self, user_id):
         """Delete a user"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('DELETE FROM users WHERE id = ?', (user_id,))
+            self._sync_candidate_search(user_id)
+            self._sync_legal_record_search(politician_id=user_id)
             self.connection.commit()
+            self._notify_change("users", user_id=user_id)
             return self.cursor.fetchall()
     
+    # =====================
+    # Candidate Search Methods
+    # =====================
+    
+    # Light candidate columns returned by search (no biography or profile image)
+    CANDIDATE_SEARCH_COLUMNS = "u.id, u.username, u.full_name, u.position, u.party, u.status"
+    
+    # Share of query trigrams a fuzzy match must contain
+    FUZZY_MATCH_THRESHOLD = 0.5
+    
+    def _sync_candidate_search(self, user_id):
+        """Re-index one user in the candidate search table (call inside the write's transaction)"""
+        if not self.candidate_index_enabled:
+            return
+        self.cursor.execute('DELETE FROM candidate_search WHERE rowid = ?', (user_id,))
+        self.cursor.execute('''
+            INSERT INTO candidate_search (rowid, full_name, username, position, party)
+            SELECT id, COALESCE(full_name, ''), username, COALESCE(position, ''), COALESCE(party, '')
+            FROM users WHERE id = ? AND role = 'politician'
+        ''', (user_id,))
+    
+    def _backfill_candidate_search(self):
+        """Rebuild the candidate index when it is out of step with the politicians table"""
+        self.cursor.execute("SELECT COUNT(*) FROM users WHERE role = 'politician'")
+        politicians = self.cursor.fetchone()[0]
+        self.cursor.execute('SELECT COUNT(*) FROM candidate_search')
+        if self.cursor.fetchone()[0] == politicians:
+            return
+        self.cursor.execute('DELETE FROM candidate_search')
+        self.cursor.execute('''
+            INSERT INTO candidate_search (rowid, full_name, username, position, party)
+            SELECT id, COALESCE(full_name, ''), username, COALESCE(position, ''), COALESCE(party, '')
+            FROM users WHERE role = 'politician'
+        ''')
+    
+    @staticmethod
+    def _trigrams(text):
+        text = f" {(text or '').lower()} "
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+    
+    @staticmethod
+    def _fts_phrase(text):
+        return '"' + text.replace('"', '""') + '"'
+    
+    def _fts_word_conditions(self, table, alias, columns, words):
+        """WHERE conditions requiring every word somewhere in a trigram FTS table's columns
+        
+        Trigram MATCH needs 3+ characters; shorter words become word-prefix LIKEs.
+        """
+        long_words = [w for w in words if len(w) >= 3]
+        conditions, params = [], []
+        if long_words:
+            conditions.append(f"{table} MATCH ?")
+            params.append(" AND ".join(self._fts_phrase(w) for w in long_words))
+        for word in words:
+            if len(word) < 3:
+                like_any = " OR ".join(f"{alias}.{col} LIKE ? OR {alias}.{col} LIKE ?" for col in columns)
+                conditions.append(f"({like_any})")
+                params.extend([f"{word}%", f"% {word}%"] * len(columns))
+        return conditions, params
+    
+    def search_candidates(self, query="", limit=100, fuzzy=True, offset=0):
+        """Search politicians by name, username, position or party
+        
+        Every word of the query must appear in one of the fields (substring or
+        prefix); close spellings found by trigram overlap follow those matches.
+        Returns light rows (id, username, full_name, position, party, status),
+        best matches first, offset paging through them. An empty query lists
+        every politician by name.
+        """
+        words = (query or "").lower().split()
+        with self._db_lock:
+            if not words:
+                self.cursor.execute(f'''
+                    SELECT {self.CANDIDATE_SEARCH_COLUMNS} FROM users u
+                    WHERE u.role = 'politician'
+                    ORDER BY COALESCE(u.full_name, u.username), u.id LIMIT ? OFFSET ?
+                ''', (limit, offset))
+                return self.cursor.fetchall()
+            
+            if not self.candidate_index_enabled:
+                return self._search_candidates_like(words, limit, offset)
+            
+            conditions, params = self._fts_word_conditions(
+                "candidate_search", "cs", ("full_name", "username", "position", "party"), words
+            )
+            ranked = any(len(w) >= 3 for w in words)
+            self.cursor.execute(f'''
+                SELECT {self.CANDIDATE_SEARCH_COLUMNS}
+                FROM candidate_search cs
+                JOIN users u ON u.id = cs.rowid
+                WHERE {" AND ".join(conditions)}
+                ORDER BY cs.full_name LIKE ? DESC, {"cs.rank" if ranked else "cs.full_name"}, u.id
+                LIMIT ? OFFSET ?
+            ''', params + [f"{words[0]}%", limit, offset])
+            results = self.cursor.fetchall()
+            
+            if fuzzy and len(results) < limit and any(len(w) >= 4 for w in words):
+                # Close spellings come after every exact match, so page past all of those first
+                self.cursor.execute(f'''
+                    SELECT cs.rowid FROM candidate_search cs WHERE {" AND ".join(conditions)}
+                ''', params)
+                exact_ids = {row[0] for row in self.cursor.fetchall()}
+                results += self._fuzzy_candidates(
+                    words, exact_ids, limit - len(results), max(0, offset - len(exact_ids))
+                )
+            return results
+    
+    def _fuzzy_candidates(self, words, exclude_ids, limit, offset=0):
+        """Candidates containing most of each word's trigrams (typo-tolerant matches)"""
+        # Padding trigrams (" be", "en ") are not in the index; keep the inner ones
+        word_grams = [
+            {g for g in self._trigrams(w) if g.strip() == g}
+            for w in words if len(w) >= 3
+        ]
+        if not word_grams:
+            return []
+        all_grams = set().union(*word_grams)
+        self.cursor.execute(f'''
+            SELECT {self.CANDIDATE_SEARCH_COLUMNS}
+            FROM candidate_search cs
+            JOIN users u ON u.id = cs.rowid
+            WHERE candidate_search MATCH ?
+            ORDER BY cs.rank
+            LIMIT ?
+        ''', (" OR ".join(self._fts_phrase(g) for g in all_grams), (limit + offset + len(exclude_ids)) * 4))
+        
+        scored = []
+        for row in self.cursor.fetchall():
+            if row[0] in exclude_ids:
+                continue
+            fields = self._trigrams(" ".join(str(v or "") for v in row[1:5]))
+            # Every word has to be close to something in the row, not just one of them
+            score = min(len(grams & fields) / len(grams) for grams in word_grams)
+            if score >= self.FUZZY_MATCH_THRESHOLD:
+                scored.append((score, row))
+        scored.sort(key=lambda item: -item[0])
+        return [row for _, row in scored[offset:offset + limit]]
+    
+    def _search_candidates_like(self, words, limit, offset=0):
+        """Substring search over the users table for builds without FTS5"""
+        conditions, params = [], []
+        for word in words:
+            conditions.append(
+                "(u.full_name LIKE ? OR u.username LIKE ? OR u.position LIKE ? OR u.party LIKE ?)"
+            )
+            params.extend([f"%{word}%"] * 4)
+        self.cursor.execute(f'''
+            SELECT {self.CANDIDATE_SEARCH_COLUMNS} FROM users u
+            WHERE u.role = 'politician' AND {" AND ".join(conditions)}
+            ORDER BY COALESCE(u.full_name, u.username), u.id LIMIT ? OFFSET ?
+        ''', params + [limit, offset])
+        return self.cursor.fetchall()
+    
+    def get_profile_images(self, user_ids):
+        """Get profile images for just the given users, as {user_id: image}"""
+        if not user_ids:
+            return {}
+        with self._db_lock:
+            placeholders = ','.join(['?' for _ in user_ids])
+            self.cursor.execute(
+                f'SELECT id, profile_image FROM users WHERE id IN ({placeholders}) AND profile_image IS NOT NULL',
+                list(user_ids),
+            )
+            return dict(self.cursor.fetchall())
+    
     # Achievement Verification Methods
     def create_achievement_verification(self, politician_id, title, description, evidence_url=None):
         """Create a new achievement verification request"""
-        with Database._db_lock:
+        with self._db_lock:
             try:
                 self.cursor.execute('''
                     INSERT INTO achievement_verifications (politician_id, achievement_title, achievement_description, evidence_url)
                     VALUES (?, ?, ?, ?)
                 ''', (politician_id, title, description, evidence_url))
                 self.connection.commit()
-                return self.cursor.lastrowid
-            except sqlite3.IntegrityError:
+                verification_id = self.cursor.lastrowid
+                self._notify_change("achievement_verifications", politician_id=politician_id)
+                return verification_id
+            except self.backend.IntegrityError:
                 return None
     
     def get_pending_verifications(self):
         """Get all pending achievement verifications"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 SELECT av.id, av.politician_id, av.achievement_title, av.achievement_description, 
                        av.evidence_url, av.status, av.created_at, u.full_name, u.username, u.position
@@ -655,7 +1674,7 @@ class Database:
     
     def get_all_verifications(self):
         """Get all achievement verifications"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 SELECT av.id, av.politician_id, av.achievement_title, av.achievement_description, 
                        av.evidence_url, av.status, av.created_at, u.full_name, u.username, u.position
@@ -667,17 +1686,18 @@ class Database:
     
     def verify_achievement(self, verification_id, verified_by_id, status='verified'):
         """Verify or reject an achievement"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 UPDATE achievement_verifications 
                 SET status = ?, verified_by = ?, verified_at = CURRENT_TIMESTAMP
                 WHERE id = ?
             ''', (status, verified_by_id, verification_id))
             self.connection.commit()
+            self._notify_change("achievement_verifications", verification_id=verification_id)
     
     def get_verifications_by_politician(self, politician_id):
         """Get all verifications for a specific politician"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 SELECT id, achievement_title, achievement_description, evidence_url, status, created_at
                 FROM achievement_verifications
@@ -685,83 +1705,167 @@ class Database:
                 ORDER BY created_at DESC
             ''', (politician_id,))
             return self.cursor.fetchall()
-    
+
+    def get_verification_counts_by_politician(self, politician_ids=None):
+        """Get verification status counts for every politician (or just politician_ids) in one query"""
+        where, params = "", []
+        if politician_ids is not None:
+            if not politician_ids:
+                return {}
+            where = f"WHERE politician_id IN ({','.join(['?' for _ in politician_ids])})"
+            params = list(politician_ids)
+        with self._db_lock:
+            self.cursor.execute(f'''
+                SELECT politician_id,
+                       SUM(CASE WHEN status = 'verified' THEN 1 ELSE 0 END),
+                       SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END),
+                       SUM(CASE WHEN status NOT IN ('verified', 'pending') THEN 1 ELSE 0 END)
+                FROM achievement_verifications
+                {where}
+                GROUP BY politician_id
+            ''', params)
+            return {
+                r[0]: {"verified": r[1], "pending": r[2], "rejected": r[3]}
+                for r in self.cursor.fetchall()
+            }
+
     # Voting Status Methods
     def get_voting_status(self):
-        """Get current voting status"""
-        with Database._db_lock:
-            self.cursor.execute('SELECT is_active, started_at, ended_at FROM voting_status ORDER BY id DESC LIMIT 1')
-            result = self.cursor.fetchone()
-            if result:
-                return {"is_active": bool(result[0]), "started_at": result[1], "ended_at": result[2]}
-            return {"is_active": False, "started_at": None, "ended_at": None}
+        """Get current voting status (from memory once loaded)"""
+        return self.get_voting_state().to_dict()
+    
+    def get_voting_state(self):
+        """Current VotingState; the voting_status table is read only when nothing is cached"""
+        state = self.voting_state.current
+        if state is None:
+            with self._db_lock:
+                state = self.voting_state.current
+                if state is None:
+                    state = self._load_voting_state()
+        return state
+    
+    def is_voting_active(self):
+        """Whether ballots are accepted; a memory read on the vote path"""
+        return self.get_voting_state().is_active
+    
+    def _load_voting_state(self):
+        """Read the latest voting_status row and the active election session into the cache.
+        Use within _db_lock context."""
+        self.cursor.execute('SELECT id FROM election_sessions WHERE is_active = 1 ORDER BY id DESC LIMIT 1')
+        session = self.cursor.fetchone()
+        election_session_id = session[0] if session else None
+        self.cursor.execute('SELECT is_active, started_at, ended_at FROM voting_status ORDER BY id DESC LIMIT 1')
+        result = self.cursor.fetchone()
+        if result:
+            return self.voting_state.set(*result, election_session_id=election_session_id)
+        return self.voting_state.set(False, election_session_id=election_session_id)
     
     def start_voting(self, user_id):
         """Start voting session"""
-        with Database._db_lock:
+        with self._db_lock:
+            # Ballots go to the active election, which records when voting first opened
+            election_session_id = self._ensure_election_session()
+            self.cursor.execute(
+                'UPDATE election_sessions SET start_time = COALESCE(start_time, CURRENT_TIMESTAMP) WHERE id = ?',
+                (election_session_id,)
+            )
             self.cursor.execute('''
                 INSERT INTO voting_status (is_active, started_at, updated_by)
                 VALUES (1, CURRENT_TIMESTAMP, ?)
             ''', (user_id,))
             self.connection.commit()
+            self._load_voting_state()
+            self._notify_change("voting_status", is_active=True)
             return True
     
     def stop_voting(self, user_id):
         """Stop voting session"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 UPDATE voting_status SET is_active = 0, ended_at = CURRENT_TIMESTAMP, updated_by = ?
                 WHERE id = (SELECT MAX(id) FROM voting_status)
             ''', (user_id,))
+            self.cursor.execute(
+                'UPDATE election_sessions SET end_time = CURRENT_TIMESTAMP WHERE is_active = 1'
+            )
             self.connection.commit()
-            return True
+            self._load_voting_state()
+            self._notify_change("voting_status", is_active=False)
+        # Seal the tail so every ballot of the closed round can be proven
+        self.seal_ledger()
+        return True
     
     # Election Results Methods
-    def get_election_results(self):
+    # Results read one election session (the active one by default) from vote_tallies,
+    # so past elections never add to the cost of current-result queries
+    def get_election_results(self, election_session_id=None):
         """Get election results grouped by position"""
-        with Database._db_lock:
+        if election_session_id is None:
+            election_session_id = self.get_active_election_session_id()
+        with self._db_lock:
             self.cursor.execute('''
                 SELECT u.id, u.full_name, u.username, u.position, u.party, u.profile_image,
-                       COUNT(v.id) as vote_count
+                       COALESCE(t.vote_count, 0) as vote_count
                 FROM users u
-                LEFT JOIN votes v ON u.id = v.candidate_id
+                LEFT JOIN vote_tallies t ON t.candidate_id = u.id AND t.election_session_id = ?
                 WHERE u.role = 'politician'
-                GROUP BY u.id
                 ORDER BY u.position, vote_count DESC
-            ''')
+            ''', (election_session_id,))
             return self.cursor.fetchall()
     
-    def get_total_votes_cast(self):
+    def get_total_votes_cast(self, election_session_id=None):
         """Get total number of votes cast"""
-        with Database._db_lock:
-            self.cursor.execute('SELECT COUNT(*) FROM votes')
+        if election_session_id is None:
+            election_session_id = self.get_active_election_session_id()
+        with self._db_lock:
+            self.cursor.execute(
+                'SELECT COALESCE(SUM(vote_count), 0) FROM vote_tallies WHERE election_session_id = ?',
+                (election_session_id,)
+            )
             result = self.cursor.fetchone()
             return result[0] if result else 0
     
-    def get_unique_voters_count(self):
+    def get_unique_voters_count(self, election_session_id=None):
         """Get count of unique voters who have voted"""
-        with Database._db_lock:
-            self.cursor.execute('SELECT COUNT(DISTINCT voter_id) FROM votes')
+        if election_session_id is None:
+            election_session_id = self.get_active_election_session_id()
+        with self._db_lock:
+            self.cursor.execute(
+                'SELECT COUNT(DISTINCT voter_id) FROM votes WHERE election_session_id = ?',
+                (election_session_id,)
+            )
+            result = self.cursor.fetchone()
+            return result[0] if result else 0
+    
+    def get_politicians_count(self):
+        """Get count of politician accounts"""
+        with self._db_lock:
+            self.cursor.execute("SELECT COUNT(*) FROM users WHERE role = 'politician'")
             result = self.cursor.fetchone()
             return result[0] if result else 0
     
     def get_positions_count(self):
         """Get count of unique positions being voted on"""
-        with Database._db_lock:
-            self.cursor.execute('SELECT COUNT(DISTINCT position) FROM users WHERE role = "politician"')
+        with self._db_lock:
+            self.cursor.execute("SELECT COUNT(DISTINCT position) FROM users WHERE role = 'politician'")
             result = self.cursor.fetchone()
             return result[0] if result else 0
     
-    def get_votes_by_candidate(self, candidate_id):
+    def get_votes_by_candidate(self, candidate_id, election_session_id=None):
         """Get vote count for a specific candidate"""
-        with Database._db_lock:
-            self.cursor.execute('SELECT COUNT(*) FROM votes WHERE candidate_id = ?', (candidate_id,))
+        if election_session_id is None:
+            election_session_id = self.get_active_election_session_id()
+        with self._db_lock:
+            self.cursor.execute(
+                'SELECT vote_count FROM vote_tallies WHERE election_session_id = ? AND candidate_id = ?',
+                (election_session_id, candidate_id)
+            )
             result = self.cursor.fetchone()
             return result[0] if result else 0
     
     def verify_user_by_username(self, username, password):
         """Verify user credentials by username using bcrypt"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 SELECT id, username, email, role, password_hash FROM users
                 WHERE username = ?
@@ -795,7 +1899,7 @@ class Database:
     
     def record_login_attempt(self, identifier, success=False, ip_address=None):
         """Record a login attempt for rate limiting"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 INSERT INTO login_attempts (identifier, success, ip_address)
                 VALUES (?, ?, ?)
@@ -804,7 +1908,7 @@ class Database:
     
     def get_failed_attempts_count(self, identifier, minutes=15):
         """Get the number of failed login attempts in the last N minutes"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute(f'''
                 SELECT COUNT(*) FROM login_attempts
                 WHERE identifier = ? 
@@ -824,7 +1928,7 @@ class Database:
     
     def get_lockout_remaining_time(self, identifier):
         """Get remaining lockout time in seconds"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 SELECT attempt_time FROM login_attempts
                 WHERE identifier = ? AND success = 0
@@ -842,7 +1946,7 @@ class Database:
     
     def clear_failed_attempts(self, identifier):
         """Clear failed login attempts after successful login"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 DELETE FROM login_attempts
                 WHERE identifier = ? AND success = 0
@@ -851,7 +1955,7 @@ class Database:
     
     def cleanup_old_login_attempts(self, hours=24):
         """Clean up old login attempts (older than N hours)"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute(f'''
                 DELETE FROM login_attempts
                 WHERE attempt_time < datetime('now', '-{int(hours)} hours')
@@ -861,20 +1965,23 @@ class Database:
     # Legal Records Methods (NBI)
     def create_legal_record(self, politician_id, record_type, title, description, date, added_by):
         """Create a new legal record for a politician"""
-        with Database._db_lock:
+        with self._db_lock:
             try:
                 self.cursor.execute('''
                     INSERT INTO legal_records (politician_id, record_type, title, description, record_date, status, added_by)
                     VALUES (?, ?, ?, ?, ?, 'pending', ?)
                 ''', (politician_id, record_type, title, description, date, added_by))
+                record_id = self.cursor.lastrowid
+                self._sync_legal_record_search(record_id=record_id)
                 self.connection.commit()
-                return self.cursor.lastrowid
-            except sqlite3.IntegrityError:
+                self._notify_change("legal_records", record_id=record_id, politician_id=politician_id)
+                return record_id
+            except self.backend.IntegrityError:
                 return None
     
     def get_all_legal_records(self):
         """Get all legal records with politician info"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 SELECT lr.id, lr.politician_id, lr.record_type, lr.title, lr.description, 
                        lr.record_date, lr.status, lr.created_at, u.full_name, u.username, u.position, u.party, u.profile_image
@@ -886,7 +1993,7 @@ class Database:
     
     def get_legal_records_by_politician(self, politician_id):
         """Get all legal records for a specific politician"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 SELECT id, record_type, title, description, record_date, status, created_at
                 FROM legal_records
@@ -897,24 +2004,27 @@ class Database:
     
     def update_legal_record_status(self, record_id, status, verified_by):
         """Update the status of a legal record"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 UPDATE legal_records 
                 SET status = ?, verified_by = ?, verified_at = CURRENT_TIMESTAMP
                 WHERE id = ?
             ''', (status, verified_by, record_id))
             self.connection.commit()
+            self._notify_change("legal_records", record_id=record_id)
     
     def update_legal_record(self, record_id, record_type, title, description, date):
         """Update a legal record's details"""
-        with Database._db_lock:
+        with self._db_lock:
             try:
                 self.cursor.execute('''
                     UPDATE legal_records 
                     SET record_type = ?, title = ?, description = ?, record_date = ?
                     WHERE id = ?
                 ''', (record_type, title, description, date, record_id))
+                self._sync_legal_record_search(record_id=record_id)
                 self.connection.commit()
+                self._notify_change("legal_records", record_id=record_id)
                 return True
             except Exception as e:
                 print(f"Error updating legal record: {e}")
@@ -922,7 +2032,7 @@ class Database:
     
     def get_legal_record_by_id(self, record_id):
         """Get a single legal record by ID"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 SELECT id, politician_id, record_type, title, description, record_date, status
                 FROM legal_records
@@ -932,13 +2042,15 @@ class Database:
     
     def delete_legal_record(self, record_id):
         """Delete a legal record"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('DELETE FROM legal_records WHERE id = ?', (record_id,))
+            self._sync_legal_record_search(record_id=record_id)
             self.connection.commit()
+            self._notify_change("legal_records", record_id=record_id)
     
     def get_legal_records_stats(self):
         """Get statistics about legal records"""
-        with Database._db_lock:
+        with self._db_lock:
             # Total records
             self.cursor.execute('SELECT COUNT(*) FROM legal_records')
             total = self.cursor.fetchone()[0]
@@ -952,19 +2064,158 @@ class Database:
             pending = self.cursor.fetchone()[0]
         
             return {"total": total, "verified": verified, "pending": pending}
+
+    def get_legal_record_counts_by_politician(self, politician_ids=None):
+        """Get legal record status counts for every politician (or just politician_ids) in one query"""
+        where, params = "", []
+        if politician_ids is not None:
+            if not politician_ids:
+                return {}
+            where = f"WHERE politician_id IN ({','.join(['?' for _ in politician_ids])})"
+            params = list(politician_ids)
+        with self._db_lock:
+            self.cursor.execute(f'''
+                SELECT politician_id, COUNT(*),
+                       SUM(CASE WHEN status = 'verified' THEN 1 ELSE 0 END),
+                       SUM(CASE WHEN status = 'pending' THEN 1 ELSE 0 END)
+                FROM legal_records
+                {where}
+                GROUP BY politician_id
+            ''', params)
+            return {
+                r[0]: {"total": r[1], "verified": r[2], "pending": r[3]}
+                for r in self.cursor.fetchall()
+            }
+
+    # Record and politician-name columns behind every legal record search
+    LEGAL_RECORD_SELECT = '''
+        SELECT lr.id, lr.politician_id, lr.record_type, lr.title, lr.description, 
+               lr.record_date, lr.status, lr.created_at, u.full_name, u.username, u.position, u.party, u.profile_image
+        FROM legal_records lr
+        JOIN users u ON lr.politician_id = u.id
+    '''
+    
+    def _sync_legal_record_search(self, record_id=None, politician_id=None):
+        """Re-index one record, or all of a politician's records (call inside the write's transaction)"""
+        if not self.legal_record_index_enabled:
+            return
+        if record_id is not None:
+            self.cursor.execute('DELETE FROM legal_record_search WHERE rowid = ?', (record_id,))
+            where, param = "lr.id = ?", record_id
+        else:
+            self.cursor.execute(
+                'DELETE FROM legal_record_search WHERE rowid IN (SELECT id FROM legal_records WHERE politician_id = ?)',
+                (politician_id,),
+            )
+            where, param = "lr.politician_id = ?", politician_id
+        self.cursor.execute(f'''
+            INSERT INTO legal_record_search (rowid, title, description, record_type, politician_name)
+            SELECT lr.id, COALESCE(lr.title, ''), COALESCE(lr.description, ''), COALESCE(lr.record_type, ''),
+                   COALESCE(u.full_name, '') || ' ' || u.username
+            FROM legal_records lr
+            JOIN users u ON lr.politician_id = u.id
+            WHERE {where}
+        ''', (param,))
+    
+    def _backfill_legal_record_search(self):
+        """Rebuild the legal record index when it is out of step with the records table"""
+        self.cursor.execute('SELECT COUNT(*) FROM legal_records lr JOIN users u ON lr.politician_id = u.id')
+        records = self.cursor.fetchone()[0]
+        self.cursor.execute('SELECT COUNT(*) FROM legal_record_search')
+        if self.cursor.fetchone()[0] == records:
+            return
+        self.cursor.execute('DELETE FROM legal_record_search')
+        self.cursor.execute('''
+            INSERT INTO legal_record_search (rowid, title, description, record_type, politician_name)
+            SELECT lr.id, COALESCE(lr.title, ''), COALESCE(lr.description, ''), COALESCE(lr.record_type, ''),
+                   COALESCE(u.full_name, '') || ' ' || u.username
+            FROM legal_records lr
+            JOIN users u ON lr.politician_id = u.id
+        ''')
+    
+    def _legal_record_filter(self, query):
+        """SQL condition on lr (aliasing legal_records, joined to users u) matching every query word"""
+        words = (query or "").lower().split()
+        if not words:
+            return "1=1", []
+        if self.legal_record_index_enabled:
+            conditions, params = self._fts_word_conditions(
+                "legal_record_search", "lrs", ("title", "description", "record_type", "politician_name"), words
+            )
+            return (
+                f"lr.id IN (SELECT lrs.rowid FROM legal_record_search lrs WHERE {' AND '.join(conditions)})",
+                params,
+            )
+        conditions, params = [], []
+        for word in words:
+            conditions.append(
+                "(u.full_name LIKE ? OR u.username LIKE ? OR lr.title LIKE ? "
+                "OR lr.description LIKE ? OR lr.record_type LIKE ?)"
+            )
+            params.extend([f"%{word}%"] * 5)
+        return " AND ".join(conditions), params
     
     def search_legal_records(self, query):
-        """Search legal records by politician name or record title"""
-        with Database._db_lock:
-            search_term = f"%{query}%"
-            self.cursor.execute('''
-                SELECT lr.id, lr.politician_id, lr.record_type, lr.title, lr.description, 
-                       lr.record_date, lr.status, lr.created_at, u.full_name, u.username, u.position, u.party, u.profile_image
-                FROM legal_records lr
-                JOIN users u ON lr.politician_id = u.id
-                WHERE u.full_name LIKE ? OR u.username LIKE ? OR lr.title LIKE ?
+        """Search legal records by politician name, record title, description or type"""
+        with self._db_lock:
+            condition, params = self._legal_record_filter(query)
+            self.cursor.execute(
+                f"{self.LEGAL_RECORD_SELECT} WHERE {condition} ORDER BY lr.created_at DESC",
+                params,
+            )
+            return self.cursor.fetchall()
+    
+    def get_legal_record_politicians(self, query=None, limit=50, offset=0):
+        """Get one page of politicians with their record counts, most recently filed first
+        
+        Rows are (id, full_name, username, position, party, profile_image, total,
+        pending, verified, dismissed, latest_record_at). Politicians without records
+        follow when not searching; with a query only politicians having a matching
+        record are returned and the counts cover the matching records.
+        """
+        with self._db_lock:
+            columns = '''
+                SELECT u.id, u.full_name, u.username, u.position, u.party, u.profile_image,
+                       COUNT(lr.id),
+                       COALESCE(SUM(CASE WHEN lr.status = 'pending' THEN 1 ELSE 0 END), 0),
+                       COALESCE(SUM(CASE WHEN lr.status = 'verified' THEN 1 ELSE 0 END), 0),
+                       COALESCE(SUM(CASE WHEN lr.status NOT IN ('pending', 'verified') THEN 1 ELSE 0 END), 0),
+                       MAX(lr.created_at)
+                FROM users u
+            '''
+            if query:
+                condition, params = self._legal_record_filter(query)
+                self.cursor.execute(f'''
+                    {columns}
+                    JOIN legal_records lr ON lr.politician_id = u.id
+                    WHERE {condition}
+                    GROUP BY u.id
+                    ORDER BY MAX(lr.created_at) DESC, u.id
+                    LIMIT ? OFFSET ?
+                ''', params + [limit, offset])
+            else:
+                self.cursor.execute(f'''
+                    {columns}
+                    LEFT JOIN legal_records lr ON lr.politician_id = u.id
+                    WHERE u.role = 'politician' OR lr.id IS NOT NULL
+                    GROUP BY u.id
+                    ORDER BY MAX(lr.created_at) IS NULL, MAX(lr.created_at) DESC, u.id
+                    LIMIT ? OFFSET ?
+                ''', (limit, offset))
+            return self.cursor.fetchall()
+    
+    def get_legal_records_for_politicians(self, politician_ids, query=None):
+        """Get legal records for a set of politicians, matching query if given"""
+        if not politician_ids:
+            return []
+        with self._db_lock:
+            placeholders = ','.join(['?' for _ in politician_ids])
+            condition, params = self._legal_record_filter(query)
+            self.cursor.execute(f'''
+                {self.LEGAL_RECORD_SELECT}
+                WHERE lr.politician_id IN ({placeholders}) AND {condition}
                 ORDER BY lr.created_at DESC
-            ''', (search_term, search_term, search_term))
+            ''', list(politician_ids) + params)
             return self.cursor.fetchall()
     
     # =====================
@@ -974,7 +2225,7 @@ class Database:
     def log_action(self, action, action_type, description=None, user_id=None, user_role=None, 
                    target_type=None, target_id=None, details=None, ip_address=None):
         """Log an action to the audit log"""
-        with Database._db_lock:
+        with self._db_lock:
             try:
                 details_json = json.dumps(details) if details else None
                 self.cursor.execute('''
@@ -984,6 +2235,7 @@ class Database:
                 ''', (action, action_type, description, user_id, user_role, 
                       target_type, target_id, details_json, ip_address))
                 self.connection.commit()
+                AUDIT_EVENTS.inc(action_type=action_type or "unknown")
                 return self.cursor.lastrowid
             except Exception as e:
                 print(f"Error logging action: {e}")
@@ -992,7 +2244,7 @@ class Database:
     def get_audit_logs(self, limit=100, offset=0, action_type=None, user_role=None, 
                        date_from=None, date_to=None):
         """Get audit logs with optional filtering including date range"""
-        with Database._db_lock:
+        with self._db_lock:
             query = '''
                 SELECT al.id, al.action, al.action_type, al.description, al.user_id, 
                        al.user_role, al.target_type, al.target_id, al.details, 
@@ -1025,9 +2277,9 @@ class Database:
             self.cursor.execute(query, params)
             return self.cursor.fetchall()
     
-    def get_audit_logs_for_role(self, viewer_role, limit=100, offset=0):
+    def get_audit_logs_for_role(self, viewer_role, limit=100, offset=0, date_from=None):
         """Get audit logs filtered by what a role is allowed to see"""
-        with Database._db_lock:
+        with self._db_lock:
             # Define what each role can see
             role_permissions = {
                 'comelec': ['all'],  # COMELEC can see everything
@@ -1038,7 +2290,7 @@ class Database:
             allowed_types = role_permissions.get(viewer_role, [])
         
             if 'all' in allowed_types:
-                return self.get_audit_logs(limit, offset)
+                return self.get_audit_logs(limit, offset, date_from=date_from)
         
             if not allowed_types:
                 return []
@@ -1051,16 +2303,19 @@ class Database:
                 FROM audit_logs al
                 LEFT JOIN users u ON al.user_id = u.id
                 WHERE al.action_type IN ({placeholders})
-                ORDER BY al.created_at DESC
-                LIMIT ? OFFSET ?
             '''
-            params = allowed_types + [limit, offset]
+            params = list(allowed_types)
+            if date_from:
+                query += " AND al.created_at >= ?"
+                params.append(date_from)
+            query += " ORDER BY al.created_at DESC LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
             self.cursor.execute(query, params)
             return self.cursor.fetchall()
     
     def get_audit_log_stats(self):
         """Get audit log statistics"""
-        with Database._db_lock:
+        with self._db_lock:
             stats = {}
         
             # Total logs
@@ -1083,9 +2338,9 @@ class Database:
         
             return stats
     
-    def search_audit_logs(self, query, viewer_role=None, limit=100):
+    def search_audit_logs(self, query, viewer_role=None, limit=100, offset=0, date_from=None):
         """Search audit logs by action, description, or username"""
-        with Database._db_lock:
+        with self._db_lock:
             search_term = f"%{query}%"
         
             base_query = '''
@@ -1110,8 +2365,12 @@ class Database:
                     base_query += f" AND al.action_type IN ({placeholders})"
                     params.extend(allowed_types)
         
-            base_query += " ORDER BY al.created_at DESC LIMIT ?"
-            params.append(limit)
+            if date_from:
+                base_query += " AND al.created_at >= ?"
+                params.append(date_from)
+        
+            base_query += " ORDER BY al.created_at DESC LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
         
             self.cursor.execute(base_query, params)
             return self.cursor.fetchall()
@@ -1122,21 +2381,23 @@ class Database:
     
     def create_news_post(self, author_id, author_role, title, content, category='general', is_pinned=False):
         """Create a news post (for politicians, NBI, COMELEC)"""
-        with Database._db_lock:
+        with self._db_lock:
             try:
                 self.cursor.execute('''
                     INSERT INTO news_posts (author_id, author_role, title, content, category, is_pinned)
                     VALUES (?, ?, ?, ?, ?, ?)
                 ''', (author_id, author_role, title, content, category, is_pinned))
                 self.connection.commit()
-                return self.cursor.lastrowid
+                post_id = self.cursor.lastrowid
+                self._notify_change("news_posts", post_id=post_id, author_id=author_id)
+                return post_id
             except Exception as e:
                 print(f"Error creating news post: {e}")
                 return None
     
     def get_news_posts(self, limit=50, offset=0, category=None, author_role=None):
         """Get news posts for the feed (voters view)"""
-        with Database._db_lock:
+        with self._db_lock:
             query = '''
                 SELECT np.id, np.author_id, np.author_role, np.title, np.content, 
                        np.category, np.is_pinned, np.created_at, np.updated_at,
@@ -1181,7 +2442,7 @@ class Database:
     
     def get_news_posts_by_author(self, author_id, limit=20):
         """Get news posts by a specific author"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('''
                 SELECT id, title, content, category, is_pinned, created_at, updated_at
                 FROM news_posts
@@ -1193,7 +2454,7 @@ class Database:
     
     def update_news_post(self, post_id, title, content, category=None, is_pinned=None):
         """Update a news post"""
-        with Database._db_lock:
+        with self._db_lock:
             try:
                 updates = ["title = ?", "content = ?", "updated_at = CURRENT_TIMESTAMP"]
                 params = [title, content]
@@ -1212,6 +2473,7 @@ class Database:
                     UPDATE news_posts SET {", ".join(updates)} WHERE id = ?
                 ''', params)
                 self.connection.commit()
+                self._notify_change("news_posts", post_id=post_id)
                 return True
             except Exception as e:
                 print(f"Error updating news post: {e}")
@@ -1219,23 +2481,158 @@ class Database:
     
     def delete_news_post(self, post_id):
         """Delete a news post"""
-        with Database._db_lock:
+        with self._db_lock:
             self.cursor.execute('DELETE FROM news_posts WHERE id = ?', (post_id,))
+            self.cursor.execute('DELETE FROM news_post_themes WHERE post_id = ?', (post_id,))
+            self.cursor.execute('DELETE FROM news_post_features WHERE post_id = ?', (post_id,))
+            self.connection.commit()
+            self._notify_change("news_posts", post_id=post_id)
+    
+    def get_news_post_by_id(self, post_id):
+        """Get a single news post as (id, author_id, author_role, title, content)"""
+        with self._db_lock:
+            self.cursor.execute('''
+                SELECT id, author_id, author_role, title, content
+                FROM news_posts WHERE id = ?
+            ''', (post_id,))
+            return self.cursor.fetchone()
+    
+    # =====================
+    # News Analysis Methods
+    # =====================
+    
+    def save_news_post_features(self, post_id, author_id, sentiment, themes):
+        """Replace the derived sentiment and {theme: weight} for a news post"""
+        with self._db_lock:
+            try:
+                self.cursor.execute('''
+                    INSERT OR REPLACE INTO news_post_features (post_id, author_id, sentiment, analyzed_at)
+                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                ''', (post_id, author_id, sentiment))
+                self.cursor.execute('DELETE FROM news_post_themes WHERE post_id = ?', (post_id,))
+                self.cursor.executemany('''
+                    INSERT INTO news_post_themes (post_id, theme, weight) VALUES (?, ?, ?)
+                ''', [(post_id, theme, weight) for theme, weight in themes.items()])
+                self.connection.commit()
+                self._notify_change("news_post_features", post_id=post_id, author_id=author_id)
+                return True
+            except Exception as e:
+                print(f"Error saving news post features: {e}")
+                return False
+    
+    def get_unanalyzed_news_post_ids(self, limit=500):
+        """Get ids of posts with no features yet or edited since they were analyzed"""
+        with self._db_lock:
+            self.cursor.execute('''
+                SELECT np.id FROM news_posts np
+                LEFT JOIN news_post_features f ON f.post_id = np.id
+                WHERE f.post_id IS NULL OR np.updated_at > f.analyzed_at
+                ORDER BY np.id
+                LIMIT ?
+            ''', (limit,))
+            return [r[0] for r in self.cursor.fetchall()]
+    
+    def get_news_sentiment_by_politician(self):
+        """Get per-politician post counts and average sentiment from analyzed posts"""
+        with self._db_lock:
+            self.cursor.execute('''
+                SELECT f.author_id, COALESCE(u.full_name, u.username),
+                       COUNT(*), AVG(f.sentiment)
+                FROM news_post_features f
+                JOIN users u ON u.id = f.author_id
+                WHERE u.role = 'politician'
+                GROUP BY f.author_id, u.full_name, u.username
+                ORDER BY COUNT(*) DESC
+            ''')
+            return [{
+                "politician_id": r[0],
+                "name": r[1],
+                "posts": r[2],
+                "avg_sentiment": r[3] or 0.0,
+            } for r in self.cursor.fetchall()]
+    
+    def get_news_theme_trends(self, days=30):
+        """Get per-theme post counts and average sentiment over the last `days` days"""
+        with self._db_lock:
+            self.cursor.execute('''
+                SELECT t.theme, COUNT(*), AVG(f.sentiment)
+                FROM news_post_themes t
+                JOIN news_post_features f ON f.post_id = t.post_id
+                JOIN news_posts np ON np.id = t.post_id
+                WHERE np.created_at >= datetime('now', ?)
+                GROUP BY t.theme
+                ORDER BY COUNT(*) DESC
+            ''', (f"-{int(days)} days",))
+            return [{
+                "theme": r[0],
+                "posts": r[1],
+                "avg_sentiment": r[2] or 0.0,
+            } for r in self.cursor.fetchall()]
+    
+    # =====================
+    # Recommendation Cache Methods
+    # =====================
+    
+    def get_cached_recommendations(self, cache_key):
+        """Get the cached ranking ({"ranked": [[politician_id, score], ...]}) for a preference key, or None"""
+        with self._db_lock:
+            self.cursor.execute('SELECT payload FROM recommendation_cache WHERE cache_key = ?', (cache_key,))
+            result = self.cursor.fetchone()
+            return json.loads(result[0]) if result else None
+    
+    def save_cached_recommendations(self, cache_key, recommendations):
+        """Store a ranking of politician ids and scores for a preference key"""
+        with self._db_lock:
+            try:
+                self.cursor.execute('''
+                    INSERT OR REPLACE INTO recommendation_cache (cache_key, payload)
+                    VALUES (?, ?)
+                ''', (cache_key, json.dumps(recommendations)))
+                self.connection.commit()
+                return True
+            except Exception as e:
+                print(f"Error caching recommendations: {e}")
+                return False
+    
+    def clear_recommendation_cache(self):
+        """Drop every cached recommendation"""
+        with self._db_lock:
+            self.cursor.execute('DELETE FROM recommendation_cache')
             self.connection.commit()
     
     def close(self):
         """Close database connection"""
         if self.connection:
             self.connection.close()
+            self.connection = None
+            self.cursor = None
+
+
+_shared_database = None
+_shared_database_lock = threading.Lock()
+
+
+def get_database():
+    """Return the process-wide Database, opening it on first use
+    
+    Page sessions and background services share this one connection
+    (statements are serialized by Database._db_lock) instead of each
+    opening their own. It is reopened if something closed it.
+    """
+    global _shared_database
+    with _shared_database_lock:
+        if _shared_database is None or _shared_database.connection is None:
+            _shared_database = Database()
+        return _shared_database
 
 
-def init_demo_data():
+def init_demo_data(db=None):
     """Initialize database with demo users and candidates"""
-    db = Database()
+    if db is None:
+        db = get_database()
     
     # Check if users already exist
-    existing_users = db.get_all_users()
-    if len(existing_users) > 0:
+    if db.has_users():
         return db  # Database already initialized, return open connection
     
     # Create role-based demo users
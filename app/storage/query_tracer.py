@@ -0,0 +1,218 @@
+"""
+Query Tracer - Statement-level timing for the SQLite database layer
+Keeps a latency histogram, row counts and lock wait per normalized statement,
+and logs statements over the slow-query threshold with their query plan
+"""
+
+import re
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional
+
+from app.metrics import DB_LOCK_WAIT_SECONDS, DB_QUERY_ERRORS, DB_QUERY_SECONDS
+from app.security_logger import logger as app_logger
+
+try:
+    from app.config import Config
+except ImportError:
+    Config = None
+
+
+db_logger = app_logger.getChild("db")
+
+# Upper bounds (milliseconds) of the latency histogram buckets; a final bucket catches the rest
+LATENCY_BUCKETS_MS = (0.1, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+# Only these statements have a plan worth logging
+_EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE", "REPLACE")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+
+
+def statement_kind(sql: str) -> str:
+    """Leading keyword of a statement (SELECT, INSERT, ...), used as a low-cardinality label"""
+    words = sql.split(None, 1)
+    return words[0].upper() if words else "UNKNOWN"
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace and IN (?, ?, ...) lists so one query shape maps to one key"""
+    return _PLACEHOLDER_LIST.sub("(?...)", " ".join(sql.split()))
+
+
+class StatementStats:
+    """Running totals and latency histogram for one statement shape"""
+    
+    __slots__ = ("sql", "count", "errors", "total_ms", "max_ms", "rows", "lock_wait_ms", "buckets")
+    
+    def __init__(self, sql: str):
+        self.sql = sql
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.lock_wait_ms = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+    
+    def observe(self, elapsed_ms: float, rows: int, lock_wait_ms: float):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.rows += max(rows, 0)
+        self.lock_wait_ms += lock_wait_ms
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+    
+    def percentile(self, q: float) -> float:
+        """Approximate latency percentile (bucket upper bound) in milliseconds"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.buckets):
+            seen += n
+            if seen >= target:
+                return LATENCY_BUCKETS_MS[i] if i < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+    
+    def to_dict(self) -> Dict:
+        return {
+            "sql": self.sql,
+            "count": self.count,
+            "errors": self.errors,
+            "total_ms": self.total_ms,
+            "avg_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(0.5),
+            "p95_ms": self.percentile(0.95),
+            "max_ms": self.max_ms,
+            "rows": self.rows,
+            "avg_rows": self.rows / self.count if self.count else 0.0,
+            "lock_wait_ms": self.lock_wait_ms,
+            "buckets": list(zip(LATENCY_BUCKETS_MS + (float("inf"),), self.buckets)),
+        }
+
+
+class TimedLock:
+    """Re-entrant lock that measures how long callers wait to acquire it
+    
+    Drop-in for threading.RLock as Database._db_lock. Only the outermost
+    acquire on a thread is timed; the wait is kept for the next statement
+    that thread runs so it can be charged to that query.
+    """
+    
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self.acquisitions = 0
+        self.contended = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+    
+    def acquire(self, blocking=True, timeout=-1):
+        if getattr(self._local, "depth", 0):
+            self._lock.acquire()
+            self._local.depth += 1
+            return True
+        
+        started = time.perf_counter()
+        if not self._lock.acquire(blocking, timeout):
+            return False
+        waited = time.perf_counter() - started
+        self._local.depth = 1
+        self._local.wait = waited
+        # Counters are only touched while holding the lock
+        self.acquisitions += 1
+        self.wait_seconds += waited
+        if waited > 0.001:
+            self.contended += 1
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        DB_LOCK_WAIT_SECONDS.observe(waited)
+        return True
+    
+    def release(self):
+        self._local.depth -= 1
+        self._lock.release()
+    
+    __enter__ = acquire
+    
+    def __exit__(self, *exc):
+        self.release()
+    
+    def take_wait(self) -> float:
+        """Return and clear this thread's last acquire wait in seconds"""
+        waited = getattr(self._local, "wait", 0.0)
+        self._local.wait = 0.0
+        return waited
+    
+    def stats(self) -> Dict:
+        return {
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+            "wait_ms": self.wait_seconds * 1000,
+            "max_wait_ms": self.max_wait_seconds * 1000,
+        }
+
+
+class QueryTracer:
+    """Aggregates statement timings reported by the database cursor"""
+    
+    def __init__(self, enabled: bool = None, slow_ms: float = None):
+        if enabled is None:
+            enabled = Config.QUERY_TRACING if Config else False
+        if slow_ms is None:
+            slow_ms = Config.SLOW_QUERY_MS if Config else 100
+        self.enabled = enabled
+        self.slow_ms = slow_ms
+        self._lock = threading.Lock()
+        self._stats: Dict[str, StatementStats] = {}
+    
+    def record(self, sql, parameters, elapsed, rows, lock_wait=0.0, connection=None):
+        """Record one finished statement; elapsed and lock_wait are in seconds"""
+        key = normalize_sql(sql)
+        elapsed_ms = elapsed * 1000
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = StatementStats(key)
+            stats.observe(elapsed_ms, rows, lock_wait * 1000)
+        DB_QUERY_SECONDS.observe(elapsed, statement=statement_kind(sql))
+        
+        if elapsed_ms >= self.slow_ms:
+            plan = self.explain(connection, sql, parameters) if connection is not None and parameters is not None else ""
+            db_logger.warning(
+                f"Slow query | {elapsed_ms:.1f}ms | rows={max(rows, 0)} | lock_wait={lock_wait * 1000:.1f}ms "
+                f"| {key} | plan: {plan or 'n/a'}"
+            )
+    
+    def record_error(self, sql, error):
+        key = normalize_sql(sql)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = StatementStats(key)
+            stats.errors += 1
+        DB_QUERY_ERRORS.inc(statement=statement_kind(sql))
+        db_logger.warning(f"Query failed | {type(error).__name__}: {error} | {key}")
+    
+    @staticmethod
+    def explain(connection, sql, parameters=()) -> str:
+        """EXPLAIN QUERY PLAN for sql, as '; '-joined plan steps"""
+        if not sql.lstrip().upper().startswith(_EXPLAINABLE):
+            return ""
+        try:
+            # connection.execute uses a plain cursor, so this is not traced again
+            plan = connection.execute(f"EXPLAIN QUERY PLAN {sql}", parameters).fetchall()
+        except Exception as e:
+            return f"unavailable ({e})"
+        return "; ".join(str(step[-1]) for step in plan)
+    
+    def snapshot(self, order_by: str = "total_ms", limit: Optional[int] = None) -> List[Dict]:
+        """Per-statement stats, most expensive first"""
+        with self._lock:
+            rows = [stats.to_dict() for stats in self._stats.values()]
+        rows.sort(key=lambda r: r[order_by], reverse=True)
+        return rows[:limit] if limit else rows
+    
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
@@ -0,0 +1,175 @@
+"""
+Recount - Independent, parallel recount of an election session's ballots
+Copies the database to a snapshot with the incremental online backup (the
+live file is only read a few pages at a time), streams the snapshot's votes
+in id-range chunks through worker processes that count per position and
+candidate, merges the partial counts and reconciles them with the
+materialized vote_tallies the app reports results from.
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from app.storage.backup import backup_database
+from app.storage.vote_ledger import connect_read_only
+
+try:
+    from app.config import Config
+except ImportError:
+    Config = None
+
+
+@dataclass
+class Discrepancy:
+    """One candidate whose recounted votes differ from the live tally"""
+    
+    position: str
+    candidate_id: int
+    recounted: int
+    tallied: int
+    
+    @property
+    def difference(self) -> int:
+        return self.recounted - self.tallied
+
+
+@dataclass
+class RecountReport:
+    """Recounted results of one election session and how they reconcile"""
+    
+    election_session_id: Optional[int]
+    results: Dict[str, Dict[int, int]] = field(default_factory=dict)  # position -> candidate_id -> votes
+    tallies: Dict[str, Dict[int, int]] = field(default_factory=dict)
+    discrepancies: List[Discrepancy] = field(default_factory=list)
+    total_votes: int = 0
+    chunks: int = 0
+    snapshot: bool = True
+    elapsed_seconds: float = 0.0
+    
+    @property
+    def ok(self) -> bool:
+        return not self.discrepancies
+    
+    def summary(self) -> str:
+        status = "RECONCILED" if self.ok else f"{len(self.discrepancies)} DISCREPANCIES"
+        return (
+            f"Recount {status} | session={self.election_session_id} votes={self.total_votes} "
+            f"positions={len(self.results)} chunks={self.chunks} "
+            f"source={'snapshot' if self.snapshot else 'live'} | {self.elapsed_seconds:.2f}s"
+        )
+
+
+def _count_chunk(task) -> Dict:
+    """Count one id range of a session's votes by (position, candidate) (worker process entry point)"""
+    path, election_session_id, first_id, last_id = task
+    counts = Counter()
+    connection = connect_read_only(path)
+    try:
+        rows = connection.execute(
+            'SELECT position, candidate_id FROM votes WHERE id BETWEEN ? AND ? AND election_session_id = ?',
+            (first_id, last_id, election_session_id)
+        )
+        for position, candidate_id in rows:
+            counts[(position, candidate_id)] += 1
+    finally:
+        connection.close()
+    return counts
+
+
+class Recounter:
+    """Recounts a database file's votes across worker processes"""
+    
+    def __init__(self, db_path: str = None, workers: int = None, chunk_size: int = None, use_snapshot: bool = True):
+        if db_path is None:
+            db_path = Config.DATABASE_NAME if Config else "voting_app.db"
+        if workers is None:
+            workers = Config.RECOUNT_WORKERS if Config else 0
+        if chunk_size is None:
+            chunk_size = Config.RECOUNT_CHUNK_SIZE if Config else 100000
+        self.db_path = str(db_path)
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.use_snapshot = use_snapshot
+    
+    def recount(self, election_session_id: int = None) -> RecountReport:
+        """Recount one session (the active one by default) and reconcile it with vote_tallies"""
+        started = time.perf_counter()
+        snapshot_dir = tempfile.mkdtemp(prefix="recount-") if self.use_snapshot else None
+        try:
+            path = self.db_path
+            if snapshot_dir:
+                path = os.path.join(snapshot_dir, "snapshot.db")
+                backup_database(self.db_path, path)
+            report = self._recount(path, election_session_id)
+        finally:
+            if snapshot_dir:
+                shutil.rmtree(snapshot_dir, ignore_errors=True)
+        report.snapshot = self.use_snapshot
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+    
+    def _recount(self, path: str, election_session_id: Optional[int]) -> RecountReport:
+        # Without a snapshot this connection's read transaction keeps the tallies and
+        # vote id range consistent, but ballots cast meanwhile may still be counted
+        connection = connect_read_only(path)
+        try:
+            if election_session_id is None:
+                row = connection.execute(
+                    'SELECT id FROM election_sessions WHERE is_active = 1 ORDER BY id DESC LIMIT 1'
+                ).fetchone()
+                election_session_id = row[0] if row else None
+            first_id, last_id = connection.execute('SELECT MIN(id), MAX(id) FROM votes').fetchone()
+            tallied = connection.execute(
+                'SELECT position, candidate_id, vote_count FROM vote_tallies WHERE election_session_id = ?',
+                (election_session_id,)
+            ).fetchall()
+        finally:
+            connection.close()
+        
+        tasks = []
+        if first_id is not None and election_session_id is not None:
+            for lo in range(first_id, last_id + 1, self.chunk_size):
+                tasks.append((path, election_session_id, lo, min(lo + self.chunk_size - 1, last_id)))
+        
+        counts = Counter()
+        workers = min(self.workers, len(tasks))
+        if workers <= 1:
+            for task in tasks:
+                counts.update(_count_chunk(task))
+        else:
+            with multiprocessing.Pool(workers) as pool:
+                for partial in pool.imap_unordered(_count_chunk, tasks):
+                    counts.update(partial)
+        
+        report = RecountReport(election_session_id=election_session_id, chunks=len(tasks))
+        for (position, candidate_id), votes in counts.items():
+            report.results.setdefault(position, {})[candidate_id] = votes
+            report.total_votes += votes
+        for position, candidate_id, vote_count in tallied:
+            report.tallies.setdefault(position, {})[candidate_id] = vote_count
+        report.discrepancies = reconcile(report.results, report.tallies)
+        return report
+
+
+def reconcile(results: Dict[str, Dict[int, int]], tallies: Dict[str, Dict[int, int]]) -> List[Discrepancy]:
+    """Candidates whose recounted and tallied votes differ (a missing side counts as 0)"""
+    tallied_by_candidate = {
+        candidate_id: (position, votes)
+        for position, candidates in tallies.items() for candidate_id, votes in candidates.items()
+    }
+    discrepancies = []
+    for position, candidates in results.items():
+        for candidate_id, votes in candidates.items():
+            _, tallied = tallied_by_candidate.pop(candidate_id, (position, 0))
+            if votes != tallied:
+                discrepancies.append(Discrepancy(position, candidate_id, votes, tallied))
+    for candidate_id, (position, tallied) in tallied_by_candidate.items():
+        if tallied:
+            discrepancies.append(Discrepancy(position, candidate_id, 0, tallied))
+    return sorted(discrepancies, key=lambda d: (d.position, d.candidate_id))
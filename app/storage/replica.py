@@ -0,0 +1,162 @@
+"""
+Replica - A read-only copy of the database for reporting
+Analytics, the audit log and other reporting screens can read a copy of the
+database file instead of the database itself. The copy is refreshed through
+the backup API (a few pages per step, see backup_database), so reports never
+take the lock voters' writes wait on, and their scans never hold the
+database file's read lock while a ballot is being committed.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from urllib.parse import quote
+
+from app.metrics import REPLICA_LAG_SECONDS, REPLICA_REFRESH_SECONDS, REPLICA_REFRESHES
+from app.storage.backup import BackupResult, backup_database
+from app.storage.database import Database
+from app.storage.query_tracer import TimedLock
+from app.storage.vote_ledger import connect_read_only
+
+try:
+    from app.config import Config
+except ImportError:
+    Config = None
+
+
+class ReplicaDatabase(Database):
+    """Database opened read-only on a replica file
+    
+    Every read method works unchanged and writes fail with "attempt to write
+    a readonly database". It has its own lock, so a long report never makes
+    a ballot wait and a ballot never makes a report wait.
+    """
+    
+    def __init__(self, db_name):
+        self._db_lock = TimedLock()
+        super().__init__(db_name)
+    
+    def initialize_db(self):
+        """Open the replica read-only; its schema is whatever the copied database had"""
+        uri = f"file:{quote(self.db_path.resolve().as_posix())}?mode=ro"
+        # A refresh holds the replica's write lock for one local copy; wait it out
+        self.connection = sqlite3.connect(uri, uri=True, check_same_thread=False, timeout=30)
+        self.cursor = self._traced_cursor()
+        self._detect_search_indexes()
+
+
+class ReadReplica:
+    """A copy of one database file, refreshed on demand and never older than a bound
+    
+    refresh() copies the database into a per-process staging file through the
+    backup API and then into the replica in one local step, so readers of the
+    replica only ever wait for that final copy. An interval with no commits
+    (PRAGMA data_version unchanged) costs no copy at all.
+    """
+    
+    def __init__(self, db_path: str = None, replica_path: str = None, max_staleness_seconds: float = None):
+        if db_path is None:
+            db_path = Config.DATABASE_NAME if Config else "voting_app.db"
+        if replica_path is None:
+            replica_path = Config.REPLICA_PATH if Config else "voting_app_replica.db"
+        if max_staleness_seconds is None:
+            max_staleness_seconds = Config.REPLICA_MAX_STALENESS_SECONDS if Config else 60
+        self.db_path = Path(db_path)
+        self.replica_path = Path(replica_path)
+        if self.replica_path.resolve() == self.db_path.resolve():
+            raise ValueError("The replica must be a different file from the database")
+        self.max_staleness_seconds = max_staleness_seconds
+        # Wall-clock time at which the replica was last known to hold every commit
+        self.refreshed_at: Optional[float] = None
+        self.last_result: Optional[BackupResult] = None
+        
+        self._database: Optional[ReplicaDatabase] = None
+        self._watch: Optional[sqlite3.Connection] = None
+        self._seen_version = None
+        self._lock = threading.Lock()
+    
+    @property
+    def staleness_seconds(self) -> Optional[float]:
+        """Seconds since the replica last matched the database (None before the first refresh)"""
+        if self.refreshed_at is None:
+            return None
+        return max(0.0, time.time() - self.refreshed_at)
+    
+    def is_fresh(self, max_staleness_seconds: float = None) -> bool:
+        if max_staleness_seconds is None:
+            max_staleness_seconds = self.max_staleness_seconds
+        staleness = self.staleness_seconds
+        return staleness is not None and staleness <= max_staleness_seconds
+    
+    def refresh(self, force: bool = False) -> Optional[BackupResult]:
+        """Bring the replica up to date; returns the copy made, or None if nothing had changed"""
+        with self._lock:
+            checked_at = time.time()
+            version = self._data_version()
+            if not force and version == self._seen_version and self.replica_path.exists():
+                self.refreshed_at = checked_at
+                REPLICA_REFRESHES.inc(outcome="unchanged")
+                return None
+            
+            started = time.perf_counter()
+            staging_path = self.replica_path.with_name(f"{self.replica_path.name}.staging-{os.getpid()}")
+            try:
+                result = backup_database(self.db_path, staging_path)
+                self._install(staging_path)
+            except Exception:
+                REPLICA_REFRESHES.inc(outcome="failed")
+                raise
+            finally:
+                staging_path.unlink(missing_ok=True)
+            
+            # Commits made while copying leave the version changed, so the next refresh copies again
+            self._seen_version = version
+            self.refreshed_at = checked_at
+            self.last_result = result
+            REPLICA_REFRESHES.inc(outcome="copied")
+            REPLICA_REFRESH_SECONDS.observe(time.perf_counter() - started)
+        
+        if self._database is not None:
+            # Voting status cached for the replica file describes the previous copy
+            self._database.voting_state.invalidate()
+            self._database._notify_change("replica", refreshed_at=checked_at)
+        return result
+    
+    def database(self, max_staleness_seconds: float = None) -> ReplicaDatabase:
+        """The replica as a read-only Database, refreshed first if it is older than the bound"""
+        if not self.is_fresh(max_staleness_seconds):
+            self.refresh()
+        if self._database is None:
+            self._database = ReplicaDatabase(self.replica_path)
+        REPLICA_LAG_SECONDS.set(self.staleness_seconds or 0.0)
+        return self._database
+    
+    def close(self):
+        with self._lock:
+            if self._watch is not None:
+                self._watch.close()
+                self._watch = None
+            if self._database is not None:
+                self._database.close()
+                self._database = None
+    
+    def _data_version(self) -> int:
+        if self._watch is None:
+            # Only used for data_version, so it never holds a read transaction; refreshes run
+            # on the refresher thread and on whichever thread finds the replica stale
+            uri = f"file:{quote(self.db_path.resolve().as_posix())}?mode=ro"
+            self._watch = sqlite3.connect(uri, uri=True, isolation_level=None, check_same_thread=False)
+        return self._watch.execute('PRAGMA data_version').fetchone()[0]
+    
+    def _install(self, staging_path: Path):
+        """Copy a finished staging file over the replica in one step"""
+        source = connect_read_only(str(staging_path))
+        target = sqlite3.connect(str(self.replica_path), timeout=30)
+        try:
+            source.backup(target)
+        finally:
+            target.close()
+            source.close()
@@ -0,0 +1,395 @@
+"""
+Vote Ledger - Append-only, Merkle-sealed record of every ballot write
+Each cast or changed vote appends a ledger entry in the vote's transaction;
+full batches are sealed with an RFC 6962-style Merkle root chained to the
+previous batch, so any edit, removal or reordering of a sealed entry changes
+the chain. The verifier streams the ledger in parallel worker processes
+with memory bounded by the batch size, and an inclusion proof shows one
+ballot is in a sealed batch with O(log n) hashes.
+"""
+
+import hashlib
+import multiprocessing
+import os
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import quote
+
+try:
+    from app.config import Config
+except ImportError:
+    Config = None
+
+
+# Domain-separation prefixes keep leaves, inner nodes and chain links from colliding
+LEAF_PREFIX = b"\x00"
+NODE_PREFIX = b"\x01"
+CHAIN_PREFIX = b"\x02"
+
+# prev_hash of the first sealed batch
+GENESIS_HASH = "0" * 64
+
+# Entry columns covered by the leaf hash, in hashing order
+LEAF_FIELDS = ("election_session_id", "vote_id", "voter_id", "candidate_id", "position", "action", "recorded_at")
+
+# At most this many problems are kept per report (all are counted)
+MAX_REPORTED_ERRORS = 100
+
+
+def leaf_hash(election_session_id, vote_id, voter_id, candidate_id, position, action, recorded_at) -> str:
+    """Hex SHA-256 of one ledger entry's fields"""
+    data = "\x1f".join(str(value) for value in (
+        election_session_id, vote_id, voter_id, candidate_id, position, action, recorded_at
+    ))
+    return hashlib.sha256(LEAF_PREFIX + data.encode("utf-8")).hexdigest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(NODE_PREFIX + left + right).digest()
+
+
+def chain_hash(prev_hash: str, merkle_root: str, first_seq: int, last_seq: int, leaf_count: int) -> str:
+    """Hex link sealing one batch onto the previous batch's chain hash"""
+    data = bytes.fromhex(prev_hash) + bytes.fromhex(merkle_root) + f"{first_seq}|{last_seq}|{leaf_count}".encode()
+    return hashlib.sha256(CHAIN_PREFIX + data).hexdigest()
+
+
+class MerkleRootBuilder:
+    """Streaming Merkle tree hash: O(log n) memory however many leaves are added
+    
+    Keeps one root per complete subtree (sizes are the set bits of the leaf
+    count, largest first); folding them right to left gives the same root as
+    the recursive RFC 6962 definition.
+    """
+    
+    def __init__(self):
+        self._subtrees = []  # [(leaf_count, root)]
+        self.count = 0
+    
+    def add(self, leaf: bytes):
+        size, node = 1, leaf
+        while self._subtrees and self._subtrees[-1][0] == size:
+            _, left = self._subtrees.pop()
+            size, node = size * 2, node_hash(left, node)
+        self._subtrees.append((size, node))
+        self.count += 1
+    
+    def root(self) -> bytes:
+        if not self._subtrees:
+            return hashlib.sha256(b"").digest()
+        node = self._subtrees[-1][1]
+        for _, left in reversed(self._subtrees[:-1]):
+            node = node_hash(left, node)
+        return node
+
+
+def merkle_root(leaves: Iterable[bytes]) -> bytes:
+    builder = MerkleRootBuilder()
+    for leaf in leaves:
+        builder.add(leaf)
+    return builder.root()
+
+
+def _split(n: int) -> int:
+    # Largest power of two smaller than n
+    k = 1
+    while k * 2 < n:
+        k *= 2
+    return k
+
+
+def audit_path(leaves: List[bytes], index: int) -> List[bytes]:
+    """Sibling hashes from leaf index up to the root (RFC 6962 PATH), leaf side first"""
+    if not 0 <= index < len(leaves):
+        raise IndexError(f"Leaf {index} is outside a tree of {len(leaves)}")
+    path = []
+    lo, hi = 0, len(leaves)
+    while hi - lo > 1:
+        k = _split(hi - lo)
+        if index < lo + k:
+            path.append(merkle_root(leaves[lo + k:hi]))
+            hi = lo + k
+        else:
+            path.append(merkle_root(leaves[lo:lo + k]))
+            lo = lo + k
+    return path[::-1]
+
+
+def verify_inclusion(leaf: bytes, index: int, size: int, path: List[bytes], root: bytes) -> bool:
+    """Check an audit path in O(log n) (RFC 9162 section 2.1.3.2)"""
+    if not 0 <= index < size:
+        return False
+    fn, sn = index, size - 1
+    node = leaf
+    for sibling in path:
+        if sn == 0:
+            return False
+        if fn & 1 or fn == sn:
+            node = node_hash(sibling, node)
+            while not fn & 1 and fn != 0:
+                fn >>= 1
+                sn >>= 1
+        else:
+            node = node_hash(node, sibling)
+        fn >>= 1
+        sn >>= 1
+    return sn == 0 and node == root
+
+
+def verify_inclusion_proof(proof: Dict) -> bool:
+    """Check a proof from Database.get_vote_inclusion_proof()
+    
+    Recomputes the leaf from the entry's fields, walks the audit path to the
+    batch's Merkle root and re-derives the batch's chain hash; compare that
+    chain hash with a trusted copy of the ledger to finish the audit.
+    """
+    entry = proof["entry"]
+    expected_leaf = leaf_hash(*(entry[name] for name in LEAF_FIELDS))
+    if expected_leaf != proof["leaf_hash"]:
+        return False
+    included = verify_inclusion(
+        bytes.fromhex(proof["leaf_hash"]), proof["leaf_index"], proof["leaf_count"],
+        [bytes.fromhex(sibling) for sibling in proof["path"]], bytes.fromhex(proof["merkle_root"])
+    )
+    if not included:
+        return False
+    batch = proof["batch"]
+    return chain_hash(
+        batch["prev_hash"], proof["merkle_root"], batch["first_seq"], batch["last_seq"], proof["leaf_count"]
+    ) == batch["chain_hash"]
+
+
+# =====================
+# Verification
+# =====================
+
+@dataclass
+class LedgerReport:
+    """Outcome of a full ledger audit"""
+    
+    batches_checked: int = 0
+    entries_checked: int = 0
+    votes_checked: int = 0
+    unsealed_entries: int = 0
+    error_count: int = 0
+    errors: List[str] = field(default_factory=list)
+    head_hash: Optional[str] = None
+    elapsed_seconds: float = 0.0
+    
+    @property
+    def ok(self) -> bool:
+        return self.error_count == 0
+    
+    def add(self, result: Dict):
+        self.batches_checked += result.get("batches", 0)
+        self.entries_checked += result.get("entries", 0)
+        self.votes_checked += result.get("votes", 0)
+        self.unsealed_entries += result.get("unsealed", 0)
+        self.error_count += result["error_count"]
+        room = MAX_REPORTED_ERRORS - len(self.errors)
+        if room > 0:
+            self.errors.extend(result["errors"][:room])
+    
+    def summary(self) -> str:
+        status = "OK" if self.ok else f"FAILED ({self.error_count} problems)"
+        return (
+            f"Ledger {status} | batches={self.batches_checked} entries={self.entries_checked} "
+            f"votes={self.votes_checked} unsealed={self.unsealed_entries} "
+            f"head={self.head_hash or 'none'} | {self.elapsed_seconds:.2f}s"
+        )
+
+
+def connect_read_only(path: str) -> sqlite3.Connection:
+    """Read-only connection to a database file, inside one read transaction"""
+    uri = f"file:{quote(Path(path).resolve().as_posix())}?mode=ro"
+    connection = sqlite3.connect(uri, uri=True, isolation_level=None)
+    # One snapshot per task, so rows sealed while it runs are not half-seen
+    connection.execute("BEGIN")
+    return connection
+
+
+class _TaskResult:
+    def __init__(self):
+        self.counts = {}
+        self.errors = []
+        self.error_count = 0
+    
+    def error(self, message: str):
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(message)
+    
+    def to_dict(self) -> Dict:
+        return dict(self.counts, errors=self.errors, error_count=self.error_count)
+
+
+def _check_chain(connection, result: _TaskResult):
+    """Walk batch headers in order: links, seq contiguity and stored chain hashes"""
+    prev_hash, next_seq, batches = GENESIS_HASH, None, 0
+    rows = connection.execute(
+        'SELECT id, first_seq, last_seq, leaf_count, merkle_root, prev_hash, chain_hash FROM ledger_batches ORDER BY id'
+    )
+    for batch_id, first_seq, last_seq, leaf_count, root, stored_prev, stored_chain in rows:
+        batches += 1
+        if stored_prev != prev_hash:
+            result.error(f"batch {batch_id}: prev_hash does not match the previous batch")
+        if next_seq is not None and first_seq != next_seq:
+            result.error(f"batch {batch_id}: starts at seq {first_seq}, expected {next_seq}")
+        if last_seq - first_seq + 1 != leaf_count:
+            result.error(f"batch {batch_id}: seq range {first_seq}-{last_seq} does not hold {leaf_count} entries")
+        if chain_hash(stored_prev, root, first_seq, last_seq, leaf_count) != stored_chain:
+            result.error(f"batch {batch_id}: chain hash mismatch")
+        prev_hash, next_seq = stored_chain, last_seq + 1
+    result.counts["head_hash"] = prev_hash if batches else None
+
+
+def _check_batches(connection, first_id: int, last_id: int, result: _TaskResult):
+    """Recompute leaf hashes and Merkle roots for a range of sealed batches"""
+    batches = connection.execute(
+        'SELECT id, first_seq, last_seq, leaf_count, merkle_root FROM ledger_batches WHERE id BETWEEN ? AND ? ORDER BY id',
+        (first_id, last_id)
+    ).fetchall()
+    columns = ", ".join(("seq", "batch_id", "leaf_hash") + LEAF_FIELDS)
+    entries = 0
+    for batch_id, first_seq, last_seq, leaf_count, root in batches:
+        builder = MerkleRootBuilder()
+        expected_seq = first_seq
+        rows = connection.execute(
+            f'SELECT {columns} FROM vote_ledger WHERE seq BETWEEN ? AND ? ORDER BY seq', (first_seq, last_seq)
+        )
+        for seq, entry_batch, stored_leaf, *fields in rows:
+            entries += 1
+            if seq != expected_seq:
+                result.error(f"batch {batch_id}: entry {expected_seq} is missing")
+            expected_seq = seq + 1
+            if entry_batch != batch_id:
+                result.error(f"entry {seq}: sealed in batch {entry_batch}, expected {batch_id}")
+            if leaf_hash(*fields) != stored_leaf:
+                result.error(f"entry {seq}: fields do not match its leaf hash")
+            builder.add(bytes.fromhex(stored_leaf))
+        if builder.count != leaf_count:
+            result.error(f"batch {batch_id}: holds {builder.count} entries, sealed with {leaf_count}")
+        elif builder.root().hex() != root:
+            result.error(f"batch {batch_id}: Merkle root mismatch")
+    result.counts["batches"] = len(batches)
+    result.counts["entries"] = entries
+
+
+def _check_unsealed(connection, result: _TaskResult):
+    """Entries awaiting a batch must come after the last sealed one and match their hashes"""
+    last_sealed = connection.execute('SELECT COALESCE(MAX(last_seq), 0) FROM ledger_batches').fetchone()[0]
+    columns = ", ".join(("seq", "leaf_hash") + LEAF_FIELDS)
+    unsealed = 0
+    for seq, stored_leaf, *fields in connection.execute(
+        f'SELECT {columns} FROM vote_ledger WHERE batch_id IS NULL ORDER BY seq'
+    ):
+        unsealed += 1
+        if seq <= last_sealed:
+            result.error(f"entry {seq}: unsealed inside the sealed range")
+        if leaf_hash(*fields) != stored_leaf:
+            result.error(f"entry {seq}: fields do not match its leaf hash")
+    result.counts["unsealed"] = unsealed
+
+
+def _check_votes(connection, first_id: int, last_id: int, result: _TaskResult):
+    """Every counted vote must equal its latest ledger entry"""
+    checked = connection.execute(
+        'SELECT COUNT(*) FROM votes WHERE id BETWEEN ? AND ? AND election_session_id IS NOT NULL',
+        (first_id, last_id)
+    ).fetchone()[0]
+    mismatched = connection.execute('''
+        SELECT v.id FROM votes v
+        WHERE v.id BETWEEN ? AND ? AND v.election_session_id IS NOT NULL
+        AND NOT EXISTS (
+            SELECT 1 FROM vote_ledger l
+            WHERE l.seq = (SELECT MAX(seq) FROM vote_ledger WHERE vote_id = v.id)
+            AND l.election_session_id = v.election_session_id AND l.voter_id = v.voter_id
+            AND l.candidate_id = v.candidate_id AND l.position = v.position
+        )
+    ''', (first_id, last_id))
+    for (vote_id,) in mismatched:
+        result.error(f"vote {vote_id}: differs from its latest ledger entry")
+    result.counts["votes"] = checked
+
+
+def _run_task(task) -> Dict:
+    """Run one verification task in its own read-only connection (worker process entry point)"""
+    kind, path, *bounds = task
+    result = _TaskResult()
+    try:
+        connection = connect_read_only(path)
+        try:
+            if kind == "chain":
+                _check_chain(connection, result)
+            elif kind == "batches":
+                _check_batches(connection, *bounds, result)
+            elif kind == "unsealed":
+                _check_unsealed(connection, result)
+            elif kind == "votes":
+                _check_votes(connection, *bounds, result)
+        finally:
+            connection.close()
+    except sqlite3.Error as e:
+        result.error(f"{kind} check failed: {e}")
+    return result.to_dict()
+
+
+class LedgerVerifier:
+    """Audits a database file's vote ledger across worker processes
+    
+    Work is split into tasks (the chain walk, ranges of batches, ranges of
+    votes, the unsealed tail) that each stream their rows, so memory stays
+    bounded by the batch size however long the ledger is.
+    """
+    
+    def __init__(self, db_path: str = None, workers: int = None, batches_per_task: int = 64, votes_per_task: int = 50000):
+        if db_path is None:
+            db_path = Config.DATABASE_NAME if Config else "voting_app.db"
+        if workers is None:
+            workers = Config.LEDGER_VERIFY_WORKERS if Config else 0
+        self.db_path = str(db_path)
+        self.workers = workers or os.cpu_count() or 1
+        self.batches_per_task = batches_per_task
+        self.votes_per_task = votes_per_task
+    
+    def _tasks(self) -> List[tuple]:
+        connection = connect_read_only(self.db_path)
+        try:
+            first_batch, last_batch = connection.execute('SELECT MIN(id), MAX(id) FROM ledger_batches').fetchone()
+            first_vote, last_vote = connection.execute('SELECT MIN(id), MAX(id) FROM votes').fetchone()
+        finally:
+            connection.close()
+        tasks = [("chain", self.db_path), ("unsealed", self.db_path)]
+        if first_batch is not None:
+            for lo in range(first_batch, last_batch + 1, self.batches_per_task):
+                tasks.append(("batches", self.db_path, lo, min(lo + self.batches_per_task - 1, last_batch)))
+        if first_vote is not None:
+            for lo in range(first_vote, last_vote + 1, self.votes_per_task):
+                tasks.append(("votes", self.db_path, lo, min(lo + self.votes_per_task - 1, last_vote)))
+        return tasks
+    
+    def verify(self) -> LedgerReport:
+        """Check every batch, link, pending entry and counted vote"""
+        started = time.perf_counter()
+        report = LedgerReport()
+        tasks = self._tasks()
+        workers = min(self.workers, len(tasks))
+        if workers <= 1:
+            results = map(_run_task, tasks)
+            for result in results:
+                self._collect(report, result)
+        else:
+            with multiprocessing.Pool(workers) as pool:
+                for result in pool.imap_unordered(_run_task, tasks):
+                    self._collect(report, result)
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+    
+    @staticmethod
+    def _collect(report: LedgerReport, result: Dict):
+        if "head_hash" in result:
+            report.head_hash = result.pop("head_hash")
+        report.add(result)
@@ -0,0 +1,87 @@
+"""
+Voting State - In-memory voting status for the database layer
+Views and the ballot path read the status from memory; start/stop replace it
+after their write commits, and the voting_status table is the fallback that
+is read once per process (or after another worker changes it)
+"""
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+
+@dataclass(frozen=True)
+class VotingState:
+    """One immutable snapshot of the voting status"""
+    
+    is_active: bool = False
+    started_at: Optional[str] = None
+    ended_at: Optional[str] = None
+    # Active election session: where ballots go and which results are current
+    election_session_id: Optional[int] = None
+    version: int = 0
+    
+    def to_dict(self) -> Dict:
+        return {
+            "is_active": self.is_active,
+            "started_at": self.started_at,
+            "ended_at": self.ended_at,
+            "election_session_id": self.election_session_id,
+        }
+
+
+class VotingStateHolder:
+    """Current VotingState for one database file
+    
+    Reads are a single attribute load. Writers replace the snapshot under a
+    lock and bump the version, so a reader holding an older snapshot can tell
+    it is stale. Database takes its own lock before this one, never after.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state: Optional[VotingState] = None
+        self._version = 0
+    
+    @property
+    def current(self) -> Optional[VotingState]:
+        """The cached state, or None when it must be loaded from the database"""
+        return self._state
+    
+    @property
+    def version(self) -> int:
+        return self._version
+    
+    def set(self, is_active, started_at=None, ended_at=None, election_session_id=None) -> VotingState:
+        with self._lock:
+            self._version += 1
+            self._state = VotingState(bool(is_active), started_at, ended_at, election_session_id, self._version)
+            return self._state
+    
+    def invalidate(self):
+        """Drop the cached state so the next read goes to the database"""
+        with self._lock:
+            self._state = None
+
+
+_holders: Dict[str, VotingStateHolder] = {}
+_holders_lock = threading.Lock()
+
+
+def voting_state_for(db_path) -> VotingStateHolder:
+    """Return the holder shared by every Database opened on db_path in this process"""
+    key = str(Path(db_path).resolve())
+    with _holders_lock:
+        holder = _holders.get(key)
+        if holder is None:
+            holder = _holders[key] = VotingStateHolder()
+        return holder
+
+
+def invalidate_voting_states():
+    """Reload every cached status on next read, e.g. after another worker changed it"""
+    with _holders_lock:
+        holders = list(_holders.values())
+    for holder in holders:
+        holder.invalidate()
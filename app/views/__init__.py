@@ -1,36 +1,48 @@
 # Views / Page Components
-from .login_page import LoginPage
-from .signup_page import SignupPage
-from .home_page import HomePage
-from .settings_page import SettingsPage
-from .profile_page import ProfilePage
-from .comelec_dashboard import ComelecDashboard
-from .user_management import UserManagement
-from .election_results import ElectionResults
-from .voter_dashboard import VoterDashboard
-from .politician_profile import PoliticianProfile
-from .candidate_comparison import CandidateComparison
-from .voting_page import VotingPage
-from .politician_dashboard import PoliticianDashboard
-from .nbi_dashboard import NBIDashboard
-from .audit_log_page import AuditLogPage
-from .analytics_page import AnalyticsPage
+# Each view module is imported the first time the view is used, so starting the
+# app only pays for the login page instead of every dashboard.
+import importlib
+import time
 
-__all__ = [
-    'LoginPage',
-    'SignupPage', 
-    'HomePage',
-    'SettingsPage',
-    'ProfilePage',
-    'ComelecDashboard',
-    'UserManagement',
-    'ElectionResults',
-    'VoterDashboard',
-    'PoliticianProfile',
-    'CandidateComparison',
-    'VotingPage',
-    'PoliticianDashboard',
-    'NBIDashboard',
-    'AuditLogPage',
-    'AnalyticsPage',
-]
+from app.startup import startup_timer
+
+_VIEW_MODULES = {
+    'LoginPage': '.login_page',
+    'SignupPage': '.signup_page',
+    'HomePage': '.home_page',
+    'SettingsPage': '.settings_page',
+    'ProfilePage': '.profile_page',
+    'ComelecDashboard': '.comelec_dashboard',
+    'UserManagement': '.user_management',
+    'ElectionResults': '.election_results',
+    'VoterDashboard': '.voter_dashboard',
+    'PoliticianProfile': '.politician_profile',
+    'CandidateComparison': '.candidate_comparison',
+    'VotingPage': '.voting_page',
+    'PoliticianDashboard': '.politician_dashboard',
+    'NBIDashboard': '.nbi_dashboard',
+    'AuditLogPage': '.audit_log_page',
+    'AnalyticsPage': '.analytics_page',
+}
+
+__all__ = list(_VIEW_MODULES)
+
+
+def load_view(name):
+    """Return the view class called name, importing its module on first use"""
+    view = globals().get(name)
+    if view is None:
+        if name not in _VIEW_MODULES:
+            raise AttributeError(f"module {__name__!r} has no view {name!r}")
+        started = time.perf_counter()
+        module = importlib.import_module(_VIEW_MODULES[name], __name__)
+        view = globals()[name] = getattr(module, name)
+        startup_timer.record(f"view:{name}", time.perf_counter() - started)
+    return view
+
+
+def __getattr__(name):
+    # `from app.views import LoginPage` keeps working, resolved lazily
+    if name in _VIEW_MODULES:
+        return load_view(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
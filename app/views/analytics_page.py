@@ -4,20 +4,26 @@ Analytics Page - Election analytics with AI insights and data visualization
 
 import flet as ft
 from app.components.charts import (
-    BarChart, DonutChart, StatCard, CompatibilityMeter, InsightCard, ChartColors
+    BarChart, DonutChart, StatCard, CompatibilityMeter, InsightCard, ChartColors, TurnoutChart
 )
 from app.services.ai_service import AIService, RecommendationEngine
+from app.services.analytics_service import AnalyticsSnapshotBuilder, get_analytics_scheduler, turnout_chart_series
+from app.services.results_broadcaster import RESULTS_DELTA
 from app.theme import AppTheme
 from app.components.loading_overlay import LoadingOverlay, InlineSpinner
+from app.components.view_slot import ViewSlot
+from app.services.render_profiler import profiled
 
 
 class AnalyticsPage(ft.Column):
     """Analytics dashboard with AI-powered insights and visualizations"""
     
-    def __init__(self, username, db, user_role, on_back, on_logout, current_user_id=None):
+    def __init__(self, username, db, user_role, on_back, on_logout, current_user_id=None, reporting_db=None):
         super().__init__()
         self.username = username
         self.db = db
+        # Aggregates and turnout are read from here (the read replica, when enabled)
+        self.reporting_db = reporting_db or db
         self.user_role = user_role
         self.on_back = on_back
         self.on_logout = on_logout
@@ -26,6 +32,10 @@ class AnalyticsPage(ft.Column):
         # Initialize AI services
         self.ai_service = AIService(db)
         self.recommendation_engine = RecommendationEngine(db, self.ai_service)
+
+        # Snapshots are rebuilt in the background; the page renders the latest one immediately
+        self.scheduler = get_analytics_scheduler(self.reporting_db) if db else None
+        self.snapshot = self.scheduler.latest() if self.scheduler else AnalyticsSnapshotBuilder(db, self.ai_service).build()
         
         # User preferences for recommendations
         self.user_preferences = []
@@ -40,11 +50,58 @@ class AnalyticsPage(ft.Column):
     def did_mount(self):
         if self.page and self._loading_overlay not in self.page.overlay:
             self.page.overlay.append(self._loading_overlay)
+        if self.page:
+            self.page.pubsub.subscribe(self._on_pubsub_message)
+        if self.scheduler:
+            self.scheduler.subscribe(self._on_snapshot_refreshed)
+            # Pick up anything rebuilt between construction and mount
+            if self.scheduler.latest() is not self.snapshot:
+                self._on_snapshot_refreshed(self.scheduler.latest())
 
     def will_unmount(self):
+        if self.scheduler:
+            self.scheduler.unsubscribe(self._on_snapshot_refreshed)
+        if self.page:
+            self.page.pubsub.unsubscribe()
         if self.page and self._loading_overlay in self.page.overlay:
             self.page.overlay.remove(self._loading_overlay)
+
+    def _on_pubsub_message(self, message):
+        """Patch the votes stat from a live results delta until the next snapshot lands"""
+        if isinstance(message, dict) and message.get("type") == RESULTS_DELTA:
+            self._live_votes += message.get("total", 0)
+            self._votes_card.set_value(self._live_votes)
+            if self.page:
+                self.page.update()
     
+    def _on_snapshot_refreshed(self, snapshot):
+        """Rebuild only the sections whose data differs in a snapshot rebuilt by the background scheduler"""
+        previous, self.snapshot = self.snapshot, snapshot
+        for slot, inputs in self._snapshot_slots:
+            if inputs(snapshot) != inputs(previous):
+                slot.refresh()
+        self._age_text.value = self._format_snapshot_age()
+        if self._age_text.page:
+            self._age_text.update()
+
+    def _request_refresh(self, e=None):
+        """Ask the scheduler for a fresh snapshot; the page re-renders when it lands"""
+        if self.scheduler:
+            self.scheduler.request_refresh()
+            self._age_text.value = "Refreshing…"
+            if self.page:
+                self.page.update()
+
+    def _format_snapshot_age(self):
+        """Human readable age of the snapshot being displayed"""
+        age = int(self.snapshot.age_seconds())
+        if age < 5:
+            return "Updated just now"
+        if age < 60:
+            return f"Updated {age}s ago"
+        return f"Updated {age // 60}m ago"
+    
+    @profiled()
     def _build_ui(self):
         """Build the main UI"""
         self.controls = [
@@ -72,6 +129,7 @@ class AnalyticsPage(ft.Column):
     
     def _build_header(self):
         """Build the header"""
+        self._age_text = ft.Text(self._format_snapshot_age(), size=11, color="#999999")
         return ft.Container(
             content=ft.Row(
                 [
@@ -111,17 +169,30 @@ class AnalyticsPage(ft.Column):
                         ],
                         spacing=12,
                     ),
-                    ft.Container(
-                        content=ft.Row(
-                            [
-                                ft.Icon(ft.Icons.AUTO_AWESOME, color="#FF9800", size=16),
-                                ft.Text("AI Enhanced", size=12, color="#FF9800"),
-                            ],
-                            spacing=4,
-                        ),
-                        bgcolor="#1AFF9800",
-                        padding=ft.padding.symmetric(horizontal=12, vertical=6),
-                        border_radius=16,
+                    ft.Row(
+                        [
+                            self._age_text,
+                            ft.IconButton(
+                                icon=ft.Icons.REFRESH,
+                                icon_color=AppTheme.PRIMARY,
+                                icon_size=18,
+                                tooltip="Refresh analytics",
+                                on_click=self._request_refresh,
+                            ),
+                            ft.Container(
+                                content=ft.Row(
+                                    [
+                                        ft.Icon(ft.Icons.AUTO_AWESOME, color="#FF9800", size=16),
+                                        ft.Text("AI Enhanced", size=12, color="#FF9800"),
+                                    ],
+                                    spacing=4,
+                                ),
+                                bgcolor="#1AFF9800",
+                                padding=ft.padding.symmetric(horizontal=12, vertical=6),
+                                border_radius=16,
+                            ),
+                        ],
+                        spacing=8,
                     ),
                 ],
                 alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
@@ -133,32 +204,67 @@ class AnalyticsPage(ft.Column):
     
     def _build_content(self):
         """Build main content area"""
+        self._recommendation_slot = ft.Container(content=self._build_recommendation_section())
+        stats_slot = ViewSlot(self._build_stats_section)
+        top_candidates_slot = ViewSlot(self._build_top_candidates_section)
+        charts_slot = ViewSlot(self._build_charts_section)
+        turnout_slot = ViewSlot(self._build_turnout_section)
+        news_slot = ViewSlot(self._build_news_trends_section)
+        insights_slot = ViewSlot(self._build_insights_section)
+        # (slot, snapshot data it renders): a new snapshot rebuilds a slot only if its data changed
+        self._snapshot_slots = [
+            (stats_slot, lambda s: s.stats),
+            (top_candidates_slot, lambda s: s.top_candidates),
+            (charts_slot, lambda s: s.chart_data),
+            (turnout_slot, lambda s: (s.turnout_series, s.turnout_by_position, s.votes_per_second)),
+            (news_slot, lambda s: (s.news_themes, s.news_sentiment)),
+            (insights_slot, lambda s: (
+                s.theme_counts, s.experience_levels, s.stats, s.verification_totals,
+                s.candidates_with_verifications, s.candidates_with_votes, s.position_leaders,
+            )),
+        ]
         return ft.Column(
             [
                 # Statistics Overview
-                self._build_stats_section(),
+                stats_slot,
                 ft.Container(height=24),
                 
-                # AI Recommendation Section
-                self._build_recommendation_section(),
+                # AI Recommendation Section (swapped in place on preference changes)
+                self._recommendation_slot,
                 ft.Container(height=24),
                 
                 # Top Candidates by AI Score
-                self._build_top_candidates_section(),
+                top_candidates_slot,
                 ft.Container(height=24),
                 
                 # Voting Analytics Charts
-                self._build_charts_section(),
+                charts_slot,
+                ft.Container(height=24),
+                
+                # Turnout over time
+                turnout_slot,
+                ft.Container(height=24),
+                
+                # News sentiment and themes
+                news_slot,
                 ft.Container(height=24),
                 
                 # Candidate Insights
-                self._build_insights_section(),
+                insights_slot,
             ],
         )
     
     def _build_stats_section(self):
         """Build statistics overview cards"""
         stats = self._get_stats()
+        self._live_votes = stats["votes"]
+        self._votes_card = StatCard(
+            title="Votes Cast",
+            value=str(stats["votes"]),
+            icon=ft.Icons.HOW_TO_VOTE,
+            color="#FF9800",
+            subtitle="This election",
+        )
         
         return ft.Container(
             content=ft.Column(
@@ -182,13 +288,7 @@ class AnalyticsPage(ft.Column):
                                 trend=15.3,
                                 subtitle="Confirmed records",
                             ),
-                            StatCard(
-                                title="Votes Cast",
-                                value=str(stats["votes"]),
-                                icon=ft.Icons.HOW_TO_VOTE,
-                                color="#FF9800",
-                                subtitle="This election",
-                            ),
+                            self._votes_card,
                             StatCard(
                                 title="Positions",
                                 value=str(stats["positions"]),
@@ -243,7 +343,7 @@ class AnalyticsPage(ft.Column):
         recommendations = []
         if self.user_preferences:
             recommendations = self.recommendation_engine.get_recommendations(
-                self.user_preferences, limit=3
+                self.user_preferences, limit=3, on_compute=self._show_ranking_overlay
             )
         
         recommendation_cards = []
@@ -345,38 +445,7 @@ class AnalyticsPage(ft.Column):
     
     def _build_top_candidates_section(self):
         """Build top candidates section with AI scores"""
-        if not self.db:
-            return ft.Container()
-        
-        politicians = self.db.get_users_by_role("politician")
-        
-        # Calculate AI scores for all candidates
-        scored_candidates = []
-        for pol in politicians:
-            pol_dict = {
-                "id": pol[0],
-                "username": pol[1],
-                "full_name": pol[4],
-                "position": pol[7] if len(pol) > 7 else None,
-                "party": pol[8] if len(pol) > 8 else None,
-                "biography": pol[9] if len(pol) > 9 else "",
-                "profile_image": pol[6] if len(pol) > 6 else None,
-            }
-            
-            insights = self.ai_service.get_candidate_insights(pol_dict)
-            score = self.ai_service._calculate_overall_score(insights)
-            summary = self.ai_service.generate_candidate_summary(pol_dict)
-            
-            scored_candidates.append({
-                "politician": pol_dict,
-                "insights": insights,
-                "score": score,
-                "summary": summary,
-            })
-        
-        # Sort by score
-        scored_candidates.sort(key=lambda x: x["score"], reverse=True)
-        top_5 = scored_candidates[:5]
+        top_5 = self.snapshot.top_candidates
         
         if not top_5:
             return ft.Container()
@@ -586,6 +655,89 @@ class AnalyticsPage(ft.Column):
             ),
         )
     
+    def _build_turnout_section(self):
+        """Build turnout curves from the snapshot's pre-bucketed vote counts"""
+        if not self.db:
+            return ft.Container()
+        
+        overall = turnout_chart_series(self.snapshot.turnout_series)
+        by_position = self.snapshot.turnout_by_position
+        
+        position_charts = []
+        for i, (position, rows) in enumerate(by_position.items()):
+            position_charts.append(
+                ft.Container(
+                    content=TurnoutChart(
+                        series=turnout_chart_series(rows),
+                        title=position,
+                        color=ChartColors.MIXED[i % len(ChartColors.MIXED)],
+                    ),
+                    width=280,
+                )
+            )
+        
+        return ft.Container(
+            content=ft.Column(
+                [
+                    ft.Text("Turnout Over Time", size=18, weight=ft.FontWeight.BOLD, color="#333333"),
+                    ft.Container(height=12),
+                    TurnoutChart(
+                        series=overall,
+                        title="Votes per Minute (last 30 min)",
+                        votes_per_second=self.snapshot.votes_per_second,
+                    ),
+                    ft.Container(height=16),
+                    ft.Text("Hourly Turnout by Position", size=14, weight=ft.FontWeight.W_500, color="#666666"),
+                    ft.Container(height=8),
+                    ft.Row(position_charts, spacing=16, wrap=True),
+                ],
+            ),
+        )
+    
+    def _build_news_trends_section(self):
+        """Build news theme and per-politician sentiment charts from analyzed posts"""
+        news_themes = self.snapshot.news_themes
+        news_sentiment = self.snapshot.news_sentiment
+        if not news_themes and not news_sentiment:
+            return ft.Container()
+        
+        theme_data = [
+            {"label": t["theme"], "value": t["posts"], "color": ChartColors.MIXED[i % len(ChartColors.MIXED)]}
+            for i, t in enumerate(news_themes)
+        ]
+        # Sentiment is -1..1; chart it as 0..100 so negative tone still renders a bar
+        sentiment_data = [
+            {
+                "label": s["name"],
+                "value": round((s["avg_sentiment"] + 1) * 50),
+                "color": "#4CAF50" if s["avg_sentiment"] > 0.2 else "#F44336" if s["avg_sentiment"] < -0.2 else "#FF9800",
+            }
+            for s in news_sentiment[:8]
+        ]
+        
+        return ft.Container(
+            content=ft.Column(
+                [
+                    ft.Text("News Themes & Sentiment", size=18, weight=ft.FontWeight.BOLD, color="#333333"),
+                    ft.Container(height=12),
+                    ft.Row(
+                        [
+                            ft.Container(
+                                content=BarChart(data=theme_data, title="Posts by Theme (30 days)"),
+                                width=420,
+                            ),
+                            ft.Container(
+                                content=BarChart(data=sentiment_data, title="Candidate Post Tone", max_value=100),
+                                width=420,
+                            ),
+                        ],
+                        spacing=16,
+                        wrap=True,
+                    ),
+                ],
+            ),
+        )
+    
     def _build_insights_section(self):
         """Build AI insights section with enhanced layout"""
         insights = self._generate_insights()
@@ -664,118 +816,31 @@ class AnalyticsPage(ft.Column):
         else:
             self.user_preferences.append(pref_key)
 
-        # Show loading while AI recommendations recalculate
-        self._loading_overlay.show("Generating AI recommendations…")
-        if self.page:
-            self.page.update()
-
-        # Rebuild UI
-        self._build_ui()
+        # Cached preference sets are answered instantly; only a miss shows the overlay
+        self._ranking = False
+        # Only the recommendation section depends on preferences
+        self._recommendation_slot.content = self._build_recommendation_section()
 
         # Hide overlay
-        self._loading_overlay.hide()
+        if self._ranking:
+            self._loading_overlay.hide()
+        if self.page:
+            self.page.update()
+    
+    def _show_ranking_overlay(self):
+        """Called by the recommendation engine just before it ranks an uncached preference set"""
+        self._ranking = True
+        self._loading_overlay.show("Generating AI recommendations…")
         if self.page:
             self.page.update()
     
     def _get_stats(self):
-        """Get statistics from database"""
-        stats = {
-            "candidates": 0,
-            "verified": 0,
-            "votes": 0,
-            "positions": 0,
-        }
-        
-        if not self.db:
-            return stats
-        
-        # Get candidates
-        politicians = self.db.get_users_by_role("politician")
-        stats["candidates"] = len(politicians)
-        
-        # Get unique positions
-        positions = set(p[7] for p in politicians if p[7])
-        stats["positions"] = len(positions)
-        
-        # Get verified achievements
-        for pol in politicians:
-            verifications = self.db.get_verifications_by_politician(pol[0])
-            stats["verified"] += len([v for v in verifications if v[4] == 'verified'])
-        
-        # Get votes - result[6] is vote_count from get_election_results
-        results = self.db.get_election_results()
-        stats["votes"] = sum(r[6] for r in results)
-        
-        return stats
+        """Get statistics from the analytics snapshot"""
+        return self.snapshot.stats
     
     def _get_chart_data(self):
-        """Get data for charts"""
-        data = {
-            "votes_by_position": [],
-            "party_distribution": [],
-            "verification_status": [],
-            "legal_records": [],
-        }
-        
-        if not self.db:
-            return data
-        
-        # Votes by position - result[3] is position, result[6] is vote_count
-        results = self.db.get_election_results()
-        position_votes = {}
-        for result in results:
-            pos = result[3] if len(result) > 3 else "Unknown"
-            position_votes[pos] = position_votes.get(pos, 0) + result[6]
-        
-        colors = ChartColors.MIXED
-        for i, (pos, votes) in enumerate(position_votes.items()):
-            data["votes_by_position"].append({
-                "label": pos,
-                "value": votes,
-                "color": colors[i % len(colors)],
-            })
-        
-        # Party distribution
-        politicians = self.db.get_users_by_role("politician")
-        party_counts = {}
-        for pol in politicians:
-            party = pol[8] if pol[8] else "Independent"
-            party_counts[party] = party_counts.get(party, 0) + 1
-        
-        for i, (party, count) in enumerate(party_counts.items()):
-            data["party_distribution"].append({
-                "label": party,
-                "value": count,
-                "color": colors[i % len(colors)],
-            })
-        
-        # Verification status
-        verified = pending = rejected = 0
-        for pol in politicians:
-            verifications = self.db.get_verifications_by_politician(pol[0])
-            for v in verifications:
-                if v[4] == 'verified':
-                    verified += 1
-                elif v[4] == 'pending':
-                    pending += 1
-                else:
-                    rejected += 1
-        
-        data["verification_status"] = [
-            {"label": "Verified", "value": verified, "color": "#4CAF50"},
-            {"label": "Pending", "value": pending, "color": "#FF9800"},
-            {"label": "Rejected", "value": rejected, "color": "#F44336"},
-        ]
-        
-        # Legal records
-        legal_stats = self.db.get_legal_records_stats()
-        data["legal_records"] = [
-            {"label": "Total Records", "value": legal_stats.get("total", 0), "color": "#5C6BC0"},
-            {"label": "Verified", "value": legal_stats.get("verified", 0), "color": "#4CAF50"},
-            {"label": "Pending", "value": legal_stats.get("pending", 0), "color": "#FF9800"},
-        ]
-        
-        return data
+        """Get data for charts from the analytics snapshot"""
+        return self.snapshot.chart_data
     
     def _generate_insights(self):
         """Generate AI insights with comprehensive analysis"""
@@ -784,24 +849,10 @@ class AnalyticsPage(ft.Column):
         if not self.db:
             return insights
         
-        politicians = self.db.get_users_by_role("politician")
-        results = self.db.get_election_results()
+        snapshot = self.snapshot
         
         # === 1. Campaign Focus Analysis ===
-        all_themes = []
-        experience_levels = {"high": 0, "medium": 0, "emerging": 0, "unknown": 0}
-        
-        for pol in politicians:
-            bio = pol[9] if len(pol) > 9 and pol[9] else ""
-            themes = self.ai_service._extract_themes(bio)
-            all_themes.extend(themes)
-            exp = self.ai_service._assess_experience(bio)
-            experience_levels[exp] = experience_levels.get(exp, 0) + 1
-        
-        # Count theme frequency
-        from collections import Counter
-        theme_counts = Counter(all_themes)
-        top_themes = theme_counts.most_common(5)
+        top_themes = snapshot.theme_counts
         
         if top_themes:
             theme_points = []
@@ -820,6 +871,7 @@ class AnalyticsPage(ft.Column):
             })
         
         # === 2. Experience Distribution ===
+        experience_levels = snapshot.experience_levels
         exp_points = []
         total = sum(experience_levels.values())
         if experience_levels["high"] > 0:
@@ -828,7 +880,7 @@ class AnalyticsPage(ft.Column):
         if experience_levels["emerging"] > 0:
             pct = int(experience_levels["emerging"] / total * 100)
             exp_points.append(f"🌟 {experience_levels['emerging']} fresh/new candidates ({pct}%)")
-        exp_points.append(f"📋 {len(set(p[7] for p in politicians if len(p) > 7 and p[7]))} different positions contested")
+        exp_points.append(f"📋 {snapshot.stats['positions']} different positions contested")
         
         insights.append({
             "title": "Candidate Experience",
@@ -838,24 +890,12 @@ class AnalyticsPage(ft.Column):
         })
         
         # === 3. Verification & Trust Score ===
-        total_verified = 0
-        total_pending = 0
-        candidates_with_verifications = 0
-        
-        for p in politicians:
-            verifs = self.db.get_verifications_by_politician(p[0])
-            verified_count = len([v for v in verifs if v[4] == 'verified'])
-            pending_count = len([v for v in verifs if v[4] == 'pending'])
-            total_verified += verified_count
-            total_pending += pending_count
-            if verified_count > 0:
-                candidates_with_verifications += 1
-        
-        trust_pct = int(candidates_with_verifications / len(politicians) * 100) if politicians else 0
+        candidate_count = snapshot.candidate_count
+        trust_pct = int(snapshot.candidates_with_verifications / candidate_count * 100) if candidate_count else 0
         
         trust_points = [
-            f"✅ {total_verified} total verified achievements",
-            f"⏳ {total_pending} verifications pending",
+            f"✅ {snapshot.verification_totals['verified']} total verified achievements",
+            f"⏳ {snapshot.verification_totals['pending']} verifications pending",
             f"🏆 {trust_pct}% of candidates have verified records",
         ]
         
@@ -867,25 +907,15 @@ class AnalyticsPage(ft.Column):
         })
         
         # === 4. Voting Trends ===
-        if results:
-            total_votes = sum(r[6] for r in results)
-            candidates_with_votes = len([r for r in results if r[6] > 0])
-            
-            # Find leader by position
-            position_leaders = {}
-            for r in results:
-                pos = r[3] if len(r) > 3 else "Unknown"
-                if pos not in position_leaders or r[6] > position_leaders[pos][1]:
-                    position_leaders[pos] = (r[1], r[6])  # name, votes
-            
+        if snapshot.candidate_count:
             trend_points = [
-                f"📊 {total_votes} total votes cast",
-                f"🗳️ {candidates_with_votes}/{len(politicians)} candidates received votes",
+                f"📊 {snapshot.stats['votes']} total votes cast",
+                f"🗳️ {snapshot.candidates_with_votes}/{candidate_count} candidates received votes",
             ]
             
-            if position_leaders:
-                top_pos = list(position_leaders.items())[0]
-                trend_points.append(f"🏅 Leading in {top_pos[0]}: {top_pos[1][0]}")
+            if snapshot.position_leaders:
+                top_pos, leader_name, _ = snapshot.position_leaders[0]
+                trend_points.append(f"🏅 Leading in {top_pos}: {leader_name}")
             
             insights.append({
                 "title": "Voting Trends",
@@ -2,6 +2,14 @@ import flet as ft
 from datetime import datetime, timedelta
 from app.theme import AppTheme
 from app.components.empty_state import EmptyState
+from app.components.paged_list import PagedList
+from app.components.view_slot import ViewSlot
+from app.services.search_controller import SearchController
+from app.services.render_profiler import profiled
+
+
+# Log entries per page in the activity list
+LOGS_PAGE_SIZE = 50
 
 
 class AuditLogPage(ft.Column):
@@ -22,12 +30,26 @@ class AuditLogPage(ft.Column):
         
         # UI references
         self.logs_container = None
+        self.logs_list = None
+        self.entries_text = None
         self.search_field = None
         self.stats_row = None
         
+        # Audit writes are too frequent to invalidate on; a short TTL keeps results fresh
+        self._log_search = SearchController(
+            lambda query: self._fetch_logs_page(0, LOGS_PAGE_SIZE, query),
+            self._show_search_results,
+            cache_ttl=10.0,
+        )
+        
         # Build UI
         self._build_ui()
     
+    def will_unmount(self):
+        """Drop any search still waiting on its debounce timer"""
+        self._log_search.close()
+    
+    @profiled()
     def _build_ui(self):
         """Build the main UI"""
         self.controls = [
@@ -212,14 +234,49 @@ class AuditLogPage(ft.Column):
             border_color="#E0E0E0",
             focused_border_color="#5C6BC0",
             content_padding=ft.padding.symmetric(horizontal=16, vertical=12),
+            value=self.search_query,
             on_change=self._on_search_change,
             expand=True,
         )
         
-        # Filter buttons based on role
+        # Button rows sit in slots so picking a filter only redraws its buttons
+        self.filter_buttons_slot = ViewSlot(self._build_filter_buttons)
+        self.date_buttons_slot = ViewSlot(self._build_date_buttons)
+        
+        return ft.Container(
+            content=ft.Column(
+                [
+                    ft.Row([self.search_field], expand=True),
+                    ft.Container(height=12),
+                    ft.Row(
+                        [
+                            ft.Text("Type:", size=12, color="#666666", weight=ft.FontWeight.W_500),
+                            self.filter_buttons_slot,
+                        ],
+                        spacing=8,
+                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                    ),
+                    ft.Container(height=8),
+                    ft.Row(
+                        [
+                            ft.Text("Date:", size=12, color="#666666", weight=ft.FontWeight.W_500),
+                            self.date_buttons_slot,
+                        ],
+                        spacing=8,
+                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                    ),
+                ],
+            ),
+            bgcolor=ft.Colors.WHITE,
+            border_radius=12,
+            padding=16,
+        )
+    
+    def _build_filter_buttons(self):
+        """Build the type filter buttons based on role"""
         filter_options = self._get_filter_options()
         
-        filter_buttons = ft.Row(
+        return ft.Row(
             [
                 ft.ElevatedButton(
                     text=label,
@@ -235,8 +292,9 @@ class AuditLogPage(ft.Column):
             spacing=8,
             wrap=True,
         )
-        
-        # Date range filter
+    
+    def _build_date_buttons(self):
+        """Build the date range filter buttons"""
         date_options = [
             ("all", "All Time"),
             ("today", "Today"),
@@ -244,7 +302,7 @@ class AuditLogPage(ft.Column):
             ("month", "This Month"),
         ]
         
-        date_buttons = ft.Row(
+        return ft.Row(
             [
                 ft.OutlinedButton(
                     text=label,
@@ -260,35 +318,6 @@ class AuditLogPage(ft.Column):
             spacing=8,
             wrap=True,
         )
-        
-        return ft.Container(
-            content=ft.Column(
-                [
-                    ft.Row([self.search_field], expand=True),
-                    ft.Container(height=12),
-                    ft.Row(
-                        [
-                            ft.Text("Type:", size=12, color="#666666", weight=ft.FontWeight.W_500),
-                            filter_buttons,
-                        ],
-                        spacing=8,
-                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                    ),
-                    ft.Container(height=8),
-                    ft.Row(
-                        [
-                            ft.Text("Date:", size=12, color="#666666", weight=ft.FontWeight.W_500),
-                            date_buttons,
-                        ],
-                        spacing=8,
-                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                    ),
-                ],
-            ),
-            bgcolor=ft.Colors.WHITE,
-            border_radius=12,
-            padding=16,
-        )
     
     def _get_filter_options(self):
         """Get filter options based on role"""
@@ -317,10 +346,9 @@ class AuditLogPage(ft.Column):
     
     def _build_logs_section(self):
         """Build the logs list section"""
-        logs = self._get_filtered_logs()
-        
+        self.entries_text = ft.Text("0 entries", size=12, color="#666666")
         self.logs_container = ft.Container(
-            content=self._build_logs_list(logs),
+            content=self._build_logs_list(),
         )
         
         return ft.Container(
@@ -329,7 +357,7 @@ class AuditLogPage(ft.Column):
                     ft.Row(
                         [
                             ft.Text("Activity Log", size=16, weight=ft.FontWeight.BOLD, color="#333333"),
-                            ft.Text(f"{len(logs)} entries", size=12, color="#666666"),
+                            self.entries_text,
                         ],
                         alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
                     ),
@@ -358,65 +386,77 @@ class AuditLogPage(ft.Column):
         
         return None, None  # All time
     
-    def _get_filtered_logs(self):
-        """Get logs based on current filters including date range"""
+    def _fetch_logs_page(self, offset, limit, query=None):
+        """Get one page of logs based on current filters including date range"""
         if not self.db:
             return []
         
         date_from, date_to = self._get_date_range_values()
+        if query is None:
+            query = self.search_query
         
-        if self.search_query:
-            logs = self.db.search_audit_logs(self.search_query, self.user_role)
+        if query:
+            return self.db.search_audit_logs(
+                query, self.user_role,
+                limit=limit, offset=offset, date_from=date_from
+            )
         elif self.selected_filter == "all":
-            logs = self.db.get_audit_logs_for_role(self.user_role)
-        else:
-            logs = self.db.get_audit_logs(
-                action_type=self.selected_filter,
-                date_from=date_from,
-                date_to=date_to
+            return self.db.get_audit_logs_for_role(
+                self.user_role, limit=limit, offset=offset, date_from=date_from
             )
-        
-        # Apply date filter for search and role-based queries too
-        if date_from and logs:
-            logs = [
-                log for log in logs 
-                if log[10] and log[10] >= date_from  # created_at is index 10
-            ]
-        
-        return logs
+        return self.db.get_audit_logs(
+            limit=limit,
+            offset=offset,
+            action_type=self.selected_filter,
+            date_from=date_from,
+            date_to=date_to
+        )
     
     def _apply_date_range(self, range_value):
         """Apply date range filter"""
         self.date_range = range_value
-        self._rebuild_filters()
+        self._log_search.clear_cache()
+        self.date_buttons_slot.refresh()
         self._update_logs()
     
-    def _build_logs_list(self, logs):
-        """Build the list of log entries"""
-        if not logs:
-            return EmptyState(
+    def _build_logs_list(self):
+        """Build the list of log entries, fetching further pages on scroll"""
+        self.logs_list = PagedList(
+            fetch_page=self._fetch_logs_page,
+            build_item=self._build_log_row,
+            page_size=LOGS_PAGE_SIZE,
+            empty_content=EmptyState(
                 icon=ft.Icons.HISTORY,
                 title="No Audit Logs Found",
                 subtitle="No system activity matches the current filters. Try broadening your search or date range.",
                 icon_color=AppTheme.PRIMARY,
-            )
-        
-        log_items = []
-        for log in logs:
-            log_id, action, action_type, description, user_id, user_role, \
-            target_type, target_id, details, ip_address, created_at, username, full_name = log
-            
-            log_items.append(self._build_log_item(
-                action=action,
-                action_type=action_type,
-                description=description,
-                user_name=full_name or username or "System",
-                user_role=user_role,
-                created_at=created_at,
-                target_type=target_type,
-            ))
-        
-        return ft.Column(log_items, spacing=8)
+            ),
+            on_page_loaded=self._update_entries_count,
+        )
+        return self.logs_list
+    
+    def _build_log_row(self, log):
+        """Build a log item from an audit log row"""
+        log_id, action, action_type, description, user_id, user_role, \
+        target_type, target_id, details, ip_address, created_at, username, full_name = log
+        
+        return self._build_log_item(
+            action=action,
+            action_type=action_type,
+            description=description,
+            user_name=full_name or username or "System",
+            user_role=user_role,
+            created_at=created_at,
+            target_type=target_type,
+        )
+    
+    def _update_entries_count(self, logs_list):
+        """Show how many entries are loaded, marking that more remain"""
+        if self.entries_text:
+            suffix = "+" if logs_list.has_more else ""
+            self.entries_text.value = f"{logs_list.loaded_count}{suffix} entries"
+            if self.entries_text.page:
+                self.entries_text.update()
     
     def _build_log_item(self, action, action_type, description, user_name, user_role, created_at, target_type):
         """Build a single log item"""
@@ -515,27 +555,23 @@ class AuditLogPage(ft.Column):
         )
     
     def _on_search_change(self, e):
-        """Handle search input change"""
-        self.search_query = e.control.value
-        self._update_logs()
+        """Handle search input change (debounced, runs off the UI handler)"""
+        self._log_search.submit(e.control.value)
+    
+    def _show_search_results(self, query, first_page):
+        """Show the first page of logs matching the latest search"""
+        self.search_query = query
+        if self.logs_list:
+            self.logs_list.reset(first_page=first_page)
     
     def _apply_filter(self, filter_value):
         """Apply a filter"""
         self.selected_filter = filter_value
-        self._rebuild_filters()
+        self._log_search.clear_cache()
+        self.filter_buttons_slot.refresh()
         self._update_logs()
     
-    def _rebuild_filters(self):
-        """Rebuild filter buttons to show selected state"""
-        # This will be called when filter changes
-        if self.page:
-            self._build_ui()
-            self.page.update()
-    
     def _update_logs(self):
         """Update the logs list"""
-        if self.logs_container:
-            logs = self._get_filtered_logs()
-            self.logs_container.content = self._build_logs_list(logs)
-            if self.page:
-                self.page.update()
+        if self.logs_list:
+            self.logs_list.reset()
@@ -1,5 +1,6 @@
 import flet as ft
 from app.theme import AppTheme
+from app.services.render_profiler import profiled
 
 
 class CandidateComparison(ft.Column):
@@ -48,6 +49,7 @@ class CandidateComparison(ft.Column):
                     }
         return None
     
+    @profiled()
     def _build_ui(self):
         """Build the main UI"""
         self.controls = [
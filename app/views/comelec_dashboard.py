@@ -3,6 +3,16 @@ from app.components.news_post_creator import NewsPostCreator, MyPostsList
 from app.theme import AppTheme
 from app.components.loading_overlay import LoadingOverlay
 from app.components.empty_state import EmptyState
+from app.components.paged_list import PagedList
+from app.services.event_bus import VOTING_STATUS_CHANGED, get_event_bus
+from app.services.results_broadcaster import RESULTS_DELTA
+from app.services.search_controller import SearchController
+from app.services.render_profiler import profiled
+
+
+# Candidates loaded per page of the roster or of search matches, and the fixed height of each row
+CANDIDATE_PAGE_SIZE = 50
+CANDIDATE_ROW_HEIGHT = 60
 
 
 class ComelecDashboard(ft.Column):
@@ -26,6 +36,15 @@ class ComelecDashboard(ft.Column):
         # Search state
         self.candidate_search_query = ""
         self.candidates_table_container = None
+        self.candidates_list = None
+        self._candidates_total = 0
+        self._candidate_images = {}
+        self._candidate_verifications = {}
+        self._candidate_search = SearchController(
+            self._get_filtered_candidates,
+            self._show_candidate_results,
+            invalidate_on=("users",),
+        )
         
         # Get voting status from database
         status = self.db.get_voting_status() if self.db else {"is_active": False}
@@ -34,20 +53,41 @@ class ComelecDashboard(ft.Column):
         # Loading overlay
         self._loading_overlay = LoadingOverlay()
         
+        # Statistic value controls, patched in place by live results deltas
+        self._stat_values = {}
+        self._total_votes = 0
+        
         # Build UI
         self._build_ui()
     
     def did_mount(self):
         """Attach loading overlay to page overlay when mounted."""
+        self._candidate_search.attach()
+        if self.page:
+            self.page.pubsub.subscribe(self._on_pubsub_message)
         if self.page and self._loading_overlay not in self.page.overlay:
             self.page.overlay.append(self._loading_overlay)
             self.page.update()
 
     def will_unmount(self):
         """Remove loading overlay when unmounted."""
+        self._candidate_search.close()
+        if self.page:
+            self.page.pubsub.unsubscribe()
         if self.page and self._loading_overlay in self.page.overlay:
             self.page.overlay.remove(self._loading_overlay)
 
+    def _on_pubsub_message(self, message):
+        """Patch the vote total from a live results delta"""
+        if isinstance(message, dict) and message.get("type") == RESULTS_DELTA:
+            self._total_votes += message.get("total", 0)
+            value_text = self._stat_values.get("Total Votes Cast")
+            if value_text:
+                value_text.value = str(self._total_votes)
+                if self.page:
+                    self.page.update()
+
+    @profiled()
     def _build_ui(self):
         """Build the main UI"""
         self.controls = [
@@ -287,13 +327,18 @@ class ComelecDashboard(ft.Column):
         # Get counts from database
         politicians = self.db.get_users_by_role("politician") if self.db else []
         total_candidates = len(politicians)
+        total_votes = self.db.get_total_votes_cast() if self.db else 0
+        self._total_votes = total_votes
+        # Read from the per-minute turnout counters, not a scan of the votes table
+        vote_rate = self.db.get_current_vote_rate(window_seconds=60) if self.db else 0.0
         
         return ft.Row(
             [
                 self._build_stat_card("Total Candidates", str(total_candidates), ft.Icons.PEOPLE, AppTheme.PRIMARY),
                 self._build_stat_card("Approved", str(total_candidates), ft.Icons.CHECK_CIRCLE, "#4CAF50"),
-                self._build_stat_card("Total Votes Cast", "0", ft.Icons.HOW_TO_VOTE, AppTheme.PRIMARY),
+                self._build_stat_card("Total Votes Cast", str(total_votes), ft.Icons.HOW_TO_VOTE, AppTheme.PRIMARY),
                 self._build_stat_card("Verified", str(total_candidates), ft.Icons.VERIFIED, "#4CAF50"),
+                self._build_stat_card("Votes/sec", f"{vote_rate:.2f}", ft.Icons.SPEED, "#FF9800"),
             ],
             spacing=16,
             wrap=True,
@@ -301,6 +346,8 @@ class ComelecDashboard(ft.Column):
     
     def _build_stat_card(self, label, value, icon, color):
         """Build a statistic card"""
+        value_text = ft.Text(value, size=14, weight=ft.FontWeight.BOLD, color=color)
+        self._stat_values[label] = value_text
         return ft.Container(
             content=ft.Row(
                 [
@@ -308,7 +355,7 @@ class ComelecDashboard(ft.Column):
                     ft.Container(width=8),
                     ft.Icon(icon, color=color, size=16),
                     ft.Container(width=4),
-                    ft.Text(value, size=14, weight=ft.FontWeight.BOLD, color=color),
+                    value_text,
                 ],
             ),
             padding=ft.padding.symmetric(horizontal=16, vertical=12),
@@ -323,12 +370,13 @@ class ComelecDashboard(ft.Column):
     
     def _build_candidate_management(self):
         """Build candidate management section"""
-        # Get filtered politicians
-        politicians = self._get_filtered_candidates()
+        self._candidates_count_text = ft.Text("", size=12, color="#666666")
         
-        # Create candidates table container with stored reference
+        # Candidates list container with stored reference
         self.candidates_table_container = ft.Container(
-            content=self._build_candidates_table(politicians),
+            content=self._build_candidates_table(),
+            border=ft.border.all(1, "#E0E0E0"),
+            border_radius=8,
         )
         
         return ft.Container(
@@ -341,7 +389,9 @@ class ComelecDashboard(ft.Column):
                                 size=18,
                                 weight=ft.FontWeight.BOLD,
                             ),
+                            self._candidates_count_text,
                         ],
+                        alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
                     ),
                     ft.Container(height=12),
                     # Search bar with handler
@@ -369,159 +419,218 @@ class ComelecDashboard(ft.Column):
             ),
         )
     
-    def _get_filtered_candidates(self):
-        """Get candidates filtered by search query"""
-        politicians = self.db.get_users_by_role("politician") if self.db else []
-        
-        if self.candidate_search_query:
-            query = self.candidate_search_query.lower()
-            politicians = [p for p in politicians if 
-                          query in (p[5] or p[1] or "").lower() or  # full_name or username
-                          query in (p[7] or "").lower() or  # position
-                          query in (p[8] or "").lower()]  # party
+    def _get_filtered_candidates(self, query=None):
+        """Get candidates matching the search query from the candidate search index
         
-        return politicians
+        Rows are light (id, username, full_name, position, party, status); images
+        and verification counts are fetched for the rows on screen only. Only
+        the first page is returned (of the full roster for a blank query); the
+        list fetches later pages by offset.
+        """
+        if not self.db:
+            return []
+        if query is None:
+            query = self.candidate_search_query
+        return self.db.search_candidates(query, limit=CANDIDATE_PAGE_SIZE)
     
     def _on_candidate_search_change(self, e):
-        """Handle candidate search input change"""
-        self.candidate_search_query = e.control.value
-        self._update_candidates_table()
+        """Handle candidate search input change (debounced, runs off the UI handler)"""
+        self._candidate_search.submit(e.control.value)
+    
+    def _show_candidate_results(self, query, politicians):
+        """Show results for the latest candidate search"""
+        self.candidate_search_query = query
+        self._update_candidates_table(politicians)
     
-    def _update_candidates_table(self):
-        """Update only the candidates table without rebuilding entire UI"""
-        if self.candidates_table_container:
+    def _update_candidates_table(self, politicians=None):
+        """Reload only the candidates list without rebuilding entire UI"""
+        if self.candidates_list is None:
+            return
+        if politicians is None:
             politicians = self._get_filtered_candidates()
-            self.candidates_table_container.content = self._build_candidates_table(politicians)
-            if self.page:
-                self.page.update()
+        self.candidates_list.reset(
+            fetch_page=self._candidates_fetcher(),
+            first_page=self._load_candidate_details(politicians[:self.candidates_list.page_size]),
+        )
     
-    def _build_candidates_table(self, politicians):
-        """Build candidates data table"""
-        rows = []
+    def _candidates_fetcher(self):
+        """fetch_page for the candidates list
         
-        for politician in politicians:
-            user_id, username, email, role, created_at, full_name, status, position, party, biography, profile_image = politician
-            display_name = full_name if full_name else username
-            display_status = status if status else "active"
-            display_position = position if position else "-"
-            display_party = party if party else "-"
-            
-            # Create avatar with image or icon
-            if profile_image:
-                avatar = ft.Container(
-                    content=ft.Image(
-                        src_base64=profile_image,
-                        fit=ft.ImageFit.COVER,
-                        width=36,
-                        height=36,
-                    ),
-                    width=36,
-                    height=36,
-                    border_radius=18,
-                    clip_behavior=ft.ClipBehavior.HARD_EDGE,
-                )
-            else:
-                avatar = ft.CircleAvatar(
-                    content=ft.Text(display_name[0].upper() if display_name else "?"),
-                    bgcolor="#E8EAF6",
-                    radius=18,
-                )
-            
-            # Get verification info for this candidate
-            verifications = self.db.get_verifications_by_politician(user_id) if self.db else []
-            verified_count = len([v for v in verifications if v[4] == 'verified'])
-            total_count = len(verifications)
-            
-            # Verification badge
-            if verified_count > 0:
-                verified_cell = ft.Row(
-                    [
-                        ft.Icon(ft.Icons.CHECK_CIRCLE, color="#4CAF50", size=16),
-                        ft.Text(f"{verified_count}/{total_count}", size=12, color="#4CAF50"),
-                    ],
-                    spacing=4,
-                )
-            elif total_count > 0:
-                verified_cell = ft.Row(
-                    [
-                        ft.Icon(ft.Icons.PENDING, color="#FF9800", size=16),
-                        ft.Text(f"0/{total_count}", size=12, color="#FF9800"),
-                    ],
-                    spacing=4,
-                )
-            else:
-                verified_cell = ft.Row(
-                    [
-                        ft.Icon(ft.Icons.REMOVE_CIRCLE_OUTLINE, color="#999999", size=16),
-                        ft.Text("None", size=12, color="#999999"),
-                    ],
-                    spacing=4,
-                )
-            
-            rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(
-                            ft.Row(
-                                [
-                                    avatar,
-                                    ft.Text(display_name, size=13),
-                                ],
-                                spacing=10,
-                            )
-                        ),
-                        ft.DataCell(ft.Text(display_position, size=13)),
-                        ft.DataCell(ft.Text(display_party, size=13)),
-                        ft.DataCell(
-                            ft.Container(
-                                content=ft.Text(
-                                    "Approved" if display_status == "active" else "Pending",
-                                    color="#4CAF50" if display_status == "active" else "#FF9800",
-                                    size=11,
-                                ),
-                                bgcolor="#E8F5E9" if display_status == "active" else "#FFF3E0",
-                                padding=ft.padding.symmetric(horizontal=10, vertical=4),
-                                border_radius=12,
-                            )
-                        ),
-                        ft.DataCell(verified_cell),
-                        ft.DataCell(
-                            ft.TextButton(
-                                "Edit",
-                                style=ft.ButtonStyle(color="#5C6BC0"),
-                                on_click=lambda e, uid=user_id, name=display_name, pos=display_position: self._show_edit_candidate_dialog(uid, name, pos),
-                            )
-                        ),
-                    ],
-                )
-            )
+        The roster, or the matches for the current search, is read from the
+        database a page at a time.
+        """
+        query = self.candidate_search_query
+        # Matches are not counted up front; the count text shows how many are loaded
+        self._candidates_total = self.db.get_politicians_count() if self.db and not query.strip() else None
+        
+        def fetch_page(offset, limit):
+            rows = self.db.search_candidates(query, limit=limit, offset=offset) if self.db else []
+            return self._load_candidate_details(rows)
+        return fetch_page
+    
+    def _load_candidate_details(self, politicians):
+        """Fetch profile images and verification counts for one page of candidates"""
+        candidate_ids = [p[0] for p in politicians]
+        if self.db and candidate_ids:
+            self._candidate_images.update(self.db.get_profile_images(candidate_ids))
+            self._candidate_verifications.update(self.db.get_verification_counts_by_politician(candidate_ids))
+        return politicians
+    
+    def _update_candidates_count(self, candidates_list):
+        """Show how many candidates are listed out of how many there are"""
+        total = self._candidates_total
+        if self.candidate_search_query.strip():
+            loaded = candidates_list.loaded_count
+            text = f"{loaded} match" if loaded == 1 else f"{loaded} matches"
+            if candidates_list.has_more:
+                text = f"Showing the first {loaded} matches"
+        else:
+            text = f"Showing {candidates_list.loaded_count} of {total} candidates"
+        self._candidates_count_text.value = text
+        if self._candidates_count_text.page:
+            self._candidates_count_text.update()
+    
+    def _build_candidates_table(self):
+        """Build the candidates list, loading one page of candidates at a time"""
+        header = ft.Container(
+            content=ft.Row(
+                [
+                    ft.Container(ft.Text("Candidate", weight=ft.FontWeight.BOLD, size=12), expand=4),
+                    ft.Container(ft.Text("Position", weight=ft.FontWeight.BOLD, size=12), expand=2),
+                    ft.Container(ft.Text("Party", weight=ft.FontWeight.BOLD, size=12), expand=2),
+                    ft.Container(ft.Text("Status", weight=ft.FontWeight.BOLD, size=12), expand=2),
+                    ft.Container(ft.Text("Verified", weight=ft.FontWeight.BOLD, size=12), expand=2),
+                    ft.Container(ft.Text("Actions", weight=ft.FontWeight.BOLD, size=12), expand=1),
+                ],
+            ),
+            bgcolor="#FAFAFA",
+            padding=ft.padding.symmetric(horizontal=16, vertical=12),
+            border_radius=ft.border_radius.only(top_left=8, top_right=8),
+        )
         
-        if not rows:
-            return EmptyState(
+        self.candidates_list = PagedList(
+            fetch_page=self._candidates_fetcher(),
+            build_item=self._build_candidate_row,
+            page_size=CANDIDATE_PAGE_SIZE,
+            header=header,
+            item_extent=CANDIDATE_ROW_HEIGHT,
+            spacing=0,
+            empty_content=EmptyState(
                 icon=ft.Icons.BALLOT_OUTLINED,
                 title="No Candidates Registered",
                 subtitle="No politician accounts exist yet. Add politicians via User Management to populate the ballot.",
                 btn_label="Go to User Management",
                 on_btn_click=self.on_user_management if hasattr(self, 'on_user_management') else None,
                 compact=True,
+            ),
+            on_page_loaded=self._update_candidates_count,
+        )
+        return self.candidates_list
+    
+    def _build_candidate_row(self, politician):
+        """Build a single row of the candidates list"""
+        user_id, username, full_name, position, party, status = politician
+        profile_image = self._candidate_images.get(user_id)
+        display_name = full_name if full_name else username
+        display_status = status if status else "active"
+        display_position = position if position else "-"
+        display_party = party if party else "-"
+        
+        # Create avatar with image or icon
+        if profile_image:
+            avatar = ft.Container(
+                content=ft.Image(
+                    src_base64=profile_image,
+                    fit=ft.ImageFit.COVER,
+                    width=36,
+                    height=36,
+                ),
+                width=36,
+                height=36,
+                border_radius=18,
+                clip_behavior=ft.ClipBehavior.HARD_EDGE,
+            )
+        else:
+            avatar = ft.CircleAvatar(
+                content=ft.Text(display_name[0].upper() if display_name else "?"),
+                bgcolor="#E8EAF6",
+                radius=18,
             )
         
-        return ft.DataTable(
-            columns=[
-                ft.DataColumn(ft.Text("Candidate", weight=ft.FontWeight.BOLD, size=12)),
-                ft.DataColumn(ft.Text("Position", weight=ft.FontWeight.BOLD, size=12)),
-                ft.DataColumn(ft.Text("Party", weight=ft.FontWeight.BOLD, size=12)),
-                ft.DataColumn(ft.Text("Status", weight=ft.FontWeight.BOLD, size=12)),
-                ft.DataColumn(ft.Text("Verified", weight=ft.FontWeight.BOLD, size=12)),
-                ft.DataColumn(ft.Text("Actions", weight=ft.FontWeight.BOLD, size=12)),
-            ],
-            rows=rows,
-            border=ft.border.all(1, "#E0E0E0"),
-            border_radius=8,
-            heading_row_color="#FAFAFA",
-            data_row_min_height=50,
-            data_row_max_height=60,
-            column_spacing=20,
+        # Verification info for this candidate (counted for the whole page in one query)
+        counts = self._candidate_verifications.get(user_id, {})
+        verified_count = counts.get("verified", 0)
+        total_count = sum(counts.values())
+        
+        # Verification badge
+        if verified_count > 0:
+            verified_cell = ft.Row(
+                [
+                    ft.Icon(ft.Icons.CHECK_CIRCLE, color="#4CAF50", size=16),
+                    ft.Text(f"{verified_count}/{total_count}", size=12, color="#4CAF50"),
+                ],
+                spacing=4,
+            )
+        elif total_count > 0:
+            verified_cell = ft.Row(
+                [
+                    ft.Icon(ft.Icons.PENDING, color="#FF9800", size=16),
+                    ft.Text(f"0/{total_count}", size=12, color="#FF9800"),
+                ],
+                spacing=4,
+            )
+        else:
+            verified_cell = ft.Row(
+                [
+                    ft.Icon(ft.Icons.REMOVE_CIRCLE_OUTLINE, color="#999999", size=16),
+                    ft.Text("None", size=12, color="#999999"),
+                ],
+                spacing=4,
+            )
+        
+        return ft.Container(
+            content=ft.Row(
+                [
+                    ft.Container(
+                        ft.Row(
+                            [
+                                avatar,
+                                ft.Text(display_name, size=13),
+                            ],
+                            spacing=10,
+                        ),
+                        expand=4,
+                    ),
+                    ft.Container(ft.Text(display_position, size=13), expand=2),
+                    ft.Container(ft.Text(display_party, size=13), expand=2),
+                    ft.Container(
+                        ft.Container(
+                            content=ft.Text(
+                                "Approved" if display_status == "active" else "Pending",
+                                color="#4CAF50" if display_status == "active" else "#FF9800",
+                                size=11,
+                            ),
+                            bgcolor="#E8F5E9" if display_status == "active" else "#FFF3E0",
+                            padding=ft.padding.symmetric(horizontal=10, vertical=4),
+                            border_radius=12,
+                        ),
+                        expand=2,
+                        alignment=ft.alignment.center_left,
+                    ),
+                    ft.Container(verified_cell, expand=2),
+                    ft.Container(
+                        ft.TextButton(
+                            "Edit",
+                            style=ft.ButtonStyle(color="#5C6BC0"),
+                            on_click=lambda e, uid=user_id, name=display_name, pos=display_position: self._show_edit_candidate_dialog(uid, name, pos),
+                        ),
+                        expand=1,
+                    ),
+                ],
+            ),
+            height=CANDIDATE_ROW_HEIGHT,
+            padding=ft.padding.symmetric(horizontal=16),
+            border=ft.border.only(top=ft.BorderSide(1, "#E0E0E0")),
         )
     
     def _build_pending_verifications(self):
@@ -728,12 +837,12 @@ class ComelecDashboard(ft.Column):
         
         self.voting_active = not self.voting_active
         
-        # Broadcast voting status change to all connected clients
+        # Broadcast voting status change to all connected clients, on every worker
         if self.page:
-            self.page.pubsub.send_all({
-                "type": "voting_status_changed",
+            get_event_bus().publish({
+                "type": VOTING_STATUS_CHANGED,
                 "is_active": self.voting_active
-            })
+            }, self.page.pubsub)
 
         # Hide loading overlay before rebuild
         self._loading_overlay.hide()
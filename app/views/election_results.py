@@ -1,21 +1,100 @@
 import flet as ft
 from app.theme import AppTheme
 from app.components.empty_state import EmptyState
+from app.services.results_broadcaster import RESULTS_DELTA
+from app.services.render_profiler import profiled
 
 
 class ElectionResults(ft.Column):
     """Election Results page - Shows voting results grouped by position"""
     
-    def __init__(self, username, db, on_logout, on_back):
+    def __init__(self, username, db, on_logout, on_back, reporting_db=None):
         super().__init__()
         self.username = username
+        # Tallies come from the primary, since live deltas are added on top of them;
+        # the heavier voter and position counts may come from the read replica
         self.db = db
+        self.reporting_db = reporting_db or db
         self.on_logout = on_logout
         self.on_back = on_back
         
+        # Live tallies and the controls showing them, patched from results deltas
+        self._tallies = {}
+        self._candidate_positions = {}
+        self._position_candidates = {}  # position -> candidate ids in displayed (ranked) order
+        self._position_results = {}
+        self._position_cards = {}
+        self._total_votes = 0
+        self._position_candidates = {}
+        self._position_results = {}
+        self._position_cards = {}
+        self._row_refs = {}
+        self._position_total_texts = {}
+        self._stat_values = {}
+        
         # Build UI
         self._build_ui()
     
+    def did_mount(self):
+        """Subscribe to live results deltas"""
+        if self.page:
+            self.page.pubsub.subscribe(self._on_pubsub_message)
+    
+    def will_unmount(self):
+        """Unsubscribe from live results"""
+        if self.page:
+            self.page.pubsub.unsubscribe()
+    
+    def _on_pubsub_message(self, message):
+        """Patch only the rows affected by a results delta"""
+        if not (isinstance(message, dict) and message.get("type") == RESULTS_DELTA):
+            return
+        
+        candidates = message.get("candidates", {})
+        if self._total_votes == 0 or any(cid not in self._row_refs for cid in candidates):
+            # First votes or an unseen candidate change the layout itself
+            self._build_ui()
+        else:
+            affected_positions = set()
+            for candidate_id, count in candidates.items():
+                self._tallies[candidate_id] += count
+                affected_positions.add(self._candidate_positions[candidate_id])
+            self._total_votes += message.get("total", 0)
+            
+            for position in affected_positions:
+                self._refresh_position(position)
+            self._stat_values["Total Votes Cast"].value = str(self._total_votes)
+        
+        if self.page:
+            self.page.update()
+    
+    def _refresh_position(self, position):
+        """Update vote counts, percentages and bars for one position card"""
+        candidate_ids = self._position_candidates[position]
+        position_total = sum(self._tallies[cid] for cid in candidate_ids)
+        if sorted(candidate_ids, key=self._tallies.get, reverse=True) != candidate_ids:
+            # A candidate overtook another: rows and rank badges must be rebuilt
+            self._rebuild_position(position, position_total)
+            return
+        self._position_total_texts[position].value = f"{position_total} votes cast"
+        for cid in candidate_ids:
+            votes = self._tallies[cid]
+            percentage = (votes / position_total * 100) if position_total > 0 else 0
+            votes_text, percentage_text, bar = self._row_refs[cid]
+            votes_text.value = str(votes)
+            percentage_text.value = f"{percentage:.1f}%"
+            bar.value = percentage / 100
+    
+    def _rebuild_position(self, position, position_total):
+        """Rebuild one position card in ranked order, leaving the rest of the page alone"""
+        candidates = self._position_results[position]
+        for candidate in candidates:
+            candidate["votes"] = self._tallies[candidate["id"]]
+        card = self._position_cards[position]
+        card.content = self._build_position_results(position, candidates, position_total).content
+        self._position_cards[position] = card
+    
+    @profiled()
     def _build_ui(self):
         """Build the main UI"""
         self.controls = [
@@ -102,8 +181,9 @@ class ElectionResults(ft.Column):
         """Build main content area"""
         # Get election data
         total_votes = self.db.get_total_votes_cast() if self.db else 0
-        unique_voters = self.db.get_unique_voters_count() if self.db else 0
-        positions_count = self.db.get_positions_count() if self.db else 0
+        session_id = self.db.get_active_election_session_id() if self.db else None
+        unique_voters = self.reporting_db.get_unique_voters_count(session_id) if self.db else 0
+        positions_count = self.reporting_db.get_positions_count() if self.db else 0
         
         # Get results by position
         results = self.db.get_election_results() if self.db else []
@@ -128,6 +208,16 @@ class ElectionResults(ft.Column):
         for pos, candidates in results_by_position.items():
             position_totals[pos] = sum(c["votes"] for c in candidates)
         
+        # Remember tallies so results deltas can be applied without a reload
+        self._total_votes = total_votes
+        self._tallies = {c["id"]: c["votes"] for cands in results_by_position.values() for c in cands}
+        self._candidate_positions = {c["id"]: pos for pos, cands in results_by_position.items() for c in cands}
+        self._position_candidates = {}
+        self._position_results = {}
+        self._position_cards = {}
+        self._row_refs = {}
+        self._position_total_texts = {}
+        
         return ft.Column(
             [
                 # Back button
@@ -195,11 +285,13 @@ class ElectionResults(ft.Column):
     
     def _build_stat_box(self, label, value):
         """Build a statistics box"""
+        value_text = ft.Text(value, size=24, weight=ft.FontWeight.BOLD, color=ft.Colors.WHITE)
+        self._stat_values[label] = value_text
         return ft.Container(
             content=ft.Column(
                 [
                     ft.Text(label, size=11, color=ft.Colors.WHITE70),
-                    ft.Text(value, size=24, weight=ft.FontWeight.BOLD, color=ft.Colors.WHITE),
+                    value_text,
                 ],
                 spacing=4,
             ),
@@ -213,6 +305,8 @@ class ElectionResults(ft.Column):
         """Build results card for a position"""
         # Sort candidates by votes (descending)
         sorted_candidates = sorted(candidates, key=lambda x: x["votes"], reverse=True)
+        self._position_candidates[position] = [c["id"] for c in sorted_candidates]
+        self._position_results[position] = sorted_candidates
         
         candidate_rows = []
         for rank, candidate in enumerate(sorted_candidates, 1):
@@ -221,7 +315,14 @@ class ElectionResults(ft.Column):
                 self._build_candidate_row(rank, candidate, percentage)
             )
         
-        return ft.Container(
+        total_text = ft.Text(
+            f"{total_votes} votes cast",
+            size=12,
+            color="#5C6BC0",
+        )
+        self._position_total_texts[position] = total_text
+        
+        card = ft.Container(
             content=ft.Column(
                 [
                     # Position header
@@ -231,11 +332,7 @@ class ElectionResults(ft.Column):
                             ft.Row(
                                 [
                                     ft.Icon(ft.Icons.PEOPLE, size=14, color="#5C6BC0"),
-                                    ft.Text(
-                                        f"{total_votes} votes cast",
-                                        size=12,
-                                        color="#5C6BC0",
-                                    ),
+                                    total_text,
                                 ],
                                 spacing=4,
                             ),
@@ -257,6 +354,8 @@ class ElectionResults(ft.Column):
                 color="#1A000000",
             ),
         )
+        self._position_cards[position] = card
+        return card
     
     def _build_candidate_row(self, rank, candidate, percentage):
         """Build a row for a candidate with their votes"""
@@ -286,6 +385,17 @@ class ElectionResults(ft.Column):
                 radius=22,
             )
         
+        votes_text = ft.Text(str(candidate["votes"]), size=16, weight=ft.FontWeight.BOLD)
+        percentage_text = ft.Text(f"{percentage:.1f}%", size=12, weight=ft.FontWeight.W_500)
+        bar = ft.ProgressBar(
+            value=percentage / 100,
+            width=100,
+            height=6,
+            color="#7C4DFF",
+            bgcolor="#E8EAF6",
+        )
+        self._row_refs[candidate["id"]] = (votes_text, percentage_text, bar)
+        
         return ft.Container(
             content=ft.Row(
                 [
@@ -312,7 +422,7 @@ class ElectionResults(ft.Column):
                     # Votes count
                     ft.Column(
                         [
-                            ft.Text(str(candidate["votes"]), size=16, weight=ft.FontWeight.BOLD),
+                            votes_text,
                             ft.Text("votes", size=10, color="#666666"),
                         ],
                         spacing=0,
@@ -321,14 +431,8 @@ class ElectionResults(ft.Column):
                     # Percentage bar
                     ft.Column(
                         [
-                            ft.Text(f"{percentage:.1f}%", size=12, weight=ft.FontWeight.W_500),
-                            ft.ProgressBar(
-                                value=percentage / 100,
-                                width=100,
-                                height=6,
-                                color="#7C4DFF",
-                                bgcolor="#E8EAF6",
-                            ),
+                            percentage_text,
+                            bar,
                         ],
                         spacing=4,
                         horizontal_alignment=ft.CrossAxisAlignment.END,
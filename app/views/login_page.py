@@ -1,3 +1,5 @@
+import inspect
+
 import flet as ft
 from app.theme import AppTheme
 from app.components.loading_overlay import ButtonLoadingState
@@ -235,8 +237,8 @@ class LoginPage(ft.Container):
         self._login_btn_state = ButtonLoadingState(self._login_btn, "Sign In", "Signing in…")
         return self._login_btn
 
-    def _handle_login(self, e):
-        """Handle login button click"""
+    async def _handle_login(self, e):
+        """Handle login button click (awaits an async on_login, so Flet runs it on the event loop)"""
         username = self.username_field.value.strip() if self.username_field.value else ""
         password = self.password_field.value.strip() if self.password_field.value else ""
         
@@ -252,7 +254,9 @@ class LoginPage(ft.Container):
             self.page.update()
 
         try:
-            self.on_login_callback(username, password)
+            result = self.on_login_callback(username, password)
+            if inspect.isawaitable(result):
+                await result
         finally:
             # Restore button (in case login failed and page wasn't replaced)
             if self._login_btn_state and self._is_active_view():
@@ -5,6 +5,13 @@ from app.theme import AppTheme
 from components.date_picker_field import DatePickerField
 from app.components.loading_overlay import LoadingOverlay
 from app.components.empty_state import EmptyState
+from app.components.paged_list import PagedList
+from app.services.search_controller import SearchController
+from app.services.render_profiler import profiled
+
+
+# Politicians per page in the records list
+RECORDS_PAGE_SIZE = 20
 
 
 class NBIDashboard(ft.Column):
@@ -25,6 +32,12 @@ class NBIDashboard(ft.Column):
         # Search state
         self.search_query = ""
         self.records_container = None
+        self.records_list = None
+        self._records_search = SearchController(
+            lambda query: self._fetch_politician_records_page(0, RECORDS_PAGE_SIZE, query),
+            self._show_search_results,
+            invalidate_on=("users", "legal_records"),
+        )
         
         # Form state for adding records
         self.selected_politician_id = None
@@ -40,13 +53,16 @@ class NBIDashboard(ft.Column):
         self._build_ui()
 
     def did_mount(self):
+        self._records_search.attach()
         if self.page and self._loading_overlay not in self.page.overlay:
             self.page.overlay.append(self._loading_overlay)
 
     def will_unmount(self):
+        self._records_search.close()
         if self.page and self._loading_overlay in self.page.overlay:
             self.page.overlay.remove(self._loading_overlay)
 
+    @profiled()
     def _build_ui(self):
         """Build the main UI"""
         self.controls = [
@@ -651,6 +667,7 @@ class NBIDashboard(ft.Column):
                             width=300,
                             height=40,
                             border_radius=20,
+                            value=self.search_query,
                             on_change=self._on_search_change,
                         ),
                         ft.Container(height=16),
@@ -676,31 +693,64 @@ class NBIDashboard(ft.Column):
             )
     
     def _on_search_change(self, e):
-        """Handle search input change"""
-        self.search_query = e.control.value
-        self._refresh_records()
+        """Handle search input change (debounced, runs off the UI handler)"""
+        self._records_search.submit(e.control.value)
+    
+    def _show_search_results(self, query, first_page):
+        """Show the first page of politicians matching the latest search"""
+        self.search_query = query
+        if self.records_list:
+            self.records_list.reset(first_page=first_page)
+            if self.page:
+                self.page.update()
     
     def _build_records_list(self):
-        """Build the list of politician records"""
-        if self.search_query:
-            records = self.db.search_legal_records(self.search_query) if self.db else []
-        else:
-            records = self.db.get_all_legal_records() if self.db else []
+        """Build the list of politician records, one page of politicians at a time"""
+        self.records_list = PagedList(
+            fetch_page=self._fetch_politician_records_page,
+            build_item=self._build_politician_card,
+            spacing=12,
+            page_size=RECORDS_PAGE_SIZE,
+            empty_content=EmptyState(
+                icon=ft.Icons.PERSON_SEARCH,
+                title="No Politicians Found",
+                subtitle="No politician accounts exist yet. Ask COMELEC to add politicians via User Management.",
+                compact=True,
+            ),
+        )
+        return self.records_list
+    
+    def _fetch_politician_records_page(self, offset, limit, query=None):
+        """Get one page of politicians with record counts, plus the records themselves
+        
+        Politicians with records come first; those without follow when not searching.
+        Grouping and status counts come from one aggregate query; records are then
+        fetched for this page's politicians only.
+        """
+        if not self.db:
+            return []
         
-        # Group records by politician
-        politicians_records = {}
+        if query is None:
+            query = self.search_query
+        politicians = self.db.get_legal_record_politicians(query or None, limit, offset)
+        records = self.db.get_legal_records_for_politicians(
+            [pol[0] for pol in politicians], query or None
+        )
+        
+        politicians_records = {
+            pol[0]: {
+                "id": pol[0],
+                "name": pol[1] or pol[2],  # full_name or username
+                "position": pol[3] or "N/A",
+                "party": pol[4] or "N/A",
+                "profile_image": pol[5],
+                "counts": {"total": pol[6], "pending": pol[7], "verified": pol[8], "dismissed": pol[9]},
+                "records": [],
+            }
+            for pol in politicians
+        }
         for record in records:
-            pol_id = record[1]
-            if pol_id not in politicians_records:
-                politicians_records[pol_id] = {
-                    "id": pol_id,
-                    "name": record[8] or record[9],  # full_name or username
-                    "position": record[10] or "N/A",
-                    "party": record[11] or "N/A",
-                    "profile_image": record[12],
-                    "records": [],
-                }
-            politicians_records[pol_id]["records"].append({
+            politicians_records[record[1]]["records"].append({
                 "id": record[0],
                 "type": record[2],
                 "title": record[3],
@@ -710,43 +760,18 @@ class NBIDashboard(ft.Column):
                 "created_at": record[7],
             })
         
-        # Get all politicians to show those without records too
-        all_politicians = self.db.get_users_by_role("politician") if self.db else []
-        
-        politician_cards = []
-        
-        # First show politicians with records
-        for pol_id, pol_data in politicians_records.items():
-            politician_cards.append(self._build_politician_card(pol_data))
-        
-        # Then show politicians without records (if not searching)
-        if not self.search_query:
-            for pol in all_politicians:
-                pol_id = pol[0]
-                if pol_id not in politicians_records:
-                    pol_data = {
-                        "id": pol_id,
-                        "name": pol[5] or pol[1],
-                        "position": pol[7] or "N/A",
-                        "party": pol[8] or "N/A",
-                        "profile_image": pol[10],
-                        "records": [],
-                    }
-                    politician_cards.append(self._build_politician_card(pol_data))
-        
-        if not politician_cards:
-            return EmptyState(
-                icon=ft.Icons.PERSON_SEARCH,
-                title="No Politicians Found",
-                subtitle="No politician accounts exist yet. Ask COMELEC to add politicians via User Management.",
-                compact=True,
-            )
-        
-        return ft.Column(politician_cards, spacing=12)
+        return list(politicians_records.values())
     
     def _build_politician_card(self, pol_data):
         """Build a card for a politician with their records"""
         has_records = len(pol_data["records"]) > 0
+        counts = pol_data.get("counts") or {"total": len(pol_data["records"])}
+        if counts["total"]:
+            breakdown = [f"{counts['total']} record{'s' if counts['total'] != 1 else ''} on file"]
+            breakdown += [f"{counts[status]} {status}" for status in ("pending", "verified", "dismissed") if counts.get(status)]
+            records_summary = " · ".join(breakdown)
+        else:
+            records_summary = "No records on file"
         
         # Build profile image or placeholder
         if pol_data.get("profile_image"):
@@ -853,7 +878,7 @@ class NBIDashboard(ft.Column):
                                         color="#666666",
                                     ),
                                     ft.Text(
-                                        f"{'Records on file' if has_records else 'No records on file'}",
+                                        records_summary,
                                         size=11,
                                         color="#FF5722" if has_records else "#4CAF50",
                                         italic=True,
@@ -2,6 +2,7 @@ import flet as ft
 from datetime import datetime
 from app.components.news_post_creator import NewsPostCreator, MyPostsList
 from app.theme import AppTheme
+from app.services.render_profiler import profiled
 from components.date_picker_field import DatePickerField
 
 
@@ -72,6 +73,7 @@ class PoliticianDashboard(ft.Column):
             return verifications
         return []
     
+    @profiled()
     def _build_ui(self):
         """Build the main UI"""
         self.controls = [
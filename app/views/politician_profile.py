@@ -1,5 +1,6 @@
 import flet as ft
 from app.theme import AppTheme
+from app.services.render_profiler import profiled
 
 
 class PoliticianProfile(ft.Column):
@@ -47,6 +48,7 @@ class PoliticianProfile(ft.Column):
             return verifications
         return []
     
+    @profiled()
     def _build_ui(self):
         """Build the main UI"""
         self.controls = [
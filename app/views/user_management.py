@@ -4,6 +4,8 @@ import os
 from app.theme import AppTheme
 from app.components.loading_overlay import LoadingOverlay
 from app.components.empty_state import EmptyState
+from app.components.paged_list import PagedList
+from app.services.render_profiler import profiled
 
 
 # Dropdown options for positions and parties
@@ -35,6 +37,9 @@ PARTY_OPTIONS = [
     "Independent",
 ]
 
+# Fixed row height lets the voters list skip measuring off-screen rows
+VOTER_ROW_HEIGHT = 56
+
 
 class UserManagement(ft.Column):
     """User Management page for COMELEC - Create and manage voter and politician accounts"""
@@ -76,6 +81,7 @@ class UserManagement(ft.Column):
         if self.page and self._loading_overlay in self.page.overlay:
             self.page.overlay.remove(self._loading_overlay)
     
+    @profiled()
     def _build_ui(self):
         """Build the main UI"""
         # Create file picker (will be added to page overlay by main.py)
@@ -285,9 +291,6 @@ class UserManagement(ft.Column):
     
     def _build_voters_content(self):
         """Build voters tab content"""
-        # Get voters from database
-        voters = self.db.get_users_by_role("voter")
-        
         content_items = [
             ft.Row(
                 [
@@ -310,7 +313,7 @@ class UserManagement(ft.Column):
             content_items.append(self._build_voter_form())
         
         content_items.append(ft.Container(height=16))
-        content_items.append(self._build_voters_table(voters))
+        content_items.append(self._build_voters_table())
         
         return ft.Column(content_items)
     
@@ -403,67 +406,81 @@ class UserManagement(ft.Column):
             border=ft.border.all(1, "#E0E0E0"),
         )
     
-    def _build_voters_table(self, voters):
-        """Build voters data table"""
-        rows = []
-        for voter in voters:
-            user_id, username, email, role, created_at, full_name, status, *_ = voter
-            display_name = full_name if full_name else username
-            display_status = status if status else "active"
-            
-            # Create closure to capture user_id
-            def make_edit_handler(uid, uname, uemail, ufull_name):
-                return lambda e: self._edit_voter(uid, uname, uemail, ufull_name)
-            
-            rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(display_name)),
-                        ft.DataCell(ft.Text(username)),
-                        ft.DataCell(
-                            ft.Container(
-                                content=ft.Text(
-                                    display_status.capitalize(),
-                                    color="#4CAF50" if display_status == "active" else "#F44336",
-                                    size=12,
-                                ),
-                                bgcolor="#E8F5E9" if display_status == "active" else "#FFEBEE",
-                                padding=ft.padding.symmetric(horizontal=12, vertical=4),
-                                border_radius=12,
-                            )
-                        ),
-                        ft.DataCell(
-                            ft.TextButton(
-                                "Edit",
-                                on_click=make_edit_handler(user_id, username, email, full_name),
-                                style=ft.ButtonStyle(color="#5C6BC0"),
-                            )
-                        ),
-                    ],
-                )
-            )
-        
-        if not rows:
-            return EmptyState(
-                icon=ft.Icons.PERSON_OUTLINE,
-                title="No Voter Accounts Yet",
-                subtitle="No voter accounts have been created. Use the 'Add Voter' button above to get started.",
-                btn_label="Add Voter",
-                on_btn_click=self._toggle_voter_form,
-                compact=True,
-            )
+    def _build_voters_table(self):
+        """Build the voters list, loading one page of accounts at a time"""
+        header = ft.Container(
+            content=ft.Row(
+                [
+                    ft.Container(ft.Text("Name", weight=ft.FontWeight.BOLD), expand=3),
+                    ft.Container(ft.Text("Username", weight=ft.FontWeight.BOLD), expand=3),
+                    ft.Container(ft.Text("Status", weight=ft.FontWeight.BOLD), expand=2),
+                    ft.Container(ft.Text("Actions", weight=ft.FontWeight.BOLD), expand=1),
+                ],
+            ),
+            bgcolor="#F5F5F5",
+            padding=ft.padding.symmetric(horizontal=16, vertical=12),
+            border_radius=ft.border_radius.only(top_left=8, top_right=8),
+        )
         
-        return ft.DataTable(
-            columns=[
-                ft.DataColumn(ft.Text("Name", weight=ft.FontWeight.BOLD)),
-                ft.DataColumn(ft.Text("Username", weight=ft.FontWeight.BOLD)),
-                ft.DataColumn(ft.Text("Status", weight=ft.FontWeight.BOLD)),
-                ft.DataColumn(ft.Text("Actions", weight=ft.FontWeight.BOLD)),
-            ],
-            rows=rows,
+        return ft.Container(
+            content=PagedList(
+                fetch_page=lambda offset, limit: self.db.get_users_by_role("voter", limit=limit, offset=offset),
+                build_item=self._build_voter_row,
+                header=header,
+                item_extent=VOTER_ROW_HEIGHT,
+                spacing=0,
+                empty_content=EmptyState(
+                    icon=ft.Icons.PERSON_OUTLINE,
+                    title="No Voter Accounts Yet",
+                    subtitle="No voter accounts have been created. Use the 'Add Voter' button above to get started.",
+                    btn_label="Add Voter",
+                    on_btn_click=self._toggle_voter_form,
+                    compact=True,
+                ),
+            ),
             border=ft.border.all(1, "#E0E0E0"),
             border_radius=8,
-            heading_row_color="#F5F5F5",
+        )
+    
+    def _build_voter_row(self, voter):
+        """Build a single row of the voters list"""
+        user_id, username, email, role, created_at, full_name, status, *_ = voter
+        display_name = full_name if full_name else username
+        display_status = status if status else "active"
+        
+        return ft.Container(
+            content=ft.Row(
+                [
+                    ft.Container(ft.Text(display_name), expand=3),
+                    ft.Container(ft.Text(username), expand=3),
+                    ft.Container(
+                        ft.Container(
+                            content=ft.Text(
+                                display_status.capitalize(),
+                                color="#4CAF50" if display_status == "active" else "#F44336",
+                                size=12,
+                            ),
+                            bgcolor="#E8F5E9" if display_status == "active" else "#FFEBEE",
+                            padding=ft.padding.symmetric(horizontal=12, vertical=4),
+                            border_radius=12,
+                        ),
+                        expand=2,
+                        alignment=ft.alignment.center_left,
+                    ),
+                    ft.Container(
+                        ft.TextButton(
+                            "Edit",
+                            on_click=lambda e: self._edit_voter(user_id, username, email, full_name),
+                            style=ft.ButtonStyle(color="#5C6BC0"),
+                        ),
+                        expand=1,
+                    ),
+                ],
+                vertical_alignment=ft.CrossAxisAlignment.CENTER,
+            ),
+            height=VOTER_ROW_HEIGHT,
+            padding=ft.padding.symmetric(horizontal=16),
+            border=ft.border.only(top=ft.BorderSide(1, "#E0E0E0")),
         )
     
     def _build_politicians_content(self):
@@ -2,6 +2,8 @@ import flet as ft
 from app.components.news_feed import NewsFeed
 from app.theme import AppTheme
 from app.components.empty_state import EmptyState
+from app.components.view_slot import ViewSlot
+from app.services.render_profiler import profiled
 
 
 class VoterDashboard(ft.Column):
@@ -26,6 +28,7 @@ class VoterDashboard(ft.Column):
         self.compare_banner_container = None
         self.content_column = None
         self.news_feed = None
+        self._tab_contents = {}  # tab_id -> built content, reused across tab switches
         
         # Get voting status
         self.voting_active = self._get_voting_status()
@@ -66,23 +69,21 @@ class VoterDashboard(ft.Column):
             return status.get("is_active", False)
         return False
     
+    @profiled()
     def _build_ui(self):
         """Build the main UI"""
-        # Determine content based on current tab
-        if self.current_tab == "news":
-            main_content = self._build_news_feed_content()
-        elif self.current_tab == "records":
-            main_content = self._build_legal_records_content()
-        else:
-            main_content = self._build_candidates_content()
+        # Tab bar and tab content are slots; switching tabs only redraws those two
+        self._tab_contents = {}
+        self._tab_bar_slot = ViewSlot(self._build_tab_bar)
+        self._tab_content_slot = ViewSlot(self._build_current_tab)
         
         self.controls = [
             self._build_header(),
-            self._build_tab_bar(),
+            self._tab_bar_slot,
             ft.Container(
                 content=ft.Column(
                     [
-                        main_content,
+                        self._tab_content_slot,
                     ],
                     scroll=ft.ScrollMode.AUTO,
                     expand=True,
@@ -96,6 +97,21 @@ class VoterDashboard(ft.Column):
         self.expand = True
         self.spacing = 0
     
+    def _build_current_tab(self):
+        """Return the current tab's content, building it on first visit"""
+        if self.current_tab in self._tab_contents:
+            return self._tab_contents[self.current_tab]
+        
+        if self.current_tab == "news":
+            content = self._build_news_feed_content()
+        elif self.current_tab == "records":
+            # Legal records change outside this view; re-read them on every visit
+            return self._build_legal_records_content()
+        else:
+            content = self._build_candidates_content()
+        self._tab_contents[self.current_tab] = content
+        return content
+    
     def _build_news_feed_content(self):
         """Build the news feed tab content"""
         self.news_feed = NewsFeed(self.db)
@@ -457,9 +473,8 @@ class VoterDashboard(ft.Column):
         """Switch between tabs"""
         if self.current_tab != tab_id:
             self.current_tab = tab_id
-            self._build_ui()
-            if self.page:
-                self.page.update()
+            self._tab_bar_slot.refresh()
+            self._tab_content_slot.refresh()
     
     def _get_filtered_politicians(self):
         """Get politicians filtered by search query and compare mode"""
@@ -539,13 +554,13 @@ class VoterDashboard(ft.Column):
         self.search_query = e.control.value
         self._update_candidate_grid()
     
-    def _update_candidate_grid(self):
+    def _update_candidate_grid(self, update=True):
         """Update only the candidate grid without rebuilding entire UI"""
         if self.candidate_grid_container:
             politicians = self._get_filtered_politicians()
             self.candidate_grid_container.content = self._build_candidate_grid(politicians)
-            if self.page:
-                self.page.update()
+            if update and self.candidate_grid_container.page:
+                self.candidate_grid_container.update()
     
     def _build_candidate_grid(self, politicians):
         """Build responsive grid of candidate cards"""
@@ -559,14 +574,15 @@ class VoterDashboard(ft.Column):
         
         # Keep responsive flow while centering each card inside its column slot.
         cards = []
+        verification_counts = self.db.get_verification_counts_by_politician() if self.db else {}
         
         for politician in politicians:
             user_id, username, email, role, created_at, full_name, status, position, party, biography, profile_image = politician
             
             # Get verification count for this politician
-            verifications = self.db.get_verifications_by_politician(user_id) if self.db else []
-            verified_count = len([v for v in verifications if v[4] == 'verified'])
-            pending_count = len([v for v in verifications if v[4] == 'pending'])
+            counts = verification_counts.get(user_id, {})
+            verified_count = counts.get("verified", 0)
+            pending_count = counts.get("pending", 0)
             
             # Check if this candidate is selected for comparison
             is_selected = (self.selected_for_compare and 
@@ -869,8 +885,8 @@ class VoterDashboard(ft.Column):
                 self.compare_banner_container.content = None
                 self.compare_banner_container.margin = None
         
-        # Update candidate grid
-        self._update_candidate_grid()
+        # Update candidate grid, then send the candidates tab in one update
+        self._update_candidate_grid(update=False)
         
-        if self.page:
-            self.page.update()
+        if self.content_column and self.content_column.page:
+            self.content_column.update()
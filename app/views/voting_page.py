@@ -1,6 +1,12 @@
+import asyncio
+
 import flet as ft
+from app.storage.async_database import get_async_database
+from app.storage.database import VotingClosedError
 from app.theme import AppTheme
 from app.components.loading_overlay import LoadingOverlay
+from app.components.view_slot import ViewSlot
+from app.services.render_profiler import profiled
 
 
 class VotingPage(ft.Column):
@@ -11,10 +17,15 @@ class VotingPage(ft.Column):
         self.user_id = user_id
         self.username = username
         self.db = db
+        # Ballots are submitted from an async handler through the database's thread pool
+        self.db_async = get_async_database(db) if db else None
         self.on_logout = on_logout
         self.on_view_profile = on_view_profile
         self.on_voting_stopped = on_voting_stopped
         
+        # Ballots on this page belong to the election that was active when it opened
+        self.election_session_id = db.get_active_election_session_id() if db else None
+        
         # Track votes and UI state
         self.votes = {}  # position -> candidate_id
         self.submitted_positions = set()
@@ -65,6 +76,7 @@ class VotingPage(ft.Column):
         candidates = {}
         if self.db:
             politicians = self.db.get_users_by_role("politician")
+            verification_counts = self.db.get_verification_counts_by_politician()
             for politician in politicians:
                 user_id, username, email, role, created_at, full_name, status, position, party, biography, profile_image = politician
                 if position:
@@ -72,9 +84,9 @@ class VotingPage(ft.Column):
                         candidates[position] = []
                     
                     # Get verification info
-                    verifications = self.db.get_verifications_by_politician(user_id) if self.db else []
-                    verified_count = len([v for v in verifications if v[4] == 'verified'])
-                    total_achievements = len(verifications)
+                    counts = verification_counts.get(user_id, {})
+                    verified_count = counts.get("verified", 0)
+                    total_achievements = sum(counts.values())
                     
                     # Get any records (placeholder for NBI integration)
                     records_count = 1 if user_id % 3 == 0 else 0  # Demo: some have records
@@ -93,11 +105,12 @@ class VotingPage(ft.Column):
     def _load_existing_votes(self):
         """Load existing votes for this user from database"""
         if self.db:
-            existing_votes = self.db.get_votes_by_voter(self.user_id)
+            existing_votes = self.db.get_votes_by_voter(self.user_id, self.election_session_id)
             for position, candidate_id in existing_votes:
                 self.votes[position] = candidate_id
                 self.submitted_positions.add(position)
     
+    @profiled()
     def _build_ui(self):
         """Build the main UI"""
         self.controls = [
@@ -195,13 +208,16 @@ class VotingPage(ft.Column):
     
     def _build_content(self):
         """Build main content area"""
-        total_positions = len(self.candidates_by_position)
-        voted_positions = len(self.submitted_positions)
-        all_voted = voted_positions == total_positions and total_positions > 0
-        
-        position_cards = []
-        for position, candidates in sorted(self.candidates_by_position.items()):
-            position_cards.append(self._build_position_section(position, candidates))
+        # Each section lives in its own slot so an interaction only rebuilds
+        # the position it touched (see _refresh_position)
+        self._progress_slot = ViewSlot(
+            lambda: self._build_voting_progress(len(self.submitted_positions), len(self.candidates_by_position))
+        )
+        self._position_slots = {
+            position: ViewSlot(lambda pos=position: self._build_position_section(pos, self.candidates_by_position[pos]))
+            for position in sorted(self.candidates_by_position)
+        }
+        self._complete_slot = ViewSlot(self._build_complete_section)
         
         return ft.Column(
             [
@@ -235,15 +251,29 @@ class VotingPage(ft.Column):
                 ),
                 ft.Container(height=20),
                 # Voting Progress
-                self._build_voting_progress(voted_positions, total_positions),
+                self._progress_slot,
                 ft.Container(height=20),
                 # Position sections (collapsible)
-                *position_cards,
+                *self._position_slots.values(),
                 # Voting complete message
-                self._build_voting_complete() if all_voted else ft.Container(),
+                self._complete_slot,
             ],
         )
     
+    def _build_complete_section(self):
+        """Show the voting complete message once every position has a vote"""
+        total_positions = len(self.candidates_by_position)
+        if total_positions > 0 and len(self.submitted_positions) == total_positions:
+            return self._build_voting_complete()
+        return ft.Container()
+    
+    def _refresh_position(self, position, progress=False):
+        """Rebuild one position card (and the progress summary) instead of the whole page"""
+        self._position_slots[position].refresh()
+        if progress:
+            self._progress_slot.refresh()
+            self._complete_slot.refresh()
+    
     def _build_voting_progress(self, voted, total):
         """Build voting progress bar"""
         progress = voted / total if total > 0 else 0
@@ -498,9 +528,7 @@ class VotingPage(ft.Column):
         self.change_vote_mode.add(position)
         # Also expand the position
         self.expanded_positions.add(position)
-        self._build_ui()
-        if self.page:
-            self.page.update()
+        self._refresh_position(position)
     
     def _toggle_position(self, position):
         """Toggle expand/collapse for a position"""
@@ -511,9 +539,7 @@ class VotingPage(ft.Column):
         else:
             self.expanded_positions.add(position)
         
-        self._build_ui()
-        if self.page:
-            self.page.update()
+        self._refresh_position(position)
     
     def _select_candidate(self, candidate_id, position):
         """Select a candidate for voting"""
@@ -525,9 +551,7 @@ class VotingPage(ft.Column):
         # If changing vote and clicking same candidate, cancel change mode
         if is_changing and self.votes.get(position) == candidate_id:
             self.change_vote_mode.discard(position)
-            self._build_ui()
-            if self.page:
-                self.page.update()
+            self._refresh_position(position)
             return
         
         # Toggle selection or select new
@@ -537,32 +561,49 @@ class VotingPage(ft.Column):
         else:
             # Select and submit immediately
             self.selected_candidates[position] = candidate_id
-            self._submit_vote(position, candidate_id, is_update=is_changing)
+            if self.page:
+                self.page.run_task(self._submit_vote, position, candidate_id, is_update=is_changing)
+            else:
+                # Not in a page session (no event loop to hand the ballot to)
+                asyncio.run(self._submit_vote(position, candidate_id, is_update=is_changing))
     
-    def _submit_vote(self, position, candidate_id, is_update=False):
-        """Submit vote for a position"""
+    async def _submit_vote(self, position, candidate_id, is_update=False):
+        """Submit vote for a position without blocking the event loop on the database"""
+        # Ballots are only accepted while voting is open (a cached status read)
+        if self.db and not await self.db_async.run(self.db.is_voting_active):
+            if self.on_voting_stopped:
+                self.on_voting_stopped()
+            return
+        
         # Show loading overlay
         action_label = "Updating vote…" if is_update else "Submitting vote…"
         self._loading_overlay.show(action_label)
-        if self.page:
-            self.page.update()
+        self._update_overlay()
 
-        # Record the vote
-        self.votes[position] = candidate_id
-        self.submitted_positions.add(position)
-        
         # Save to database
         if self.db:
             try:
                 if is_update:
-                    self.db.update_vote(self.user_id, candidate_id, position)
+                    await self.db_async.update_vote(self.user_id, candidate_id, position, self.election_session_id)
                 else:
-                    self.db.cast_vote(self.user_id, candidate_id, position)
+                    await self.db_async.cast_vote(self.user_id, candidate_id, position, self.election_session_id)
+            except VotingClosedError:
+                # Voting stopped after the check above; the ballot was not recorded
+                self._loading_overlay.hide()
+                self._update_overlay()
+                if self.on_voting_stopped:
+                    self.on_voting_stopped()
+                return
             except Exception as e:
                 print(f"Error casting vote: {e}")
         
+        # Record the vote
+        self.votes[position] = candidate_id
+        self.submitted_positions.add(position)
+        
         # Hide loading overlay
         self._loading_overlay.hide()
+        self._update_overlay()
 
         # Exit change vote mode if active
         self.change_vote_mode.discard(position)
@@ -575,10 +616,12 @@ class VotingPage(ft.Column):
         if position in self.selected_candidates:
             del self.selected_candidates[position]
         
-        # Rebuild UI
-        self._build_ui()
-        if self.page:
-            self.page.update()
+        # Only this position's card and the progress summary changed
+        self._refresh_position(position, progress=True)
+    
+    def _update_overlay(self):
+        if self._loading_overlay.page:
+            self._loading_overlay.update()
     
     def _view_profile(self, candidate_id):
         """View politician profile"""
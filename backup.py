@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Backup script for HonestBallot
+Creates, lists, verifies and restores point-in-time snapshots of the
+database. Snapshots are taken online, so this is safe while the app runs;
+stop the app before restoring.
+"""
+
+import argparse
+import sys
+import os
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.storage.backup import BackupManager
+
+
+def main():
+    """Run one backup command"""
+    parser = argparse.ArgumentParser(description="Back up and restore the HonestBallot database")
+    parser.add_argument("--db", help="database file (default: DATABASE_NAME)")
+    parser.add_argument("--dir", help="snapshot directory (default: BACKUP_DIR)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("create", help="take a snapshot now")
+    commands.add_parser("list", help="list snapshots, newest first")
+    verify = commands.add_parser("verify", help="check snapshots against their manifests")
+    verify.add_argument("snapshot", nargs="?", help="snapshot file (default: all)")
+    restore = commands.add_parser("restore", help="replace the database with a verified snapshot")
+    restore.add_argument("snapshot", help="snapshot file")
+    args = parser.parse_args()
+    
+    manager = BackupManager(args.db, args.dir)
+    
+    if args.command == "create":
+        result = manager.create_snapshot()
+        print(f"✅ Snapshot created: {result.path}")
+        print(f"  {result.size_bytes} bytes, {result.pages} pages in {result.steps} steps "
+              f"({result.restarts} restarts), {result.seconds * 1000:.0f}ms")
+        print(f"  sha256 {result.sha256}")
+        return 0
+    
+    if args.command == "list":
+        snapshots = manager.list_snapshots()
+        if not snapshots:
+            print(f"No snapshots in {manager.backup_dir}")
+        for snapshot in snapshots:
+            print(f"  {snapshot['path']}  {snapshot.get('created_at', '?')}  "
+                  f"{snapshot['size_bytes']} bytes  schema v{snapshot.get('schema_version', '?')}")
+        return 0
+    
+    if args.command == "verify":
+        paths = [args.snapshot] if args.snapshot else [s["path"] for s in manager.list_snapshots()]
+        failed = 0
+        for path in paths:
+            problems = manager.verify_snapshot(path)
+            if problems:
+                failed += 1
+                print(f"  ❌ {path}: {'; '.join(problems)}")
+            else:
+                print(f"  ✅ {path}")
+        print(f"{len(paths) - failed} of {len(paths)} snapshots verified")
+        return 1 if failed else 0
+    
+    if args.command == "restore":
+        try:
+            result = manager.restore_snapshot(args.snapshot)
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+        print(f"✅ Restored {result.source} into {result.path} (previous database saved as a pre-restore snapshot)")
+        return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
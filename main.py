@@ -1,29 +1,36 @@
+import time
+
+# Taken before anything else is imported so the startup report covers Flet too
+_PROCESS_STARTED = time.perf_counter()
+
+import asyncio
 import flet as ft
+import multiprocessing
 import sys
 import os
 
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app.views.login_page import LoginPage
-from app.views.signup_page import SignupPage
-from app.views.home_page import HomePage
-from app.views.settings_page import SettingsPage
-from app.views.profile_page import ProfilePage
-from app.views.comelec_dashboard import ComelecDashboard
-from app.views.user_management import UserManagement
-from app.views.election_results import ElectionResults
-from app.views.voter_dashboard import VoterDashboard
-from app.views.politician_profile import PoliticianProfile
-from app.views.candidate_comparison import CandidateComparison
-from app.views.voting_page import VotingPage
-from app.views.politician_dashboard import PoliticianDashboard
-from app.views.nbi_dashboard import NBIDashboard
-from app.views.audit_log_page import AuditLogPage
-from app.views.analytics_page import AnalyticsPage
-from app.storage.database import init_demo_data
+# Views are imported on first navigation (see app.views.load_view)
+from app.views import load_view
+from app.storage.database import get_database
+from app.storage.async_database import get_async_database
+from app.services.news_analysis_service import get_news_pipeline
+from app.services.results_broadcaster import get_results_broadcaster
+from app.services.event_bus import get_event_bus
+from app.services.backup_service import get_backup_scheduler
+from app.services.replica_service import get_reporting_database
+from app.services.render_profiler import get_render_profiler, profile_render
+from app.components.render_debug_panel import RenderDebugPanel
 from app.state.session_manager import SessionManager
 from app.security_logger import auth_logger
+from app.config import Config
+from app.metrics import ACCOUNT_LOCKOUTS, LOGIN_ATTEMPTS, LOGIN_SECONDS, start_metrics_server
+from app.startup import startup_timer
+
+startup_timer.begin(_PROCESS_STARTED)
+startup_timer.record("imports", time.perf_counter() - _PROCESS_STARTED)
 
 
 APP_LOGO_ASSET = "646362954_1313996230543670_9086585389723444034_n-removebg-preview.png"
@@ -32,18 +39,41 @@ APP_LOGO_ASSET = "646362954_1313996230543670_9086585389723444034_n-removebg-prev
 class HonestBallotApp:
     """Main application class for local voting app with session management"""
     
-    def __init__(self):
+    def __init__(self, db):
         self.page = None
         self.current_session = None
-        self.session_manager = SessionManager()
-        self.db = None
+        # Handle to the process-wide database, shared by every page session
+        self.db = db
+        # Awaitable calls for async handlers, run on the database's thread pool
+        self.db_async = get_async_database(db)
+        self.session_manager = SessionManager(db)
     
     def main(self, page: ft.Page):
         """Main entry point for the Flet app"""
         self.page = page
         
-        # Initialize database with demo data
-        self.db = init_demo_data()
+        with startup_timer.phase("services"):
+            # Analyze news posts in the background as they are created or edited
+            get_news_pipeline(self.db)
+            
+            # Events reach this worker's sessions over pubsub and, with
+            # WORKERS > 1, the other workers' sessions through the event bus
+            event_bus = get_event_bus()
+            event_bus.attach(page.pubsub)
+            
+            # Push coalesced vote tallies to every session
+            get_results_broadcaster().attach(event_bus)
+            
+            # Prometheus scrape endpoint on a side port (METRICS_ENABLED=True)
+            if Config.METRICS_ENABLED:
+                try:
+                    start_metrics_server()
+                except OSError as e:
+                    print(f"METRICS WARNING: Could not start metrics endpoint: {e}")
+        
+        # Render profiling (RENDER_PROFILING=True): Ctrl+Shift+D opens the cost panel
+        if get_render_profiler().enabled:
+            page.on_keyboard_event = self._on_keyboard_event
         
         # Page configuration
         page.title = "HonestBallot - Local Voting App"
@@ -74,164 +104,156 @@ class HonestBallotApp:
             page.window.on_event = on_window_event
         
         # Start with login page
-        self.show_login_page()
+        with startup_timer.phase("first_page"):
+            self.show_login_page()
+        
+        # Logged once, for the first session of the process
+        startup_timer.report()
     
     def show_login_page(self):
         """Show the login page"""
-        self.page.clean()
-        
-        login_page = LoginPage(
-            on_login=self.handle_login,
-            on_create_account=self.show_signup_page,
-            on_forgot_password=self.handle_forgot_password,
-        )
-        
-        self.page.add(login_page)
-        self.page.update()
+        with profile_render("show_login_page", root=self.page) as render:
+            self.page.clean()
+            
+            login_page = load_view("LoginPage")(
+                on_login=self.handle_login,
+                on_create_account=self.show_signup_page,
+                on_forgot_password=self.handle_forgot_password,
+            )
+            
+            render.built()
+            self.page.add(login_page)
+            self.page.update()
     
     def show_signup_page(self):
         """Show the signup page"""
-        self.page.clean()
-        
-        signup_page = SignupPage(
-            on_google_signin=self.handle_google_signin,
-            on_apple_signin=self.handle_apple_signin,
-            on_create_account=self.handle_create_account,
-            on_signin=self.show_login_page,
-        )
-        
-        self.page.add(signup_page)
-        self.page.update()
+        with profile_render("show_signup_page", root=self.page) as render:
+            self.page.clean()
+            
+            signup_page = load_view("SignupPage")(
+                on_google_signin=self.handle_google_signin,
+                on_apple_signin=self.handle_apple_signin,
+                on_create_account=self.handle_create_account,
+                on_signin=self.show_login_page,
+            )
+            
+            render.built()
+            self.page.add(signup_page)
+            self.page.update()
     
     def show_home_page(self):
         """Show the main home page - now voter dashboard"""
-        self.page.clean()
-        self.page.overlay.clear()
-        
-        if not self.current_session:
-            self.show_login_page()
-            return
-        
-        # Check if voting is active
-        voting_status = self.db.get_voting_status() if self.db else {"is_active": False}
-        
-        if voting_status.get("is_active", False):
-            # Show voting page when voting is active
-            voting_page = VotingPage(
-                user_id=self.current_session["user_id"],
-                username=self.current_session["username"],
+        with profile_render("show_home_page", root=self.page) as render:
+            self.page.clean()
+            self.page.overlay.clear()
+            
+            if not self.current_session:
+                self.show_login_page()
+                return
+            
+            # Check if voting is active
+            voting_status = self.db.get_voting_status() if self.db else {"is_active": False}
+            
+            if voting_status.get("is_active", False):
+                # Show voting page when voting is active
+                voting_page = load_view("VotingPage")(
+                    user_id=self.current_session["user_id"],
+                    username=self.current_session["username"],
+                    db=self.db,
+                    on_logout=self.handle_logout,
+                    on_view_profile=self.show_politician_profile,
+                    on_voting_stopped=self.show_home_page,  # Auto-refresh when voting stops
+                )
+                render.built()
+                self.page.add(voting_page)
+            else:
+                # Show voter dashboard when not voting time
+                dashboard = load_view("VoterDashboard")(
+                    username=self.current_session["username"],
+                    db=self.db,
+                    on_logout=self.handle_logout,
+                    on_profile_view=self.show_politician_profile,
+                    on_compare=self.show_candidate_comparison,
+                    on_voting_started=self.show_home_page,  # Auto-refresh when voting starts
+                )
+                render.built()
+                self.page.add(dashboard)
+            
+            self.page.update()
+    
+    def show_politician_profile(self, politician_id):
+        """Show politician profile page"""
+        with profile_render("show_politician_profile", root=self.page) as render:
+            self.page.clean()
+            self.page.overlay.clear()
+            
+            if not self.current_session:
+                self.show_login_page()
+                return
+            
+            profile_page = load_view("PoliticianProfile")(
+                politician_id=politician_id,
                 db=self.db,
+                on_back=self.show_home_page,
                 on_logout=self.handle_logout,
-                on_view_profile=self.show_politician_profile,
-                on_voting_stopped=self.show_home_page,  # Auto-refresh when voting stops
-            )
-            self.page.add(voting_page)
-        else:
-            # Show voter dashboard when not voting time
-            dashboard = VoterDashboard(
                 username=self.current_session["username"],
-                db=self.db,
-                on_logout=self.handle_logout,
-                on_profile_view=self.show_politician_profile,
-                on_compare=self.show_candidate_comparison,
-                on_voting_started=self.show_home_page,  # Auto-refresh when voting starts
             )
-            self.page.add(dashboard)
-        
-        self.page.update()
-    
-    def show_politician_profile(self, politician_id):
-        """Show politician profile page"""
-        self.page.clean()
-        self.page.overlay.clear()
-        
-        if not self.current_session:
-            self.show_login_page()
-            return
-        
-        profile_page = PoliticianProfile(
-            politician_id=politician_id,
-            db=self.db,
-            on_back=self.show_home_page,
-            on_logout=self.handle_logout,
-            username=self.current_session["username"],
-        )
-        
-        self.page.add(profile_page)
-        self.page.update()
+            
+            render.built()
+            self.page.add(profile_page)
+            self.page.update()
     
     def show_candidate_comparison(self, candidate1_id, candidate2_id):
         """Show candidate comparison page"""
-        self.page.clean()
-        self.page.overlay.clear()
-        
-        if not self.current_session:
-            self.show_login_page()
-            return
-        
-        comparison_page = CandidateComparison(
-            candidate1_id=candidate1_id,
-            candidate2_id=candidate2_id,
-            db=self.db,
-            on_back=self.show_home_page,
-            on_logout=self.handle_logout,
-            username=self.current_session["username"],
-        )
-        
-        self.page.add(comparison_page)
-        self.page.update()
+        with profile_render("show_candidate_comparison", root=self.page) as render:
+            self.page.clean()
+            self.page.overlay.clear()
+            
+            if not self.current_session:
+                self.show_login_page()
+                return
+            
+            comparison_page = load_view("CandidateComparison")(
+                candidate1_id=candidate1_id,
+                candidate2_id=candidate2_id,
+                db=self.db,
+                on_back=self.show_home_page,
+                on_logout=self.handle_logout,
+                username=self.current_session["username"],
+            )
+            
+            render.built()
+            self.page.add(comparison_page)
+            self.page.update()
     
     def show_politician_dashboard(self):
         """Show the Politician dashboard"""
-        self.page.clean()
-        self.page.overlay.clear()
-        
-        if not self.current_session:
-            self.show_login_page()
-            return
-        
-        dashboard = PoliticianDashboard(
-            user_id=self.current_session["user_id"],
-            username=self.current_session["username"],
-            db=self.db,
-            on_logout=self.handle_logout,
-            on_audit_log=self.show_audit_log,
-        )
-        
-        # Add file picker to page overlay
-        self.page.overlay.append(dashboard.file_picker)
-        
-        self.page.add(dashboard)
-        self.page.update()
+        with profile_render("show_politician_dashboard", root=self.page) as render:
+            self.page.clean()
+            self.page.overlay.clear()
+            
+            if not self.current_session:
+                self.show_login_page()
+                return
+            
+            dashboard = load_view("PoliticianDashboard")(
+                user_id=self.current_session["user_id"],
+                username=self.current_session["username"],
+                db=self.db,
+                on_logout=self.handle_logout,
+                on_audit_log=self.show_audit_log,
+            )
+            
+            # Add file picker to page overlay
+            self.page.overlay.append(dashboard.file_picker)
+            
+            render.built()
+            self.page.add(dashboard)
+            self.page.update()
     
     def show_comelec_dashboard(self):
         """Show the COMELEC dashboard"""
-        self.page.clean()
-        self.page.overlay.clear()
-        
-        if not self.current_session:
-            self.show_login_page()
-            return
-        
-        dashboard = ComelecDashboard(
-            username=self.current_session["username"],
-            db=self.db,
-            on_logout=self.handle_logout,
-            on_user_management=self.show_user_management,
-            on_election_results=self.show_election_results,
-            on_candidates=lambda: self.show_error_dialog("Info", "Verified Candidates - Coming Soon"),
-            current_user_id=self.current_session["user_id"],
-            on_audit_log=self.show_audit_log,
-            on_analytics=self.show_analytics_page,
-        )
-        
-        self.page.add(dashboard)
-        self.page.update()
-    
-    def show_nbi_dashboard(self):
-        """Show the NBI Officer dashboard"""
-        try:
-            print("NBI: Cleaning page...")
+        with profile_render("show_comelec_dashboard", root=self.page) as render:
             self.page.clean()
             self.page.overlay.clear()
             
@@ -239,129 +261,175 @@ class HonestBallotApp:
                 self.show_login_page()
                 return
             
-            print("NBI: Creating NBIDashboard instance...")
-            dashboard = NBIDashboard(
+            dashboard = load_view("ComelecDashboard")(
                 username=self.current_session["username"],
                 db=self.db,
                 on_logout=self.handle_logout,
+                on_user_management=self.show_user_management,
+                on_election_results=self.show_election_results,
+                on_candidates=lambda: self.show_error_dialog("Info", "Verified Candidates - Coming Soon"),
                 current_user_id=self.current_session["user_id"],
                 on_audit_log=self.show_audit_log,
+                on_analytics=self.show_analytics_page,
             )
-            print("NBI: Dashboard created, adding to page...")
             
+            render.built()
             self.page.add(dashboard)
-            print("NBI: Dashboard added, calling update...")
             self.page.update()
-            print("NBI: Done!")
-        except Exception as e:
-            print(f"NBI ERROR: {type(e).__name__}: {e}")
-            import traceback
-            traceback.print_exc()
+    
+    def show_nbi_dashboard(self):
+        """Show the NBI Officer dashboard"""
+        with profile_render("show_nbi_dashboard", root=self.page) as render:
+            try:
+                print("NBI: Cleaning page...")
+                self.page.clean()
+                self.page.overlay.clear()
+                
+                if not self.current_session:
+                    self.show_login_page()
+                    return
+                
+                print("NBI: Creating NBIDashboard instance...")
+                dashboard = load_view("NBIDashboard")(
+                    username=self.current_session["username"],
+                    db=self.db,
+                    on_logout=self.handle_logout,
+                    current_user_id=self.current_session["user_id"],
+                    on_audit_log=self.show_audit_log,
+                )
+                print("NBI: Dashboard created, adding to page...")
+                
+                render.built()
+                self.page.add(dashboard)
+                print("NBI: Dashboard added, calling update...")
+                self.page.update()
+                print("NBI: Done!")
+            except Exception as e:
+                print(f"NBI ERROR: {type(e).__name__}: {e}")
+                import traceback
+                traceback.print_exc()
     
     def show_audit_log(self):
         """Show the Audit Log page"""
-        self.page.clean()
-        self.page.overlay.clear()
-        
-        if not self.current_session:
-            self.show_login_page()
-            return
-        
-        # Determine which dashboard to go back to
-        role = self.current_session["role"]
-        if role == "comelec":
-            on_back = self.show_comelec_dashboard
-        elif role == "nbi":
-            on_back = self.show_nbi_dashboard
-        elif role == "politician":
-            on_back = self.show_politician_dashboard
-        else:
-            on_back = self.show_home_page
-        
-        audit_page = AuditLogPage(
-            username=self.current_session["username"],
-            db=self.db,
-            user_role=role,
-            on_back=on_back,
-            current_user_id=self.current_session["user_id"],
-        )
-        
-        self.page.add(audit_page)
-        self.page.update()
+        with profile_render("show_audit_log", root=self.page) as render:
+            self.page.clean()
+            self.page.overlay.clear()
+            
+            if not self.current_session:
+                self.show_login_page()
+                return
+            
+            # Determine which dashboard to go back to
+            role = self.current_session["role"]
+            if role == "comelec":
+                on_back = self.show_comelec_dashboard
+            elif role == "nbi":
+                on_back = self.show_nbi_dashboard
+            elif role == "politician":
+                on_back = self.show_politician_dashboard
+            else:
+                on_back = self.show_home_page
+            
+            # Read-only page: served from the read replica when one is enabled
+            audit_page = load_view("AuditLogPage")(
+                username=self.current_session["username"],
+                db=get_reporting_database(self.db),
+                user_role=role,
+                on_back=on_back,
+                current_user_id=self.current_session["user_id"],
+            )
+            
+            render.built()
+            self.page.add(audit_page)
+            self.page.update()
     
     def show_analytics_page(self):
         """Show the Analytics Dashboard page"""
-        self.page.clean()
-        self.page.overlay.clear()
-        
-        if not self.current_session:
-            self.show_login_page()
-            return
-        
-        analytics_page = AnalyticsPage(
-            username=self.current_session["username"],
-            db=self.db,
-            user_role=self.current_session["role"],
-            on_back=self.show_comelec_dashboard,
-            on_logout=self.handle_logout,
-        )
-        
-        self.page.add(analytics_page)
-        self.page.update()
+        with profile_render("show_analytics_page", root=self.page) as render:
+            self.page.clean()
+            self.page.overlay.clear()
+            
+            if not self.current_session:
+                self.show_login_page()
+                return
+            
+            analytics_page = load_view("AnalyticsPage")(
+                username=self.current_session["username"],
+                db=self.db,
+                user_role=self.current_session["role"],
+                on_back=self.show_comelec_dashboard,
+                on_logout=self.handle_logout,
+                reporting_db=get_reporting_database(self.db),
+            )
+            
+            render.built()
+            self.page.add(analytics_page)
+            self.page.update()
     
     def show_election_results(self):
         """Show the Election Results page"""
-        self.page.clean()
-        self.page.overlay.clear()
-        
-        if not self.current_session:
-            self.show_login_page()
-            return
-        
-        results_page = ElectionResults(
-            username=self.current_session["username"],
-            db=self.db,
-            on_logout=self.handle_logout,
-            on_back=self.show_comelec_dashboard,
-        )
-        
-        self.page.add(results_page)
-        self.page.update()
+        with profile_render("show_election_results", root=self.page) as render:
+            self.page.clean()
+            self.page.overlay.clear()
+            
+            if not self.current_session:
+                self.show_login_page()
+                return
+            
+            results_page = load_view("ElectionResults")(
+                username=self.current_session["username"],
+                db=self.db,
+                on_logout=self.handle_logout,
+                on_back=self.show_comelec_dashboard,
+                reporting_db=get_reporting_database(self.db) if Config.REPLICA_FOR_RESULTS else None,
+            )
+            
+            render.built()
+            self.page.add(results_page)
+            self.page.update()
     
     def show_user_management(self):
         """Show the User Management page"""
-        self.page.clean()
-        # Clear any existing overlays
-        self.page.overlay.clear()
-        
-        if not self.current_session:
-            self.show_login_page()
-            return
-        
-        user_mgmt = UserManagement(
-            username=self.current_session["username"],
-            db=self.db,
-            on_logout=self.handle_logout,
-            on_back=self.show_comelec_dashboard,
-        )
-        
-        # Add file picker to page overlay
-        self.page.overlay.append(user_mgmt.file_picker)
-        
-        self.page.add(user_mgmt)
-        self.page.update()
+        with profile_render("show_user_management", root=self.page) as render:
+            self.page.clean()
+            # Clear any existing overlays
+            self.page.overlay.clear()
+            
+            if not self.current_session:
+                self.show_login_page()
+                return
+            
+            user_mgmt = load_view("UserManagement")(
+                username=self.current_session["username"],
+                db=self.db,
+                on_logout=self.handle_logout,
+                on_back=self.show_comelec_dashboard,
+            )
+            
+            # Add file picker to page overlay
+            self.page.overlay.append(user_mgmt.file_picker)
+            
+            render.built()
+            self.page.add(user_mgmt)
+            self.page.update()
     
-    def handle_login(self, username, password):
-        """Handle login attempt with credential stuffing protection"""
+    async def handle_login(self, username, password):
+        """Handle login attempt with credential stuffing protection
+        
+        Awaits every database call (and the bcrypt check) on the database's
+        thread pool, so the event loop keeps serving other sessions meanwhile.
+        """
         try:
             if not username or not password:
                 self.show_error_dialog("Login Error", "Please enter both username and password.")
                 return
             
+            db = self.db_async
             # Check if account is locked due to too many failed attempts
             identifier = username.lower()
-            if self.db.is_account_locked(identifier):
-                remaining_time = self.db.get_lockout_remaining_time(identifier)
+            if await db.run(self.db.is_account_locked, identifier):
+                LOGIN_ATTEMPTS.inc(outcome="locked")
+                remaining_time = await db.run(self.db.get_lockout_remaining_time, identifier)
                 minutes = remaining_time // 60
                 seconds = remaining_time % 60
                 self.show_error_dialog(
@@ -371,18 +439,22 @@ class HonestBallotApp:
                 return
             
             # Verify credentials from database (try username first, then email)
-            user = self.session_manager.db.verify_user_by_username(username, password)
+            started = time.perf_counter()
+            user = await db.verify_user_by_username(username, password)
             if not user:
-                user = self.session_manager.db.verify_user(username, password)
+                user = await db.verify_user(username, password)
+            LOGIN_SECONDS.observe(time.perf_counter() - started)
+            LOGIN_ATTEMPTS.inc(outcome="success" if user else "failure")
             
             if user:
                 print(f"LOGIN: User verified - {user['username']} role={user['role']}")
                 # Record successful login and clear failed attempts
-                self.db.record_login_attempt(identifier, success=True)
-                self.db.clear_failed_attempts(identifier)
+                await db.run(self.db.record_login_attempt, identifier, success=True)
+                await db.run(self.db.clear_failed_attempts, identifier)
                 
                 # Create session
-                session_token = self.session_manager.create_session(
+                session_token = await db.run(
+                    self.session_manager.create_session,
                     user["id"],
                     user["username"],
                     user["email"],
@@ -399,7 +471,7 @@ class HonestBallotApp:
                 }
                 
                 # Log the login action to database
-                self.db.log_action(
+                await db.log_action(
                     action=f"User {user['username']} logged in",
                     action_type="login",
                     description=f"Successful login for {user['email']}",
@@ -415,22 +487,16 @@ class HonestBallotApp:
                 )
                 
                 print(f"LOGIN: Routing to dashboard for role={user['role']}")
-                # Route based on role
-                if user["role"] == "comelec":
-                    self.show_comelec_dashboard()
-                elif user["role"] == "nbi":
-                    self.show_nbi_dashboard()
-                elif user["role"] == "politician":
-                    self.show_politician_dashboard()
-                else:
-                    self.show_home_page()
+                # Dashboards read the database while they are built, so build them
+                # off the event loop, as Flet does for synchronous handlers
+                await asyncio.to_thread(self.show_dashboard_for_role, user["role"])
                 print(f"LOGIN: Dashboard shown successfully")
             else:
                 # Record failed login attempt
-                self.db.record_login_attempt(identifier, success=False)
+                await db.run(self.db.record_login_attempt, identifier, success=False)
                 
                 # Log the failed attempt to database
-                self.db.log_action(
+                await db.log_action(
                     action=f"Failed login attempt for {username}",
                     action_type="login_failed",
                     description=f"Invalid credentials provided",
@@ -439,7 +505,8 @@ class HonestBallotApp:
                 )
                 
                 # Check if account just got locked
-                if self.db.is_account_locked(identifier):
+                if await db.run(self.db.is_account_locked, identifier):
+                    ACCOUNT_LOCKOUTS.inc()
                     # Log account lockout to security logger
                     auth_logger.account_locked(
                         username=username,
@@ -450,7 +517,8 @@ class HonestBallotApp:
                         f"Too many failed attempts. Account locked for {self.db.LOCKOUT_DURATION_MINUTES} minutes."
                     )
                 else:
-                    attempts_remaining = self.db.MAX_LOGIN_ATTEMPTS - self.db.get_failed_attempts_count(identifier)
+                    failed_attempts = await db.run(self.db.get_failed_attempts_count, identifier)
+                    attempts_remaining = self.db.MAX_LOGIN_ATTEMPTS - failed_attempts
                     # Log failed login to security logger
                     auth_logger.login_failed(
                         username=username,
@@ -467,6 +535,17 @@ class HonestBallotApp:
             traceback.print_exc()
             self.show_error_dialog("Login Error", f"An error occurred: {str(e)}")
     
+    def show_dashboard_for_role(self, role):
+        """Route a signed-in user to their role's landing page"""
+        if role == "comelec":
+            self.show_comelec_dashboard()
+        elif role == "nbi":
+            self.show_nbi_dashboard()
+        elif role == "politician":
+            self.show_politician_dashboard()
+        else:
+            self.show_home_page()
+    
     def handle_create_account(self, username, email, password):
         """Handle create account"""
         if not username or not email or not password:
@@ -482,7 +561,7 @@ class HonestBallotApp:
                 role="voter"
             )
             # Auto-login after signup
-            self.handle_login(email, password)
+            self.page.run_task(self.handle_login, email, password)
         else:
             self.show_error_dialog("Signup Failed", "Email or username already exists.")
     
@@ -532,43 +611,47 @@ class HonestBallotApp:
     
     def show_profile_page(self):
         """Show the profile page"""
-        self.page.clean()
-        
-        if not self.current_session:
-            self.show_login_page()
-            return
-        
-        profile_page = ProfilePage(
-            username=self.current_session["username"],
-            user_handle=f"@{self.current_session['username'].lower()}",
-            on_logout=self.handle_logout,
-            on_settings=self.handle_settings,
-            on_home=self.show_home_page,
-        )
-        
-        self.page.add(profile_page)
-        self.page.update()
+        with profile_render("show_profile_page", root=self.page) as render:
+            self.page.clean()
+            
+            if not self.current_session:
+                self.show_login_page()
+                return
+            
+            profile_page = load_view("ProfilePage")(
+                username=self.current_session["username"],
+                user_handle=f"@{self.current_session['username'].lower()}",
+                on_logout=self.handle_logout,
+                on_settings=self.handle_settings,
+                on_home=self.show_home_page,
+            )
+            
+            render.built()
+            self.page.add(profile_page)
+            self.page.update()
     
     def show_settings_page(self):
         """Show the settings page"""
-        self.page.clean()
-        
-        if not self.current_session:
-            self.show_login_page()
-            return
-        
-        settings_page = SettingsPage(
-            username=self.current_session["username"],
-            user_handle=f"@{self.current_session['username'].lower()}",
-            on_save=lambda settings: self.handle_settings_save(settings),
-            on_cancel=self.show_home_page,
-            on_back=self.show_home_page,
-            on_logout=self.handle_logout,
-            on_profile=self.show_profile_page,
-        )
-        
-        self.page.add(settings_page)
-        self.page.update()
+        with profile_render("show_settings_page", root=self.page) as render:
+            self.page.clean()
+            
+            if not self.current_session:
+                self.show_login_page()
+                return
+            
+            settings_page = load_view("SettingsPage")(
+                username=self.current_session["username"],
+                user_handle=f"@{self.current_session['username'].lower()}",
+                on_save=lambda settings: self.handle_settings_save(settings),
+                on_cancel=self.show_home_page,
+                on_back=self.show_home_page,
+                on_logout=self.handle_logout,
+                on_profile=self.show_profile_page,
+            )
+            
+            render.built()
+            self.page.add(settings_page)
+            self.page.update()
     
     def handle_settings_save(self, settings_data):
         """Handle saving settings and return to home"""
@@ -588,6 +671,22 @@ class HonestBallotApp:
         dialog.open = True
         self.page.update()
     
+    def show_render_debug_panel(self):
+        """Show recorded render costs for every view visited so far"""
+        dialog = ft.AlertDialog(
+            content=RenderDebugPanel(get_render_profiler()),
+            actions=[
+                ft.TextButton("Close", on_click=lambda e: self.close_dialog(dialog)),
+            ],
+        )
+        self.page.overlay.append(dialog)
+        dialog.open = True
+        self.page.update()
+    
+    def _on_keyboard_event(self, e: ft.KeyboardEvent):
+        if e.ctrl and e.shift and e.key.upper() == "D":
+            self.show_render_debug_panel()
+    
     def close_dialog(self, dialog):
         """Close a dialog"""
         dialog.open = False
@@ -606,7 +705,7 @@ def main(page: ft.Page):
     sys.excepthook = handle_exception
     
     try:
-        app = HonestBallotApp()
+        app = HonestBallotApp(get_database())
         page.theme_mode = ft.ThemeMode.LIGHT
         page.on_error = lambda e: print(f"PAGE ERROR: {e.data}")
         app.main(page)
@@ -627,12 +726,52 @@ def _get_bind_config():
     return host, port
 
 
+def _serve_worker(host, port):
+    """Run one headless web server process (multi-worker mode)"""
+    ft.app(target=main, view=None, assets_dir="assets", host=host, port=port)
+
+
+def run_workers(host, port, workers):
+    """Run workers server processes on port, port + 1, ... for a reverse proxy to balance
+    
+    A session stays on the worker that accepted its connection; voting status
+    and live results reach the other workers' sessions through the event bus.
+    """
+    # Spawned (not forked) so no worker inherits this process's database connection
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=_serve_worker, args=(host, port + i), name=f"honestballot-worker-{i}")
+        for i in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    print(f"Started {workers} workers on {host}:{port}-{port + workers - 1}")
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.terminate()
+
+
 if __name__ == "__main__": 
+    # Schema and demo data are created by setup_db.py, not per session
+    with startup_timer.phase("database_open"):
+        if not get_database().has_users():
+            print("DATABASE WARNING: No users found. Run `python setup_db.py` to create the demo accounts.")
+    
+    # Snapshots are taken here, once, rather than in each worker (see backup.py to restore)
+    if Config.BACKUP_ENABLED:
+        get_backup_scheduler()
+    
     host, port = _get_bind_config()
-    ft.app(
-        target=main,
-        view=ft.AppView.WEB_BROWSER,
-        assets_dir="assets",
-        host=host,
-        port=port,
-    )
+    if Config.WORKERS > 1:
+        run_workers(host, port, Config.WORKERS)
+    else:
+        ft.app(
+            target=main,
+            view=ft.AppView.WEB_BROWSER,
+            assets_dir="assets",
+            host=host,
+            port=port,
+        )
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Recount script for HonestBallot
+Recounts an election session's ballots from a snapshot of the database in
+parallel worker processes and reconciles the counts with the live tallies;
+exits non-zero when any candidate's count differs
+"""
+
+import argparse
+import sys
+import os
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.storage.recount import Recounter
+from app.storage.vote_ledger import connect_read_only
+
+
+def candidate_names(db_path, candidate_ids):
+    """Full names for the recounted candidate ids (politician accounts)"""
+    if not candidate_ids:
+        return {}
+    connection = connect_read_only(db_path or Recounter().db_path)
+    try:
+        placeholders = ",".join("?" * len(candidate_ids))
+        rows = connection.execute(
+            f'SELECT id, full_name FROM users WHERE id IN ({placeholders})', list(candidate_ids)
+        ).fetchall()
+    finally:
+        connection.close()
+    return {row[0]: row[1] for row in rows}
+
+
+def main():
+    """Recount and print per-position results with any discrepancies"""
+    parser = argparse.ArgumentParser(description="Recount HonestBallot votes and reconcile them with the live tally")
+    parser.add_argument("--db", help="database file (default: DATABASE_NAME)")
+    parser.add_argument("--session", type=int, help="election session id (default: the active one)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: RECOUNT_WORKERS, 0 = one per core)")
+    parser.add_argument("--chunk-size", type=int, help="votes per worker task (default: RECOUNT_CHUNK_SIZE)")
+    parser.add_argument("--live", action="store_true", help="read the database directly instead of a snapshot")
+    args = parser.parse_args()
+    
+    print("Recounting HonestBallot votes...")
+    print("-" * 50)
+    report = Recounter(args.db, args.workers, args.chunk_size, use_snapshot=not args.live).recount(args.session)
+    
+    candidate_ids = {c for candidates in report.results.values() for c in candidates}
+    candidate_ids |= {d.candidate_id for d in report.discrepancies}
+    names = candidate_names(args.db, candidate_ids)
+    mismatched = {d.candidate_id: d for d in report.discrepancies}
+    for position in sorted(set(report.results) | {d.position for d in report.discrepancies}):
+        print(f"\n{position}")
+        candidates = report.results.get(position, {})
+        for candidate_id, votes in sorted(candidates.items(), key=lambda item: -item[1]):
+            flag = f"  ❌ tally says {mismatched[candidate_id].tallied}" if candidate_id in mismatched else ""
+            print(f"  {names.get(candidate_id, f'Candidate #{candidate_id}')}: {votes}{flag}")
+        for d in report.discrepancies:
+            if d.position == position and d.candidate_id not in candidates:
+                print(f"  {names.get(d.candidate_id, f'Candidate #{d.candidate_id}')}: 0  ❌ tally says {d.tallied}")
+    
+    print("\n" + "-" * 50)
+    print(("✅ " if report.ok else "❌ ") + report.summary())
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
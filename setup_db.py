@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """
 Database initialization script for HonestBallot voting app
-This script initializes the local SQLite database with demo data
+This script creates the schema and seeds demo data. The app opens the
+database without re-running the DDL once it is stamped with the current
+schema version, and never seeds it, so run this before the first start
 """
 
 import sys
@@ -10,7 +12,7 @@ import os
 # Add current directory to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from app.storage.database import init_demo_data
+from app.storage.database import Database, init_demo_data
 
 
 def main():
@@ -18,7 +20,9 @@ def main():
     print("Initializing HonestBallot Local Database...")
     print("-" * 50)
     
-    db = init_demo_data()
+    db = Database()
+    db.create_schema()
+    init_demo_data(db)
     
     print("✅ Database initialized successfully!")
     print("\nDemo Users Created:")
@@ -6,11 +6,13 @@ Tests AI-powered analysis and recommendation features
 import unittest
 import os
 import sys
+import tempfile
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.services.ai_service import AIService, RecommendationEngine
+from app.storage.database import Database
 
 
 class TestAIServiceThemeExtraction(unittest.TestCase):
@@ -262,5 +264,82 @@ class TestRecommendationEngine(unittest.TestCase):
         self.assertEqual(recs, [])
 
 
+class TestRecommendationCache(unittest.TestCase):
+    """Test cases for the persistent recommendation cache"""
+    
+    def setUp(self):
+        """Set up a database with two politicians"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "recommendation_test.db")
+        self.db = Database(db_name=self.db_path)
+        self.db.create_politician("pol1", "pol1@test.com", "pass", "Pol One", "Mayor", "Party A",
+                                  "Education and school reform advocate")
+        self.db.create_politician("pol2", "pol2@test.com", "pass", "Pol Two", "Mayor", "Party B",
+                                  "Hospital and healthcare champion")
+        self.engine = RecommendationEngine(self.db)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        if self.db.connection:
+            self.db.connection.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+    
+    def test_cache_key_is_order_independent(self):
+        """Test the same preference set maps to one cache key"""
+        self.assertEqual(
+            RecommendationEngine.cache_key(["healthcare", "education"]),
+            RecommendationEngine.cache_key(["education", "healthcare", "education"]),
+        )
+        self.assertNotEqual(
+            RecommendationEngine.cache_key(["education"]),
+            RecommendationEngine.cache_key(["education"], position="Mayor"),
+        )
+    
+    def test_recommendations_served_from_cache(self):
+        """Test a repeated preference set skips candidate scoring"""
+        first = self.engine.get_recommendations(["education", "healthcare"], limit=2)
+        self.assertTrue(self.engine.is_cached(["healthcare", "education"]))
+        
+        # Only the ranked ids and scores are stored
+        payload = self.db.get_cached_recommendations(RecommendationEngine.cache_key(["education", "healthcare"]))
+        self.assertEqual(payload["ranked"][0], [first[0]["politician"]["id"], first[0]["compatibility_score"]])
+        self.assertEqual(len(payload["ranked"]), 2)
+        
+        # A second engine (another session) reads the shared cache without ranking or reading the roster
+        other = RecommendationEngine(self.db)
+        other._rank_candidates = None
+        self.db.get_users_by_role = None
+        cached = other.get_recommendations(["healthcare", "education"], limit=1)
+        self.assertEqual(cached, first[:1])
+    
+    def test_on_compute_called_only_on_miss(self):
+        """Test the miss callback (the page's loading overlay) is skipped for cached preference sets"""
+        computed = []
+        self.engine.get_recommendations(["education"], on_compute=lambda: computed.append(True))
+        self.engine.get_recommendations(["education"], on_compute=lambda: computed.append(True))
+        self.assertEqual(computed, [True])
+    
+    def test_roster_change_invalidates_cache(self):
+        """Test politician, verification and legal record writes clear the cache"""
+        pol_id = self.db.get_users_by_role("politician")[0][0]
+        writes = [
+            lambda: self.db.create_politician("pol3", "pol3@test.com", "pass", "Pol Three", "Mayor", None, "bio"),
+            lambda: self.db.create_achievement_verification(pol_id, "Award", "desc"),
+            lambda: self.db.create_legal_record(pol_id, "Tax", "Tax case", "desc", "1/1/2024", 1),
+        ]
+        for write in writes:
+            self.engine.get_recommendations(["education"])
+            self.assertTrue(self.engine.is_cached(["education"]))
+            write()
+            self.assertFalse(self.engine.is_cached(["education"]))
+    
+    def test_voter_change_keeps_cache(self):
+        """Test voter account writes leave cached recommendations alone"""
+        self.engine.get_recommendations(["education"])
+        self.db.create_voter("voter1", "voter1@test.com", "pass", "Voter One")
+        self.assertTrue(self.engine.is_cached(["education"]))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,295 @@
+"""
+Unit Tests for Analytics Service
+Tests single-pass analytics snapshot aggregation
+"""
+
+import gc
+import unittest
+import os
+import sys
+import tempfile
+import threading
+import weakref
+from dataclasses import FrozenInstanceError
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.storage.database import Database
+from app.services import analytics_service
+from app.services.analytics_service import AnalyticsSnapshotBuilder, AnalyticsScheduler, get_analytics_scheduler
+
+
+class TestAnalyticsSnapshotBuilder(unittest.TestCase):
+    """Test cases for the analytics snapshot builder"""
+    
+    def setUp(self):
+        """Set up a database with politicians, votes, verifications and records"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "analytics_test.db")
+        self.db = Database(db_name=self.db_path)
+        self.db.start_voting(user_id=1)
+        
+        self.db.create_politician("gov1", "gov1@test.com", "pass", "Gov One", "Governor",
+                                  "Party A", "Education reform champion with 15 years of service")
+        self.db.create_politician("gov2", "gov2@test.com", "pass", "Gov Two", "Governor",
+                                  "Party B", "Healthcare advocate")
+        self.db.create_politician("may1", "may1@test.com", "pass", "Mayor One", "Mayor",
+                                  None, "Young and fresh infrastructure builder")
+        self.db.create_user("voter1", "v1@test.com", "pass", "voter")
+        self.db.create_user("voter2", "v2@test.com", "pass", "voter")
+        
+        pols = {p[1]: p[0] for p in self.db.get_users_by_role("politician")}
+        voters = [v[0] for v in self.db.get_users_by_role("voter")]
+        self.pols = pols
+        
+        self.db.cast_vote(voters[0], pols["gov1"], "Governor")
+        self.db.cast_vote(voters[1], pols["gov1"], "Governor")
+        self.db.cast_vote(voters[1], pols["may1"], "Mayor")
+        
+        v1 = self.db.create_achievement_verification(pols["gov1"], "A1", "desc")
+        self.db.create_achievement_verification(pols["gov1"], "A2", "desc")
+        v3 = self.db.create_achievement_verification(pols["gov2"], "A3", "desc")
+        self.db.verify_achievement(v1, 1, "verified")
+        self.db.verify_achievement(v3, 1, "rejected")
+        
+        r1 = self.db.create_legal_record(pols["gov2"], "Tax", "Tax issue", "desc", "1/1/2024", 1)
+        self.db.create_legal_record(pols["gov2"], "Graft", "Graft case", "desc", "1/1/2024", 1)
+        self.db.update_legal_record_status(r1, "verified", 1)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        if self.db.connection:
+            self.db.connection.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+        if os.path.exists(self.temp_dir):
+            os.rmdir(self.temp_dir)
+    
+    def test_verification_counts_by_politician(self):
+        """Test grouped verification counts"""
+        counts = self.db.get_verification_counts_by_politician()
+        self.assertEqual(counts[self.pols["gov1"]], {"verified": 1, "pending": 1, "rejected": 0})
+        self.assertEqual(counts[self.pols["gov2"]], {"verified": 0, "pending": 0, "rejected": 1})
+        self.assertNotIn(self.pols["may1"], counts)
+    
+    def test_legal_record_counts_by_politician(self):
+        """Test grouped legal record counts"""
+        counts = self.db.get_legal_record_counts_by_politician()
+        self.assertEqual(counts[self.pols["gov2"]], {"total": 2, "verified": 1, "pending": 1})
+    
+    def test_snapshot_stats(self):
+        """Test overview statistics"""
+        snapshot = AnalyticsSnapshotBuilder(self.db).build()
+        self.assertEqual(snapshot.stats["candidates"], 3)
+        self.assertEqual(snapshot.stats["positions"], 2)
+        self.assertEqual(snapshot.stats["votes"], 3)
+        self.assertEqual(snapshot.stats["verified"], 1)
+    
+    def test_snapshot_chart_data(self):
+        """Test chart series derived from the same read"""
+        chart_data = AnalyticsSnapshotBuilder(self.db).build().chart_data
+        votes = {d["label"]: d["value"] for d in chart_data["votes_by_position"]}
+        self.assertEqual(votes, {"Governor": 2, "Mayor": 1})
+        parties = {d["label"]: d["value"] for d in chart_data["party_distribution"]}
+        self.assertEqual(parties, {"Party A": 1, "Party B": 1, "Independent": 1})
+        verification = {d["label"]: d["value"] for d in chart_data["verification_status"]}
+        self.assertEqual(verification, {"Verified": 1, "Pending": 1, "Rejected": 1})
+        legal = {d["label"]: d["value"] for d in chart_data["legal_records"]}
+        self.assertEqual(legal, {"Total Records": 2, "Verified": 1, "Pending": 1})
+    
+    def test_snapshot_insight_inputs(self):
+        """Test insight inputs and top candidate ranking"""
+        snapshot = AnalyticsSnapshotBuilder(self.db).build()
+        self.assertEqual(snapshot.candidates_with_verifications, 1)
+        self.assertEqual(snapshot.candidates_with_votes, 2)
+        self.assertIn(("Governor", "Gov One", 2), snapshot.position_leaders)
+        self.assertEqual(snapshot.experience_levels["high"], 1)
+        self.assertEqual(len(snapshot.top_candidates), 3)
+        top = snapshot.top_candidates[0]
+        self.assertEqual(top["politician"]["full_name"], "Gov One")
+        self.assertEqual(top["insights"]["verified_achievements"], 1)
+    
+    def test_snapshot_turnout(self):
+        """Test turnout curves and the vote rate are read into the shared snapshot"""
+        snapshot = AnalyticsSnapshotBuilder(self.db).build()
+        self.assertEqual(sum(count for _, count in snapshot.turnout_series), 3)
+        self.assertEqual(sum(count for _, count in snapshot.turnout_by_position["Governor"]), 2)
+        self.assertGreater(snapshot.votes_per_second, 0)
+    
+    def test_snapshot_uses_batch_queries(self):
+        """Test the builder never issues per-politician queries"""
+        self.db.get_verifications_by_politician = None
+        self.db.get_legal_records_by_politician = None
+        snapshot = AnalyticsSnapshotBuilder(self.db).build()
+        self.assertEqual(snapshot.query_count, 9)
+        
+        # The count is measured, and stays the same as the roster grows
+        for i in range(5):
+            self.db.create_politician(f"extra{i}", f"extra{i}@test.com", "pass", f"Extra {i}", "Mayor", None, "")
+        self.assertEqual(AnalyticsSnapshotBuilder(self.db).build().query_count, 9)
+    
+    def test_snapshot_leaves_out_images_and_credentials(self):
+        """Test the long-lived snapshot holds only the politician fields the page renders"""
+        pol_id = self.pols["gov1"]
+        self.db.cursor.execute("UPDATE users SET profile_image = ? WHERE id = ?", ("aGVsbG8=" * 1000, pol_id))
+        self.db.connection.commit()
+        
+        snapshot = AnalyticsSnapshotBuilder(self.db).build()
+        for pol in snapshot.politicians + tuple(c["politician"] for c in snapshot.top_candidates):
+            self.assertEqual(set(pol), {"id", "username", "full_name", "position", "party", "biography"})
+    
+    def test_snapshot_is_immutable(self):
+        """Test snapshot fields cannot be reassigned or mutated"""
+        snapshot = AnalyticsSnapshotBuilder(self.db).build()
+        with self.assertRaises(FrozenInstanceError):
+            snapshot.stats = {}
+        with self.assertRaises(TypeError):
+            snapshot.stats["votes"] = 0
+        # Rows inside the snapshot are read-only too
+        with self.assertRaises(TypeError):
+            snapshot.top_candidates[0]["politician"]["full_name"] = "Changed"
+        with self.assertRaises(TypeError):
+            snapshot.chart_data["votes_by_position"][0]["value"] = 0
+        self.assertIsInstance(snapshot.top_candidates[0]["insights"]["key_strengths"], tuple)
+    
+    def test_snapshot_without_database(self):
+        """Test an empty snapshot is returned without a database"""
+        snapshot = AnalyticsSnapshotBuilder(None).build()
+        self.assertEqual(snapshot.stats["candidates"], 0)
+        self.assertEqual(snapshot.top_candidates, ())
+
+
+class TestAnalyticsScheduler(unittest.TestCase):
+    """Test cases for background snapshot refresh"""
+    
+    def setUp(self):
+        """Set up a database and a scheduler with a short debounce"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "scheduler_test.db")
+        self.db = Database(db_name=self.db_path)
+        self.scheduler = AnalyticsScheduler(self.db, interval_seconds=60, debounce_seconds=0.01)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.scheduler.stop()
+        if self.db.connection:
+            self.db.connection.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+    
+    def _wait_for_snapshot(self):
+        refreshed = threading.Event()
+        snapshots = []
+        
+        def on_snapshot(snapshot):
+            snapshots.append(snapshot)
+            refreshed.set()
+        
+        self.scheduler.subscribe(on_snapshot)
+        return refreshed, snapshots
+    
+    def test_latest_builds_once(self):
+        """Test latest() builds synchronously only when no snapshot exists"""
+        first = self.scheduler.latest()
+        self.assertIs(self.scheduler.latest(), first)
+    
+    def test_write_triggers_background_refresh(self):
+        """Test relevant writes rebuild the snapshot on the worker"""
+        self.assertEqual(self.scheduler.latest().stats["candidates"], 0)
+        refreshed, snapshots = self._wait_for_snapshot()
+        self.scheduler.start()
+        
+        self.db.create_politician("gov1", "gov1@test.com", "pass", "Gov One", "Governor", "Party A", "bio")
+        
+        self.assertTrue(refreshed.wait(5))
+        self.assertEqual(snapshots[-1].stats["candidates"], 1)
+        self.assertIs(self.scheduler.latest(), snapshots[-1])
+    
+    def test_irrelevant_write_does_not_refresh(self):
+        """Test writes outside analytics tables are ignored"""
+        self.scheduler.latest()
+        self.scheduler.start()
+        self.db.create_news_post(1, "comelec", "Title", "Body")
+        self.assertFalse(self.scheduler._wake.is_set())
+    
+    def test_votes_wait_for_interval(self):
+        """Test a stream of votes does not rebuild the whole snapshot every debounce"""
+        self.db.create_user("voter1", "voter1@test.com", "pass")
+        self.db.create_politician("gov1", "gov1@test.com", "pass", "Gov One", "Governor", "Party A", "bio")
+        voter_id = self.db.get_users_by_role("voter")[0][0]
+        candidate_id = self.db.get_users_by_role("politician")[0][0]
+        self.db.start_voting(1)
+        self.scheduler.latest()
+        self.scheduler.start()
+        
+        self.assertTrue(self.db.cast_vote(voter_id, candidate_id, "Governor"))
+        self.assertFalse(self.scheduler._wake.is_set())
+        self.assertEqual(self.scheduler.refresh().stats["votes"], 1)
+    
+    def test_session_and_status_changes_refresh(self):
+        """Test starting voting or switching election session makes the snapshot stale"""
+        self.scheduler.latest()
+        refreshed, snapshots = self._wait_for_snapshot()
+        self.scheduler.start()
+        
+        self.db.start_voting(1)
+        self.assertTrue(refreshed.wait(5))
+        
+        refreshed.clear()
+        self.db.create_election_session("Runoff")
+        self.assertTrue(refreshed.wait(5))
+    
+    def test_stop_removes_change_listener(self):
+        """Test stopping the scheduler detaches it from the database"""
+        self.scheduler.start()
+        self.assertIn(self.scheduler._on_db_change, Database._change_listeners)
+        self.scheduler.stop()
+        self.assertNotIn(self.scheduler._on_db_change, Database._change_listeners)
+        self.assertFalse(self.scheduler.running)
+    
+    def test_collected_subscriber_is_dropped(self):
+        """Test a page that is never unmounted does not stay subscribed"""
+        class Page:
+            def __init__(self):
+                self.snapshots = []
+            
+            def on_snapshot(self, snapshot):
+                self.snapshots.append(snapshot)
+        
+        kept, dropped = Page(), Page()
+        self.scheduler.subscribe(kept.on_snapshot)
+        self.scheduler.subscribe(dropped.on_snapshot)
+        dropped_ref = weakref.ref(dropped)
+        del dropped
+        gc.collect()
+        
+        self.assertIsNone(dropped_ref())
+        self.scheduler.refresh()
+        self.assertEqual(len(kept.snapshots), 1)
+        self.assertEqual(len(self.scheduler._subscribers), 1)
+        
+        self.scheduler.unsubscribe(kept.on_snapshot)
+        self.assertEqual(self.scheduler._subscribers, [])
+    
+    def test_shared_scheduler_follows_database(self):
+        """Test asking for the scheduler with another database rebinds it rather than ignoring it"""
+        other_path = os.path.join(self.temp_dir, "scheduler_other.db")
+        other = Database(db_name=other_path)
+        self.addCleanup(os.remove, other_path)
+        self.addCleanup(other.connection.close)
+        other.create_politician("gov1", "gov1@test.com", "pass", "Gov One", "Governor", "Party A", "bio")
+        
+        with mock.patch.object(analytics_service, "_scheduler", None):
+            shared = get_analytics_scheduler(self.db)
+            self.addCleanup(shared.stop)
+            self.assertEqual(shared.latest().stats["candidates"], 0)
+            
+            self.assertIs(get_analytics_scheduler(other), shared)
+            self.assertIs(shared.db, other)
+            self.assertEqual(shared.refresh().stats["candidates"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
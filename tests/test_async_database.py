@@ -0,0 +1,94 @@
+"""
+Unit Tests for the Async Database
+Tests the awaitable methods and that they leave the event loop free
+"""
+
+import asyncio
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+import threading
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.storage.database import Database
+from app.storage.async_database import AsyncDatabase, get_async_database
+
+
+class TestAsyncDatabase(unittest.TestCase):
+    """Test cases for the asyncio facade"""
+    
+    def setUp(self):
+        """Set up test database with a voter and a news post"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db = Database(db_name=os.path.join(self.temp_dir, "async.db"))
+        self.db.start_voting(user_id=1)
+        self.db.create_user("voter1", "voter1@example.com", "Passw0rd!", "voter")
+        self.db.create_news_post(1, "comelec", "Polls open", "Voting starts at 8am")
+        self.async_db = get_async_database(self.db)
+    
+    def tearDown(self):
+        """Clean up"""
+        self.async_db.close()
+        self.db.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_methods_match_database(self):
+        """Test each awaitable method returns what the Database method does"""
+        async def scenario():
+            user = await self.async_db.verify_user_by_username("voter1", "Passw0rd!")
+            self.assertEqual(user["email"], "voter1@example.com")
+            self.assertIsNone(await self.async_db.verify_user_by_username("voter1", "wrong"))
+            self.assertEqual((await self.async_db.verify_user("voter1@example.com", "Passw0rd!"))["id"], user["id"])
+            
+            self.assertTrue(await self.async_db.cast_vote(user["id"], 100, "President"))
+            self.assertEqual(await self.async_db.get_election_results(), self.db.get_election_results())
+            self.assertEqual(len(await self.async_db.get_news_posts()), 1)
+            await self.async_db.log_action("LOGIN", "login", user_id=user["id"])
+            return user
+        
+        user = asyncio.run(scenario())
+        self.assertEqual(len(self.db.get_votes_by_voter(user["id"])), 1)
+        self.assertEqual(self.db.get_audit_logs(action_type="login")[0][1], "LOGIN")
+    
+    def test_event_loop_runs_while_database_is_busy(self):
+        """Test other coroutines keep running while a call waits on the database lock"""
+        held = threading.Event()
+        release = threading.Event()
+        
+        def hold_lock():
+            with Database._db_lock:
+                held.set()
+                release.wait(5)
+        
+        async def scenario():
+            worker = threading.Thread(target=hold_lock)
+            worker.start()
+            held.wait()
+            login = asyncio.ensure_future(self.async_db.verify_user_by_username("voter1", "Passw0rd!"))
+            ticks = 0
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+            self.assertFalse(login.done())
+            release.set()
+            user = await login
+            worker.join()
+            return ticks, user
+        
+        ticks, user = asyncio.run(scenario())
+        self.assertEqual(ticks, 5)
+        self.assertEqual(user["username"], "voter1")
+    
+    def test_one_facade_per_database(self):
+        """Test every caller shares the pool of the Database it passes"""
+        self.assertIs(get_async_database(self.db), self.async_db)
+        self.assertIsInstance(self.async_db, AsyncDatabase)
+        self.assertGreater(self.async_db.max_workers, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,287 @@
+"""
+Unit Tests for Storage Backends
+Tests backend selection and the SQLite-to-PostgreSQL statement translation
+"""
+
+import unittest
+import os
+import re
+import shutil
+import sqlite3
+import sys
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.storage.backends import SQLiteBackend, _split_literals, create_backend, translate_to_postgres
+from app.storage.database import Database
+
+
+class TestBackendSelection(unittest.TestCase):
+    """Test cases for choosing a backend from a database name"""
+    
+    def setUp(self):
+        """Set up a temporary directory"""
+        self.temp_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        """Clean up"""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_paths_and_sqlite_urls_open_files(self):
+        """Test plain paths and sqlite:/// URLs both select the SQLite backend"""
+        path = os.path.join(self.temp_dir, "backend.db")
+        self.assertIsInstance(create_backend(path), SQLiteBackend)
+        self.assertEqual(create_backend(f"sqlite:///{path}").location, path)
+        
+        db = Database(db_name=f"sqlite:///{path}")
+        try:
+            self.assertEqual(str(db.db_path), path)
+            self.assertIs(db._db_lock, Database._db_lock)
+            self.assertEqual(db.get_schema_version(), Database.SCHEMA_VERSION)
+        finally:
+            db.close()
+
+
+class TestPostgresTranslation(unittest.TestCase):
+    """Test cases for rewriting SQLite statements for PostgreSQL"""
+    
+    def test_placeholders_and_percent_signs(self):
+        """Test ? becomes %s outside literals and every % is escaped for psycopg2"""
+        statement = translate_to_postgres("SELECT id FROM users WHERE username LIKE ? AND role = 'a?%'")
+        self.assertEqual(statement.sql, "SELECT id FROM users WHERE username ILIKE %s AND role = 'a?%%'")
+        # Without parameters psycopg2 does not format the statement
+        statement = translate_to_postgres("SELECT 1 FROM users WHERE username LIKE '%a%'", has_parameters=False)
+        self.assertEqual(statement.sql, "SELECT 1 FROM users WHERE username ILIKE '%a%'")
+    
+    def test_sqlite_time_functions_use_shims(self):
+        """Test date/time functions and CURRENT_TIMESTAMP call the sqlite_* stand-ins"""
+        statement = translate_to_postgres(
+            "UPDATE s SET t = COALESCE(t, CURRENT_TIMESTAMP) WHERE DATE(c) = DATE('now') "
+            "AND a > datetime('now', ?) AND strftime('%H', b) = ?"
+        )
+        self.assertEqual(
+            statement.sql,
+            "UPDATE s SET t = COALESCE(t, sqlite_datetime('now')) WHERE sqlite_date(c) = sqlite_date('now') "
+            "AND a > sqlite_datetime('now', %s) AND sqlite_strftime('%%H', b) = %s"
+        )
+    
+    def test_create_table_types(self):
+        """Test SQLite column types and foreign keys are mapped for PostgreSQL"""
+        statement = translate_to_postgres('''
+            CREATE TABLE IF NOT EXISTS votes (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                is_active BOOLEAN DEFAULT 0,
+                timestamp TIMESTAMP,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (voter_id) REFERENCES users(id)
+            )
+        ''', has_parameters=False)
+        self.assertIn("id INTEGER GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY", statement.sql)
+        self.assertIn("is_active INTEGER DEFAULT 0", statement.sql)
+        self.assertIn("created_at TEXT DEFAULT sqlite_datetime('now')", statement.sql)
+        self.assertIn("timestamp TEXT,", statement.sql)
+        self.assertNotIn("FOREIGN KEY", statement.sql)
+    
+    def test_insert_or_replace_and_lastrowid(self):
+        """Test INSERT OR REPLACE becomes an upsert and INSERTs return their generated id"""
+        statement = translate_to_postgres(
+            "INSERT OR REPLACE INTO recommendation_cache (cache_key, payload) VALUES (?, ?)",
+            primary_keys={"recommendation_cache": ("cache_key",)},
+        )
+        self.assertEqual(
+            statement.sql,
+            "INSERT INTO recommendation_cache (cache_key, payload) VALUES (%s, %s) "
+            "ON CONFLICT (cache_key) DO UPDATE SET payload = EXCLUDED.payload"
+        )
+        self.assertIsNone(statement.returning)
+        
+        statement = translate_to_postgres(
+            "INSERT INTO votes (voter_id, candidate_id) VALUES (?, ?)", identity_columns={"votes": "id"}
+        )
+        self.assertEqual(statement.sql, "INSERT INTO votes (voter_id, candidate_id) VALUES (%s, %s) RETURNING id")
+        self.assertEqual(statement.returning, "id")
+    
+    def test_begin_immediate_takes_advisory_lock(self):
+        """Test BEGIN IMMEDIATE opens a transaction serialized like SQLite's write lock"""
+        statement = translate_to_postgres("BEGIN IMMEDIATE", has_parameters=False)
+        self.assertTrue(statement.sql.startswith("BEGIN; SELECT pg_advisory_xact_lock("))
+    
+    def test_insert_or_ignore_and_upserts(self):
+        """Test INSERT OR IGNORE skips conflicts and hand-written upserts pass through unchanged"""
+        statement = translate_to_postgres(
+            "INSERT OR IGNORE INTO news_post_themes (post_id, theme) VALUES (?, ?)",
+            identity_columns={"votes": "id"},
+        )
+        self.assertEqual(
+            statement.sql, "INSERT INTO news_post_themes (post_id, theme) VALUES (%s, %s) ON CONFLICT DO NOTHING"
+        )
+        
+        upsert = (
+            "INSERT INTO vote_tallies (election_session_id, candidate_id, position, vote_count) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (election_session_id, candidate_id) "
+            "DO UPDATE SET vote_count = vote_tallies.vote_count + excluded.vote_count"
+        )
+        self.assertEqual(translate_to_postgres(upsert).sql, upsert.replace("?", "%s"))
+    
+    def test_lastrowid_for_ledger_batches(self):
+        """Test sealing a ledger batch returns its id, and executemany never asks for one"""
+        sql = ("INSERT INTO ledger_batches (first_seq, last_seq, leaf_count, merkle_root, prev_hash, chain_hash) "
+               "VALUES (?, ?, ?, ?, ?, ?)")
+        statement = translate_to_postgres(sql, identity_columns={"ledger_batches": "id"})
+        self.assertTrue(statement.sql.endswith(" RETURNING id"))
+        self.assertEqual(statement.returning, "id")
+        self.assertIsNone(translate_to_postgres(sql, identity_columns=None).returning)
+    
+    def test_time_expressions(self):
+        """Test the date/time shapes used by turnout buckets and login lockouts"""
+        statement = translate_to_postgres(
+            "SELECT COALESCE(SUM(vote_count), 0), CAST(strftime('%S', 'now') AS INTEGER) FROM vote_rate_buckets "
+            "WHERE bucket_start >= strftime('%Y-%m-%d %H:%M:00', 'now', ?)"
+        )
+        self.assertEqual(
+            statement.sql,
+            "SELECT COALESCE(SUM(vote_count), 0), CAST(sqlite_strftime('%%S', 'now') AS INTEGER) FROM vote_rate_buckets "
+            "WHERE bucket_start >= sqlite_strftime('%%Y-%%m-%%d %%H:%%M:00', 'now', %s)"
+        )
+        statement = translate_to_postgres(
+            "SELECT COUNT(*) FROM login_attempts WHERE attempt_time > datetime('now', '-15 minutes')",
+            has_parameters=False,
+        )
+        self.assertIn("attempt_time > sqlite_datetime('now', '-15 minutes')", statement.sql)
+    
+    def test_partial_index_and_counted_subquery(self):
+        """Test the ledger's partial index and its pending-entry count need no rewriting"""
+        sql = "CREATE INDEX IF NOT EXISTS idx_vote_ledger_unsealed ON vote_ledger(seq) WHERE batch_id IS NULL"
+        self.assertEqual(translate_to_postgres(sql, has_parameters=False).sql, sql)
+        statement = translate_to_postgres(
+            "SELECT COUNT(*) FROM (SELECT 1 FROM vote_ledger WHERE batch_id IS NULL LIMIT ?) AS unsealed"
+        )
+        self.assertEqual(
+            statement.sql, "SELECT COUNT(*) FROM (SELECT 1 FROM vote_ledger WHERE batch_id IS NULL LIMIT %s) AS unsealed"
+        )
+    
+    def test_explain_query_plan(self):
+        """Test the query tracer's EXPLAIN QUERY PLAN becomes PostgreSQL's EXPLAIN"""
+        statement = translate_to_postgres("EXPLAIN QUERY PLAN SELECT id FROM users WHERE role = ?")
+        self.assertEqual(statement.sql, "EXPLAIN SELECT id FROM users WHERE role = %s")
+
+
+
+class TestPostgresTranslationOfWorkload(unittest.TestCase):
+    """Translates every statement a SQLite run of the app executes and checks no SQLite dialect is left
+    
+    Needs no PostgreSQL server; the server-backed run is TestOnLocalPostgres in test_database.
+    """
+    
+    # Run only where backend.supports_full_text_search, or only on SQLite (PRAGMA, triggers)
+    SQLITE_ONLY = re.compile(r"candidate_search|legal_record_search|PRAGMA|sqlite_master|sqlite_sequence|TRIGGER", re.I)
+    LEFTOVER_DIALECT = (
+        re.compile(r"\bAUTOINCREMENT\b", re.I),
+        re.compile(r"^\s*(INSERT|UPDATE)\s+OR\s+(IGNORE|REPLACE)\b", re.I),
+        re.compile(r"^\s*BEGIN\s+IMMEDIATE\b", re.I),
+        re.compile(r"(?<!sqlite_)\b(strftime|datetime|date)\s*\(", re.I),
+        re.compile(r"\bCURRENT_TIMESTAMP\b", re.I),
+        re.compile(r"(?<!I)\bLIKE\b", re.I),
+        re.compile(r"\?"),
+    )
+    
+    def setUp(self):
+        """Run a workload that touches every table on a SQLite database, recording its statements"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.statements = []
+        Database.add_query_listener(self._on_query)
+        self.db = Database(db_name=os.path.join(self.temp_dir, "workload.db"))
+        self._run_workload(self.db)
+        Database.remove_query_listener(self._on_query)
+    
+    def tearDown(self):
+        """Clean up"""
+        Database.remove_query_listener(self._on_query)
+        self.db.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _on_query(self, sql, elapsed):
+        self.statements.append(sql)
+    
+    def _run_workload(self, db):
+        db.create_user("comelec", "comelec@example.com", "Passw0rd!", "comelec")
+        db.create_voter("voter1", "voter1@example.com", "Passw0rd!", "Voter One")
+        db.create_politician("gov1", "gov1@example.com", "Passw0rd!", "Ana Reyes", "Governor", "Party A", "bio")
+        voter = db.verify_user_by_username("voter1", "Passw0rd!")
+        politician = db.search_candidates("")[0][0]
+        db.record_login_attempt("voter1")
+        db.get_failed_attempts_count("voter1")
+        db.is_account_locked("voter1")
+        db.cleanup_old_login_attempts()
+        db.create_user_session(voter["id"], "token")
+        db.verify_session("token")
+        db.end_session("token")
+        
+        db.start_voting(1)
+        db.cast_vote(voter["id"], politician, "Governor")
+        db.update_vote(voter["id"], politician, "Governor")
+        db.get_election_results()
+        db.get_turnout_series("minute")
+        db.get_turnout_by_position("hour")
+        db.get_current_vote_rate(60)
+        db.stop_voting(1)
+        db.get_vote_inclusion_proof(1)
+        session_id = db.create_election_session("Runoff", activate=False)
+        db.set_active_election_session(session_id)
+        
+        verification_id = db.create_achievement_verification(politician, "Roads", "Built roads")
+        db.verify_achievement(verification_id, 1)
+        db.get_verification_counts_by_politician()
+        record_id = db.create_legal_record(politician, "case", "Case", "desc", "2024-01-01", 1)
+        db.update_legal_record_status(record_id, "verified", 1)
+        db.get_legal_record_counts_by_politician()
+        db.get_legal_records_stats()
+        post_id = db.create_news_post(1, "comelec", "Polls open", "Voting starts at 8am")
+        db.save_news_post_features(post_id, 1, 0.5, ["turnout"])
+        db.get_news_sentiment_by_politician()
+        db.get_news_theme_trends()
+        db.save_cached_recommendations("key", {"ranked": []})
+        db.get_cached_recommendations("key")
+        db.log_action("LOGIN", "login", user_id=voter["id"])
+        db.get_audit_logs()
+        db.get_audit_log_stats()
+        db.delete_user(voter["id"])
+    
+    def _tables(self):
+        connection = sqlite3.connect(self.db.db_path)
+        try:
+            primary_keys, identity_columns = {}, {}
+            for name, sql in connection.execute("SELECT name, sql FROM sqlite_master WHERE type = 'table'"):
+                columns = connection.execute(f"PRAGMA table_info({name})").fetchall()
+                keys = tuple(c[1] for c in sorted(columns, key=lambda c: c[5]) if c[5])
+                if keys:
+                    primary_keys[name] = keys
+                if sql and "AUTOINCREMENT" in sql.upper():
+                    identity_columns[name] = keys[0]
+            return primary_keys, identity_columns
+        finally:
+            connection.close()
+    
+    def test_every_statement_translates(self):
+        """Test each statement the app ran comes out free of SQLite-only syntax"""
+        primary_keys, identity_columns = self._tables()
+        statements = [sql for sql in dict.fromkeys(self.statements) if not self.SQLITE_ONLY.search(sql)]
+        self.assertGreater(len(statements), 50)
+        
+        for sql in statements:
+            with self.subTest(sql=" ".join(sql.split())[:120]):
+                statement = translate_to_postgres(sql, True, primary_keys, identity_columns)
+                code = " ".join(part for part, literal in _split_literals(statement.sql) if not literal)
+                for pattern in self.LEFTOVER_DIALECT:
+                    self.assertIsNone(pattern.search(code), pattern.pattern)
+                if code.lstrip().upper().startswith("CREATE TABLE"):
+                    self.assertNotRegex(code, r"(?i)\w\s+(TIMESTAMP|BOOLEAN|BLOB)\b")
+                insert = re.match(r"\s*INSERT\s+INTO\s+(\w+)\b.*\bVALUES\b", statement.sql, re.I | re.S)
+                if insert and insert.group(1).lower() in identity_columns:
+                    self.assertIsNotNone(statement.returning)
+
+
+if __name__ == '__main__':
+    unittest.main()
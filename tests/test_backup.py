@@ -0,0 +1,126 @@
+"""
+Unit Tests for Backups
+Tests online snapshots, retention, verification, restore and the backup scheduler
+"""
+
+import unittest
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.storage.database import Database
+from app.storage.backup import BackupManager, backup_database
+from app.services.backup_service import BackupScheduler
+
+
+class TestBackups(unittest.TestCase):
+    """Test cases for snapshots of a live database"""
+    
+    def setUp(self):
+        """Set up test database with a few votes"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "backup_test.db")
+        self.backup_dir = os.path.join(self.temp_dir, "backups")
+        self.db = Database(db_name=self.db_path)
+        self.db.start_voting(user_id=1)
+        for voter_id in range(1, 6):
+            self.db.cast_vote(voter_id, 100, "President")
+        self.manager = BackupManager(self.db_path, self.backup_dir, retention=3)
+    
+    def tearDown(self):
+        """Clean up"""
+        if self.db.connection:
+            self.db.connection.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_incremental_copy_survives_concurrent_writes(self):
+        """Test a copy taken a page at a time while votes commit is complete and consistent"""
+        target = os.path.join(self.temp_dir, "copy.db")
+        
+        steps = []
+        
+        def vote_between_steps(remaining, total):
+            steps.append(remaining)
+            self.db.cast_vote(1000 + len(steps), 101, "Senator")
+        
+        result = backup_database(self.db_path, target, pages_per_step=1, step_sleep=0,
+                                 max_restarts=2, on_step=vote_between_steps)
+        
+        self.assertGreater(result.restarts, 0)
+        copy = sqlite3.connect(target)
+        try:
+            self.assertEqual(copy.execute('PRAGMA integrity_check').fetchone()[0], "ok")
+            # Restarted copies end in one step, so the copy holds every vote cast before it
+            self.assertEqual(copy.execute('SELECT COUNT(*) FROM votes').fetchone()[0], 5 + len(steps))
+        finally:
+            copy.close()
+        self.assertFalse(Path(target + ".partial").exists())
+    
+    def test_snapshots_are_verified_and_pruned(self):
+        """Test each snapshot gets a manifest and only the newest `retention` are kept"""
+        for _ in range(4):
+            result = self.manager.create_snapshot()
+            self.assertEqual(self.manager.verify_snapshot(result.path), [])
+        snapshots = self.manager.list_snapshots()
+        self.assertEqual(len(snapshots), 3)
+        self.assertEqual(snapshots[0]["path"], result.path)
+        self.assertEqual(snapshots[0]["schema_version"], Database.SCHEMA_VERSION)
+    
+    def test_verify_detects_corrupted_snapshot(self):
+        """Test a snapshot changed after it was taken fails verification"""
+        result = self.manager.create_snapshot()
+        with open(result.path, "r+b") as f:
+            f.seek(result.size_bytes - 100)
+            f.write(b"tampered")
+        self.assertIn("checksum does not match the manifest", self.manager.verify_snapshot(result.path))
+        with self.assertRaises(ValueError):
+            self.manager.restore_snapshot(result.path)
+    
+    def test_restore_replaces_database_and_keeps_previous(self):
+        """Test restoring brings back the snapshot's votes and saves the current database first"""
+        snapshot = self.manager.create_snapshot()
+        self.db.cast_vote(99, 100, "President")
+        self.assertEqual(self.db.get_total_votes_cast(), 6)
+        
+        self.manager.restore_snapshot(snapshot.path)
+        self.assertEqual(self.db.get_total_votes_cast(), 5)
+        self.assertTrue(any(s["path"].endswith("-pre-restore.db") for s in self.manager.list_snapshots()))
+
+
+class TestBackupScheduler(unittest.TestCase):
+    """Test cases for scheduled snapshots"""
+    
+    def setUp(self):
+        """Set up test database"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "scheduler_test.db")
+        self.db = Database(db_name=self.db_path)
+        self.db.start_voting(user_id=1)
+        manager = BackupManager(self.db_path, os.path.join(self.temp_dir, "backups"), retention=10)
+        self.scheduler = BackupScheduler(manager, interval_seconds=3600)
+    
+    def tearDown(self):
+        """Clean up"""
+        self.scheduler.stop()
+        if self.db.connection:
+            self.db.connection.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_snapshots_only_after_writes(self):
+        """Test an interval without commits is skipped"""
+        self.assertIsNotNone(self.scheduler.snapshot())
+        self.assertIsNone(self.scheduler.snapshot())
+        
+        self.db.cast_vote(1, 100, "President")
+        self.assertIsNotNone(self.scheduler.snapshot())
+        self.assertEqual(len(self.scheduler.manager.list_snapshots()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
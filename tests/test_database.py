@@ -5,13 +5,93 @@ Tests core database operations for the HonestBallot voting application
 
 import unittest
 import os
+import shutil
+import socket
+import subprocess
 import tempfile
 import sys
+import threading
+import time
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.storage.database import Database
+from app.storage.backends import PostgresBackend, create_backend
+from app.storage.database import Database, VotingClosedError, init_demo_data
+
+# Set TEST_DATABASE_URL (e.g. postgresql://localhost/honestballot_test) to run these
+# tests against PostgreSQL instead; that database is emptied before each test
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+sqlite_only = unittest.skipIf(TEST_DATABASE_URL, "tests a SQLite-only feature")
+postgres_only = unittest.skipUnless(TEST_DATABASE_URL, "tests a PostgreSQL-only feature")
+
+
+def database_for_test(db_path):
+    """Where a test's database lives: db_path, or TEST_DATABASE_URL emptied for the test"""
+    if not TEST_DATABASE_URL:
+        return db_path
+    connection = create_backend(TEST_DATABASE_URL).connect()
+    try:
+        connection.execute("DROP SCHEMA public CASCADE")
+        connection.execute("CREATE SCHEMA public")
+    finally:
+        connection.close()
+    return TEST_DATABASE_URL
+
+
+def find_postgres_bin_dir():
+    """Directory with the initdb and pg_ctl to start a test server from (None if there are none)
+    
+    POSTGRES_BIN_DIR wins, then PATH, then pg_config --bindir.
+    """
+    candidates = [os.getenv("POSTGRES_BIN_DIR")]
+    initdb = shutil.which("initdb")
+    if initdb:
+        candidates.append(os.path.dirname(initdb))
+    if shutil.which("pg_config"):
+        result = subprocess.run(["pg_config", "--bindir"], capture_output=True, text=True)
+        candidates.append(result.stdout.strip())
+    for bin_dir in candidates:
+        if bin_dir and all(os.access(os.path.join(bin_dir, tool), os.X_OK) for tool in ("initdb", "pg_ctl")):
+            return bin_dir
+    return None
+
+
+class LocalPostgres:
+    """A throwaway PostgreSQL server: initdb in a temporary directory, pg_ctl on a free port"""
+    
+    def __init__(self, bin_dir):
+        self.bin_dir = bin_dir
+        self.data_dir = None
+        self.url = None
+    
+    def _run(self, tool, *args):
+        subprocess.run([os.path.join(self.bin_dir, tool), *args], check=True, capture_output=True, text=True)
+    
+    def start(self):
+        """Create and start the server, returning its postgresql:// URL"""
+        self.data_dir = tempfile.mkdtemp(prefix="honestballot-pg-")
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        self._run("initdb", "-D", os.path.join(self.data_dir, "data"), "-U", "postgres",
+                  "-A", "trust", "-E", "UTF8", "--no-sync")
+        self._run("pg_ctl", "-D", os.path.join(self.data_dir, "data"), "-w",
+                  "-l", os.path.join(self.data_dir, "server.log"),
+                  "-o", f"-p {port} -k {self.data_dir} -c listen_addresses=127.0.0.1 -c fsync=off",
+                  "start")
+        self.url = f"postgresql://postgres@127.0.0.1:{port}/postgres"
+        return self.url
+    
+    def stop(self):
+        """Stop the server and delete its files"""
+        if self.data_dir is None:
+            return
+        try:
+            self._run("pg_ctl", "-D", os.path.join(self.data_dir, "data"), "-m", "immediate", "-w", "stop")
+        finally:
+            shutil.rmtree(self.data_dir, ignore_errors=True)
+            self.data_dir = None
 
 
 class TestDatabaseUserOperations(unittest.TestCase):
@@ -21,7 +101,7 @@ class TestDatabaseUserOperations(unittest.TestCase):
         """Set up test database before each test"""
         # Create a temporary database file
         self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "test_voting.db")
+        self.db_path = database_for_test(os.path.join(self.temp_dir, "test_voting.db"))
         self.db = Database(db_name=self.db_path)
     
     def tearDown(self):
@@ -134,6 +214,178 @@ class TestDatabaseUserOperations(unittest.TestCase):
         self.assertEqual(len(voters), 2)
         self.assertEqual(len(politicians), 1)
         self.assertEqual(len(comelec), 1)
+    
+    def test_get_users_by_role_paged(self):
+        """Test users by role can be fetched one page at a time"""
+        for i in range(5):
+            self.db.create_user(f"voter{i}", f"voter{i}@test.com", "pass", "voter")
+        
+        first = self.db.get_users_by_role("voter", limit=2)
+        rest = self.db.get_users_by_role("voter", limit=10, offset=2)
+        
+        self.assertEqual([u[1] for u in first], ["voter0", "voter1"])
+        self.assertEqual([u[1] for u in rest], ["voter2", "voter3", "voter4"])
+
+
+@sqlite_only
+class TestCandidateSearchIndex(unittest.TestCase):
+    """Test cases for the candidate search index"""
+    
+    def setUp(self):
+        """Set up test database with three politicians"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = database_for_test(os.path.join(self.temp_dir, "test_voting.db"))
+        self.db = Database(db_name=self.db_path)
+        
+        self.db.create_politician("ana", "ana@test.com", "pass", "Ana Reyes", "Governor", "Liberal Party", "bio")
+        self.db.create_politician("ben", "ben@test.com", "pass", "Benjamin Cruz", "Mayor", "Nacionalista Party", "bio")
+        self.db.create_politician("carl", "carl@test.com", "pass", "Carlos Santos", "Senator", "Liberal Party", "bio")
+    
+    def tearDown(self):
+        """Clean up"""
+        if self.db.connection:
+            self.db.connection.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+        if os.path.exists(self.temp_dir):
+            os.rmdir(self.temp_dir)
+    
+    def _names(self, query):
+        return [row[2] for row in self.db.search_candidates(query)]
+    
+    def test_prefix_and_substring_match(self):
+        """Test every query word must match a name, position or party"""
+        self.assertEqual(self._names("rey"), ["Ana Reyes"])
+        self.assertEqual(self._names("b"), ["Benjamin Cruz"])
+        self.assertEqual(self._names("liberal gov"), ["Ana Reyes"])
+        self.assertEqual(self._names("mayor"), ["Benjamin Cruz"])
+        self.assertEqual(len(self._names("")), 3)
+    
+    def test_fuzzy_match(self):
+        """Test close misspellings still find the candidate"""
+        self.assertEqual(self._names("Benjamn"), ["Benjamin Cruz"])
+        self.assertEqual(self._names("santso"), ["Carlos Santos"])
+        self.assertEqual(self._names("zzzz"), [])
+    
+    def test_returns_light_columns(self):
+        """Test search rows carry no biography or profile image"""
+        row = self.db.search_candidates("ana")[0]
+        self.assertEqual(row[1:], ("ana", "Ana Reyes", "Governor", "Liberal Party", "active"))
+    
+    def test_index_follows_politician_writes(self):
+        """Test updates and deletes are reflected in search results"""
+        ana_id = self.db.search_candidates("ana")[0][0]
+        self.db.update_politician(ana_id, "Ana Lim", "ana@test.com", "ana", "Mayor", "PDP", "bio")
+        self.assertEqual(self._names("lim"), ["Ana Lim"])
+        self.assertEqual(self._names("governor"), [])
+        
+        self.db.delete_user(ana_id)
+        self.assertEqual(self._names("lim"), [])
+    
+    def test_search_pages_through_exact_and_fuzzy_matches(self):
+        """Test offset pages through substring matches and then close spellings without gaps or repeats"""
+        for i, name in enumerate(["Rey Reyez", "Dana Reye", "Gov Reyes"]):
+            self.db.create_politician(f"r{i}", f"r{i}@test.com", "pass", name, "Mayor", "PDP", "bio")
+        everything = self.db.search_candidates("reyes")
+        self.assertEqual(len(everything), 4)
+        
+        for enabled in (True, False):
+            # False covers builds without FTS5, which search with LIKE and no fuzzy matches
+            self.db.candidate_index_enabled = enabled
+            expected = everything if enabled else self.db.search_candidates("reyes", offset=0)
+            for limit in (1, 2, 3):
+                with self.subTest(fts=enabled, limit=limit):
+                    pages = [self.db.search_candidates("reyes", limit=limit, offset=offset)
+                             for offset in range(0, len(expected) + limit, limit)]
+                    self.assertEqual([row for page in pages for row in page], expected)
+                    self.assertEqual(pages[-1], [])
+    
+    def test_new_accounts_announce_their_own_id(self):
+        """Test create_user and create_politician report the inserted user's id to change listeners"""
+        changes = []
+        listener = lambda table, details: changes.append(details)
+        Database.add_change_listener(listener)
+        self.addCleanup(Database.remove_change_listener, listener)
+        
+        self.db.create_politician("dina", "dina@test.com", "pass", "Dina Uy", "Mayor", "PDP", "bio")
+        self.db.create_user("eli", "eli@test.com", "pass", "politician")
+        
+        ids = {row[1]: row[0] for row in self.db.search_candidates("")}
+        self.assertEqual([c["user_id"] for c in changes], [ids["dina"], ids["eli"]])
+        self.assertEqual(self._names("dina"), ["Dina Uy"])
+    
+    def test_index_rebuilt_by_schema_setup(self):
+        """Test politicians written outside the index are picked up by the setup step"""
+        self.db.cursor.execute("DELETE FROM candidate_search")
+        self.db.connection.commit()
+        self.db.connection.close()
+        
+        self.db = Database(db_name=self.db_path)
+        self.db.create_schema()
+        self.assertEqual(self._names("santos"), ["Carlos Santos"])
+
+
+@sqlite_only
+class TestLegalRecordSearch(unittest.TestCase):
+    """Test cases for legal record full-text search and per-politician counts"""
+    
+    def setUp(self):
+        """Set up test database with two politicians and three records"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = database_for_test(os.path.join(self.temp_dir, "test_voting.db"))
+        self.db = Database(db_name=self.db_path)
+        
+        self.db.create_user("nbi", "nbi@test.com", "pass", "nbi")
+        nbi_id = self.db.get_users_by_role("nbi")[0][0]
+        self.db.create_politician("ana", "ana@test.com", "pass", "Ana Reyes", "Governor", "Party A", "bio")
+        self.db.create_politician("ben", "ben@test.com", "pass", "Ben Cruz", "Mayor", "Party B", "bio")
+        self.ana, self.ben = [p[0] for p in self.db.get_users_by_role("politician")]
+        
+        self.fraud = self.db.create_legal_record(self.ana, "criminal", "Fraud case", "Misuse of provincial funds", "2024-01-01", nbi_id)
+        self.db.create_legal_record(self.ana, "civil", "Land dispute", "Boundary claim", "2024-02-01", nbi_id)
+        self.db.create_legal_record(self.ben, "administrative", "Late filing", "SALN filed late", "2024-03-01", nbi_id)
+        self.db.update_legal_record_status(self.fraud, "verified", nbi_id)
+    
+    def tearDown(self):
+        """Clean up"""
+        if self.db.connection:
+            self.db.connection.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+        if os.path.exists(self.temp_dir):
+            os.rmdir(self.temp_dir)
+    
+    def _titles(self, query):
+        return sorted(r[3] for r in self.db.search_legal_records(query))
+    
+    def test_search_covers_record_and_politician_fields(self):
+        """Test search matches title, description, type and politician name"""
+        self.assertEqual(self._titles("fraud"), ["Fraud case"])
+        self.assertEqual(self._titles("provincial"), ["Fraud case"])
+        self.assertEqual(self._titles("administrative"), ["Late filing"])
+        self.assertEqual(self._titles("reyes"), ["Fraud case", "Land dispute"])
+        self.assertEqual(self._titles("ana land"), ["Land dispute"])
+    
+    def test_politician_counts_and_status_breakdown(self):
+        """Test one page of politicians carries record counts by status"""
+        rows = {r[0]: r for r in self.db.get_legal_record_politicians()}
+        self.assertEqual(rows[self.ana][6:10], (2, 1, 1, 0))
+        self.assertEqual(rows[self.ben][6:10], (1, 1, 0, 0))
+        
+        matching = self.db.get_legal_record_politicians("dispute")
+        self.assertEqual([(r[0], r[6]) for r in matching], [(self.ana, 1)])
+    
+    def test_index_follows_record_and_politician_writes(self):
+        """Test edits, deletes and politician renames reach the index"""
+        self.db.update_legal_record(self.fraud, "criminal", "Graft case", "Kickbacks", "2024-01-01")
+        self.assertEqual(self._titles("fraud"), [])
+        self.assertEqual(self._titles("kickbacks"), ["Graft case"])
+        
+        self.db.update_politician(self.ben, "Benedict Cruz", "ben@test.com", "ben", "Mayor", "Party B", "bio")
+        self.assertEqual(self._titles("benedict"), ["Late filing"])
+        
+        self.db.delete_legal_record(self.fraud)
+        self.assertEqual(self._titles("graft"), [])
 
 
 class TestDatabaseVotingOperations(unittest.TestCase):
@@ -142,7 +394,7 @@ class TestDatabaseVotingOperations(unittest.TestCase):
     def setUp(self):
         """Set up test database"""
         self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "test_voting.db")
+        self.db_path = database_for_test(os.path.join(self.temp_dir, "test_voting.db"))
         self.db = Database(db_name=self.db_path)
         
         # Create test users
@@ -229,6 +481,23 @@ class TestDatabaseVotingOperations(unittest.TestCase):
         # Just verify it returns a boolean (True or False is valid behavior)
         self.assertIsInstance(result2, bool)
     
+    def test_ballots_rejected_while_voting_closed(self):
+        """Test cast_vote and update_vote refuse ballots before voting opens and after it stops"""
+        with self.assertRaises(VotingClosedError):
+            self.db.cast_vote(self.voter["id"], self.cand1["id"], "President")
+        
+        self.db.start_voting(user_id=1)
+        self.assertTrue(self.db.cast_vote(self.voter["id"], self.cand1["id"], "President"))
+        self.db.stop_voting(user_id=1)
+        
+        with self.assertRaises(VotingClosedError):
+            self.db.update_vote(self.voter["id"], self.cand2["id"], "President")
+        self.db.create_user("voter2", "voter2@test.com", "pass", "voter")
+        with self.assertRaises(VotingClosedError):
+            self.db.cast_vote(self.db.verify_user("voter2@test.com", "pass")["id"], self.cand1["id"], "President")
+        self.assertEqual(self.db.get_votes_by_candidate(self.cand1["id"]), 1)
+        self.assertEqual(self.db.get_votes_by_candidate(self.cand2["id"]), 0)
+    
     def test_get_election_results(self):
         """Test election results retrieval"""
         self.db.start_voting(user_id=1)
@@ -249,6 +518,47 @@ class TestDatabaseVotingOperations(unittest.TestCase):
         self.assertIsNotNone(results)
         # Results should be a list (may be empty if no results with this schema)
         self.assertIsInstance(results, list)
+    
+    def test_turnout_buckets_updated_at_cast_time(self):
+        """Test per-minute and per-hour turnout counters follow cast_vote"""
+        self.db.start_voting(user_id=1)
+        self.db.create_user("voter2", "voter2@test.com", "pass", "voter")
+        voter2 = self.db.verify_user("voter2@test.com", "pass")
+        
+        self.db.cast_vote(self.voter["id"], self.cand1["id"], "President")
+        self.db.cast_vote(voter2["id"], self.cand2["id"], "President")
+        self.db.cast_vote(voter2["id"], self.cand1["id"], "Mayor")
+        
+        for granularity in ("minute", "hour"):
+            overall = self.db.get_turnout_series(granularity)
+            self.assertEqual(sum(count for _, count in overall), 3)
+        
+        president = self.db.get_turnout_series("minute", position="President")
+        self.assertEqual(sum(count for _, count in president), 2)
+        
+        by_position = self.db.get_turnout_by_position("hour")
+        self.assertEqual(set(by_position), {"President", "Mayor"})
+        self.assertEqual(by_position["Mayor"][0][1], 1)
+        
+        self.assertGreater(self.db.get_current_vote_rate(window_seconds=60), 0)
+    
+    def test_turnout_buckets_backfilled_for_existing_votes(self):
+        """Test the setup step rebuilds buckets from votes when the counters table is empty"""
+        self.db.start_voting(user_id=1)
+        self.db.cast_vote(self.voter["id"], self.cand1["id"], "President")
+        self.db.cursor.execute("DELETE FROM vote_rate_buckets")
+        self.db.connection.commit()
+        self.db.connection.close()
+        
+        self.db = Database(db_name=self.db_path)
+        self.db.create_schema()
+        overall = self.db.get_turnout_series("hour")
+        self.assertEqual(sum(count for _, count in overall), 1)
+    
+    def test_turnout_series_rejects_unknown_granularity(self):
+        """Test only minute and hour buckets are available"""
+        with self.assertRaises(ValueError):
+            self.db.get_turnout_series("second")
 
 
 class TestDatabaseAuditOperations(unittest.TestCase):
@@ -257,7 +567,7 @@ class TestDatabaseAuditOperations(unittest.TestCase):
     def setUp(self):
         """Set up test database"""
         self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "test_voting.db")
+        self.db_path = database_for_test(os.path.join(self.temp_dir, "test_voting.db"))
         self.db = Database(db_name=self.db_path)
         
         # Create test user
@@ -318,6 +628,18 @@ class TestDatabaseAuditOperations(unittest.TestCase):
         # NBI should see records and logins
         nbi_logs = self.db.get_audit_logs_for_role("nbi")
         self.assertIsNotNone(nbi_logs)
+    
+    def test_search_audit_logs_paged(self):
+        """Test audit log search pages with limit and offset"""
+        for i in range(5):
+            self.db.log_action(f"Login {i}", "login", "Desc", self.admin["id"], "comelec")
+        
+        first = self.db.search_audit_logs("Login", "comelec", limit=3)
+        rest = self.db.search_audit_logs("Login", "comelec", limit=3, offset=3)
+        
+        self.assertEqual(len(first), 3)
+        self.assertEqual(len(rest), 2)
+        self.assertFalse({log[0] for log in first} & {log[0] for log in rest})
 
 
 class TestCredentialStuffingProtection(unittest.TestCase):
@@ -326,7 +648,7 @@ class TestCredentialStuffingProtection(unittest.TestCase):
     def setUp(self):
         """Set up test database before each test"""
         self.temp_dir = tempfile.mkdtemp()
-        self.db_path = os.path.join(self.temp_dir, "test_voting.db")
+        self.db_path = database_for_test(os.path.join(self.temp_dir, "test_voting.db"))
         self.db = Database(db_name=self.db_path)
     
     def tearDown(self):
@@ -406,5 +728,344 @@ class TestCredentialStuffingProtection(unittest.TestCase):
         self.assertEqual(count, 3)
 
 
+class TestElectionSessions(unittest.TestCase):
+    """Test cases for votes, tallies and results partitioned by election session"""
+    
+    def setUp(self):
+        """Set up test database with two voters and two Governor candidates"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = database_for_test(os.path.join(self.temp_dir, "test_voting.db"))
+        self.db = Database(db_name=self.db_path)
+        for name in ("v1", "v2"):
+            self.db.create_user(name, f"{name}@test.com", "pass", "voter")
+        self.db.create_politician("gov1", "gov1@test.com", "pass", "Gov One", "Governor", "Party", "bio")
+        self.db.create_politician("gov2", "gov2@test.com", "pass", "Gov Two", "Governor", "Party", "bio")
+        self.voters = [row[0] for row in self.db.get_users_by_role("voter")]
+        self.govs = [row[0] for row in self.db.get_users_by_role("politician")]
+        self.first = self.db.create_election_session("2025 Election")
+        self.db.start_voting(user_id=1)
+    
+    def tearDown(self):
+        """Clean up"""
+        if self.db.connection:
+            self.db.connection.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+        if os.path.exists(self.temp_dir):
+            os.rmdir(self.temp_dir)
+    
+    def _tallies(self, session_id=None):
+        return {row[0]: row[6] for row in self.db.get_election_results(session_id)}
+    
+    def test_new_session_starts_from_zero(self):
+        """Test a new active session has its own ballots and results"""
+        self.db.cast_vote(self.voters[0], self.govs[0], "Governor")
+        self.db.cast_vote(self.voters[1], self.govs[0], "Governor")
+        
+        second = self.db.create_election_session("2028 Election")
+        self.assertEqual(self.db.get_active_election_session_id(), second)
+        self.assertEqual(self._tallies(), {self.govs[0]: 0, self.govs[1]: 0})
+        self.assertEqual(self.db.get_total_votes_cast(), 0)
+        self.assertEqual(self.db.get_votes_by_voter(self.voters[0]), [])
+        
+        # The same voter votes again in the new election
+        self.assertTrue(self.db.cast_vote(self.voters[0], self.govs[1], "Governor"))
+        self.assertEqual(self._tallies(), {self.govs[0]: 0, self.govs[1]: 1})
+        self.assertEqual(self._tallies(self.first), {self.govs[0]: 2, self.govs[1]: 0})
+        self.assertEqual(self.db.get_total_votes_cast(self.first), 2)
+        self.assertEqual(self.db.get_unique_voters_count(), 1)
+    
+    def test_duplicate_ballot_rejected_within_session(self):
+        """Test a second ballot for the same position in one session is refused"""
+        self.assertTrue(self.db.cast_vote(self.voters[0], self.govs[0], "Governor"))
+        self.assertFalse(self.db.cast_vote(self.voters[0], self.govs[1], "Governor"))
+        self.assertEqual(self.db.get_total_votes_cast(), 1)
+        self.assertEqual(self.db.get_votes_by_position("Governor"), [(self.govs[0], 1)])
+    
+    def test_update_vote_moves_tally_in_its_session(self):
+        """Test changing a vote only touches that session's ballot and tallies"""
+        self.db.cast_vote(self.voters[0], self.govs[0], "Governor")
+        second = self.db.create_election_session("Runoff")
+        self.db.cast_vote(self.voters[0], self.govs[0], "Governor")
+        
+        self.assertTrue(self.db.update_vote(self.voters[0], self.govs[1], "Governor"))
+        self.assertEqual(self._tallies(second), {self.govs[0]: 0, self.govs[1]: 1})
+        self.assertEqual(self._tallies(self.first), {self.govs[0]: 1, self.govs[1]: 0})
+        self.assertEqual(self.db.get_votes_by_voter(self.voters[0], self.first), [("Governor", self.govs[0])])
+        self.assertFalse(self.db.update_vote(self.voters[1], self.govs[1], "Governor"))
+    
+    def test_switch_active_session(self):
+        """Test the active-session pointer can be moved back to an earlier election"""
+        self.db.cast_vote(self.voters[0], self.govs[0], "Governor")
+        self.db.create_election_session("2028 Election")
+        self.assertTrue(self.db.set_active_election_session(self.first))
+        self.assertEqual(self.db.get_active_election_session_id(), self.first)
+        self.assertEqual(self.db.get_total_votes_cast(), 1)
+        self.assertFalse(self.db.set_active_election_session(9999))
+        self.assertEqual([row[4] for row in self.db.get_election_sessions()], [0, 1])
+    
+    @sqlite_only
+    def test_current_queries_use_session_indexes(self):
+        """Test per-session reads search an index instead of scanning all votes"""
+        plan = Database._query_tracer.explain(
+            self.db.connection, 'SELECT COUNT(DISTINCT voter_id) FROM votes WHERE election_session_id = ?', (1,)
+        )
+        self.assertIn("idx_votes_session_voter", plan)
+    
+    @sqlite_only
+    def test_unscoped_votes_migrated(self):
+        """Test votes from before session scoping are assigned to a session and tallied"""
+        self.db.cursor.execute(
+            "INSERT INTO votes (voter_id, candidate_id, position) VALUES (?, ?, 'Governor')",
+            (self.voters[0], self.govs[1])
+        )
+        self.db.cursor.execute("DELETE FROM vote_tallies")
+        self.db.cursor.execute("PRAGMA user_version = 1")
+        self.db.connection.commit()
+        self.db.connection.close()
+        
+        self.db = Database(db_name=self.db_path)
+        self.assertEqual(self.db.get_schema_version(), Database.SCHEMA_VERSION)
+        self.assertEqual(self._tallies(), {self.govs[0]: 0, self.govs[1]: 1})
+        self.assertEqual(self.db.get_votes_by_voter(self.voters[0]), [("Governor", self.govs[1])])
+
+
+class TestSchemaSetup(unittest.TestCase):
+    """Test cases for the schema version stamp and the setup step"""
+    
+    def setUp(self):
+        """Set up a temporary database path"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = database_for_test(os.path.join(self.temp_dir, "test_voting.db"))
+        self.statements = []
+    
+    def tearDown(self):
+        """Clean up"""
+        Database.remove_query_listener(self._on_query)
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+        if os.path.exists(self.temp_dir):
+            os.rmdir(self.temp_dir)
+    
+    def _on_query(self, sql, elapsed):
+        self.statements.append(sql)
+    
+    def test_new_file_is_stamped(self):
+        """Test the first open creates the schema and records its version"""
+        db = Database(db_name=self.db_path)
+        self.assertEqual(db.get_schema_version(), Database.SCHEMA_VERSION)
+        db.close()
+    
+    def test_statements_are_traced(self):
+        """Test statements reach query listeners and the tracer on every backend"""
+        db = Database(db_name=self.db_path)
+        self.addCleanup(setattr, Database._query_tracer, "enabled", Database._query_tracer.enabled)
+        Database._query_tracer.enabled = True
+        Database._query_tracer.reset()
+        Database.add_query_listener(self._on_query)
+        db.get_users_by_role("voter")
+        db.close()
+        
+        self.assertTrue([sql for sql in self.statements if "FROM users WHERE role" in sql])
+        self.assertTrue([s for s in Database.get_query_stats() if "FROM users WHERE role" in s["sql"]])
+    
+    @sqlite_only
+    def test_reopen_skips_ddl(self):
+        """Test a stamped database opens without running CREATE statements"""
+        Database(db_name=self.db_path).close()
+        
+        Database.add_query_listener(self._on_query)
+        db = Database(db_name=self.db_path)
+        self.assertFalse([sql for sql in self.statements if "CREATE" in sql.upper()])
+        self.assertTrue(db.candidate_index_enabled)
+        self.assertTrue(db.legal_record_index_enabled)
+        db.close()
+    
+    def test_seeding_is_explicit(self):
+        """Test opening leaves the database empty until init_demo_data runs"""
+        db = Database(db_name=self.db_path)
+        self.assertFalse(db.has_users())
+        
+        init_demo_data(db)
+        self.assertTrue(db.has_users())
+        count = len(db.get_all_users())
+        init_demo_data(db)
+        self.assertEqual(len(db.get_all_users()), count)
+        db.close()
+
+
+@sqlite_only
+class TestQueryTracing(unittest.TestCase):
+    """Test cases for per-statement query tracing"""
+    
+    def setUp(self):
+        """Set up test database with fresh query stats"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = database_for_test(os.path.join(self.temp_dir, "test_voting.db"))
+        self.db = Database(db_name=self.db_path)
+        for i in range(3):
+            self.db.create_politician(f"pol{i}", f"pol{i}@test.com", "pass", f"Pol {i}", "Mayor", "Party", "bio")
+        self.tracer = Database._query_tracer
+        self.tracer.reset()
+        self.addCleanup(setattr, self.tracer, "slow_ms", self.tracer.slow_ms)
+        # Tracing is off by default outside development
+        self.addCleanup(setattr, self.tracer, "enabled", self.tracer.enabled)
+        self.tracer.enabled = True
+    
+    def tearDown(self):
+        """Clean up"""
+        if self.db.connection:
+            self.db.connection.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+    
+    def _stats_for(self, fragment):
+        return [s for s in Database.get_query_stats() if fragment in s["sql"]]
+    
+    def test_select_records_rows_and_latency(self):
+        """Test a traced SELECT records its rows and a histogram sample"""
+        self.db.get_users_by_role("politician")
+        self.db.get_users_by_role("politician")
+        
+        stats = self._stats_for("WHERE role = ?")[0]
+        self.assertEqual(stats["count"], 2)
+        self.assertEqual(stats["rows"], 6)
+        self.assertEqual(sum(n for _, n in stats["buckets"]), 2)
+    
+    def test_placeholder_lists_share_one_entry(self):
+        """Test IN (?, ?, ...) queries of any length are grouped together"""
+        ids = [p[0] for p in self.db.get_users_by_role("politician")]
+        self.db.get_profile_images(ids[:1])
+        self.db.get_profile_images(ids)
+        
+        self.assertEqual([s["count"] for s in self._stats_for("IN (?...)")], [2])
+    
+    def test_slow_query_logged_with_plan(self):
+        """Test statements over the threshold are logged with EXPLAIN QUERY PLAN output"""
+        self.tracer.slow_ms = 0
+        with self.assertLogs("honestballot.db", level="WARNING") as logs:
+            self.db.get_users_by_role("politician")
+        
+        self.assertIn("Slow query", logs.output[0])
+        self.assertRegex(logs.output[0], r"plan: .*(SCAN|SEARCH)")
+    
+    def test_lock_wait_charged_to_statement(self):
+        """Test time spent waiting for the database lock is recorded"""
+        held = threading.Event()
+        
+        def hold_lock():
+            with Database._db_lock:
+                held.set()
+                time.sleep(0.1)
+        
+        worker = threading.Thread(target=hold_lock)
+        worker.start()
+        held.wait()
+        self.db.get_election_sessions()
+        worker.join()
+        
+        stats = self._stats_for("FROM election_sessions ORDER BY")[0]
+        self.assertGreaterEqual(stats["lock_wait_ms"], 50)
+        self.assertGreaterEqual(Database.get_lock_stats()["max_wait_ms"], 50)
+    
+    def test_failed_statement_counted(self):
+        """Test a failing statement is logged and counted as an error"""
+        with self.assertLogs("honestballot.db", level="WARNING"):
+            self.assertFalse(self.db.create_user("pol0", "pol0@test.com", "pass", "voter"))
+        
+        self.assertEqual(self._stats_for("INSERT INTO users")[0]["errors"], 1)
+
+
+
+@postgres_only
+class TestPostgresConnectionPool(unittest.TestCase):
+    """Test cases for borrowing pooled PostgreSQL connections"""
+    
+    def setUp(self):
+        """Set up an emptied test database"""
+        self.db_path = database_for_test(None)
+        self.db = Database(db_name=self.db_path)
+    
+    def tearDown(self):
+        """Clean up"""
+        self.db.close()
+    
+    def test_connection_held_only_during_transaction(self):
+        """Test a Database returns its connection to the pool between statements and transactions"""
+        self.assertTrue(self.db.create_user("voter1", "voter1@example.com", "Passw0rd!", "voter"))
+        self.assertIsNone(self.db.connection.raw)
+        
+        with self.db._db_lock:
+            self.db.cursor.execute("UPDATE users SET full_name = ? WHERE username = ?", ("Voter One", "voter1"))
+            self.assertIsNotNone(self.db.connection.raw)
+            self.db.connection.commit()
+        self.assertIsNone(self.db.connection.raw)
+        self.assertEqual(self.db.get_users_by_role("voter")[0][5], "Voter One")
+    
+    def test_more_databases_than_connections(self):
+        """Test threads with their own Database share a pool smaller than their number"""
+        backend = PostgresBackend(self.db_path, min_connections=1, max_connections=2)
+        databases = [Database(backend=backend) for _ in range(5)]
+        errors = []
+        
+        def register(db, i):
+            try:
+                for j in range(3):
+                    self.assertTrue(db.create_user(f"v{i}_{j}", f"v{i}_{j}@example.com", "Passw0rd!", "voter"))
+            except Exception as e:
+                errors.append(e)
+        
+        threads = [threading.Thread(target=register, args=(db, i)) for i, db in enumerate(databases)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for db in databases:
+            db.close()
+        backend.close()
+        
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.db.get_users_by_role("voter")), 15)
+
+
+@unittest.skipIf(TEST_DATABASE_URL, "this run is already against TEST_DATABASE_URL")
+class TestOnLocalPostgres(unittest.TestCase):
+    """Runs this module again against a throwaway PostgreSQL server"""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Start a local server, or skip when none can be started here"""
+        bin_dir = find_postgres_bin_dir()
+        if bin_dir is None:
+            raise unittest.SkipTest("no PostgreSQL server binaries (initdb, pg_ctl); set POSTGRES_BIN_DIR")
+        if hasattr(os, "geteuid") and os.geteuid() == 0:
+            raise unittest.SkipTest("PostgreSQL refuses to run as root")
+        try:
+            import psycopg2  # noqa: F401
+        except ImportError:
+            raise unittest.SkipTest("psycopg2 is not installed")
+        cls.server = LocalPostgres(bin_dir)
+        try:
+            cls.server.start()
+        except (OSError, subprocess.CalledProcessError) as e:
+            cls.server.stop()
+            raise unittest.SkipTest(f"could not start PostgreSQL: {getattr(e, 'stderr', None) or e}")
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Stop the server"""
+        cls.server.stop()
+    
+    def test_database_tests_pass_on_postgres(self):
+        """Test every backend-independent test in this module passes on PostgreSQL"""
+        result = subprocess.run(
+            [sys.executable, "-m", "unittest", "tests.test_database"],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            env={**os.environ, "TEST_DATABASE_URL": self.server.url},
+            capture_output=True, text=True,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr[-5000:])
+
+
 if __name__ == "__main__":
     unittest.main()
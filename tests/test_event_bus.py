@@ -0,0 +1,198 @@
+"""
+Unit Tests for Event Bus
+Tests local delivery and SQLite fanout of session events between worker processes
+"""
+
+import unittest
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from unittest import mock
+
+# Add parent directory to path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.config import Config
+from app.services import event_bus
+from app.services.event_bus import (
+    ELECTION_SESSION_CHANGED, VOTING_STATUS_CHANGED, EventBus, SqliteEventBus, decode_message, encode_message,
+    get_event_bus,
+)
+from app.services.results_broadcaster import ResultsBroadcaster, RESULTS_DELTA
+from app.storage.database import Database
+
+
+class RecordingPubSub:
+    """Stands in for a Flet pubsub client and records broadcast messages"""
+    
+    def __init__(self):
+        self.messages = []
+    
+    def send_all(self, message):
+        self.messages.append(message)
+
+
+class TestEventBus(unittest.TestCase):
+    """Test cases for the single-process bus and message encoding"""
+    
+    def test_publish_reaches_local_sessions(self):
+        """Test publishing is a send_all on the attached (or given) pubsub client"""
+        attached, given = RecordingPubSub(), RecordingPubSub()
+        bus = EventBus()
+        bus.attach(attached)
+        
+        bus.publish({"type": VOTING_STATUS_CHANGED, "is_active": True})
+        bus.publish({"type": VOTING_STATUS_CHANGED, "is_active": False}, given)
+        self.assertEqual(attached.messages, [{"type": VOTING_STATUS_CHANGED, "is_active": True}])
+        self.assertEqual(given.messages, [{"type": VOTING_STATUS_CHANGED, "is_active": False}])
+    
+    def test_encoding_keeps_integer_keys(self):
+        """Test results deltas keyed by candidate id survive the JSON round trip"""
+        message = {"type": RESULTS_DELTA, "candidates": {7: 2, 9: 1}, "positions": {"Mayor": 3}, "total": 3}
+        self.assertEqual(decode_message(encode_message(message)), message)
+
+
+class TestSqliteEventBus(unittest.TestCase):
+    """Test cases for fanout between workers through a shared events file"""
+    
+    def setUp(self):
+        """Set up two workers sharing one events file"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, "events.db")
+        self.pubsub_a, self.pubsub_b = RecordingPubSub(), RecordingPubSub()
+        self.worker_a = SqliteEventBus(self.path, poll_interval=0.05)
+        self.worker_b = SqliteEventBus(self.path, poll_interval=0.05)
+        self.worker_a.attach(self.pubsub_a)
+        self.worker_b.attach(self.pubsub_b)
+        self.worker_a.open()
+        self.worker_b.open()
+    
+    def tearDown(self):
+        """Clean up"""
+        self.worker_a.stop()
+        self.worker_b.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_event_reaches_other_worker_once(self):
+        """Test a published event is delivered locally now and to the other worker on poll"""
+        message = {"type": VOTING_STATUS_CHANGED, "is_active": False}
+        self.worker_a.publish(message)
+        self.assertEqual(self.pubsub_a.messages, [message])
+        self.assertEqual(self.pubsub_b.messages, [])
+        
+        self.assertEqual(self.worker_b.poll(), [message])
+        self.assertEqual(self.pubsub_b.messages, [message])
+        # Neither worker sees it again
+        self.assertEqual(self.worker_a.poll(), [])
+        self.assertEqual(self.worker_b.poll(), [])
+        self.assertEqual(self.pubsub_a.messages, [message])
+    
+    def test_results_broadcaster_publishes_through_bus(self):
+        """Test tally deltas flushed by one worker's broadcaster reach another worker"""
+        broadcaster = ResultsBroadcaster(max_per_second=100)
+        broadcaster.attach(self.worker_a)
+        broadcaster.record_vote(5, "Mayor")
+        broadcaster.flush()
+        
+        received = self.worker_b.poll()
+        self.assertEqual(received[0]["type"], RESULTS_DELTA)
+        self.assertEqual(received[0]["candidates"], {5: 1})
+    
+    def test_prune_drops_expired_events(self):
+        """Test events older than the retention window are deleted"""
+        self.worker_a.publish({"type": VOTING_STATUS_CHANGED, "is_active": True})
+        self.assertEqual(self.worker_a.prune(), 0)
+        self.worker_a.retention_seconds = -1
+        self.assertEqual(self.worker_a.prune(), 1)
+    
+    def test_event_from_another_process(self):
+        """Test an event published by a separate process is delivered here"""
+        code = (
+            "from app.services.event_bus import SqliteEventBus\n"
+            f"bus = SqliteEventBus({self.path!r})\n"
+            "bus.publish({'type': 'voting_status_changed', 'is_active': True})\n"
+            "bus.close()\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        
+        message = {"type": VOTING_STATUS_CHANGED, "is_active": True}
+        self.assertEqual(self.worker_b.poll(), [message])
+        self.assertEqual(self.pubsub_b.messages, [message])
+
+
+
+class TestElectionSessionFanout(unittest.TestCase):
+    """Test cases for switching the active election session with several workers"""
+    
+    def setUp(self):
+        """Set up a database with two sessions and this process's multi-worker bus"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "sessions.db")
+        self.events_path = os.path.join(self.temp_dir, "events.db")
+        self.db = Database(db_name=self.db_path)
+        self.first = self.db.create_election_session("First")
+        self.second = self.db.create_election_session("Second", activate=False)
+        self.db.start_voting(user_id=1)
+        
+        for patcher in (
+            mock.patch.object(Config, "WORKERS", 2),
+            mock.patch.object(Config, "EVENT_BUS_PATH", self.events_path),
+            mock.patch.object(event_bus, "_bus", None),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.bus = get_event_bus()
+    
+    def tearDown(self):
+        """Clean up"""
+        self.bus.stop()
+        Database.remove_change_listener(event_bus._on_db_change)
+        self.db.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_switch_in_another_worker_moves_ballots(self):
+        """Test a session activated by another worker process is where this worker stamps ballots"""
+        self.assertEqual(self.db.get_active_election_session_id(), self.first)
+        
+        code = (
+            "from app.services.event_bus import get_event_bus\n"
+            "from app.storage.database import Database\n"
+            "bus = get_event_bus()\n"
+            f"db = Database(db_name={self.db_path!r})\n"
+            f"assert db.set_active_election_session({self.second})\n"
+            "bus.stop()\n"
+            "db.close()\n"
+        )
+        env = {**os.environ, "WORKERS": "2", "EVENT_BUS_PATH": self.events_path}
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env,
+                                capture_output=True, text=True, timeout=60)
+        self.assertEqual(result.returncode, 0, result.stderr)
+        
+        deadline = time.time() + 5
+        while self.db.get_active_election_session_id() != self.second and time.time() < deadline:
+            time.sleep(0.05)
+        self.assertEqual(self.db.get_active_election_session_id(), self.second)
+        
+        self.assertTrue(self.db.cast_vote(1, 7, "Mayor"))
+        self.assertEqual(self.db.get_total_votes_cast(self.second), 1)
+        self.assertEqual(self.db.get_total_votes_cast(self.first), 0)
+    
+    def test_local_switch_is_published(self):
+        """Test activating a session publishes it for the other workers"""
+        self.db.set_active_election_session(self.second)
+        connection = sqlite3.connect(self.events_path)
+        try:
+            messages = [decode_message(row[0]) for row in connection.execute('SELECT payload FROM bus_events')]
+        finally:
+            connection.close()
+        self.assertIn({"type": ELECTION_SESSION_CHANGED, "election_session_id": self.second}, messages)
+
+
+if __name__ == '__main__':
+    unittest.main()
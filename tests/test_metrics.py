@@ -0,0 +1,128 @@
+"""
+Unit Tests for Metrics Module
+Tests the metrics registry, Prometheus text output and the instrumented database calls
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import urllib.request
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.storage.database import Database
+from app.metrics import (
+    AUDIT_EVENTS, DB_QUERY_SECONDS, VOTES_CAST,
+    MetricsRegistry, start_metrics_server, stop_metrics_server,
+)
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Test cases for counters, gauges and histograms"""
+    
+    def setUp(self):
+        """Set up an empty registry"""
+        self.registry = MetricsRegistry()
+    
+    def test_counter_with_labels(self):
+        """Test labelled counters render one sample per label value"""
+        votes = self.registry.counter("votes_total", "Votes", ("position",))
+        votes.inc(position="Mayor")
+        votes.inc(2, position='Vice "Mayor"')
+        
+        text = self.registry.render()
+        self.assertIn("# TYPE votes_total counter", text)
+        self.assertIn('votes_total{position="Mayor"} 1', text)
+        self.assertIn('votes_total{position="Vice \\"Mayor\\""} 2', text)
+    
+    def test_gauge_function_read_at_scrape(self):
+        """Test a callback gauge reports the current value on every render"""
+        depth = [3]
+        self.registry.gauge("queue_depth", "Queue depth").set_function(lambda: depth[0])
+        self.assertIn("queue_depth 3", self.registry.render())
+        depth[0] = 7
+        self.assertIn("queue_depth 7", self.registry.render())
+    
+    def test_histogram_buckets_are_cumulative(self):
+        """Test histogram output has cumulative buckets, +Inf, sum and count"""
+        latency = self.registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1))
+        for value in (0.05, 0.5, 2):
+            latency.observe(value)
+        
+        text = self.registry.render()
+        self.assertIn('latency_seconds_bucket{le="0.1"} 1', text)
+        self.assertIn('latency_seconds_bucket{le="1"} 2', text)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 3', text)
+        self.assertIn("latency_seconds_sum 2.55", text)
+        self.assertIn("latency_seconds_count 3", text)
+    
+    def test_registration_checks(self):
+        """Test repeated names return the same metric and bad labels are rejected"""
+        counter = self.registry.counter("events_total", "Events", ("kind",))
+        self.assertIs(self.registry.counter("events_total", "Events", ("kind",)), counter)
+        with self.assertRaises(ValueError):
+            self.registry.gauge("events_total", "Events")
+        with self.assertRaises(ValueError):
+            counter.inc(other="x")
+
+
+class TestInstrumentedDatabase(unittest.TestCase):
+    """Test cases for metrics fed by database calls and the scrape endpoint"""
+    
+    def setUp(self):
+        """Set up test database with a voter and a candidate"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "metrics_test.db")
+        self.db = Database(db_name=self.db_path)
+        self.db.start_voting(user_id=1)
+        self.db.create_user("voter", "voter@test.com", "pass", "voter")
+        self.db.create_politician("gov1", "gov1@test.com", "pass", "Gov One", "Governor", "Party", "bio")
+        self.voter_id = self.db.get_users_by_role("voter")[0][0]
+        self.candidate_id = self.db.get_users_by_role("politician")[0][0]
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        if self.db.connection:
+            self.db.connection.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+    
+    def test_votes_and_audit_events_counted(self):
+        """Test cast_vote and log_action feed their counters"""
+        votes_before = VOTES_CAST.value(position="Governor")
+        audits_before = AUDIT_EVENTS.value(action_type="vote")
+        
+        self.db.cast_vote(self.voter_id, self.candidate_id, "Governor")
+        self.assertFalse(self.db.cast_vote(self.voter_id, self.candidate_id, "Governor"))
+        self.db.log_action("Vote cast", "vote", user_id=self.voter_id, user_role="voter")
+        
+        self.assertEqual(VOTES_CAST.value(position="Governor") - votes_before, 1)
+        self.assertEqual(AUDIT_EVENTS.value(action_type="vote") - audits_before, 1)
+    
+    def test_query_latency_observed(self):
+        """Test traced statements land in the query latency histogram"""
+        tracer = Database._query_tracer
+        self.addCleanup(setattr, tracer, "enabled", tracer.enabled)
+        tracer.enabled = True
+        before = DB_QUERY_SECONDS.count(statement="SELECT")
+        self.db.get_election_sessions()
+        self.assertEqual(DB_QUERY_SECONDS.count(statement="SELECT") - before, 1)
+    
+    def test_metrics_endpoint(self):
+        """Test the side endpoint serves the registry in Prometheus text format"""
+        server = start_metrics_server("127.0.0.1", 0)
+        self.addCleanup(stop_metrics_server)
+        self.db.cast_vote(self.voter_id, self.candidate_id, "Governor")
+        
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        with urllib.request.urlopen(url, timeout=5) as response:
+            body = response.read().decode("utf-8")
+            self.assertTrue(response.headers["Content-Type"].startswith("text/plain; version=0.0.4"))
+        self.assertIn('honestballot_votes_cast_total{position="Governor"}', body)
+        self.assertIn("# TYPE honestballot_db_query_duration_seconds histogram", body)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+Unit Tests for News Analysis Service
+Tests background sentiment/theme extraction and the aggregate queries it feeds
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.storage.database import Database
+from app.services.news_analysis_service import NewsAnalysisPipeline
+
+
+class TestNewsAnalysisPipeline(unittest.TestCase):
+    """Test cases for the news analysis pipeline"""
+    
+    def setUp(self):
+        """Set up a database with one politician and a running pipeline"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "news_analysis_test.db")
+        self.db = Database(db_name=self.db_path)
+        
+        self.db.create_politician("gov1", "gov1@test.com", "pass", "Gov One", "Governor", "Party A", "bio")
+        self.politician_id = self.db.get_users_by_role("politician")[0][0]
+        self.pipeline = NewsAnalysisPipeline(self.db)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.pipeline.stop()
+        if self.db.connection:
+            self.db.connection.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+    
+    def _themes(self, post_id):
+        self.db.cursor.execute("SELECT theme FROM news_post_themes WHERE post_id = ?", (post_id,))
+        return {r[0] for r in self.db.cursor.fetchall()}
+    
+    def test_created_post_is_analyzed(self):
+        """Test a new post is analyzed by the background worker"""
+        self.pipeline.start()
+        post_id = self.db.create_news_post(self.politician_id, "politician", "School plan",
+                                           "We achieved a new scholarship for every student")
+        self.pipeline.wait_until_idle()
+        
+        self.assertEqual(self._themes(post_id), {"Education"})
+        sentiment = self.db.get_news_sentiment_by_politician()
+        self.assertEqual(len(sentiment), 1)
+        self.assertEqual(sentiment[0]["posts"], 1)
+        self.assertGreater(sentiment[0]["avg_sentiment"], 0)
+    
+    def test_updated_post_is_reanalyzed(self):
+        """Test editing a post replaces its stored themes"""
+        self.pipeline.start()
+        post_id = self.db.create_news_post(self.politician_id, "politician", "Roads", "New road and bridge")
+        self.pipeline.wait_until_idle()
+        self.assertEqual(self._themes(post_id), {"Infrastructure"})
+        
+        self.db.update_news_post(post_id, "Hospitals", "A new hospital for the province")
+        self.pipeline.wait_until_idle()
+        self.assertEqual(self._themes(post_id), {"Healthcare"})
+    
+    def test_backlog_analyzed_on_start(self):
+        """Test posts written before the pipeline started are picked up"""
+        post_id = self.db.create_news_post(self.politician_id, "politician", "Jobs", "More jobs and investment")
+        self.assertEqual(self.db.get_unanalyzed_news_post_ids(), [post_id])
+        
+        self.pipeline.start()
+        self.pipeline.wait_until_idle()
+        self.assertEqual(self.db.get_unanalyzed_news_post_ids(), [])
+    
+    def test_theme_trends_and_delete(self):
+        """Test theme aggregates read stored features and follow deletes"""
+        post_id = self.db.create_news_post(self.politician_id, "politician", "Safety", "Police and crime safety")
+        self.pipeline.analyze_post(post_id)
+        
+        trends = self.db.get_news_theme_trends()
+        self.assertEqual(trends[0]["theme"], "Security")
+        self.assertEqual(trends[0]["posts"], 1)
+        
+        self.db.delete_news_post(post_id)
+        self.assertEqual(self.db.get_news_theme_trends(), [])
+        self.assertEqual(self.db.get_news_sentiment_by_politician(), [])
+    
+    def test_stop_removes_change_listener(self):
+        """Test stopping the pipeline detaches it from the database"""
+        self.pipeline.start()
+        self.pipeline.stop()
+        self.assertNotIn(self.pipeline._on_db_change, Database._change_listeners)
+        self.assertFalse(self.pipeline.running)
+
+
+if __name__ == "__main__":
+    unittest.main()
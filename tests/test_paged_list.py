@@ -0,0 +1,145 @@
+"""
+Unit Tests for Paged List
+Tests page-at-a-time loading in the shared list component and the views using it
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+
+import flet as ft
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.storage.database import Database
+from app.components.paged_list import PagedList
+from app.views.audit_log_page import AuditLogPage
+from app.views.nbi_dashboard import NBIDashboard
+
+
+class TestPagedList(unittest.TestCase):
+    """Test cases for the paged list component"""
+    
+    def setUp(self):
+        """Set up a fetcher over 25 rows that records each request"""
+        self.rows = list(range(25))
+        self.requests = []
+    
+    def _fetch(self, offset, limit):
+        self.requests.append((offset, limit))
+        return self.rows[offset:offset + limit]
+    
+    def _items(self, paged):
+        return [c.value for c in paged.list_view.controls if isinstance(c, ft.Text)]
+    
+    def test_first_page_only_on_build(self):
+        """Test only the first page is fetched and built up front"""
+        paged = PagedList(self._fetch, lambda row: ft.Text(row), page_size=10)
+        
+        self.assertEqual(self.requests, [(0, 10)])
+        self.assertEqual(self._items(paged), list(range(10)))
+        self.assertTrue(paged.has_more)
+    
+    def test_scroll_near_end_loads_next_page(self):
+        """Test scrolling close to the end fetches the following page"""
+        paged = PagedList(self._fetch, lambda row: ft.Text(row), page_size=10, load_threshold=100)
+        event = ft.OnScrollEvent(ft.ControlEvent(
+            target="", name="scroll", data='{"t":"update","p":50,"minse":0,"maxse":1000,"vd":500}',
+            control=paged.list_view, page=None,
+        ))
+        paged._on_scroll(event)
+        self.assertEqual(paged.loaded_count, 10)
+        
+        event.pixels = 950
+        paged._on_scroll(event)
+        self.assertEqual(paged.loaded_count, 20)
+    
+    def test_loads_until_exhausted(self):
+        """Test a short final page marks the list exhausted"""
+        paged = PagedList(self._fetch, lambda row: ft.Text(row), page_size=10)
+        paged.load_next_page()
+        paged.load_next_page()
+        
+        self.assertEqual(self._items(paged), self.rows)
+        self.assertFalse(paged.has_more)
+        self.assertEqual(paged.load_next_page(), 0)
+        self.assertEqual(len(self.requests), 3)
+    
+    def test_empty_and_reset(self):
+        """Test empty content is shown until a reset finds rows"""
+        self.rows = []
+        empty = ft.Text("empty")
+        paged = PagedList(self._fetch, lambda row: ft.Text(row), page_size=10, empty_content=empty)
+        self.assertIs(paged.content, empty)
+        
+        self.rows = [1, 2]
+        paged.reset()
+        self.assertIs(paged.content, paged.list_view)
+        self.assertEqual(self._items(paged), [1, 2])
+
+
+class TestPagedViews(unittest.TestCase):
+    """Test cases for views that page through database rows"""
+    
+    def setUp(self):
+        """Set up a database with politicians, legal records and audit logs"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "paged_list_test.db")
+        self.db = Database(db_name=self.db_path)
+        
+        self.db.create_user("nbi", "nbi@test.com", "pass", "nbi")
+        self.nbi_id = self.db.get_users_by_role("nbi")[0][0]
+        for i in range(3):
+            self.db.create_politician(f"pol{i}", f"pol{i}@test.com", "pass", f"Pol {i}", "Mayor", "Party", "bio")
+        self.pols = [p[0] for p in self.db.get_users_by_role("politician")]
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        if self.db.connection:
+            self.db.connection.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+    
+    def test_legal_record_politicians_paged(self):
+        """Test politicians with records come first and search narrows the page"""
+        self.db.create_legal_record(self.pols[2], "case", "Fraud case", "desc", "2024-01-01", self.nbi_id)
+        
+        first = self.db.get_legal_record_politicians(limit=2)
+        rest = self.db.get_legal_record_politicians(limit=2, offset=2)
+        self.assertEqual([p[0] for p in first], [self.pols[2], self.pols[0]])
+        self.assertEqual([p[0] for p in rest], [self.pols[1]])
+        
+        found = self.db.get_legal_record_politicians("Fraud")
+        self.assertEqual([p[0] for p in found], [self.pols[2]])
+        records = self.db.get_legal_records_for_politicians([self.pols[2]], "Fraud")
+        self.assertEqual([r[3] for r in records], ["Fraud case"])
+    
+    def test_nbi_records_page_groups_records(self):
+        """Test the NBI records page attaches records to each politician"""
+        self.db.create_legal_record(self.pols[1], "case", "Case A", "desc", "2024-01-01", self.nbi_id)
+        self.db.create_legal_record(self.pols[1], "case", "Case B", "desc", "2024-01-02", self.nbi_id)
+        view = NBIDashboard("nbi", self.db, on_logout=lambda: None, current_user_id=self.nbi_id)
+        
+        page = view._fetch_politician_records_page(0, 10)
+        self.assertEqual(len(page), 3)
+        self.assertEqual(page[0]["id"], self.pols[1])
+        self.assertEqual({r["title"] for r in page[0]["records"]}, {"Case A", "Case B"})
+        self.assertEqual(page[0]["counts"], {"total": 2, "pending": 2, "verified": 0, "dismissed": 0})
+        self.assertEqual(page[1]["records"], [])
+    
+    def test_audit_log_page_counts_loaded_entries(self):
+        """Test the audit log shows the loaded count and that more remain"""
+        for i in range(60):
+            self.db.log_action(f"Login {i}", "login", "Desc", self.nbi_id, "nbi")
+        view = AuditLogPage("admin", self.db, "comelec", on_back=lambda: None)
+        
+        self.assertEqual(view.logs_list.loaded_count, 50)
+        self.assertEqual(view.entries_text.value, "50+ entries")
+        view.logs_list.load_next_page()
+        self.assertEqual(view.entries_text.value, "60 entries")
+
+
+if __name__ == "__main__":
+    unittest.main()
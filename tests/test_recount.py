@@ -0,0 +1,86 @@
+"""
+Unit Tests for Recount
+Tests the parallel recount, its snapshot source and reconciliation with vote tallies
+"""
+
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.storage.database import Database
+from app.storage.recount import Discrepancy, Recounter, reconcile
+
+
+class TestReconcile(unittest.TestCase):
+    """Test cases for comparing recounted and tallied votes"""
+    
+    def test_reports_differences_and_missing_candidates(self):
+        """Test a candidate missing on either side counts as zero there"""
+        results = {"President": {1: 5, 2: 3}, "Senator": {4: 2}}
+        tallies = {"President": {1: 5, 2: 4, 3: 1}, "Senator": {4: 2}}
+        self.assertEqual(reconcile(results, tallies), [
+            Discrepancy("President", 2, 3, 4),
+            Discrepancy("President", 3, 0, 1),
+        ])
+        self.assertEqual(reconcile(results, results), [])
+
+
+class TestRecounter(unittest.TestCase):
+    """Test cases for recounting a database file"""
+    
+    def setUp(self):
+        """Set up test database with votes in two election sessions"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "recount_test.db")
+        self.db = Database(db_name=self.db_path)
+        self.db.start_voting(user_id=1)
+        
+        self.first_session = self.db.create_election_session("First")
+        for voter_id in range(1, 8):
+            self.db.cast_vote(voter_id, 100 + voter_id % 2, "President")
+            self.db.cast_vote(voter_id, 200, "Senator")
+        self.db.update_vote(1, 102, "President")
+        self.second_session = self.db.create_election_session("Second")
+        self.db.cast_vote(1, 100, "President")
+    
+    def tearDown(self):
+        """Clean up"""
+        if self.db.connection:
+            self.db.connection.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_recount_matches_results_in_parallel(self):
+        """Test chunked worker counts merge to the session's reported results"""
+        report = Recounter(self.db_path, workers=2, chunk_size=3).recount(self.first_session)
+        self.assertTrue(report.ok, report.discrepancies)
+        self.assertEqual(report.results, {"President": {100: 3, 101: 3, 102: 1}, "Senator": {200: 7}})
+        self.assertEqual(report.total_votes, self.db.get_total_votes_cast(self.first_session))
+        self.assertEqual(report.chunks, 5)
+    
+    def test_defaults_to_active_session(self):
+        """Test the active session is recounted when none is given"""
+        report = Recounter(self.db_path, workers=1, use_snapshot=False).recount()
+        self.assertEqual(report.election_session_id, self.second_session)
+        self.assertEqual(report.results, {"President": {100: 1}})
+    
+    def test_detects_tally_drift(self):
+        """Test a tally that no longer matches the ballots is reported"""
+        self.db.connection.execute(
+            'UPDATE vote_tallies SET vote_count = vote_count + 2 WHERE election_session_id = ? AND candidate_id = 200',
+            (self.first_session,)
+        )
+        self.db.connection.commit()
+        
+        report = Recounter(self.db_path, workers=1).recount(self.first_session)
+        self.assertFalse(report.ok)
+        self.assertEqual(report.discrepancies, [Discrepancy("Senator", 200, 7, 9)])
+        self.assertEqual(report.discrepancies[0].difference, -2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Unit Tests for Render Profiler
+Tests render timing, control/payload measurement and database query attribution
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+
+import flet as ft
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.storage.database import Database
+from app.services.render_profiler import RenderProfiler, get_render_profiler, measure_controls
+from app.views.voting_page import VotingPage
+
+
+class TestRenderProfiler(unittest.TestCase):
+    """Test cases for the render profiler"""
+    
+    def setUp(self):
+        """Set up a database with one voter and a candidate"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "render_profiler_test.db")
+        self.db = Database(db_name=self.db_path)
+        self.db.create_user("voter", "voter@test.com", "pass", "voter")
+        self.db.create_politician("gov1", "gov1@test.com", "pass", "Gov One", "Governor", "Party", "bio")
+        self.voter_id = self.db.get_users_by_role("voter")[0][0]
+        
+        self.profiler = RenderProfiler(enabled=True, slow_ms=10000)
+        self.addCleanup(self.profiler.disable)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        if self.db.connection:
+            self.db.connection.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+    
+    def test_profile_records_queries_and_controls(self):
+        """Test a render sample counts its statements and measures its root"""
+        root = ft.Column([ft.Text("a"), ft.Container(content=ft.Text("b"))])
+        with self.profiler.profile("screen", root=root) as render:
+            self.db.get_users_by_role("voter")
+            self.db.get_users_by_role("politician")
+            render.built()
+        
+        sample = self.profiler.recent()[0]
+        self.assertEqual(sample.name, "screen")
+        self.assertEqual(sample.query_count, 2)
+        self.assertEqual(sample.control_count, 4)
+        self.assertGreater(sample.payload_bytes, 0)
+        self.assertGreaterEqual(sample.build_ms, 0)
+    
+    def test_nested_renders_roll_up_queries(self):
+        """Test queries in a nested builder also count toward the enclosing navigation"""
+        with self.profiler.profile("outer"):
+            self.db.get_users_by_role("voter")
+            with self.profiler.profile("inner"):
+                self.db.get_users_by_role("voter")
+        
+        counts = {s.name: s.query_count for s in self.profiler.recent()}
+        self.assertEqual(counts, {"outer": 2, "inner": 1})
+        self.assertEqual([row["name"] for row in self.profiler.summary()].count("outer"), 1)
+    
+    def test_disabled_profiler_records_nothing(self):
+        """Test a disabled profiler neither records samples nor follows queries"""
+        self.profiler.disable()
+        with self.profiler.profile("screen") as render:
+            self.db.get_users_by_role("voter")
+            render.built()
+        
+        self.assertEqual(self.profiler.recent(), [])
+        self.assertNotIn(self.profiler._on_query, Database._query_listeners)
+    
+    def test_slow_render_logged(self):
+        """Test renders over the threshold are logged as warnings"""
+        self.profiler.slow_ms = 0
+        with self.assertLogs("honestballot.render", level="WARNING") as logs:
+            with self.profiler.profile("slow screen"):
+                pass
+        self.assertIn("slow screen", logs.output[0])
+    
+    def test_view_builder_decorated(self):
+        """Test decorated view builders report their control tree and queries"""
+        profiler = get_render_profiler()
+        profiler.enable()
+        self.addCleanup(profiler.clear)
+        self.addCleanup(profiler.disable)
+        
+        view = VotingPage(self.voter_id, "voter", self.db, on_logout=lambda: None)
+        
+        sample = profiler.recent()[0]
+        self.assertEqual(sample.name, "VotingPage._build_ui")
+        self.assertEqual(sample.control_count, measure_controls(view)[0])
+        self.assertGreater(sample.control_count, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,138 @@
+"""
+Unit Tests for the Read Replica
+Tests refreshing, the staleness bound, read-only access and reporting routing
+"""
+
+import unittest
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.storage.database import Database
+from app.storage.replica import ReadReplica
+from app.services.replica_service import get_reporting_database
+
+
+class TestReadReplica(unittest.TestCase):
+    """Test cases for a replica of a live database"""
+    
+    def setUp(self):
+        """Set up test database with a few votes and audit entries"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "primary.db")
+        self.db = Database(db_name=self.db_path)
+        self.db.start_voting(user_id=1)
+        for voter_id in range(1, 4):
+            self.db.cast_vote(voter_id, 100, "President")
+        self.db.log_action("LOGIN", 1, "voter logged in")
+        self.replica = ReadReplica(self.db_path, os.path.join(self.temp_dir, "replica.db"), max_staleness_seconds=60)
+    
+    def tearDown(self):
+        """Clean up"""
+        self.replica.close()
+        if self.db.connection:
+            self.db.connection.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_reports_read_the_copy(self):
+        """Test reporting queries on the replica match the database it was copied from"""
+        replica_db = self.replica.database()
+        self.assertEqual(replica_db.get_total_votes_cast(), 3)
+        self.assertEqual(replica_db.get_election_results(), self.db.get_election_results())
+        self.assertEqual(len(replica_db.get_audit_logs()), len(self.db.get_audit_logs()))
+        self.assertEqual(replica_db.get_audit_log_stats(), self.db.get_audit_log_stats())
+        with self.assertRaises(sqlite3.OperationalError):
+            replica_db.connection.execute('DELETE FROM votes')
+    
+    def test_refresh_only_copies_after_writes(self):
+        """Test new votes appear after a refresh, and a refresh with no writes copies nothing"""
+        replica_db = self.replica.database()
+        self.assertIsNone(self.replica.refresh())
+        
+        self.db.cast_vote(4, 101, "President")
+        self.assertEqual(replica_db.get_total_votes_cast(), 3)
+        self.assertIsNotNone(self.replica.refresh())
+        self.assertEqual(replica_db.get_total_votes_cast(), 4)
+        self.assertLess(self.replica.staleness_seconds, 5)
+    
+    def test_stale_replica_is_refreshed_before_use(self):
+        """Test a replica older than the staleness bound is brought up to date when handed out"""
+        replica_db = self.replica.database()
+        self.db.cast_vote(4, 101, "President")
+        
+        self.assertEqual(self.replica.database().get_total_votes_cast(), 3)
+        self.replica.refreshed_at -= 120
+        self.assertFalse(self.replica.is_fresh())
+        self.assertIs(self.replica.database(), replica_db)
+        self.assertEqual(replica_db.get_total_votes_cast(), 4)
+    
+    def test_reports_do_not_wait_for_the_database_lock(self):
+        """Test a replica query completes while a ballot holds the database lock"""
+        replica_db = self.replica.database()
+        held = threading.Event()
+        release = threading.Event()
+        
+        def hold_lock():
+            with Database._db_lock:
+                held.set()
+                release.wait(5)
+        
+        worker = threading.Thread(target=hold_lock)
+        worker.start()
+        held.wait()
+        started = time.perf_counter()
+        try:
+            self.assertEqual(replica_db.get_total_votes_cast(), 3)
+            elapsed = time.perf_counter() - started
+        finally:
+            release.set()
+            worker.join()
+        self.assertLess(elapsed, 1)
+    
+    def test_replica_lock_wait_charged_to_its_statements(self):
+        """Test a wait on the replica's own lock is traced, and one on the shared lock is not"""
+        replica_db = self.replica.database()
+        tracer = Database._query_tracer
+        self.addCleanup(setattr, tracer, "enabled", tracer.enabled)
+        tracer.enabled = True
+        tracer.reset()
+        held = threading.Event()
+        
+        def hold_lock(lock):
+            with lock:
+                held.set()
+                time.sleep(0.1)
+        
+        for lock in (Database._db_lock, replica_db._db_lock):
+            held.clear()
+            worker = threading.Thread(target=hold_lock, args=(lock,))
+            worker.start()
+            held.wait()
+            replica_db.get_total_votes_cast()
+            worker.join()
+            
+            stats = [s for s in Database.get_query_stats() if "FROM vote_tallies" in s["sql"]][0]
+            if lock is Database._db_lock:
+                self.assertLess(stats["lock_wait_ms"], 50)
+            else:
+                self.assertGreaterEqual(stats["lock_wait_ms"], 50)
+    
+    def test_reporting_database_follows_config(self):
+        """Test reports use the primary unless the replica is enabled"""
+        with patch("app.config.Config.REPLICA_ENABLED", False):
+            self.assertIs(get_reporting_database(self.db), self.db)
+        with patch("app.config.Config.REPLICA_ENABLED", True), \
+                patch("app.services.replica_service.get_read_replica", return_value=self.replica):
+            self.assertIs(get_reporting_database(self.db), self.replica.database())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+Unit Tests for Results Broadcaster
+Tests coalesced vote tally deltas and in-place patching of the results view
+"""
+
+import unittest
+import os
+import sys
+import tempfile
+import threading
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.storage.database import Database
+from app.storage.replica import ReadReplica
+from app.services.results_broadcaster import ResultsBroadcaster, RESULTS_DELTA
+from app.views.election_results import ElectionResults
+
+
+class RecordingPubSub:
+    """Stands in for a Flet pubsub client and records broadcast messages"""
+    
+    def __init__(self):
+        self.messages = []
+        self.received = threading.Event()
+    
+    def send_all(self, message):
+        self.messages.append(message)
+        self.received.set()
+
+
+class TestResultsBroadcaster(unittest.TestCase):
+    """Test cases for results delta broadcasting"""
+    
+    def setUp(self):
+        """Set up a database with two candidates and three voters"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "broadcaster_test.db")
+        self.db = Database(db_name=self.db_path)
+        self.db.start_voting(user_id=1)
+        
+        self.db.create_politician("gov1", "gov1@test.com", "pass", "Gov One", "Governor", "Party A", "bio")
+        self.db.create_politician("gov2", "gov2@test.com", "pass", "Gov Two", "Governor", "Party B", "bio")
+        for i in range(3):
+            self.db.create_voter(f"voter{i}", f"voter{i}@test.com", "pass", f"Voter {i}")
+        self.pols = [p[0] for p in self.db.get_users_by_role("politician")]
+        self.voters = [v[0] for v in self.db.get_users_by_role("voter")]
+        
+        self.pubsub = RecordingPubSub()
+        self.broadcaster = ResultsBroadcaster(max_per_second=1)
+        self.broadcaster.attach(self.pubsub)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        self.broadcaster.stop()
+        if self.db.connection:
+            self.db.connection.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+    
+    def test_votes_are_coalesced(self):
+        """Test a burst of votes is published as one delta per interval"""
+        self.broadcaster.start()
+        self.db.cast_vote(self.voters[0], self.pols[0], "Governor")
+        self.assertTrue(self.pubsub.received.wait(5))
+        
+        # These land inside the rate-limit window and share one message
+        self.db.cast_vote(self.voters[1], self.pols[0], "Governor")
+        self.db.cast_vote(self.voters[2], self.pols[1], "Governor")
+        self.broadcaster.stop()
+        
+        self.assertEqual(len(self.pubsub.messages), 2)
+        second = self.pubsub.messages[1]
+        self.assertEqual(second["type"], RESULTS_DELTA)
+        self.assertEqual(second["candidates"], {self.pols[0]: 1, self.pols[1]: 1})
+        self.assertEqual(second["positions"], {"Governor": 2})
+        self.assertEqual(second["total"], 2)
+    
+    def test_only_new_ballots_are_counted(self):
+        """Test an update with no ballot to change publishes nothing"""
+        self.broadcaster.start()
+        self.db.update_vote(self.voters[0], self.pols[1], "Governor")
+        self.broadcaster.stop()
+        self.assertEqual(self.pubsub.messages, [])
+    
+    def test_changed_vote_moves_tally(self):
+        """Test a changed vote moves one count between candidates and leaves the total alone"""
+        self.db.cast_vote(self.voters[0], self.pols[0], "Governor")
+        self.broadcaster.start()
+        self.db.update_vote(self.voters[0], self.pols[1], "Governor")
+        self.assertTrue(self.pubsub.received.wait(5))
+        self.broadcaster.stop()
+        
+        self.assertEqual(len(self.pubsub.messages), 1)
+        delta = self.pubsub.messages[0]
+        self.assertEqual(delta["candidates"], {self.pols[0]: -1, self.pols[1]: 1})
+        self.assertEqual(delta["total"], 0)
+        
+        # The results view ends up matching the database
+        view = ElectionResults("comelec", self.db, on_logout=lambda: None, on_back=lambda: None)
+        view._tallies[self.pols[0]], view._tallies[self.pols[1]] = 1, 0
+        view._on_pubsub_message(delta)
+        self.assertEqual(view._row_refs[self.pols[0]][0].value, "0")
+        self.assertEqual(view._row_refs[self.pols[1]][0].value, "1")
+        self.assertEqual(view._stat_values["Total Votes Cast"].value, "1")
+    
+    def test_results_view_patches_rows_in_place(self):
+        """Test ElectionResults applies a delta without rebuilding its controls"""
+        self.db.cast_vote(self.voters[0], self.pols[0], "Governor")
+        view = ElectionResults("comelec", self.db, on_logout=lambda: None, on_back=lambda: None)
+        controls_before = list(view.controls)
+        votes_text, percentage_text, bar = view._row_refs[self.pols[1]]
+        
+        view._on_pubsub_message({
+            "type": RESULTS_DELTA,
+            "candidates": {self.pols[1]: 1},
+            "positions": {"Governor": 1},
+            "total": 1,
+        })
+        
+        self.assertEqual(view.controls, controls_before)
+        self.assertEqual(votes_text.value, "1")
+        self.assertEqual(percentage_text.value, "50.0%")
+        self.assertAlmostEqual(bar.value, 0.5)
+        self.assertEqual(view._stat_values["Total Votes Cast"].value, "2")
+
+    
+    def test_overtaking_candidate_is_reranked(self):
+        """Test a delta that changes the order within a position rebuilds that card in ranked order"""
+        self.db.cast_vote(self.voters[0], self.pols[0], "Governor")
+        view = ElectionResults("comelec", self.db, on_logout=lambda: None, on_back=lambda: None)
+        controls_before = list(view.controls)
+        card = view._position_cards["Governor"]
+        self.assertEqual(view._position_candidates["Governor"], [self.pols[0], self.pols[1]])
+        
+        view._on_pubsub_message({
+            "type": RESULTS_DELTA,
+            "candidates": {self.pols[1]: 2},
+            "positions": {"Governor": 2},
+            "total": 2,
+        })
+        
+        self.assertEqual(view.controls, controls_before)
+        self.assertIs(view._position_cards["Governor"], card)
+        self.assertEqual(view._position_candidates["Governor"], [self.pols[1], self.pols[0]])
+        self.assertEqual(view._row_refs[self.pols[1]][0].value, "2")
+        self.assertEqual(view._position_total_texts["Governor"].value, "3 votes cast")
+        first_row = card.content.controls[2].content.controls
+        self.assertEqual(first_row[0].content.value, "1")
+        self.assertEqual(first_row[4].controls[0].value, "66.7%")
+    
+    def test_tallies_read_from_primary_with_replica(self):
+        """Test live deltas are applied to tallies from the database, not a stale replica"""
+        self.db.cast_vote(self.voters[0], self.pols[0], "Governor")
+        replica = ReadReplica(self.db_path, os.path.join(self.temp_dir, "replica.db"), max_staleness_seconds=60)
+        self.addCleanup(replica.close)
+        replica_db = replica.database()
+        self.db.cast_vote(self.voters[1], self.pols[0], "Governor")
+        
+        view = ElectionResults("comelec", self.db, on_logout=lambda: None, on_back=lambda: None,
+                               reporting_db=replica_db)
+        self.assertEqual(view._tallies[self.pols[0]], 2)
+        self.assertEqual(view._stat_values["Total Votes Cast"].value, "2")
+        self.assertEqual(view._stat_values["Unique Voters"].value, "1")
+
+
+if __name__ == "__main__":
+    unittest.main()
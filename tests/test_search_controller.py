@@ -0,0 +1,216 @@
+"""
+Unit Tests for Search Controller
+Tests debounced, sequence-checked and cached searches used by the dashboard search boxes
+"""
+
+import gc
+import unittest
+import os
+import sys
+import tempfile
+import threading
+import time
+import weakref
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.storage.database import Database
+from app.services.search_controller import SearchController
+from app.views.comelec_dashboard import ComelecDashboard
+
+
+class ChangeEvent:
+    """Stands in for a Flet on_change event from a text field"""
+    
+    def __init__(self, value):
+        self.control = type("Field", (), {"value": value})()
+
+
+class TestSearchController(unittest.TestCase):
+    """Test cases for the search controller"""
+    
+    def setUp(self):
+        """Set up a recording search function and result sink"""
+        self.queries = []
+        self.results = []
+        self.delivered = threading.Event()
+        self.delays = {}
+    
+    def _search(self, query):
+        self.queries.append(query)
+        time.sleep(self.delays.get(query, 0))
+        return [query.upper()]
+    
+    def _on_results(self, query, results):
+        self.results.append((query, results))
+        self.delivered.set()
+    
+    def _controller(self, **kwargs):
+        controller = SearchController(self._search, self._on_results, debounce_seconds=0.05, **kwargs)
+        self.addCleanup(controller.close)
+        return controller
+    
+    def test_keystrokes_are_debounced(self):
+        """Test typing a word runs one query for the final text"""
+        controller = self._controller()
+        for prefix in ["j", "ju", "jua", "juan"]:
+            controller.submit(prefix)
+        
+        self.assertTrue(self.delivered.wait(5))
+        time.sleep(0.1)
+        self.assertEqual(self.queries, ["juan"])
+        self.assertEqual(self.results, [("juan", ["JUAN"])])
+    
+    def test_superseded_results_are_discarded(self):
+        """Test a slow query finishing after a newer one is not shown"""
+        controller = self._controller()
+        self.delays["slow"] = 0.3
+        controller.submit("slow")
+        time.sleep(0.15)  # let the slow query start on the worker
+        controller.submit("fast")
+        
+        time.sleep(0.6)
+        self.assertEqual(self.queries, ["slow", "fast"])
+        self.assertEqual(self.results, [("fast", ["FAST"])])
+    
+    def test_repeated_query_served_from_cache(self):
+        """Test a recent query is answered without searching again"""
+        controller = self._controller()
+        controller.submit("Mayor")
+        self.assertTrue(self.delivered.wait(5))
+        
+        controller.submit("  mayor ")
+        self.assertEqual(self.queries, ["Mayor"])
+        self.assertEqual(len(self.results), 2)
+        self.assertEqual(self.results[1][1], ["MAYOR"])
+    
+    def test_cache_cleared_on_database_write(self):
+        """Test writes to a watched table invalidate cached results"""
+        temp_dir = tempfile.mkdtemp()
+        db_path = os.path.join(temp_dir, "search_test.db")
+        db = Database(db_name=db_path)
+        try:
+            controller = self._controller(invalidate_on=("users",))
+            controller.attach()
+            controller.search_now("gov")
+            controller.search_now("gov")
+            self.assertEqual(self.queries, ["gov"])
+            
+            db.create_politician("gov1", "gov1@test.com", "pass", "Gov One", "Governor", "Party A", "bio")
+            controller.search_now("gov")
+            self.assertEqual(self.queries, ["gov", "gov"])
+        finally:
+            db.connection.close()
+            os.remove(db_path)
+    
+    def test_listens_only_while_attached(self):
+        """Test construction alone does not register with the process-wide database listeners"""
+        before = list(Database._change_listeners)
+        controller = self._controller(invalidate_on=("users",))
+        self.assertEqual(Database._change_listeners, before)
+        
+        controller.attach()
+        self.assertIn(controller._on_db_change, Database._change_listeners)
+        controller.close()
+        self.assertNotIn(controller._on_db_change, Database._change_listeners)
+    
+    def test_collected_controller_stops_listening(self):
+        """Test a view dropped without unmounting does not stay registered"""
+        before = len(Database._change_listeners)
+        controller = SearchController(self._search, self._on_results, invalidate_on=("users",))
+        controller.attach()
+        self.assertEqual(len(Database._change_listeners), before + 1)
+        listener = Database._change_listeners[-1]
+        
+        controller_ref = weakref.ref(controller)
+        del controller
+        gc.collect()
+        self.assertIsNone(controller_ref())
+        
+        # The next write notification finds the controller gone and unregisters it
+        listener("users", {})
+        self.assertEqual(len(Database._change_listeners), before)
+
+
+class TestCandidateSearch(unittest.TestCase):
+    """Test cases for the COMELEC candidate search box"""
+    
+    def setUp(self):
+        """Set up a database with two politicians"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "candidate_search_test.db")
+        self.db = Database(db_name=self.db_path)
+        self.db.create_politician("gov1", "gov1@test.com", "pass", "Ana Reyes", "Governor", "Party A", "bio")
+        self.db.create_politician("may1", "may1@test.com", "pass", "Ben Cruz", "Mayor", "Party B", "bio")
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        if self.db.connection:
+            self.db.connection.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+    
+    def test_search_updates_table_once(self):
+        """Test the candidate table is filtered once typing settles"""
+        view = ComelecDashboard("admin", self.db, lambda: None, lambda: None, lambda: None, lambda: None)
+        view._candidate_search.debounce_seconds = 0.05
+        shown = []
+        view._update_candidates_table = shown.append
+        
+        for text in ["m", "ma", "may", "mayor"]:
+            view._on_candidate_search_change(ChangeEvent(text))
+        
+        deadline = time.time() + 5
+        while not shown and time.time() < deadline:
+            time.sleep(0.02)
+        view._candidate_search.close()
+        
+        self.assertEqual(len(shown), 1)
+        self.assertEqual([p[2] for p in shown[0]], ["Ben Cruz"])
+        self.assertEqual(view.candidate_search_query, "mayor")
+    
+    def test_table_pages_through_every_candidate(self):
+        """Test the unfiltered table loads the whole roster a page at a time and says how much is shown"""
+        self.db.create_politician("sen1", "sen1@test.com", "pass", "Cora Diaz", "Senator", "Party C", "bio")
+        with mock.patch("app.views.comelec_dashboard.CANDIDATE_PAGE_SIZE", 2):
+            view = ComelecDashboard("admin", self.db, lambda: None, lambda: None, lambda: None, lambda: None)
+        
+        self.assertEqual(view.candidates_list.loaded_count, 2)
+        self.assertTrue(view.candidates_list.has_more)
+        self.assertEqual(view._candidates_count_text.value, "Showing 2 of 3 candidates")
+        
+        view.candidates_list.load_next_page()
+        self.assertEqual(view.candidates_list.loaded_count, 3)
+        self.assertFalse(view.candidates_list.has_more)
+        self.assertEqual(view._candidates_count_text.value, "Showing 3 of 3 candidates")
+        
+        view._show_candidate_results("mayor", view._get_filtered_candidates("mayor"))
+        self.assertEqual(view.candidates_list.loaded_count, 1)
+        self.assertEqual(view._candidates_count_text.value, "1 match")
+    
+    def test_search_matches_load_a_page_at_a_time(self):
+        """Test search matches beyond the first page are fetched from the database by offset"""
+        for i in range(3):
+            self.db.create_politician(f"gov{i + 2}", f"gov{i + 2}@test.com", "pass", f"Gov {i + 2}",
+                                      "Governor", "Party C", "bio")
+        with mock.patch("app.views.comelec_dashboard.CANDIDATE_PAGE_SIZE", 2):
+            view = ComelecDashboard("admin", self.db, lambda: None, lambda: None, lambda: None, lambda: None)
+            view._show_candidate_results("governor", view._get_filtered_candidates("governor"))
+        
+        self.assertEqual(view.candidates_list.loaded_count, 2)
+        self.assertEqual(view._candidates_count_text.value, "Showing the first 2 matches")
+        
+        loaded = []
+        view._load_candidate_details = lambda rows: loaded.extend(rows) or rows
+        while view.candidates_list.has_more:
+            view.candidates_list.load_next_page()
+        
+        self.assertEqual(view.candidates_list.loaded_count, 4)
+        self.assertEqual(len(loaded), 2)
+        self.assertEqual(view._candidates_count_text.value, "4 matches")
+
+
+if __name__ == "__main__":
+    unittest.main()
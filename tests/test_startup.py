@@ -0,0 +1,124 @@
+"""
+Unit Tests for Startup
+Tests lazy view loading, the shared process database and the startup timing report
+"""
+
+import unittest
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from unittest import mock
+
+# Add parent directory to path
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from app.storage import database as database_module
+from app.storage.database import Database, get_database
+from app.state.session_manager import SessionManager
+from app.startup import StartupTimer
+
+
+class TestLazyViews(unittest.TestCase):
+    """Test cases for view modules imported on first use"""
+    
+    def _run(self, code):
+        result = subprocess.run(
+            [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, timeout=120,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result.stdout.strip()
+    
+    def test_importing_views_package_loads_no_view_modules(self):
+        """Test the package import alone does not import any view module"""
+        out = self._run(
+            "import sys, app.views\n"
+            "print(sorted(m for m in sys.modules if m.startswith('app.views.')))"
+        )
+        self.assertEqual(out, "[]")
+    
+    def test_load_view_imports_only_that_module(self):
+        """Test resolving one view imports its module and caches the class"""
+        out = self._run(
+            "import sys\n"
+            "from app.views import load_view\n"
+            "view = load_view('LoginPage')\n"
+            "assert load_view('LoginPage') is view\n"
+            "from app.views import LoginPage\n"
+            "assert LoginPage is view\n"
+            "print('app.views.login_page' in sys.modules, 'app.views.voting_page' in sys.modules)"
+        )
+        self.assertEqual(out, "True False")
+    
+    def test_unknown_view_raises(self):
+        """Test an unknown view name is an AttributeError"""
+        from app.views import load_view
+        with self.assertRaises(AttributeError):
+            load_view("NoSuchPage")
+
+
+class TestSharedDatabase(unittest.TestCase):
+    """Test cases for the process-wide Database"""
+    
+    def setUp(self):
+        """Point the shared database at a temporary file"""
+        self.temp_dir = tempfile.mkdtemp()
+        path = os.path.join(self.temp_dir, "shared.db")
+        self._saved = database_module._shared_database
+        database_module._shared_database = None
+        self.patcher = mock.patch.object(database_module, "Database", side_effect=lambda: Database(path))
+        self.opened = self.patcher.start()
+    
+    def tearDown(self):
+        """Restore the real shared database and remove the temporary file"""
+        self.patcher.stop()
+        if database_module._shared_database is not None:
+            database_module._shared_database.close()
+        database_module._shared_database = self._saved
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def test_one_instance_per_process(self):
+        """Test repeated calls and session managers reuse one connection"""
+        db = get_database()
+        self.assertIs(get_database(), db)
+        self.assertIs(SessionManager(db).db, db)
+        self.assertEqual(self.opened.call_count, 1)
+    
+    def test_reopened_after_close(self):
+        """Test closing the shared database makes the next call open a fresh one"""
+        db = get_database()
+        db.close()
+        fresh = get_database()
+        self.assertIsNot(fresh, db)
+        self.assertIsNotNone(fresh.connection)
+
+
+class TestStartupTimer(unittest.TestCase):
+    """Test cases for the startup timing report"""
+    
+    def test_report_lists_phases_once(self):
+        """Test the report includes every phase and only the first call reports"""
+        timer = StartupTimer()
+        timer.record("imports", 0.25)
+        with timer.phase("first_page"):
+            pass
+        
+        line = timer.report()
+        self.assertIn("imports=250.0ms", line)
+        self.assertIn("first_page=", line)
+        self.assertIn("total=", line)
+        self.assertIsNone(timer.report())
+    
+    def test_phases_after_report_are_not_kept(self):
+        """Test later sessions do not grow the startup phase list"""
+        timer = StartupTimer()
+        timer.record("imports", 0.1)
+        timer.report()
+        timer.record("view:VotingPage", 0.05)
+        self.assertEqual([name for name, _ in timer.phases()], ["imports"])
+
+
+if __name__ == '__main__':
+    unittest.main()
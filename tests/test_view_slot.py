@@ -0,0 +1,141 @@
+"""
+Unit Tests for View Slots
+Tests that interactions rebuild only the section of a view they change
+"""
+
+import json
+import unittest
+import os
+import sys
+import tempfile
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.storage.database import Database
+from app.components.news_feed import NewsFeed
+from app.views.voting_page import VotingPage
+from app.views.audit_log_page import AuditLogPage
+from app.views.voter_dashboard import VoterDashboard
+from app.views.analytics_page import AnalyticsPage
+from app.services.analytics_service import AnalyticsScheduler
+
+
+def payload_size(control):
+    """Bytes Flet would send to add this control and everything under it"""
+    commands = control._build_add_commands()
+    return len(json.dumps([(c.values, c.attrs) for c in commands], default=str))
+
+
+class TestViewSlots(unittest.TestCase):
+    """Test cases for partial view updates"""
+    
+    def setUp(self):
+        """Set up a database with a voter and candidates for two positions"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "view_slot_test.db")
+        self.db = Database(db_name=self.db_path)
+        
+        self.db.create_user("voter", "voter@test.com", "pass", "voter")
+        self.voter_id = self.db.get_users_by_role("voter")[0][0]
+        for i in range(3):
+            self.db.create_politician(f"gov{i}", f"gov{i}@test.com", "pass", f"Gov {i}", "Governor", "Party", "bio")
+            self.db.create_politician(f"may{i}", f"may{i}@test.com", "pass", f"May {i}", "Mayor", "Party", "bio")
+        self.governors = [p[0] for p in self.db.get_users_by_role("politician") if p[7] == "Governor"]
+        self.db.start_voting(user_id=1)
+    
+    def tearDown(self):
+        """Clean up test environment"""
+        if self.db.connection:
+            self.db.connection.close()
+        if os.path.exists(self.db_path):
+            os.remove(self.db_path)
+    
+    def test_vote_updates_one_position(self):
+        """Test casting a vote rebuilds only that position card without re-querying candidates"""
+        view = VotingPage(self.voter_id, "voter", self.db, on_logout=lambda: None)
+        view._toggle_position("Governor")
+        mayor_card = view._position_slots["Mayor"].content
+        governor_card = view._position_slots["Governor"].content
+        header = view.controls[0]
+        
+        queries = []
+        self.db.get_users_by_role = lambda *args, **kwargs: queries.append(args)
+        view._select_candidate(self.governors[0], "Governor")
+        
+        self.assertEqual(queries, [])
+        self.assertEqual(self.db.get_votes_by_voter(self.voter_id), [("Governor", self.governors[0])])
+        self.assertIs(view.controls[0], header)
+        self.assertIs(view._position_slots["Mayor"].content, mayor_card)
+        self.assertIsNot(view._position_slots["Governor"].content, governor_card)
+        self.assertLess(payload_size(view._position_slots["Governor"]) * 3, payload_size(view))
+    
+    def test_news_filter_keeps_posts_list(self):
+        """Test a role filter redraws its chips and reloads posts in place"""
+        feed = NewsFeed(self.db)
+        posts_list = feed.posts_list
+        category_row = feed.category_slot.content
+        role_row = feed.filter_slot.content
+        
+        feed._on_role_filter("nbi")
+        
+        self.assertIs(feed.posts_list, posts_list)
+        self.assertIs(feed.category_slot.content, category_row)
+        self.assertIsNot(feed.filter_slot.content, role_row)
+    
+    def test_audit_filter_keeps_search_and_list(self):
+        """Test picking a log filter leaves the search box and list controls in place"""
+        view = AuditLogPage("admin", self.db, "comelec", on_back=lambda: None)
+        search_field = view.search_field
+        logs_list = view.logs_list
+        date_buttons = view.date_buttons_slot.content
+        
+        view._apply_filter("login")
+        
+        self.assertIs(view.search_field, search_field)
+        self.assertIs(view.logs_list, logs_list)
+        self.assertIs(view.date_buttons_slot.content, date_buttons)
+        self.assertEqual(view.filter_buttons_slot.content.controls[1].bgcolor, "#5C6BC0")
+    
+    def test_tab_switch_reuses_built_tabs(self):
+        """Test switching tabs keeps the header and reuses already built tab content"""
+        view = VoterDashboard("voter", self.db, on_logout=lambda: None)
+        header = view.controls[0]
+        candidates = view._tab_content_slot.content
+        
+        view._switch_tab("news")
+        news = view._tab_content_slot.content
+        view._switch_tab("candidates")
+        view._switch_tab("news")
+        
+        self.assertIs(view.controls[0], header)
+        self.assertIs(view._tab_contents["candidates"], candidates)
+        self.assertIs(view._tab_content_slot.content, news)
+    
+    def test_new_snapshot_rebuilds_changed_sections(self):
+        """Test a snapshot after a vote rebuilds the vote sections and leaves the rest in place"""
+        scheduler = AnalyticsScheduler(self.db)
+        with patch("app.views.analytics_page.get_analytics_scheduler", return_value=scheduler):
+            view = AnalyticsPage("analyst", self.db, "comelec", on_back=lambda: None, on_logout=lambda: None)
+        slots = {name: slot for name, (slot, _) in zip(
+            ["stats", "top", "charts", "turnout", "news", "insights"], view._snapshot_slots
+        )}
+        before = {name: slot.content for name, slot in slots.items()}
+        header = view.controls[0]
+        
+        view._on_snapshot_refreshed(scheduler.refresh())
+        self.assertEqual({name: slot.content for name, slot in slots.items()}, before)
+        
+        self.db.cast_vote(self.voter_id, self.governors[0], "Governor")
+        view._on_snapshot_refreshed(scheduler.refresh())
+        
+        self.assertIs(view.controls[0], header)
+        for name in ("stats", "charts", "turnout", "insights"):
+            self.assertIsNot(slots[name].content, before[name])
+        for name in ("top", "news"):
+            self.assertIs(slots[name].content, before[name])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+Unit Tests for Vote Ledger
+Tests Merkle sealing, inclusion proofs, append-only enforcement and the parallel verifier
+"""
+
+import unittest
+import hashlib
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+from unittest.mock import patch
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.storage.database import Database
+from app.storage.vote_ledger import (
+    LedgerVerifier, audit_path, merkle_root, node_hash, verify_inclusion, verify_inclusion_proof,
+)
+
+
+def reference_root(leaves):
+    """Recursive RFC 6962 Merkle tree hash, for comparison with the streaming builder"""
+    if not leaves:
+        return hashlib.sha256(b"").digest()
+    if len(leaves) == 1:
+        return leaves[0]
+    k = 1
+    while k * 2 < len(leaves):
+        k *= 2
+    return node_hash(reference_root(leaves[:k]), reference_root(leaves[k:]))
+
+
+class TestMerkleTree(unittest.TestCase):
+    """Test cases for roots and audit paths"""
+    
+    def test_streaming_root_matches_recursive_definition(self):
+        """Test every tree size, including ones that are not powers of two"""
+        for size in range(1, 34):
+            leaves = [hashlib.sha256(str(i).encode()).digest() for i in range(size)]
+            self.assertEqual(merkle_root(leaves), reference_root(leaves))
+    
+    def test_audit_paths_are_logarithmic_and_verify(self):
+        """Test each leaf's path checks against the root, and only at its own index"""
+        for size in (1, 2, 5, 8, 13):
+            leaves = [hashlib.sha256(str(i).encode()).digest() for i in range(size)]
+            root = merkle_root(leaves)
+            for index, leaf in enumerate(leaves):
+                path = audit_path(leaves, index)
+                self.assertLessEqual(len(path), max(size - 1, 0).bit_length())
+                self.assertTrue(verify_inclusion(leaf, index, size, path, root))
+                if size > 1:
+                    self.assertFalse(verify_inclusion(leaf, (index + 1) % size, size, path, root))
+
+
+class TestVoteLedger(unittest.TestCase):
+    """Test cases for the ledger kept by Database and its verifier"""
+    
+    def setUp(self):
+        """Set up test database with small ledger batches"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "ledger_test.db")
+        self.batch_size = patch("app.config.Config.LEDGER_BATCH_SIZE", 4)
+        self.batch_size.start()
+        self.db = Database(db_name=self.db_path)
+        self.db.start_voting(user_id=1)
+    
+    def tearDown(self):
+        """Clean up"""
+        self.batch_size.stop()
+        if self.db.connection:
+            self.db.connection.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _cast(self, count):
+        for voter_id in range(1, count + 1):
+            self.db.cast_vote(voter_id, 100 + voter_id % 3, "President")
+    
+    def test_full_batches_are_sealed_and_chained(self):
+        """Test votes seal every LEDGER_BATCH_SIZE entries and each batch links to the last"""
+        self._cast(9)
+        batches = self.db.connection.execute(
+            'SELECT id, first_seq, last_seq, prev_hash, chain_hash FROM ledger_batches ORDER BY id'
+        ).fetchall()
+        self.assertEqual([(b[1], b[2]) for b in batches], [(1, 4), (5, 8)])
+        self.assertEqual(batches[1][3], batches[0][4])
+        self.assertEqual(self.db.get_ledger_head()["id"], batches[-1][0])
+        
+        # The tail is sealed when voting stops
+        self.assertIsNone(self.db.get_vote_inclusion_proof(9))
+        self.db.stop_voting(user_id=1)
+        self.assertEqual(self.db.get_ledger_head()["last_seq"], 9)
+    
+    def test_inclusion_proof_covers_latest_choice(self):
+        """Test a changed vote is proven by its newest ledger entry"""
+        self._cast(4)
+        self.db.update_vote(2, 999, "President")
+        self.db.seal_ledger()
+        
+        proof = self.db.get_vote_inclusion_proof(2)
+        self.assertEqual(proof["entry"]["candidate_id"], 999)
+        self.assertEqual(proof["entry"]["action"], "update")
+        self.assertTrue(verify_inclusion_proof(proof))
+        
+        proof["entry"]["candidate_id"] = 101
+        self.assertFalse(verify_inclusion_proof(proof))
+    
+    def test_inclusion_proof_with_gap_in_seq(self):
+        """Test proofs index leaves by position, since seq values can skip numbers (PostgreSQL identities)"""
+        self._cast(2)
+        self.db.connection.execute("UPDATE sqlite_sequence SET seq = seq + 10 WHERE name = 'vote_ledger'")
+        self.db.connection.commit()
+        for voter_id in (3, 4):
+            self.db.cast_vote(voter_id, 101, "President")
+        
+        proof = self.db.get_vote_inclusion_proof(4)
+        self.assertEqual(proof["seq"], 14)
+        self.assertEqual(proof["leaf_index"], 3)
+        self.assertTrue(verify_inclusion_proof(proof))
+    
+    def test_ledger_is_append_only(self):
+        """Test triggers refuse editing or deleting sealed history"""
+        self._cast(4)
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.connection.execute('UPDATE vote_ledger SET candidate_id = 5 WHERE seq = 1')
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.connection.execute('DELETE FROM vote_ledger WHERE seq = 1')
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.db.connection.execute("UPDATE ledger_batches SET merkle_root = 'x'")
+        self.db.connection.rollback()
+    
+    def test_verifier_passes_intact_ledger_in_parallel(self):
+        """Test a clean ledger verifies with several worker processes"""
+        self._cast(10)
+        self.db.update_vote(3, 999, "President")
+        
+        report = LedgerVerifier(self.db_path, workers=2, batches_per_task=1, votes_per_task=4).verify()
+        self.assertTrue(report.ok, report.errors)
+        self.assertEqual(report.batches_checked, 2)
+        self.assertEqual(report.entries_checked + report.unsealed_entries, 11)
+        self.assertEqual(report.votes_checked, 10)
+        self.assertEqual(report.head_hash, self.db.get_ledger_head()["chain_hash"])
+    
+    def test_verifier_detects_tampering(self):
+        """Test edits behind the triggers' back show up as hash and vote mismatches"""
+        self._cast(8)
+        self.db.connection.execute('DROP TRIGGER vote_ledger_seal_only')
+        self.db.connection.execute('UPDATE vote_ledger SET candidate_id = 555 WHERE seq = 6')
+        self.db.connection.execute('UPDATE votes SET candidate_id = 777 WHERE id = 2')
+        self.db.connection.commit()
+        
+        report = LedgerVerifier(self.db_path, workers=1).verify()
+        self.assertFalse(report.ok)
+        self.assertTrue(any(e.startswith("entry 6:") for e in report.errors))
+        self.assertTrue(any(e.startswith("vote 2:") for e in report.errors))
+    
+    def test_existing_votes_are_backfilled_into_ledger(self):
+        """Test schema setup records and seals votes cast before the ledger existed"""
+        self._cast(3)
+        self.db.connection.execute('DROP TABLE vote_ledger')
+        self.db.connection.execute('DROP TABLE ledger_batches')
+        self.db.connection.commit()
+        
+        self.db.create_schema()
+        self.assertEqual(self.db.get_ledger_head()["leaf_count"], 3)
+        self.assertTrue(LedgerVerifier(self.db_path, workers=1).verify().ok)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+"""
+Unit Tests for Voting State
+Tests the cached voting status, its persisted fallback and the ballot gate
+"""
+
+import asyncio
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.storage.database import Database
+from app.storage.voting_state import VotingStateHolder, invalidate_voting_states
+from app.services.event_bus import VOTING_STATUS_CHANGED, _on_remote_event
+from app.views.voting_page import VotingPage
+
+
+class TestVotingStateHolder(unittest.TestCase):
+    """Test cases for the in-memory holder"""
+    
+    def test_versions_increase_with_each_change(self):
+        """Test every change replaces the snapshot with a newer version"""
+        holder = VotingStateHolder()
+        self.assertIsNone(holder.current)
+        
+        first = holder.set(True, "2026-01-01 08:00:00")
+        second = holder.set(False, "2026-01-01 08:00:00", "2026-01-01 17:00:00")
+        self.assertTrue(first.is_active)
+        self.assertFalse(second.is_active)
+        self.assertGreater(second.version, first.version)
+        self.assertIs(holder.current, second)
+        
+        holder.invalidate()
+        self.assertIsNone(holder.current)
+
+
+class TestCachedVotingStatus(unittest.TestCase):
+    """Test cases for Database voting status reads"""
+    
+    def setUp(self):
+        """Set up test database"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, "voting_state_test.db")
+        self.db = Database(db_name=self.db_path)
+        self.statements = []
+    
+    def tearDown(self):
+        """Clean up"""
+        Database.remove_query_listener(self._on_query)
+        if self.db.connection:
+            self.db.connection.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    
+    def _on_query(self, sql, elapsed):
+        self.statements.append(sql)
+    
+    def test_status_reads_are_memory_reads(self):
+        """Test reads after a change run no SQL"""
+        self.db.start_voting(user_id=1)
+        Database.add_query_listener(self._on_query)
+        
+        for _ in range(5):
+            self.assertTrue(self.db.is_voting_active())
+            self.assertTrue(self.db.get_voting_status()["is_active"])
+        self.assertEqual(self.statements, [])
+    
+    def test_change_is_seen_by_other_instances(self):
+        """Test instances on the same file share one cached state"""
+        other = Database(db_name=self.db_path)
+        version = other.get_voting_state().version
+        
+        self.db.start_voting(user_id=1)
+        self.assertTrue(other.is_voting_active())
+        self.assertGreater(other.get_voting_state().version, version)
+        self.assertIsNotNone(other.get_voting_status()["started_at"])
+        
+        self.db.stop_voting(user_id=1)
+        self.assertFalse(other.is_voting_active())
+        self.assertIsNotNone(other.get_voting_status()["ended_at"])
+        other.connection.close()
+    
+    def test_persisted_status_after_restart(self):
+        """Test a process without a cached state loads the last stored status"""
+        self.db.start_voting(user_id=1)
+        # What another worker (or a restart) would do to its cache
+        self.db.cursor.execute("UPDATE voting_status SET is_active = 0")
+        self.db.connection.commit()
+        self.assertTrue(self.db.is_voting_active())
+        
+        invalidate_voting_states()
+        self.assertFalse(self.db.is_voting_active())
+    
+    def test_remote_status_event_invalidates(self):
+        """Test a voting status event from another worker drops the cached state"""
+        self.db.start_voting(user_id=1)
+        _on_remote_event({"type": VOTING_STATUS_CHANGED, "is_active": False})
+        self.assertIsNone(self.db.voting_state.current)
+    
+    def test_ballot_refused_while_voting_closed(self):
+        """Test the voting page does not record a ballot once voting has stopped"""
+        self.db.create_user("voter", "voter@test.com", "pass", "voter")
+        voter_id = self.db.get_users_by_role("voter")[0][0]
+        self.db.create_politician("gov", "gov@test.com", "pass", "Gov", "Governor", "Party", "bio")
+        governor_id = self.db.get_users_by_role("politician")[0][0]
+        stopped = []
+        
+        self.db.start_voting(user_id=1)
+        view = VotingPage(voter_id, "voter", self.db, on_logout=lambda: None,
+                          on_voting_stopped=lambda: stopped.append(True))
+        self.db.stop_voting(user_id=1)
+        asyncio.run(view._submit_vote("Governor", governor_id))
+        
+        self.assertEqual(stopped, [True])
+        self.assertEqual(self.db.get_votes_by_voter(voter_id), [])
+        self.assertNotIn("Governor", view.submitted_positions)
+
+
+if __name__ == '__main__':
+    unittest.main()
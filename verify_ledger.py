@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Vote ledger audit script for HonestBallot
+Recomputes every sealed batch's Merkle root and chain link and checks that
+each counted vote matches its latest ledger entry, in parallel worker
+processes; with --vote it prints and checks one ballot's inclusion proof
+"""
+
+import argparse
+import json
+import sys
+import os
+
+# Add current directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app.storage.database import Database
+from app.storage.vote_ledger import LedgerVerifier, verify_inclusion_proof
+
+
+def main():
+    """Audit the vote ledger; exits non-zero if anything fails to verify"""
+    parser = argparse.ArgumentParser(description="Verify the HonestBallot vote ledger")
+    parser.add_argument("--db", help="database file (default: DATABASE_NAME)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: LEDGER_VERIFY_WORKERS, 0 = one per core)")
+    parser.add_argument("--vote", type=int, help="print and check the inclusion proof of one vote id")
+    args = parser.parse_args()
+    
+    if args.vote is not None:
+        db = Database(args.db)
+        proof = db.get_vote_inclusion_proof(args.vote)
+        db.close()
+        if proof is None:
+            print(f"Vote {args.vote} has no sealed ledger entry yet")
+            return 1
+        print(json.dumps(proof, indent=2))
+        valid = verify_inclusion_proof(proof)
+        print(f"{'✅' if valid else '❌'} Inclusion proof {'verified' if valid else 'INVALID'} "
+              f"({len(proof['path'])} hashes, batch {proof['batch']['id']})")
+        return 0 if valid else 1
+    
+    print("Verifying HonestBallot vote ledger...")
+    print("-" * 50)
+    report = LedgerVerifier(args.db, args.workers).verify()
+    for error in report.errors:
+        print(f"  ❌ {error}")
+    if report.error_count > len(report.errors):
+        print(f"  ... and {report.error_count - len(report.errors)} more")
+    print(("✅ " if report.ok else "❌ ") + report.summary())
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())